@@ -2,14 +2,15 @@
 
 # Used for json dumping, see handle_dump_config_service
 # import json
+import asyncio
 import datetime
 import logging
-import logging.handlers
-import math
+from dataclasses import dataclass, replace
 from datetime import UTC, timedelta
 from datetime import time as datetime_time
 from enum import Enum
 from functools import partial
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
@@ -17,7 +18,6 @@ import yaml
 from homeassistant.components.cover import CoverEntityFeature
 from homeassistant.config_entries import ConfigEntries, ConfigEntry
 from homeassistant.const import (
-    ATTR_SUPPORTED_FEATURES,
     EVENT_HOMEASSISTANT_STARTED,
     STATE_OFF,
     STATE_ON,
@@ -29,37 +29,85 @@ from homeassistant.core import Event, EventStateChangedData, HomeAssistant, Serv
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry, entity_registry
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_state_change_event
+from homeassistant.helpers.event import async_call_later, async_track_point_in_utc_time, async_track_state_change_event, async_track_time_change
+from homeassistant.helpers.sun import get_astral_location
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
 
 from .adaptive_brightness import AdaptiveBrightnessCalculator
+from .command_scheduler import SCCommandScheduler, async_get_command_scheduler
 from .config_flow import YAML_CONFIG_SCHEMA, get_full_options_schema
 from .config_validation import validate_and_warn_deprecated_config
 from .const import (
+    COMMAND_BURST,
+    COMMAND_RATE_LIMIT,
     DEBUG_ENABLED,
     DOMAIN,
     DOMAIN_DATA_MANAGERS,
+    INPUT_COALESCING_WINDOW,
+    INPUT_GROUP_SOURCES,
+    INTERNAL_INPUT_GROUPS,
     INTERNAL_TO_DEFAULTS_MAP,
+    OUTPUT_MIN_INTERVAL,
     OWN_LOGFILE_ENABLED,
+    OWN_LOGFILE_SHARED_WRITER,
+    RECALCULATION_CONCURRENCY,
     SC_CONF_NAME,
+    SHARED_INPUT_ATTRIBUTES,
+    SUN_POSITION_BUILTIN,
     TARGET_COVER_ENTITY,
     VERSION,
     LockState,
     MovementRestricted,
+    SCCommandPriority,
     SCDawnInput,
     SCDefaults,
     SCDynamicInput,
     SCFacadeConfig1,
     SCFacadeConfig2,
+    SCInputGroup,
     SCInternal,
     SCShadowInput,
+    SCTriggerAction,
+    SCTriggerSource,
     ShutterState,
     ShutterType,
 )
+from .coordinator import SCRecalculationCoordinator, async_get_recalculation_coordinator
+from .cover_commands import (
+    SERVICE_SET_COVER_POSITION,
+    SERVICE_SET_COVER_TILT_POSITION,
+    SCCoverCommand,
+    SCCoverDispatchResult,
+    async_dispatch_cover_commands,
+    split_covers_by_feature,
+)
+from .cover_output import SCCoverOutput
+from .geometry import (
+    apply_stepping,
+    calculate_sun_entry_exit_angles,
+    is_elevation_in_range,
+    is_sun_between_offsets,
+    limit_shutter_angle,
+)
+from .geometry_cache import SCGeometryCache, async_get_geometry_cache
+from .input_hub import SCInputHub, async_get_input_hub
+from .logfile import async_attach_logfile, async_detach_logfile
+from .performance import SCPerformanceStats
+from .solar import SIGNAL_SOLAR_POSITION_UPDATED, SCSolarEngine, SCSolarPosition, async_get_solar_engine
+from .state_cache import SCParsedStateCache, async_get_state_cache, get_raw_state_value
+from .state_machine import (
+    STATE_MACHINE,
+    STATE_MACHINE_MAX_HOPS,
+    SCCycleSnapshot,
+    SCStateTransition,
+    SCTransitionAction,
+    format_transition_trace,
+)
+from .sun_path import SUN_HORIZON_MAX_DURATION, SUN_HORIZON_TOLERANCE, SCSunPathTable, build_sun_path_table
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -193,21 +241,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
 
     if own_logfile_enabled:
         log_file_path = hass.config.path(f"shadow_control_{sanitized_instance_name}.log")
-        log_level = instance_specific_logger.level
-
-        def _create_file_handler() -> logging.handlers.RotatingFileHandler:
-            handler = logging.handlers.RotatingFileHandler(
-                log_file_path,
-                maxBytes=5 * 1024 * 1024,  # 5 MB
-                backupCount=3,
-                encoding="utf-8",
-            )
-            handler.setFormatter(logging.Formatter("%(asctime)s  %(levelname)-8s  %(name)s — %(message)s"))
-            handler.setLevel(log_level)
-            return handler
-
-        file_handler = await hass.async_add_executor_job(_create_file_handler)
-        instance_specific_logger.addHandler(file_handler)
+        # Written by a background thread, so writing and rotating the file doesn't block the event loop
+        await async_attach_logfile(hass, instance_specific_logger, log_file_path, bool(entry.options.get(OWN_LOGFILE_SHARED_WRITER, False)))
         instance_specific_logger.info("Own logfile for instance '%s' enabled: %s", instance_name, log_file_path)
     else:
         instance_specific_logger.info("Own logfile for instance '%s' disabled.", instance_name)
@@ -353,6 +388,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:  #
     # Load platforms (like sensors)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # All internal entities are registered now, so resolve their entity_ids once
+    manager.build_internal_entity_index()
+
     # Add listeners for update of input values and integration trigger
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
@@ -707,30 +745,134 @@ class SCDynamicInputConfiguration:
         self.movement_restriction_angle: MovementRestricted = MovementRestricted.NO_RESTRICTION
 
 
+@dataclass(frozen=True, slots=True)
+class SCStaticFacadeConfiguration:
+    """Static facade configuration, which only changes with a reload of the config entry."""
+
+    azimuth: float = 180.0
+    offset_sun_in: float = -90.0
+    offset_sun_out: float = 90.0
+    elevation_sun_min: float = 0.0
+    elevation_sun_max: float = 90.0
+    slat_width: float = 95.0
+    slat_distance: float = 67.0
+    slat_angle_offset: float = 0.0
+    slat_min_angle: float = 0.0
+    shutter_stepping_height: float = 10.0
+    shutter_stepping_angle: float = 10.0
+    shutter_type: ShutterType = ShutterType.MODE1
+    light_strip_width: float = 0.0
+    shutter_height: float = 1000.0
+    max_movement_duration: float = SCDefaults.MAX_MOVEMENT_DURATION_VALUE.value
+    modification_tolerance_height: float = 0.0
+    modification_tolerance_angle: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SCSunFacadeState:
+    """Relation between sun and facade for a given sun position (azimuth, elevation)."""
+
+    sun_position: tuple[float | None, float | None]
+    is_in_sun: bool
+    effective_elevation: float | None
+
+
 class SCFacadeConfiguration:
     """Define defaults for facade configuration."""
 
-    def __init__(self) -> None:
+    def __init__(self, static_config: SCStaticFacadeConfiguration | None = None) -> None:
         """Define defaults for facade configuration."""
-        self.azimuth: float = 180.0
-        self.offset_sun_in: float = -90.0
-        self.offset_sun_out: float = 90.0
-        self.elevation_sun_min: float = 0.0
-        self.elevation_sun_max: float = 90.0
-        self.slat_width: float = 95.0
-        self.slat_distance: float = 67.0
-        self.slat_angle_offset: float = 0.0
-        self.slat_min_angle: float = 0.0
-        self.shutter_stepping_height: float = 5.0
-        self.shutter_stepping_angle: float = 5.0
-        self.shutter_type: ShutterType = ShutterType.MODE1
-        self.light_strip_width: float = 0.0
-        self.shutter_height: float = 1000.0
+        # Parsed once at manager construction, see ShadowControlManager._build_static_facade_config()
+        self.static: SCStaticFacadeConfiguration = static_config if static_config is not None else SCStaticFacadeConfiguration()
+
+        # Entity backed values, which are updated at runtime
         self.neutral_pos_height: float = 0.0
         self.neutral_pos_angle: float = 0.0
-        self.max_movement_duration: int = SCDefaults.MAX_MOVEMENT_DURATION_VALUE.value
-        self.modification_tolerance_height: int = SCDefaults.MODIFICATION_TOLERANCE_HEIGHT_STATIC.value
-        self.modification_tolerance_angle: int = SCDefaults.MODIFICATION_TOLERANCE_ANGLE_STATIC.value
+
+    @property
+    def azimuth(self) -> float:
+        """Facade azimuth."""
+        return self.static.azimuth
+
+    @property
+    def offset_sun_in(self) -> float:
+        """Sun entry offset."""
+        return self.static.offset_sun_in
+
+    @property
+    def offset_sun_out(self) -> float:
+        """Sun exit offset."""
+        return self.static.offset_sun_out
+
+    @property
+    def elevation_sun_min(self) -> float:
+        """Minimal sun elevation."""
+        return self.static.elevation_sun_min
+
+    @property
+    def elevation_sun_max(self) -> float:
+        """Maximal sun elevation."""
+        return self.static.elevation_sun_max
+
+    @property
+    def slat_width(self) -> float:
+        """Slat width."""
+        return self.static.slat_width
+
+    @property
+    def slat_distance(self) -> float:
+        """Slat distance."""
+        return self.static.slat_distance
+
+    @property
+    def slat_angle_offset(self) -> float:
+        """Slat angle offset."""
+        return self.static.slat_angle_offset
+
+    @property
+    def slat_min_angle(self) -> float:
+        """Minimal slat angle."""
+        return self.static.slat_min_angle
+
+    @property
+    def shutter_stepping_height(self) -> float:
+        """Height stepping."""
+        return self.static.shutter_stepping_height
+
+    @property
+    def shutter_stepping_angle(self) -> float:
+        """Angle stepping."""
+        return self.static.shutter_stepping_angle
+
+    @property
+    def shutter_type(self) -> ShutterType:
+        """Shutter type."""
+        return self.static.shutter_type
+
+    @property
+    def light_strip_width(self) -> float:
+        """Light strip width."""
+        return self.static.light_strip_width
+
+    @property
+    def shutter_height(self) -> float:
+        """Overall shutter height."""
+        return self.static.shutter_height
+
+    @property
+    def max_movement_duration(self) -> float:
+        """Maximal movement duration."""
+        return self.static.max_movement_duration
+
+    @property
+    def modification_tolerance_height(self) -> float:
+        """Height modification tolerance."""
+        return self.static.modification_tolerance_height
+
+    @property
+    def modification_tolerance_angle(self) -> float:
+        """Angle modification tolerance."""
+        return self.static.modification_tolerance_angle
 
 
 class SCShadowControlConfig:
@@ -784,7 +926,7 @@ class ShadowControlManager:
 
         self.name = self._config[SC_CONF_NAME]
         self._target_cover_entity_id = self._config[TARGET_COVER_ENTITY]
-        self._adaptive_brightness_calculator = None
+        self._adaptive_brightness_calculator: AdaptiveBrightnessCalculator | None = None
 
         # Sanitize instance name
         # This handles umlauts, spaces, and special characters automatically
@@ -803,68 +945,131 @@ class ShadowControlManager:
         self._unsub_callbacks: list[Callable[[], None]] = []
         self._unsub_time_constraint_callbacks: list[Callable[[], None]] = []
 
+        # Index SCInternal -> entity_id of the internal entities of this instance.
+        # Filled lazily by get_internal_entity_id() and completely by build_internal_entity_index()
+        # after the platforms are set up. Cleared on entity registry updates for this entry.
+        self._internal_entity_ids: dict[SCInternal, str] = {}
+        self._internal_unique_id_prefix = f"{self._entry_id}_"
+
+        # Coalescing of bursts of input events into a single recalculation. Lock entities are
+        # not coalesced, so (un)locking is handled immediately. The latest event per entity is
+        # kept, so entity specific handling (e.g. disabling shadow control) is not lost.
+        self._input_coalescing_window: float = self._get_static_value(
+            INPUT_COALESCING_WINDOW, SCDefaults.INPUT_COALESCING_WINDOW_VALUE.value, float, log_warning=False
+        )
+        self._coalescing_bypass_entities: frozenset[str] = frozenset()
+        self._coalesced_events: dict[str | None, Event[EventStateChangedData]] = {}
+        self._unsub_coalescing_timer: Callable[[], None] | None = None
+
+        # Single-flight calculation. Triggers during a running calculation are collapsed into one follow-up.
+        self._calculation_task: asyncio.Task | None = None
+        self._calculation_follow_up: asyncio.Future[None] | None = None
+        self._pending_calculation_triggers: dict[str | None, Event | None] = {}
+
+        # Performance diagnostics, see diagnostics.py
+        self._performance_stats = SCPerformanceStats()
+
+        # Sun path of the current day, calculated at start and at midnight
+        self._sun_path_table: SCSunPathTable | None = None
+        self._sun_path_table_task: asyncio.Task | None = None
+        # Recalculation at the next point in time, at which the facade enters or leaves the sun
+        self._unsub_sun_crossing: Callable[[], None] | None = None
+
+        # Sun position from the solar engine shared by all instances instead of the sun entities
+        self._solar_engine: SCSolarEngine | None = None
+        if self._get_static_value(SUN_POSITION_BUILTIN, False, bool, log_warning=False):
+            self._solar_engine = async_get_solar_engine(self.hass)
+
+        # Geometry results, shared by all instances with identical facades
+        self._geometry_cache: SCGeometryCache = async_get_geometry_cache(self.hass)
+
+        # Converted entity states, shared by all instances
+        self._state_cache: SCParsedStateCache = async_get_state_cache(self.hass)
+
+        # Sun and brightness entities are tracked and parsed once for all instances by the input hub
+        self._input_hub: SCInputHub = async_get_input_hub(self.hass)
+        self._shared_input_entities: frozenset[str] = frozenset(
+            entity_id
+            for key in SHARED_INPUT_ATTRIBUTES
+            if self._solar_engine is None or key not in (SCDynamicInput.SUN_ELEVATION_ENTITY, SCDynamicInput.SUN_AZIMUTH_ENTITY)
+            for entity_id in (self._config.get(key.value),)
+            if isinstance(entity_id, str) and entity_id not in ("", "none")
+        )
+        # Shared entities only feeding the sun position, their changes are skipped within the sun horizon
+        self._sun_input_entities: frozenset[str] = (
+            self._shared_input_entities
+            & {self._config.get(SCDynamicInput.SUN_ELEVATION_ENTITY.value), self._config.get(SCDynamicInput.SUN_AZIMUTH_ENTITY.value)}
+        ) - {self._config.get(SCDynamicInput.BRIGHTNESS_ENTITY.value), self._config.get(SCDynamicInput.BRIGHTNESS_DAWN_ENTITY.value)}
+        # Recalculations triggered by shared inputs run in one pass together with all other instances
+        self._recalculation_coordinator: SCRecalculationCoordinator = async_get_recalculation_coordinator(self.hass)
+        self._recalculation_coordinator.async_set_max_concurrency(
+            self._entry_id,
+            self._get_static_value(RECALCULATION_CONCURRENCY, SCDefaults.RECALCULATION_CONCURRENCY_VALUE.value, int, log_warning=False),
+        )
+        # Sun driven recalculations can't change the shutter position before this point in time
+        self._sun_horizon: datetime.datetime | None = None
+
+        # Evaluated once per calculation run, guards the assembly of expensive debug messages
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # Entity specific trigger dispatch, built at listener registration
+        self._immediate_positioning_entities: frozenset[str] = frozenset()
+        self._trigger_handlers: dict[str, Callable[[str, State | None, State | None], Awaitable[SCTriggerAction]]] | None = None
+
         # Initialize configuration with default values
         self._dynamic_config = SCDynamicInputConfiguration()
-        self._facade_config = SCFacadeConfiguration()
+        self._facade_config = SCFacadeConfiguration(self._build_static_facade_config())
+        # Output stage between the positioning and the cover services, a command is in flight
+        # until the max movement duration elapsed
+        self._cover_output = SCCoverOutput(
+            self.hass,
+            self._async_dispatch_cover_commands,
+            self._get_static_value(OUTPUT_MIN_INTERVAL, SCDefaults.OUTPUT_MIN_INTERVAL_VALUE.value, float, log_warning=False),
+            self._facade_config.max_movement_duration or 0,
+        )
+        # Cover commands of all instances are limited by the shared scheduler, the most restrictive limit applies
+        self._command_scheduler: SCCommandScheduler = async_get_command_scheduler(self.hass)
+        self._command_scheduler.async_set_limit(
+            self._entry_id,
+            self._get_static_value(COMMAND_RATE_LIMIT, SCDefaults.COMMAND_RATE_LIMIT_VALUE.value, float, log_warning=False),
+            self._get_static_value(COMMAND_BURST, SCDefaults.COMMAND_BURST_VALUE.value, int, log_warning=False),
+        )
         self._shadow_config = SCShadowControlConfig()
         self._dawn_config = SCDawnControlConfig()
 
         # === Get dynamic configuration inputs
-        # Sun elevation - read from attribute if sun.sun, else from state
-        self._dynamic_config.sun_elevation = self._get_entity_state_value(
-            SCDynamicInput.SUN_ELEVATION_ENTITY.value,
-            0.0,
-            float,
-            attribute_name="elevation",  # ← For sun.sun, read elevation attribute
-        )
-        # Sun azimuth - read from attribute if sun.sun, else from state
-        self._dynamic_config.sun_azimuth = self._get_entity_state_value(
-            SCDynamicInput.SUN_AZIMUTH_ENTITY.value,
-            0.0,
-            float,
-            attribute_name="azimuth",  # ← For sun.sun, read azimuth attribute
-        )
+        self._read_sun_position_inputs()
         self._handle_movement_restriction()
         self._dynamic_config.enforce_positioning_entity = self._config.get(SCDynamicInput.ENFORCE_POSITIONING_ENTITY.value)
         self._dynamic_config.unlock_integration_entity = self._config.get(SCDynamicInput.UNLOCK_INTEGRATION_ENTITY.value)
 
         # === Get general facade configuration
-        self._facade_config.azimuth = self._config.get(SCFacadeConfig1.AZIMUTH_STATIC.value)
-        self._facade_config.offset_sun_in = self._config.get(SCFacadeConfig1.OFFSET_SUN_IN_STATIC.value)
-        self._facade_config.offset_sun_out = self._config.get(SCFacadeConfig1.OFFSET_SUN_OUT_STATIC.value)
-        self._facade_config.elevation_sun_min = self._config.get(SCFacadeConfig1.ELEVATION_SUN_MIN_STATIC.value)
-        self._facade_config.elevation_sun_max = self._config.get(SCFacadeConfig1.ELEVATION_SUN_MAX_STATIC.value)
-        self._facade_config.slat_width = self._config.get(SCFacadeConfig2.SLAT_WIDTH_STATIC.value)
-        self._facade_config.slat_distance = self._config.get(SCFacadeConfig2.SLAT_DISTANCE_STATIC.value)
-        self._facade_config.slat_angle_offset = self._config.get(SCFacadeConfig2.SLAT_ANGLE_OFFSET_STATIC.value)
-        self._facade_config.slat_min_angle = self._config.get(SCFacadeConfig2.SLAT_MIN_ANGLE_STATIC.value)
-        self._facade_config.shutter_stepping_height = self._config.get(SCFacadeConfig2.SHUTTER_STEPPING_HEIGHT_STATIC.value)
-        self._facade_config.shutter_stepping_angle = self._config.get(SCFacadeConfig2.SHUTTER_STEPPING_ANGLE_STATIC.value)
-        self._facade_config.shutter_type = self._config.get(SCFacadeConfig2.SHUTTER_TYPE_STATIC.value)
-        self._facade_config.light_strip_width = self._config.get(SCFacadeConfig2.LIGHT_STRIP_WIDTH_STATIC.value)
-        self._facade_config.shutter_height = self._config.get(SCFacadeConfig2.SHUTTER_HEIGHT_STATIC.value)
+        # The static part was already parsed at the creation of self._facade_config
         self._facade_config.neutral_pos_height = self._config.get(SCInternal.NEUTRAL_POS_HEIGHT_MANUAL.value)
         self._facade_config.neutral_pos_angle = self._config.get(SCInternal.NEUTRAL_POS_ANGLE_MANUAL.value)
-        self._facade_config.max_movement_duration = self._config.get(SCFacadeConfig2.MAX_MOVEMENT_DURATION_STATIC.value)
-        self._facade_config.modification_tolerance_height = self._config.get(SCFacadeConfig2.MODIFICATION_TOLERANCE_HEIGHT_STATIC.value)
-        self._facade_config.modification_tolerance_angle = self._config.get(SCFacadeConfig2.MODIFICATION_TOLERANCE_ANGLE_STATIC.value)
-
-        # Define dictionary with all state handlers
-        self._state_handlers: dict[ShutterState, Callable[[], Awaitable[ShutterState]]] = {
-            ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING: self._handle_state_shadow_full_close_timer_running,
-            ShutterState.SHADOW_FULL_CLOSED: self._handle_state_shadow_full_closed,
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING: self._handle_state_shadow_horizontal_neutral_timer_running,
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL: self._handle_state_shadow_horizontal_neutral,
-            ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING: self._handle_state_shadow_neutral_timer_running,
-            ShutterState.SHADOW_NEUTRAL: self._handle_state_shadow_neutral,
-            ShutterState.NEUTRAL: self._handle_state_neutral,
-            ShutterState.DAWN_NEUTRAL: self._handle_state_dawn_neutral,
-            ShutterState.DAWN_NEUTRAL_TIMER_RUNNING: self._handle_state_dawn_neutral_timer_running,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL: self._handle_state_dawn_horizontal_neutral,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING: self._handle_state_dawn_horizontal_neutral_timer_running,
-            ShutterState.DAWN_FULL_CLOSED: self._handle_state_dawn_full_closed,
-            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING: self._handle_state_dawn_full_close_timer_running,
+
+        # Readers for the input groups, all groups are read at the first calculation run
+        self._input_group_readers: dict[SCInputGroup, Callable[[], None]] = {
+            SCInputGroup.NEUTRAL_POSITION: self._read_neutral_position_inputs,
+            SCInputGroup.BRIGHTNESS: self._read_brightness_inputs,
+            SCInputGroup.SUN_POSITION: self._read_sun_position_inputs,
+            SCInputGroup.SUN_TIMES: self._read_sun_times_inputs,
+            SCInputGroup.SHUTTER_POSITION: self._read_shutter_position_inputs,
+            SCInputGroup.LOCK: self._read_lock_inputs,
+            SCInputGroup.MOVEMENT_RESTRICTION: self._handle_movement_restriction,
+            SCInputGroup.SHADOW: self._read_shadow_inputs,
+            SCInputGroup.DAWN: self._read_dawn_inputs,
+            SCInputGroup.DAWN_TIME_CONSTRAINTS: self._read_dawn_time_constraint_inputs,
         }
+        self._dirty_input_groups: set[SCInputGroup] = set(SCInputGroup)
+        self._input_groups_by_entity: dict[str, set[SCInputGroup]] = {}
+        self._unsub_input_entities: Callable[[], None] | None = None
+        self._sunrise: datetime.datetime | None = None
+        self._sunset: datetime.datetime | None = None
+        # Sunrise and sunset normalized to today, keyed by the entity values and the date
+        self._normalized_sun_times: (
+            tuple[tuple[datetime.datetime, datetime.datetime, datetime.date], tuple[datetime.datetime, datetime.datetime]] | None
+        ) = None
 
         # Member vars
         self._enforce_position_update: bool = False
@@ -889,6 +1094,7 @@ class ShadowControlManager:
         self.brightness_threshold = self._shadow_config.brightness_threshold_winter
 
         self._effective_elevation: float | None = None
+        self._sun_facade_state: SCSunFacadeState | None = None
         self._previous_shutter_height: float | None = None
         self._previous_shutter_angle: float | None = None
         self._is_initial_run: bool = True  # Flag for initial integration run
@@ -1041,6 +1247,21 @@ class ShadowControlManager:
                 self._dynamic_config.movement_restriction_angle,
             )
 
+    @property
+    def performance_stats(self) -> SCPerformanceStats:
+        """Performance counters of this instance."""
+        return self._performance_stats
+
+    @property
+    def cover_output(self) -> SCCoverOutput:
+        """Output stage of the cover commands."""
+        return self._cover_output
+
+    @property
+    def adaptive_brightness_calculator(self) -> AdaptiveBrightnessCalculator | None:
+        """Calculator of the adaptive brightness threshold, None if the static threshold is used."""
+        return self._adaptive_brightness_calculator
+
     async def async_start(self) -> None:
         """Start ShadowControlManager."""
         # - Register listeners
@@ -1049,6 +1270,7 @@ class ShadowControlManager:
         self.logger.info("=== Starting manager lifecycle ===")
         self._async_register_listeners()
         await self.async_calculate_and_apply_cover_position(None)
+        self.hass.async_create_task(self._async_update_sun_path_table())
 
         if self._is_initial_run:
             self.logger.info("Initial calculation completed, switching to normal operation mode")
@@ -1087,9 +1309,12 @@ class ShadowControlManager:
             SCDawnInput.SHUTTER_MAX_HEIGHT_ENTITY,
             SCDawnInput.SHUTTER_MAX_ANGLE_ENTITY,
         ]:
+            # The sun position of the solar engine is received separately
+            if self._solar_engine is not None and conf_key_enum in (SCDynamicInput.SUN_ELEVATION_ENTITY, SCDynamicInput.SUN_AZIMUTH_ENTITY):
+                continue
             # False positive "Expected type 'str' (matched generic type '_KT'), got '() -> Any | () -> Any | () -> Any' instead"
             entity_id = self._config.get(conf_key_enum.value)
-            if entity_id:
+            if entity_id and entity_id not in self._shared_input_entities:
                 tracked_inputs.append(entity_id)
 
         # Also track internal lock entities for manual lock state changes
@@ -1104,6 +1329,12 @@ class ShadowControlManager:
             self.logger.debug("Tracking input entities: %s", tracked_inputs)
             self._unsub_callbacks.append(async_track_state_change_event(self.hass, tracked_inputs, self._async_state_change_listener))
 
+        if self._shared_input_entities:
+            self.logger.debug("Tracking shared input entities: %s", sorted(self._shared_input_entities))
+            self._unsub_callbacks.extend(
+                self._input_hub.async_subscribe(entity_id, self._async_shared_input_changed) for entity_id in self._shared_input_entities
+            )
+
         # Listener of state changes at the handled cover entity to register external changes.
         # Important to recognize manual modification!
         if self._target_cover_entity_id:
@@ -1131,6 +1362,23 @@ class ShadowControlManager:
                 )
             )
 
+        # Invalidate the internal entity_id index if one of our internal entities is renamed or removed
+        self._unsub_callbacks.append(
+            self.hass.bus.async_listen(
+                entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated_listener,
+                event_filter=self._is_internal_entity_registry_event,
+            )
+        )
+
+        # Sun path of the new day
+        self._unsub_callbacks.append(async_track_time_change(self.hass, self._async_update_sun_path_table, hour=0, minute=0, second=0))
+
+        # Sun position of each new minute from the shared solar engine
+        if self._solar_engine is not None:
+            self._unsub_callbacks.append(self._solar_engine.async_subscribe())
+            self._unsub_callbacks.append(async_dispatcher_connect(self.hass, SIGNAL_SOLAR_POSITION_UPDATED, self._async_solar_position_updated))
+
         # In _async_register_listeners - eigener Listener für Unlock-Entity
         unlock_integration_entity = self._config.get(SCDynamicInput.UNLOCK_INTEGRATION_ENTITY.value)
         if unlock_integration_entity:
@@ -1142,8 +1390,70 @@ class ShadowControlManager:
                 )
             )
 
+        # Keep track of changes of all entities feeding input values
+        self._async_track_input_entities()
+        self._build_trigger_dispatch()
+
         self.logger.debug("Listeners registered.")
 
+    async def async_get_sun_path_table(self) -> SCSunPathTable:
+        """Return the sun path of the current day, calculate it again if the day or configuration changed."""
+        sun_path_table = self._sun_path_table
+        if sun_path_table is None or not sun_path_table.is_valid_for(
+            dt_util.now().date(), self._facade_config.static, self._shadow_config.shutter_max_height, self._shadow_config.shutter_max_angle
+        ):
+            sun_path_table = await self._async_update_sun_path_table()
+        return sun_path_table
+
+    async def _async_update_sun_path_table(self, _now: datetime.datetime | None = None) -> SCSunPathTable:
+        """Calculate the sun path of the current day with the current facade and shadow configuration."""
+        location, observer_elevation = get_astral_location(self.hass)
+        now = dt_util.now()
+        self._sun_path_table = await self.hass.async_add_executor_job(
+            build_sun_path_table,
+            location,
+            observer_elevation,
+            now.date(),
+            now.tzinfo,
+            self._facade_config.static,
+            self._shadow_config.shutter_max_height,
+            self._shadow_config.shutter_max_angle,
+        )
+        self.logger.debug("Sun path of %s calculated, facade in sun: %s", now.date(), self._sun_path_table.in_sun_periods())
+        self._schedule_next_sun_crossing()
+        return self._sun_path_table
+
+    @callback
+    def _schedule_next_sun_crossing(self) -> None:
+        """Schedule a recalculation at the next point in time, at which the facade enters or leaves the sun."""
+        self._cancel_sun_crossing_timer()
+        # No listeners after the manager was stopped, e.g. while the sun path was calculated
+        if self._sun_path_table is None or not self._unsub_callbacks:
+            return
+
+        next_crossing = self._sun_path_table.next_in_sun_change(dt_util.utcnow())
+        if next_crossing is None:
+            # Scheduled again with the sun path of the next day
+            self.logger.debug("No further sun entry or exit today")
+            return
+
+        self.logger.debug("Next sun entry or exit at %s", dt_util.as_local(next_crossing))
+        self._unsub_sun_crossing = async_track_point_in_utc_time(self.hass, self._async_sun_crossing, next_crossing)
+
+    async def _async_sun_crossing(self, _now: datetime.datetime) -> None:
+        """Recalculate as the facade enters or leaves the sun."""
+        self._unsub_sun_crossing = None
+        self._schedule_next_sun_crossing()
+        self._dirty_input_groups.add(SCInputGroup.SUN_POSITION)
+        await self.async_calculate_and_apply_cover_position(None, SCTriggerSource.SUN_CROSSING)
+
+    @callback
+    def _cancel_sun_crossing_timer(self) -> None:
+        """Cancel a scheduled recalculation at sun entry or exit."""
+        if self._unsub_sun_crossing is not None:
+            self._unsub_sun_crossing()
+            self._unsub_sun_crossing = None
+
     async def _async_state_change_listener(self, event: Event[EventStateChangedData]) -> None:
         """Listen for state changes of monitored entites."""
         entity_id = event.data.get("entity_id")
@@ -1159,11 +1469,106 @@ class ShadowControlManager:
 
         # Check if state really was changed
         if old_state is None or new_state is None or old_state.state != new_state.state:
+            if self._input_coalescing_window > 0 and entity_id not in self._coalescing_bypass_entities:
+                self._coalesce_input_event(event)
+                return
             self.logger.debug("Input entity '%s' changed. Triggering recalculation.", entity_id)
-            await self.async_calculate_and_apply_cover_position(event)
+            # Pending coalesced events are handled by this recalculation
+            coalesced_events = list(self._coalesced_events.values())
+            self._cancel_coalescing_timer()
+            await self.async_calculate_for_events([*coalesced_events, event], SCTriggerSource.LISTENER)
         else:
             self.logger.debug("State change for %s detected, but value did not change. No recalculation triggered.", entity_id)
 
+    @callback
+    def _async_shared_input_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle a change of an input entity tracked by the input hub."""
+        self._async_input_entity_state_listener(event)
+        if event.data["entity_id"] in self._sun_input_entities and self._is_within_sun_horizon():
+            return
+        self._recalculation_coordinator.async_request(self._facade_config.static, partial(self._async_state_change_listener, event))
+
+    @callback
+    def _async_solar_position_updated(self, position: SCSolarPosition) -> None:
+        """Recalculate with the sun position of the new minute, together with all other instances."""
+        self.logger.debug("Sun position updated: azimuth %.2f°, elevation %.2f°", position.azimuth, position.elevation)
+        self._dirty_input_groups.add(SCInputGroup.SUN_POSITION)
+        if self._is_within_sun_horizon():
+            return
+        self._recalculation_coordinator.async_request(
+            self._facade_config.static, partial(self.async_calculate_and_apply_cover_position, None, SCTriggerSource.SOLAR_ENGINE)
+        )
+
+    def _is_within_sun_horizon(self) -> bool:
+        """Check if a sun position change can be skipped, because it can't change the shutter position and no other input changed."""
+        if self._sun_horizon is None or dt_util.utcnow() >= self._sun_horizon or not self._dirty_input_groups <= {SCInputGroup.SUN_POSITION}:
+            return False
+        self.logger.debug("Sun position changed, but shutter position stays the same until %s. Recalculation skipped.", self._sun_horizon)
+        self.performance_stats.record_suppressed_recalculation()
+        return True
+
+    def _update_sun_horizon(self) -> None:
+        """Determine, up to when sun position changes can't change in-sun or the stepped height and angle."""
+        self._sun_horizon = None
+        sun_path_table = self._sun_path_table
+        now = dt_util.utcnow()
+        if sun_path_table is None or self._is_initial_run:
+            return
+        if not sun_path_table.is_valid_for(
+            dt_util.as_local(now).date(), self._facade_config.static, self._shadow_config.shutter_max_height, self._shadow_config.shutter_max_angle
+        ):
+            # E.g. changed max height, available for the next recalculation
+            if self._sun_path_table_task is None or self._sun_path_table_task.done():
+                self._sun_path_table_task = self.hass.async_create_task(self._async_update_sun_path_table())
+            return
+
+        entry = sun_path_table.lookup(now)
+        if entry is None:
+            return
+        # The table is calculated for the location of Home Assistant, the sun entities might differ
+        azimuth_deviation = abs((entry.sun_azimuth - self._dynamic_config.sun_azimuth + 180) % 360 - 180)
+        elevation_deviation = abs(entry.sun_elevation - self._dynamic_config.sun_elevation)
+        if max(azimuth_deviation, elevation_deviation) > SUN_HORIZON_TOLERANCE:
+            self.logger.debug("Sun position deviates by %.1f° from the sun path, no sun horizon", max(azimuth_deviation, elevation_deviation))
+            return
+
+        stable_until = sun_path_table.stable_until(now)
+        if stable_until is not None:
+            self._sun_horizon = min(stable_until, now + SUN_HORIZON_MAX_DURATION)
+
+    @callback
+    def _coalesce_input_event(self, event: Event[EventStateChangedData]) -> None:
+        """Remember the latest input event per entity and start the coalescing window if not already running."""
+        entity_id = event.data.get("entity_id")
+        # Keep the order of the latest changes, like the collapsed calculation triggers
+        self._coalesced_events.pop(entity_id, None)
+        self._coalesced_events[entity_id] = event
+        if self._unsub_coalescing_timer is not None:
+            self.logger.debug("Input entity '%s' changed. Recalculation already scheduled.", event.data.get("entity_id"))
+            return
+
+        self.logger.debug(
+            "Input entity '%s' changed. Triggering recalculation in %.1fs.",
+            event.data.get("entity_id"),
+            self._input_coalescing_window,
+        )
+        self._unsub_coalescing_timer = async_call_later(self.hass, self._input_coalescing_window, self._async_coalescing_window_elapsed)
+
+    async def _async_coalescing_window_elapsed(self, _now: datetime.datetime) -> None:
+        """Recalculate once with the latest values and events after the coalescing window elapsed."""
+        self._unsub_coalescing_timer = None
+        events = list(self._coalesced_events.values())
+        self._coalesced_events.clear()
+        await self.async_calculate_for_events(events, SCTriggerSource.LISTENER)
+
+    @callback
+    def _cancel_coalescing_timer(self) -> None:
+        """Cancel a pending coalesced recalculation."""
+        if self._unsub_coalescing_timer is not None:
+            self._unsub_coalescing_timer()
+            self._unsub_coalescing_timer = None
+        self._coalesced_events.clear()
+
     async def _async_target_cover_entity_state_change_listener(self, event: Event[EventStateChangedData]) -> None:
         """Handle state changes of cover entities."""
         entity_id = event.data.get("entity_id")
@@ -1389,6 +1794,8 @@ class ShadowControlManager:
 
         # Set lock state to AUTO_LOCK
         self.current_lock_state = LockState.LOCKED_BY_EXTERNAL_MODIFICATION
+        # The covers left the sent targets
+        self._cover_output.async_reset_in_flight()
 
         # Do NOT turn on manual lock switch!
         # This was causing auto-lock to switch to manual-lock
@@ -1429,6 +1836,8 @@ class ShadowControlManager:
         # Set unlock time for grace period
         self._last_unlock_time = dt_util.utcnow()
         self.logger.debug("Set unlock grace period")
+        # Covers may have been moved during the lock, so the targets are sent again
+        self._cover_output.async_reset_in_flight()
 
         # Trigger immediate positioning
         # await self.async_calculate_and_apply_cover_position(None)
@@ -1476,45 +1885,132 @@ class ShadowControlManager:
             unsub_callback()
         self._unsub_time_constraint_callbacks.clear()
 
+        if self._unsub_input_entities is not None:
+            self._unsub_input_entities()
+            self._unsub_input_entities = None
+
+        self._cancel_coalescing_timer()
+        self._cancel_sun_crossing_timer()
+        self._cover_output.async_cancel()
+        self._command_scheduler.async_remove_limit(self._entry_id)
+        self._recalculation_coordinator.async_remove_max_concurrency(self._entry_id)
+
         self.logger.debug("Listeners unregistered.")
 
-        # Close and remove any file handlers to avoid leaks on reload
-        for handler in list(self.logger.handlers):
-            if isinstance(handler, logging.handlers.RotatingFileHandler):
-                self.logger.debug("Closing logfile handler: %s", handler.baseFilename)
-                handler.close()
-                self.logger.removeHandler(handler)
+        # Write pending records and close the own logfile to avoid leaks on reload
+        await async_detach_logfile(self.hass, self.logger)
 
         self.logger.debug("Manager lifecycle stopped.")
 
     async def _update_input_values(self, event: Event | None = None) -> None:
-        """Update all relevant input values from configuration or Home Assistant states."""
-        # self.logger.debug("Updating all input values")
-
-        # Facade Configuration (static values)
-        self._facade_config.azimuth = self._get_static_value(SCFacadeConfig1.AZIMUTH_STATIC.value, 180.0, float)
-        self._facade_config.offset_sun_in = self._get_static_value(SCFacadeConfig1.OFFSET_SUN_IN_STATIC.value, -90.0, float)
-        self._facade_config.offset_sun_out = self._get_static_value(SCFacadeConfig1.OFFSET_SUN_OUT_STATIC.value, 90.0, float)
-        self._facade_config.elevation_sun_min = self._get_static_value(SCFacadeConfig1.ELEVATION_SUN_MIN_STATIC.value, 0.0, float)
-        self._facade_config.elevation_sun_max = self._get_static_value(SCFacadeConfig1.ELEVATION_SUN_MAX_STATIC.value, 90.0, float)
-        self._facade_config.slat_width = self._get_static_value(SCFacadeConfig2.SLAT_WIDTH_STATIC.value, 95.0, float)
-        self._facade_config.slat_distance = self._get_static_value(SCFacadeConfig2.SLAT_DISTANCE_STATIC.value, 67.0, float)
-        self._facade_config.slat_angle_offset = self._get_static_value(SCFacadeConfig2.SLAT_ANGLE_OFFSET_STATIC.value, 0.0, float)
-        self._facade_config.slat_min_angle = self._get_static_value(SCFacadeConfig2.SLAT_MIN_ANGLE_STATIC.value, 0.0, float)
-        self._facade_config.shutter_stepping_height = self._get_static_value(SCFacadeConfig2.SHUTTER_STEPPING_HEIGHT_STATIC.value, 10.0, float)
-        self._facade_config.shutter_stepping_angle = self._get_static_value(SCFacadeConfig2.SHUTTER_STEPPING_ANGLE_STATIC.value, 10.0, float)
+        """
+        Update the input values from configuration or Home Assistant states.
+
+        Only the input groups fed by entities, which changed since the last run, are read again.
+        All groups are read at the first run after startup or reload and after the internal
+        entities were indexed again.
+        """
+        dirty_input_groups = self._dirty_input_groups
+        self._dirty_input_groups = set()
+        if dirty_input_groups and self._debug_enabled:
+            self.logger.debug("Reading input groups: %s", ", ".join(group.value for group in SCInputGroup if group in dirty_input_groups))
+        for input_group, read_input_group in self._input_group_readers.items():
+            if input_group in dirty_input_groups:
+                read_input_group()
+
+        # Depends on the auto-lock state, which is not backed by an entity
+        self.current_lock_state = self._calculate_lock_state()
+
+        # Depends on the current time
+        self._update_brightness_threshold()
+        self._schedule_dawn_time_constraint_triggers()
+
+        if self._debug_enabled:
+            facade = _format_config_object_for_logging(self._facade_config, " -> Facade config: ")
+            dynamic = _format_config_object_for_logging(self._dynamic_config, " -> Dynamic config: ")
+            shadow = _format_config_object_for_logging(self._shadow_config, " -> Shadow config: ")
+            dawn = _format_config_object_for_logging(self._dawn_config, " -> Dawn config: ")
+            self.logger.debug("Updated input values:\n%s,\n%s,\n%s,\n%s", facade, dynamic, shadow, dawn)
+
+    def _mark_all_input_groups_dirty(self) -> None:
+        """Force all input groups to be read at the next calculation run."""
+        self._dirty_input_groups = set(SCInputGroup)
 
+    def _mark_trigger_input_groups_dirty(self, event: Event | None, source: SCTriggerSource) -> None:
+        """
+        Mark the input groups changed by the trigger itself to be read at the next calculation run.
+
+        State change listeners are called one event loop iteration after the change, so a
+        calculation started by the change itself would read the previous values otherwise.
+        """
+        if event is not None:
+            self._dirty_input_groups.update(self._input_groups_by_entity.get(event.data.get("entity_id"), ()))
+        elif source == SCTriggerSource.ENTITY_NOTIFY:
+            # Internal entities notify without their entity_id
+            self._dirty_input_groups.update(INTERNAL_INPUT_GROUPS)
+
+    @callback
+    def _async_track_input_entities(self) -> None:
+        """(Re-)subscribe to the entities feeding the input groups to know which groups changed."""
+        if self._unsub_input_entities is not None:
+            self._unsub_input_entities()
+            self._unsub_input_entities = None
+
+        input_groups_by_entity: dict[str, set[SCInputGroup]] = {}
+        for input_group, sources in INPUT_GROUP_SOURCES.items():
+            if input_group == SCInputGroup.SUN_POSITION and self._solar_engine is not None:
+                continue
+            for source in sources:
+                entity_id = self.get_internal_entity_id(source) if isinstance(source, SCInternal) else self._config.get(source.value)
+                if isinstance(entity_id, str) and entity_id not in ("", "none"):
+                    input_groups_by_entity.setdefault(entity_id, set()).add(input_group)
+        self._input_groups_by_entity = input_groups_by_entity
+
+        # Changes of shared input entities are received from the input hub
+        own_input_entities = [entity_id for entity_id in input_groups_by_entity if entity_id not in self._shared_input_entities]
+        if own_input_entities:
+            self.logger.debug("Tracking %s input entities for changed input values", len(own_input_entities))
+            self._unsub_input_entities = async_track_state_change_event(self.hass, own_input_entities, self._async_input_entity_state_listener)
+
+    @callback
+    def _async_input_entity_state_listener(self, event: Event[EventStateChangedData]) -> None:
+        """Mark the input groups fed by the changed entity to be read at the next calculation run."""
+        self._dirty_input_groups.update(self._input_groups_by_entity.get(event.data["entity_id"], ()))
+
+    def _build_static_facade_config(self) -> SCStaticFacadeConfiguration:
+        """Parse and validate the static facade options, which only change with a reload of the config entry."""
         # For shutter_type_static, it's a string from a selector. Convert it to ShutterType enum.
         shutter_type_str = self._get_static_value(SCFacadeConfig2.SHUTTER_TYPE_STATIC.value, "mode1", str)
         try:
-            self._facade_config.shutter_type = ShutterType[shutter_type_str.upper()]
+            shutter_type = ShutterType[shutter_type_str.upper()]
         except KeyError:
             self.logger.warning("Invalid shutter type '%s' configured. Using default 'mode1'.", shutter_type_str)
-            self._facade_config.shutter_type = ShutterType.MODE1
-
-        self._facade_config.light_strip_width = self._get_static_value(SCFacadeConfig2.LIGHT_STRIP_WIDTH_STATIC.value, 0.0, float)
-        self._facade_config.shutter_height = self._get_static_value(SCFacadeConfig2.SHUTTER_HEIGHT_STATIC.value, 1000.0, float)
+            shutter_type = ShutterType.MODE1
+
+        return SCStaticFacadeConfiguration(
+            azimuth=self._get_static_value(SCFacadeConfig1.AZIMUTH_STATIC.value, 180.0, float),
+            offset_sun_in=self._get_static_value(SCFacadeConfig1.OFFSET_SUN_IN_STATIC.value, -90.0, float),
+            offset_sun_out=self._get_static_value(SCFacadeConfig1.OFFSET_SUN_OUT_STATIC.value, 90.0, float),
+            elevation_sun_min=self._get_static_value(SCFacadeConfig1.ELEVATION_SUN_MIN_STATIC.value, 0.0, float),
+            elevation_sun_max=self._get_static_value(SCFacadeConfig1.ELEVATION_SUN_MAX_STATIC.value, 90.0, float),
+            slat_width=self._get_static_value(SCFacadeConfig2.SLAT_WIDTH_STATIC.value, 95.0, float),
+            slat_distance=self._get_static_value(SCFacadeConfig2.SLAT_DISTANCE_STATIC.value, 67.0, float),
+            slat_angle_offset=self._get_static_value(SCFacadeConfig2.SLAT_ANGLE_OFFSET_STATIC.value, 0.0, float),
+            slat_min_angle=self._get_static_value(SCFacadeConfig2.SLAT_MIN_ANGLE_STATIC.value, 0.0, float),
+            shutter_stepping_height=self._get_static_value(SCFacadeConfig2.SHUTTER_STEPPING_HEIGHT_STATIC.value, 10.0, float),
+            shutter_stepping_angle=self._get_static_value(SCFacadeConfig2.SHUTTER_STEPPING_ANGLE_STATIC.value, 10.0, float),
+            shutter_type=shutter_type,
+            light_strip_width=self._get_static_value(SCFacadeConfig2.LIGHT_STRIP_WIDTH_STATIC.value, 0.0, float),
+            shutter_height=self._get_static_value(SCFacadeConfig2.SHUTTER_HEIGHT_STATIC.value, 1000.0, float),
+            max_movement_duration=self._get_static_value(
+                SCFacadeConfig2.MAX_MOVEMENT_DURATION_STATIC.value, SCDefaults.MAX_MOVEMENT_DURATION_VALUE.value, float
+            ),
+            modification_tolerance_height=self._get_static_value(SCFacadeConfig2.MODIFICATION_TOLERANCE_HEIGHT_STATIC.value, 0.0, float),
+            modification_tolerance_angle=self._get_static_value(SCFacadeConfig2.MODIFICATION_TOLERANCE_ANGLE_STATIC.value, 0.0, float),
+        )
 
+    def _read_neutral_position_inputs(self) -> None:
+        """Read the neutral position of the shutter."""
         entity_id_facade_neutral_pos_height_manual = self.get_internal_entity_id(SCInternal.NEUTRAL_POS_HEIGHT_MANUAL)
         entity_id_facade_neutral_pos_height_value = (
             self._get_internal_entity_state_value(entity_id_facade_neutral_pos_height_manual, 0, float)
@@ -1535,38 +2031,60 @@ class ShadowControlManager:
             SCFacadeConfig2.NEUTRAL_POS_ANGLE_ENTITY.value, entity_id_facade_neutral_pos_angle_value, float
         )
 
-        self._facade_config.modification_tolerance_height = self._get_static_value(
-            SCFacadeConfig2.MODIFICATION_TOLERANCE_HEIGHT_STATIC.value, 0.0, float
-        )
-        self._facade_config.modification_tolerance_angle = self._get_static_value(
-            SCFacadeConfig2.MODIFICATION_TOLERANCE_ANGLE_STATIC.value, 0.0, float
-        )
+    def _read_brightness_inputs(self) -> None:
+        """Read the brightness values."""
+        self._dynamic_config.brightness = self._get_shared_input_value(SCDynamicInput.BRIGHTNESS_ENTITY, 0.0)
+        self._dynamic_config.brightness_dawn = self._get_shared_input_value(SCDynamicInput.BRIGHTNESS_DAWN_ENTITY, -1.0)
+
+    def _read_sun_position_inputs(self) -> None:
+        """Read the sun elevation and azimuth."""
+        if self._solar_engine is not None:
+            position = self._solar_engine.position()
+            self._dynamic_config.sun_elevation = position.elevation
+            self._dynamic_config.sun_azimuth = position.azimuth
+            return
 
-        # Dynamic Inputs (entity states or static values)
-        self._dynamic_config.brightness = self._get_entity_state_value(SCDynamicInput.BRIGHTNESS_ENTITY.value, 0.0, float)
-        self._dynamic_config.brightness_dawn = self._get_entity_state_value(SCDynamicInput.BRIGHTNESS_DAWN_ENTITY.value, -1.0, float)
+        # Read from attribute if sun.sun, else from state
+        self._dynamic_config.sun_elevation = self._get_shared_input_value(SCDynamicInput.SUN_ELEVATION_ENTITY, 0.0)
+        self._dynamic_config.sun_azimuth = self._get_shared_input_value(SCDynamicInput.SUN_AZIMUTH_ENTITY, 0.0)
+
+    def _get_shared_input_value(self, key: SCDynamicInput, default: float) -> float:
+        """Get the value of a sun or brightness entity, parsed once for all instances by the input hub."""
+        entity_id = self._config.get(key.value)
+        if not isinstance(entity_id, str) or entity_id in ("", "none"):
+            return default
 
-        # Sun elevation - read from attribute if sun.sun, else from state
-        self._dynamic_config.sun_elevation = self._get_entity_state_value(
-            SCDynamicInput.SUN_ELEVATION_ENTITY.value,
-            0.0,
-            float,
-            attribute_name="elevation",  # ← For sun.sun, read elevation attribute
+        value = self._input_hub.value(entity_id, SHARED_INPUT_ATTRIBUTES[key])
+        if value is None:
+            self.logger.debug("Entity '%s' is unavailable or has no numeric value. Using default: %s", entity_id, default)
+            return default
+        return value
+
+    def _read_sun_times_inputs(self) -> None:
+        """Read sunrise and sunset, which are used for the adaptive brightness threshold."""
+        sunrise_str = self._get_entity_state_value(
+            SCDynamicInput.SUNRISE_ENTITY.value,
+            None,
+            str,
         )
+        self._sunrise = dt_util.parse_datetime(sunrise_str) if sunrise_str else None
 
-        # Sun azimuth - read from attribute if sun.sun, else from state
-        self._dynamic_config.sun_azimuth = self._get_entity_state_value(
-            SCDynamicInput.SUN_AZIMUTH_ENTITY.value,
-            0.0,
-            float,
-            attribute_name="azimuth",  # ← For sun.sun, read azimuth attribute
+        sunset_str = self._get_entity_state_value(
+            SCDynamicInput.SUNSET_ENTITY.value,
+            None,
+            str,
         )
+        self._sunset = dt_util.parse_datetime(sunset_str) if sunset_str else None
 
+    def _read_shutter_position_inputs(self) -> None:
+        """Read the current shutter position from the optional position entities."""
         self._dynamic_config.shutter_current_height = self._get_entity_state_value(SCDynamicInput.SHUTTER_CURRENT_HEIGHT_ENTITY.value, -1.0, float)
         self._dynamic_config.shutter_current_angle = self._get_entity_state_value(SCDynamicInput.SHUTTER_CURRENT_ANGLE_ENTITY.value, -1.0, float)
 
+    def _read_lock_inputs(self) -> None:
+        """Read the lock switches and the lock position."""
         # =============================================================
-        # Get lock states and calculate overall integration lock state
+        # Get lock states, the overall integration lock state is calculated on every run
         # 1: Lock
         # 1.1: Get our own entity
         entity_id_lock = self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL)
@@ -1585,10 +2103,7 @@ class ShadowControlManager:
             SCDynamicInput.LOCK_INTEGRATION_WITH_POSITION_ENTITY.value, lock_integration_with_position, bool
         )
 
-        # 3: Calc overal lock state
-        self.current_lock_state = self._calculate_lock_state()
-
-        # 4: Get lock height and angle values
+        # 3: Get lock height and angle values
         entity_id_lock_height = self.get_internal_entity_id(SCInternal.LOCK_HEIGHT_MANUAL)
         lock_height_config_value = self._get_internal_entity_state_value(entity_id_lock_height, 0, float) if entity_id_lock_height else 0
         self._dynamic_config.lock_height = self._get_entity_state_value(SCDynamicInput.LOCK_HEIGHT_ENTITY.value, lock_height_config_value, float)
@@ -1599,10 +2114,8 @@ class ShadowControlManager:
         # End of lock states handling
         # =============================================================
 
-        self._handle_movement_restriction()
-
-        # self._enforce_position_update = self._get_entity_state_value(SCDynamicInput.ENFORCE_POSITIONING_ENTITY.value, False, bool)
-
+    def _read_shadow_inputs(self) -> None:
+        """Read the shadow control configuration."""
         # Shadow Control Inputs
         shadow_control_enabled_manual = self.get_internal_entity_id(SCInternal.SHADOW_CONTROL_ENABLED_MANUAL)
         shadow_control_enabled_value = (
@@ -1610,9 +2123,7 @@ class ShadowControlManager:
         )
         self._shadow_config.enabled = self._get_entity_state_value(SCShadowInput.CONTROL_ENABLED_ENTITY.value, shadow_control_enabled_value, bool)
 
-        # =============================================================
-        # Start of shadow brightness threshold calculation
-        # Shadow Brightness Threshold Winter
+        # Shadow Brightness Threshold - Winter
         shadow_brightness_threshold_winter_manual = self.get_internal_entity_id(SCInternal.SHADOW_BRIGHTNESS_THRESHOLD_WINTER_MANUAL)
         shadow_brightness_threshold_winter_value = (
             self._get_internal_entity_state_value(
@@ -1657,128 +2168,6 @@ class ShadowControlManager:
             self._shadow_config.brightness_threshold_minimal,
         )
 
-        # Calculate adaptive or static brightness threshold
-        if self._shadow_config.brightness_threshold_summer > self._shadow_config.brightness_threshold_winter:
-            # Adaptive brightness is enabled
-            # Create calculator once with latitude (only static config)
-            if not hasattr(self, "_adaptive_brightness_calculator") or self._adaptive_brightness_calculator is None:
-                self._adaptive_brightness_calculator = AdaptiveBrightnessCalculator(
-                    latitude=self.hass.config.latitude,
-                    logger=self.logger,
-                )
-                self.logger.info(
-                    "Adaptive brightness calculator initialized: latitude=%s (hemisphere: %s)",
-                    self.hass.config.latitude,
-                    "Southern" if self.hass.config.latitude < 0 else "Northern",
-                )
-
-            # Calculate current threshold
-            sunrise_str = self._get_entity_state_value(
-                SCDynamicInput.SUNRISE_ENTITY.value,
-                None,
-                str,
-            )
-            sunrise = dt_util.parse_datetime(sunrise_str) if sunrise_str else None
-
-            sunset_str = self._get_entity_state_value(
-                SCDynamicInput.SUNSET_ENTITY.value,
-                None,
-                str,
-            )
-            sunset = dt_util.parse_datetime(sunset_str) if sunset_str else None
-
-            # Only calculate if both sunrise and sunset are available
-            if sunrise and sunset:
-                now = dt_util.now()
-
-                # Convert all times to local timezone for consistent date comparison
-                # This is critical for users in timezones far from UTC (e.g., NZ = UTC+13)
-                # where sunrise/sunset entities might be in UTC but appear to be "tomorrow"
-                sunrise_local = dt_util.as_local(sunrise)
-                sunset_local = dt_util.as_local(sunset)
-
-                self.logger.debug(
-                    "Sun times before normalization: sunrise=%s (local: %s), sunset=%s (local: %s), now=%s",
-                    sunrise,
-                    sunrise_local,
-                    sunset,
-                    sunset_local,
-                    now,
-                )
-
-                # Handle sun_next_rising/sun_next_setting sensors
-                # These sensors always point to NEXT occurrence, so after sunset both are tomorrow
-                # We need to normalize both back to "today" to get today's sun period
-
-                # Normalize sunrise to "today" if it's currently showing as "tomorrow"
-                if sunrise_local.date() > now.date():
-                    self.logger.debug(
-                        "Sunrise is tomorrow (%s), adjusting to today by subtracting 1 day",
-                        sunrise_local.date(),
-                    )
-                    sunrise_local = sunrise_local - timedelta(days=1)
-
-                # Normalize sunset to "today" if it's currently showing as "tomorrow"
-                # This happens with sun_next_setting sensor after today's sunset has passed
-                if sunset_local.date() > now.date():
-                    self.logger.debug(
-                        "Sunset is tomorrow (%s), adjusting to today by subtracting 1 day",
-                        sunset_local.date(),
-                    )
-                    sunset_local = sunset_local - timedelta(days=1)
-
-                # Legacy normalization: Handle edge case where sunset is "yesterday"
-                # This can happen around midnight when sunset entity hasn't updated yet
-                # (Only relevant for non-next sensors)
-                if sunset_local.date() < now.date():
-                    self.logger.debug(
-                        "Sunset is yesterday (%s), adjusting to tomorrow by adding 1 day",
-                        sunset_local.date(),
-                    )
-                    sunset_local = sunset_local + timedelta(days=1)
-
-                self.logger.debug(
-                    "Sun times after normalization: sunrise=%s, sunset=%s",
-                    sunrise_local,
-                    sunset_local,
-                )
-
-                # Final validation: Sunset must be after sunrise
-                if sunset_local <= sunrise_local:
-                    self.logger.warning(
-                        "Invalid sun times after normalization: sunrise=%s, sunset=%s. Using static winter threshold.",
-                        sunrise_local,
-                        sunset_local,
-                    )
-                    self.brightness_threshold = self._shadow_config.brightness_threshold_winter
-                else:
-                    # Calculate threshold using local times
-                    self.brightness_threshold = self._adaptive_brightness_calculator.calculate_threshold(
-                        current_time=now,
-                        sunrise=sunrise_local,
-                        sunset=sunset_local,
-                        winter_lux=self._shadow_config.brightness_threshold_winter,
-                        summer_lux=self._shadow_config.brightness_threshold_summer,
-                        minimal=self._shadow_config.brightness_threshold_minimal,
-                        dawn_threshold=self._dawn_config.brightness_threshold,
-                    )
-            else:
-                self.logger.warning(
-                    "Adaptive brightness enabled but sunrise (%s) or sunset (%s) entity not configured or invalid. "
-                    "Using static winter threshold (%s).",
-                    sunrise,
-                    sunset,
-                    self._shadow_config.brightness_threshold_winter,
-                )
-                self.brightness_threshold = self._shadow_config.brightness_threshold_winter
-
-        else:
-            # Static brightness threshold (winter value is used)
-            self._adaptive_brightness_calculator = None
-            self.brightness_threshold = self._shadow_config.brightness_threshold_winter
-        # End of shadow brightness threshold calculation
-        # =============================================================
-
         # Shadow After Seconds
         shadow_after_seconds_manual = self.get_internal_entity_id(SCInternal.SHADOW_AFTER_SECONDS_MANUAL)
         shadow_after_seconds_value = (
@@ -1869,6 +2258,8 @@ class ShadowControlManager:
             SCShadowInput.ANGLE_AFTER_SUN_ENTITY.value, shadow_angle_after_sun_value, float
         )
 
+    def _read_dawn_inputs(self) -> None:
+        """Read the dawn control configuration."""
         # Dawn Control Inputs
         dawn_control_enabled_manual = self.get_internal_entity_id(SCInternal.DAWN_CONTROL_ENABLED_MANUAL)
         dawn_control_enabled_value = (
@@ -1977,6 +2368,8 @@ class ShadowControlManager:
             SCDawnInput.ANGLE_AFTER_DAWN_ENTITY.value, dawn_angle_after_dawn_value, float
         )
 
+    def _read_dawn_time_constraint_inputs(self) -> None:
+        """Read the dawn time constraints."""
         # Dawn time constraints
         open_not_before_manual = self.get_internal_entity_id(SCInternal.DAWN_OPEN_NOT_BEFORE_MANUAL)
         open_not_before_value = self._get_time_from_internal_entity(open_not_before_manual) if open_not_before_manual else None
@@ -1993,27 +2386,220 @@ class ShadowControlManager:
             default=None,
         )
 
-        self._schedule_dawn_time_constraint_triggers()
-
-        facade = _format_config_object_for_logging(self._facade_config, " -> Facade config: ")
-        dynamic = _format_config_object_for_logging(self._dynamic_config, " -> Dynamic config: ")
-        shadow = _format_config_object_for_logging(self._shadow_config, " -> Shadow config: ")
-        dawn = _format_config_object_for_logging(self._dawn_config, " -> Dawn config: ")
-        self.logger.debug("Updated input values:\n%s,\n%s,\n%s,\n%s", facade, dynamic, shadow, dawn)
+    def _update_brightness_threshold(self) -> None:
+        """Calculate the adaptive or static shadow brightness threshold."""
+        # Calculate adaptive or static brightness threshold
+        if self._shadow_config.brightness_threshold_summer > self._shadow_config.brightness_threshold_winter:
+            # Adaptive brightness is enabled
+            # Create calculator once with latitude (only static config)
+            if not hasattr(self, "_adaptive_brightness_calculator") or self._adaptive_brightness_calculator is None:
+                self._adaptive_brightness_calculator = AdaptiveBrightnessCalculator(
+                    latitude=self.hass.config.latitude,
+                    logger=self.logger,
+                )
+                self.logger.info(
+                    "Adaptive brightness calculator initialized: latitude=%s (hemisphere: %s)",
+                    self.hass.config.latitude,
+                    "Southern" if self.hass.config.latitude < 0 else "Northern",
+                )
 
-    @callback
-    async def _async_handle_input_change(self, event: Event | None) -> None:
-        """Handle changes to any relevant input entity for this specific cover."""
-        self.logger.debug("Input change detected. Event: %s", event)
+            # Calculate current threshold
+            sunrise = self._sunrise
+            sunset = self._sunset
 
-        await self.async_calculate_and_apply_cover_position(event)
+            # Only calculate if both sunrise and sunset are available
+            if sunrise and sunset:
+                now = dt_util.now()
 
-    async def async_calculate_and_apply_cover_position(self, event: Event | None) -> None:
-        """Calculate and apply cover and tilt position."""
-        self.logger.debug("=====================================================================")
-        self.logger.debug("Calculating and applying cover position, triggered by event: %s", event.data if event else "None")
+                sunrise_local, sunset_local = self._normalize_sun_times(sunrise, sunset, now)
 
-        await self._update_input_values()
+                # Final validation: Sunset must be after sunrise
+                if sunset_local <= sunrise_local:
+                    self.logger.warning(
+                        "Invalid sun times after normalization: sunrise=%s, sunset=%s. Using static winter threshold.",
+                        sunrise_local,
+                        sunset_local,
+                    )
+                    self.brightness_threshold = self._shadow_config.brightness_threshold_winter
+                else:
+                    # Calculate threshold using local times
+                    self.brightness_threshold = self._adaptive_brightness_calculator.calculate_threshold(
+                        current_time=now,
+                        sunrise=sunrise_local,
+                        sunset=sunset_local,
+                        winter_lux=self._shadow_config.brightness_threshold_winter,
+                        summer_lux=self._shadow_config.brightness_threshold_summer,
+                        minimal=self._shadow_config.brightness_threshold_minimal,
+                        dawn_threshold=self._dawn_config.brightness_threshold,
+                    )
+            else:
+                self.logger.warning(
+                    "Adaptive brightness enabled but sunrise (%s) or sunset (%s) entity not configured or invalid. "
+                    "Using static winter threshold (%s).",
+                    sunrise,
+                    sunset,
+                    self._shadow_config.brightness_threshold_winter,
+                )
+                self.brightness_threshold = self._shadow_config.brightness_threshold_winter
+
+        else:
+            # Static brightness threshold (winter value is used)
+            self._adaptive_brightness_calculator = None
+            self.brightness_threshold = self._shadow_config.brightness_threshold_winter
+
+    def _normalize_sun_times(
+        self, sunrise: datetime.datetime, sunset: datetime.datetime, now: datetime.datetime
+    ) -> tuple[datetime.datetime, datetime.datetime]:
+        """
+        Return sunrise and sunset of today in local time.
+
+        The result only changes with the sun time entities or the date, so it's reused until then.
+        """
+        key = (sunrise, sunset, now.date())
+        if self._normalized_sun_times is not None and self._normalized_sun_times[0] == key:
+            return self._normalized_sun_times[1]
+
+        # Convert all times to local timezone for consistent date comparison
+        # This is critical for users in timezones far from UTC (e.g., NZ = UTC+13)
+        # where sunrise/sunset entities might be in UTC but appear to be "tomorrow"
+        sunrise_local = dt_util.as_local(sunrise)
+        sunset_local = dt_util.as_local(sunset)
+
+        self.logger.debug(
+            "Sun times before normalization: sunrise=%s (local: %s), sunset=%s (local: %s), now=%s",
+            sunrise,
+            sunrise_local,
+            sunset,
+            sunset_local,
+            now,
+        )
+
+        # Handle sun_next_rising/sun_next_setting sensors
+        # These sensors always point to NEXT occurrence, so after sunset both are tomorrow
+        # We need to normalize both back to "today" to get today's sun period
+
+        # Normalize sunrise to "today" if it's currently showing as "tomorrow"
+        if sunrise_local.date() > now.date():
+            self.logger.debug(
+                "Sunrise is tomorrow (%s), adjusting to today by subtracting 1 day",
+                sunrise_local.date(),
+            )
+            sunrise_local = sunrise_local - timedelta(days=1)
+
+        # Normalize sunset to "today" if it's currently showing as "tomorrow"
+        # This happens with sun_next_setting sensor after today's sunset has passed
+        if sunset_local.date() > now.date():
+            self.logger.debug(
+                "Sunset is tomorrow (%s), adjusting to today by subtracting 1 day",
+                sunset_local.date(),
+            )
+            sunset_local = sunset_local - timedelta(days=1)
+
+        # Legacy normalization: Handle edge case where sunset is "yesterday"
+        # This can happen around midnight when sunset entity hasn't updated yet
+        # (Only relevant for non-next sensors)
+        if sunset_local.date() < now.date():
+            self.logger.debug(
+                "Sunset is yesterday (%s), adjusting to tomorrow by adding 1 day",
+                sunset_local.date(),
+            )
+            sunset_local = sunset_local + timedelta(days=1)
+
+        self.logger.debug(
+            "Sun times after normalization: sunrise=%s, sunset=%s",
+            sunrise_local,
+            sunset_local,
+        )
+
+        self._normalized_sun_times = (key, (sunrise_local, sunset_local))
+        return sunrise_local, sunset_local
+
+    @callback
+    async def _async_handle_input_change(self, event: Event | None) -> None:
+        """Handle changes to any relevant input entity for this specific cover."""
+        self.logger.debug("Input change detected. Event: %s", event)
+
+        await self.async_calculate_and_apply_cover_position(event)
+
+    async def async_calculate_and_apply_cover_position(self, event: Event | None, source: SCTriggerSource = SCTriggerSource.OTHER) -> None:
+        """Calculate and apply cover and tilt position, see async_calculate_for_events()."""
+        await self.async_calculate_for_events([event], source)
+
+    async def async_calculate_for_events(self, events: list[Event | None], source: SCTriggerSource = SCTriggerSource.OTHER) -> None:
+        """
+        Calculate and apply cover and tilt position once for all given trigger events.
+
+        Only one calculation runs at a time. Triggers arriving while a calculation is running are
+        collapsed into exactly one follow-up calculation, which reads the then current input values.
+        The source of the trigger is only used for the performance diagnostics.
+        """
+        self.performance_stats.record_trigger(source)
+        for event in events:
+            self._mark_trigger_input_groups_dirty(event, source)
+        if self._calculation_task is not None:
+            if self._calculation_task is asyncio.current_task():
+                # Nested trigger from within the running calculation (e.g. enforce positioning)
+                await self._async_timed_calculation_cycle(events)
+                return
+
+            # Keep the latest trigger per entity, so no lock or enable change gets lost
+            for event in events:
+                trigger_key = event.data.get("entity_id", event.event_type) if event else None
+                self._pending_calculation_triggers.pop(trigger_key, None)
+                self._pending_calculation_triggers[trigger_key] = event
+            self.performance_stats.record_collapsed_trigger()
+            self.logger.debug(
+                "Calculation already running, collapsing trigger(s) %s into follow-up calculation (%d of %d triggers collapsed so far)",
+                ", ".join(str(event.data) if event else "None" for event in events),
+                self.performance_stats.collapsed_triggers,
+                self.performance_stats.calculation_triggers,
+            )
+            # Return after the follow-up calculation, so callers like enforce positioning keep their flags until then
+            if self._calculation_follow_up is None:
+                self._calculation_follow_up = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self._calculation_follow_up)
+            return
+
+        self._calculation_task = asyncio.current_task()
+        try:
+            await self._async_timed_calculation_cycle(events)
+            while self._pending_calculation_triggers:
+                triggers = list(self._pending_calculation_triggers.values())
+                self._pending_calculation_triggers.clear()
+                follow_up, self._calculation_follow_up = self._calculation_follow_up, None
+                self.logger.debug("Running follow-up calculation for %d collapsed trigger(s)", len(triggers))
+                try:
+                    await self._async_timed_calculation_cycle(triggers)
+                finally:
+                    if follow_up is not None and not follow_up.done():
+                        follow_up.set_result(None)
+        finally:
+            self._calculation_task = None
+            # Don't leave waiters behind if a calculation failed
+            self._pending_calculation_triggers.clear()
+            if self._calculation_follow_up is not None and not self._calculation_follow_up.done():
+                self._calculation_follow_up.set_result(None)
+            self._calculation_follow_up = None
+
+    async def _async_timed_calculation_cycle(self, triggers: list[Event | None]) -> None:
+        """Run one calculation and record its duration."""
+        start = perf_counter()
+        try:
+            await self._async_calculation_cycle(triggers)
+        finally:
+            self.performance_stats.record_calculation(perf_counter() - start)
+
+    async def _async_calculation_cycle(self, triggers: list[Event | None]) -> None:
+        """Run one calculation for the given triggers with the current input values."""
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if self._debug_enabled:
+            self.logger.debug("=====================================================================")
+            self.logger.debug(
+                "Calculating and applying cover position, triggered by event(s): %s",
+                ", ".join(str(event.data) if event else "None" for event in triggers),
+            )
+
+        await self._update_input_values()
 
         # Also check here (not only in the cover state-change listener) so that a manual
         # movement stored during the positioning timer window (FALL A) is detected even
@@ -2023,242 +2609,312 @@ class ShadowControlManager:
         # preventing State 2 → State 3 transition.
         await self._check_positioning_completed()
 
-        shadow_handling_was_disabled = False
-        dawn_handling_was_disabled = False
-        force_immediate_positioning = False
-
-        if event:  # Check for real event (not None like at the initial run)
-            event_type = event.event_type
-            event_data = event.data
-
-            if event_type == "state_changed":
-                entity = event_data.get("entity_id")
-                old_state: State | None = event_data.get("old_state")
-                new_state: State | None = event_data.get("new_state")
-
-                self.logger.debug("State change for entity: %s", entity)
-                self.logger.debug("  Old state: %s", old_state.state if old_state else "None")
-                self.logger.debug("  New state: %s", new_state.state if new_state else "None")
-
-                entity_id_lock_manual = self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL)
-                entity_id_lock_with_position_manual = self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_WITH_POSITION_MANUAL)
-
-                # List of entities, which require immediate repositioning without any timer in between:
-                config_entities_requiring_immediate_positioning = [
-                    # Shadow configuration entities
-                    self._config.get(SCShadowInput.SHUTTER_MAX_HEIGHT_ENTITY.value),
-                    self._config.get(SCShadowInput.SHUTTER_MAX_ANGLE_ENTITY.value),
-                    self._config.get(SCShadowInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY.value),
-                    self._config.get(SCShadowInput.HEIGHT_AFTER_SUN_ENTITY.value),
-                    self._config.get(SCShadowInput.ANGLE_AFTER_SUN_ENTITY.value),
-                    # Dawn configuration entities
-                    self._config.get(SCDawnInput.SHUTTER_MAX_HEIGHT_ENTITY.value),
-                    self._config.get(SCDawnInput.SHUTTER_MAX_ANGLE_ENTITY.value),
-                    self._config.get(SCDawnInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY.value),
-                    self._config.get(SCDawnInput.HEIGHT_AFTER_DAWN_ENTITY.value),
-                    self._config.get(SCDawnInput.ANGLE_AFTER_DAWN_ENTITY.value),
-                    # Internal entities
-                    self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_MAX_HEIGHT_MANUAL),
-                    self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_MAX_ANGLE_MANUAL),
-                    self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL),
-                    self.get_internal_entity_id(SCInternal.SHADOW_HEIGHT_AFTER_SUN_MANUAL),
-                    self.get_internal_entity_id(SCInternal.SHADOW_ANGLE_AFTER_SUN_MANUAL),
-                    self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_MAX_HEIGHT_MANUAL),
-                    self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_MAX_ANGLE_MANUAL),
-                    self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL),
-                    self.get_internal_entity_id(SCInternal.DAWN_HEIGHT_AFTER_DAWN_MANUAL),
-                    self.get_internal_entity_id(SCInternal.DAWN_ANGLE_AFTER_DAWN_MANUAL),
-                    # Neutral position entities
-                    self._config.get(SCFacadeConfig2.NEUTRAL_POS_HEIGHT_ENTITY.value),
-                    self._config.get(SCFacadeConfig2.NEUTRAL_POS_ANGLE_ENTITY.value),
-                    self.get_internal_entity_id(SCInternal.NEUTRAL_POS_HEIGHT_MANUAL),
-                    self.get_internal_entity_id(SCInternal.NEUTRAL_POS_ANGLE_MANUAL),
-                ]
-
-                if entity in config_entities_requiring_immediate_positioning:
-                    # ✅ NEW: Check grace period FIRST (catches all restart scenarios)
-                    if self._is_in_ha_restart_grace_period():
-                        self.logger.info(
-                            "Configuration entity '%s' changed from %s to %s during HA restart grace period "
-                            "(within %ds of HA start). Skipping immediate positioning to prevent "
-                            "unnecessary shutter movement after restart.",
-                            entity,
-                            old_state.state if old_state else "None",
-                            new_state.state if new_state else "None",
-                            self._ha_restart_grace_period_seconds,
-                        )
-                        # Continue with normal processing (facade check, state processing)
-                        # but don't force immediate positioning
-
-                    # ✅ Skip if old_state is None (initial restore)
-                    elif old_state is None:
-                        self.logger.info(
-                            "Configuration entity '%s' initialized to %s (old_state is None) -> skipping immediate positioning",
-                            entity,
-                            new_state.state if new_state else "None",
-                        )
-                        # Don't set force_immediate_positioning
-                        # Continue with rest of method (facade check, state processing, etc.)
-                    # ✅ Skip if this is a state restore
-                    elif new_state and hasattr(new_state, "context") and new_state.context.id.startswith("restore_state"):
-                        self.logger.info(
-                            "Configuration entity '%s' restored to %s -> skipping immediate positioning",
-                            entity,
-                            new_state.state if new_state else "None",
-                        )
-                        # Don't set force_immediate_positioning
-                    else:
-                        # Normal processing after grace period
-                        # Check if any lock is currently active
-                        lock_active = self._dynamic_config.lock_integration or self._dynamic_config.lock_integration_with_position
-
-                        if lock_active:
-                            self.logger.info(
-                                "Configuration entity '%s' changed from %s to %s, "
-                                "but lock is active (simple: %s, with_position: %s) -> skipping immediate positioning",
-                                entity,
-                                old_state.state if old_state else "None",
-                                new_state.state if new_state else "None",
-                                self._dynamic_config.lock_integration,
-                                self._dynamic_config.lock_integration_with_position,
-                            )
-                            # Don't set force_immediate_positioning
-                        else:
-                            self.logger.info(
-                                "Configuration entity '%s' changed from %s to %s -> forcing immediate positioning",
-                                entity,
-                                old_state.state if old_state else "None",
-                                new_state.state if new_state else "None",
-                            )
-                            force_immediate_positioning = True
-
-                if entity == self._config.get(SCShadowInput.CONTROL_ENABLED_ENTITY.value):
-                    self.logger.info("Shadow control enable changed to %s", new_state.state)
-                    shadow_handling_was_disabled = new_state.state == "off"
-
-                elif entity == self._config.get(SCDawnInput.CONTROL_ENABLED_ENTITY.value):
-                    self.logger.info("Dawn control enable changed to %s", new_state.state)
-                    dawn_handling_was_disabled = new_state.state == "off"
-
-                elif entity == self._config.get(SCDynamicInput.LOCK_INTEGRATION_ENTITY.value) or entity == entity_id_lock_manual:
-                    if new_state.state == "off" and not self._dynamic_config.lock_integration_with_position:
-                        # Lock DISABLED
-                        self.logger.info("Simple lock was disabled -> waiting for next trigger to reposition")
-                        self._last_unlock_time = dt_util.utcnow()
-                        self._previous_shutter_height = self._height_during_lock_state
-                        self._previous_shutter_angle = self._angle_during_lock_state
-
-                        # Reset Auto-Lock Flag — skip during startup state restore
-                        if self._startup_restore_complete:
-                            self._locked_by_auto_lock = False
-
-                    elif new_state.state == "off" and self._dynamic_config.lock_integration_with_position:
-                        self.logger.info("Simple lock was disabled but lock with position is already enabled -> no position update")
-                    else:
-                        # Lock ENABLED manually by user
-                        self.logger.info("Simple lock enabled -> no position update, storing current position")
-                        self._height_during_lock_state = self._previous_shutter_height
-                        self._angle_during_lock_state = self._previous_shutter_angle
-
-                        self._locked_by_auto_lock = False
-
-                elif (
-                    entity == self._config.get(SCDynamicInput.LOCK_INTEGRATION_WITH_POSITION_ENTITY.value)
-                    or entity == entity_id_lock_with_position_manual
-                ):
-                    if new_state.state == "off" and not self._dynamic_config.lock_integration:
-                        # Lock with position DISABLED
-                        self.logger.info("Lock with position was disabled and simple lock already disabled")
-
-                        # Check if lock position differs from computed position by temporary caluculation
-                        # without real positioning of shutters
-                        temp_calculated_height = (
-                            self._calculate_shutter_height() if await self._check_if_facade_is_in_sun() else self._facade_config.neutral_pos_height
-                        )
-                        temp_calculated_angle = (
-                            self._calculate_shutter_angle() if await self._check_if_facade_is_in_sun() else self._facade_config.neutral_pos_angle
-                        )
-
-                        forced_height = self._dynamic_config.lock_height
-                        forced_angle = self._dynamic_config.lock_angle
-
-                        # Check if positions differ (with small tolerance)
-                        height_differs = abs(temp_calculated_height - forced_height) > 0.5
-                        angle_differs = abs(temp_calculated_angle - forced_angle) > 0.5
-
-                        if height_differs or angle_differs:
-                            self.logger.info(
-                                "Calculated position (%.1f%%, %.1f%%) differs from forced position (%.1f%%, %.1f%%) -> enforcing position update",
-                                temp_calculated_height,
-                                temp_calculated_angle,
-                                forced_height,
-                                forced_angle,
-                            )
-                            self._enforce_position_update = True
-                            self._previous_shutter_height = forced_height
-                            self._previous_shutter_angle = forced_angle
-                        else:
-                            self.logger.info(
-                                "Calculated position (%.1f%%, %.1f%%) equals forced position (%.1f%%, %.1f%%) -> no position update needed",
-                                temp_calculated_height,
-                                temp_calculated_angle,
-                                forced_height,
-                                forced_angle,
-                            )
-                            # Setze die previous-Werte trotzdem, damit bei der nächsten Änderung die Differenz korrekt berechnet wird
-                            self._previous_shutter_height = forced_height
-                            self._previous_shutter_angle = forced_angle
-
-                        # Reset auto-lock flag if both locks are disabled — skip during startup state restore
-                        if self._startup_restore_complete:
-                            self._locked_by_auto_lock = False
-
-                    elif new_state.state == "off" and self._dynamic_config.lock_integration:
-                        self.logger.info("Lock with position was disabled but simple lock already enabled -> no position update")
-                    else:
-                        # Lock with position ENABLED
-                        self.logger.info("Lock with position enabled -> storing current position and enforcing position update")
-                        self._enforce_position_update = True
-                        self._height_during_lock_state = self._dynamic_config.lock_height
-                        self._angle_during_lock_state = self._dynamic_config.lock_angle
-
-                        # This overwrites auto-lock
-                        # If lock-with-position, it's no longer auto-lock
-                        self._locked_by_auto_lock = False
-
-                elif entity == self._config.get(SCDynamicInput.ENFORCE_POSITIONING_ENTITY.value):
-                    # External enforce entity changed
-                    if new_state.state == "on":
-                        self.logger.debug("External enforce positioning entity triggered")
-                        # Async handling by separate method
-                        # This method calls async_trigger_enforce_positioning,
-                        # which reset the flag automatically at the end
-                        await self._handle_external_enforce_trigger()
-
-            elif event_type == "time_changed":
-                self.logger.info("Time changed event received")
-            else:
-                self.logger.debug("Unhandled event type: %s", event_type)
-        # else:
-        #     self.logger.info("No specific event data (likely initial run or manual trigger)")
+        action = SCTriggerAction.PROCESS_SHUTTER_STATE
+        for event in triggers:
+            if event:  # Check for real event (not None like at the initial run)
+                action = max(action, await self._async_handle_calculation_trigger(event))
+            # else:
+            #     self.logger.info("No specific event data (likely initial run or manual trigger)")
 
         await self._check_if_facade_is_in_sun()
 
-        if shadow_handling_was_disabled:
+        if action is SCTriggerAction.SHADOW_HANDLING_DISABLED:
             await self._shadow_handling_was_disabled()
-        elif dawn_handling_was_disabled:
+        elif action is SCTriggerAction.DAWN_HANDLING_DISABLED:
             await self._dawn_handling_was_disabled()
-        elif force_immediate_positioning:
+        elif action is SCTriggerAction.FORCE_IMMEDIATE_POSITIONING:
             await self._force_immediate_positioning()
         else:
             await self._process_shutter_state()
 
+        self._update_sun_horizon()
+
+    async def _async_handle_calculation_trigger(self, event: Event) -> SCTriggerAction:
+        """Handle the entity specific side effects of a trigger and return the required follow-up action."""
+        action = SCTriggerAction.PROCESS_SHUTTER_STATE
+        event_type = event.event_type
+        event_data = event.data
+
+        if event_type == "state_changed":
+            entity = event_data.get("entity_id")
+            old_state: State | None = event_data.get("old_state")
+            new_state: State | None = event_data.get("new_state")
+
+            self.logger.debug("State change for entity: %s", entity)
+            self.logger.debug("  Old state: %s", old_state.state if old_state else "None")
+            self.logger.debug("  New state: %s", new_state.state if new_state else "None")
+
+            if self._trigger_handlers is None:
+                self._build_trigger_dispatch()
+
+            if entity in self._immediate_positioning_entities:
+                action = self._get_immediate_positioning_action(entity, old_state, new_state)
+
+            trigger_handler = self._trigger_handlers.get(entity)
+            if trigger_handler is not None:
+                action = max(action, await trigger_handler(entity, old_state, new_state))
+
+        elif event_type == "time_changed":
+            self.logger.info("Time changed event received")
+        else:
+            self.logger.debug("Unhandled event type: %s", event_type)
+
+        return action
+
+    def _build_trigger_dispatch(self) -> None:
+        """Build the set of entities requiring immediate positioning and the entity specific trigger handlers."""
+        # List of entities, which require immediate repositioning without any timer in between:
+        config_entities_requiring_immediate_positioning = [
+            # Shadow configuration entities
+            self._config.get(SCShadowInput.SHUTTER_MAX_HEIGHT_ENTITY.value),
+            self._config.get(SCShadowInput.SHUTTER_MAX_ANGLE_ENTITY.value),
+            self._config.get(SCShadowInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY.value),
+            self._config.get(SCShadowInput.HEIGHT_AFTER_SUN_ENTITY.value),
+            self._config.get(SCShadowInput.ANGLE_AFTER_SUN_ENTITY.value),
+            # Dawn configuration entities
+            self._config.get(SCDawnInput.SHUTTER_MAX_HEIGHT_ENTITY.value),
+            self._config.get(SCDawnInput.SHUTTER_MAX_ANGLE_ENTITY.value),
+            self._config.get(SCDawnInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY.value),
+            self._config.get(SCDawnInput.HEIGHT_AFTER_DAWN_ENTITY.value),
+            self._config.get(SCDawnInput.ANGLE_AFTER_DAWN_ENTITY.value),
+            # Internal entities
+            self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_MAX_HEIGHT_MANUAL),
+            self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_MAX_ANGLE_MANUAL),
+            self.get_internal_entity_id(SCInternal.SHADOW_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL),
+            self.get_internal_entity_id(SCInternal.SHADOW_HEIGHT_AFTER_SUN_MANUAL),
+            self.get_internal_entity_id(SCInternal.SHADOW_ANGLE_AFTER_SUN_MANUAL),
+            self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_MAX_HEIGHT_MANUAL),
+            self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_MAX_ANGLE_MANUAL),
+            self.get_internal_entity_id(SCInternal.DAWN_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL),
+            self.get_internal_entity_id(SCInternal.DAWN_HEIGHT_AFTER_DAWN_MANUAL),
+            self.get_internal_entity_id(SCInternal.DAWN_ANGLE_AFTER_DAWN_MANUAL),
+            # Neutral position entities
+            self._config.get(SCFacadeConfig2.NEUTRAL_POS_HEIGHT_ENTITY.value),
+            self._config.get(SCFacadeConfig2.NEUTRAL_POS_ANGLE_ENTITY.value),
+            self.get_internal_entity_id(SCInternal.NEUTRAL_POS_HEIGHT_MANUAL),
+            self.get_internal_entity_id(SCInternal.NEUTRAL_POS_ANGLE_MANUAL),
+        ]
+        self._immediate_positioning_entities = frozenset(entity for entity in config_entities_requiring_immediate_positioning if entity)
+
+        # Entity specific handlers, ordered from lowest to highest precedence if an entity is used more than once
+        handlers_by_entity = [
+            (self._config.get(SCDynamicInput.ENFORCE_POSITIONING_ENTITY.value), self._async_handle_enforce_positioning_trigger),
+            (self._config.get(SCDynamicInput.LOCK_INTEGRATION_WITH_POSITION_ENTITY.value), self._async_handle_lock_with_position_trigger),
+            (self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_WITH_POSITION_MANUAL), self._async_handle_lock_with_position_trigger),
+            (self._config.get(SCDynamicInput.LOCK_INTEGRATION_ENTITY.value), self._async_handle_lock_trigger),
+            (self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL), self._async_handle_lock_trigger),
+            (self._config.get(SCDawnInput.CONTROL_ENABLED_ENTITY.value), self._async_handle_dawn_control_enabled_trigger),
+            (self._config.get(SCShadowInput.CONTROL_ENABLED_ENTITY.value), self._async_handle_shadow_control_enabled_trigger),
+        ]
+        self._trigger_handlers = {entity: handler for entity, handler in handlers_by_entity if entity}
+
+        # Lock changes must not wait for the coalescing window
+        self._coalescing_bypass_entities = frozenset(
+            entity_id
+            for entity_id in (
+                self._config.get(SCDynamicInput.LOCK_INTEGRATION_WITH_POSITION_ENTITY.value),
+                self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL),
+                self.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_WITH_POSITION_MANUAL),
+            )
+            if entity_id
+        )
+
+        self.logger.debug(
+            "Trigger dispatch built: %d entities requiring immediate positioning, %d entity specific handlers",
+            len(self._immediate_positioning_entities),
+            len(self._trigger_handlers),
+        )
+
+    def _get_immediate_positioning_action(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Check if the change of a configuration entity requires immediate positioning."""
+        # ✅ NEW: Check grace period FIRST (catches all restart scenarios)
+        if self._is_in_ha_restart_grace_period():
+            self.logger.info(
+                "Configuration entity '%s' changed from %s to %s during HA restart grace period "
+                "(within %ds of HA start). Skipping immediate positioning to prevent "
+                "unnecessary shutter movement after restart.",
+                entity,
+                old_state.state if old_state else "None",
+                new_state.state if new_state else "None",
+                self._ha_restart_grace_period_seconds,
+            )
+            # Continue with normal processing (facade check, state processing)
+            # but don't force immediate positioning
+
+        # ✅ Skip if old_state is None (initial restore)
+        elif old_state is None:
+            self.logger.info(
+                "Configuration entity '%s' initialized to %s (old_state is None) -> skipping immediate positioning",
+                entity,
+                new_state.state if new_state else "None",
+            )
+            # Don't set force_immediate_positioning
+            # Continue with rest of method (facade check, state processing, etc.)
+        # ✅ Skip if this is a state restore
+        elif new_state and hasattr(new_state, "context") and new_state.context.id.startswith("restore_state"):
+            self.logger.info(
+                "Configuration entity '%s' restored to %s -> skipping immediate positioning",
+                entity,
+                new_state.state if new_state else "None",
+            )
+            # Don't set force_immediate_positioning
+        else:
+            # Normal processing after grace period
+            # Check if any lock is currently active
+            lock_active = self._dynamic_config.lock_integration or self._dynamic_config.lock_integration_with_position
+
+            if lock_active:
+                self.logger.info(
+                    "Configuration entity '%s' changed from %s to %s, "
+                    "but lock is active (simple: %s, with_position: %s) -> skipping immediate positioning",
+                    entity,
+                    old_state.state if old_state else "None",
+                    new_state.state if new_state else "None",
+                    self._dynamic_config.lock_integration,
+                    self._dynamic_config.lock_integration_with_position,
+                )
+                # Don't set force_immediate_positioning
+            else:
+                self.logger.info(
+                    "Configuration entity '%s' changed from %s to %s -> forcing immediate positioning",
+                    entity,
+                    old_state.state if old_state else "None",
+                    new_state.state if new_state else "None",
+                )
+                return SCTriggerAction.FORCE_IMMEDIATE_POSITIONING
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
+    async def _async_handle_shadow_control_enabled_trigger(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Handle a change of the shadow control enabled entity."""
+        self.logger.info("Shadow control enable changed to %s", new_state.state)
+        if new_state.state == "off":
+            return SCTriggerAction.SHADOW_HANDLING_DISABLED
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
+    async def _async_handle_dawn_control_enabled_trigger(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Handle a change of the dawn control enabled entity."""
+        self.logger.info("Dawn control enable changed to %s", new_state.state)
+        if new_state.state == "off":
+            return SCTriggerAction.DAWN_HANDLING_DISABLED
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
+    async def _async_handle_lock_trigger(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Handle a change of the simple lock entities."""
+        if new_state.state == "off" and not self._dynamic_config.lock_integration_with_position:
+            # Lock DISABLED
+            self.logger.info("Simple lock was disabled -> waiting for next trigger to reposition")
+            self._last_unlock_time = dt_util.utcnow()
+            self._previous_shutter_height = self._height_during_lock_state
+            self._previous_shutter_angle = self._angle_during_lock_state
+            self._cover_output.async_reset_in_flight()
+
+            # Reset Auto-Lock Flag — skip during startup state restore
+            if self._startup_restore_complete:
+                self._locked_by_auto_lock = False
+
+        elif new_state.state == "off" and self._dynamic_config.lock_integration_with_position:
+            self.logger.info("Simple lock was disabled but lock with position is already enabled -> no position update")
+        else:
+            # Lock ENABLED manually by user
+            self.logger.info("Simple lock enabled -> no position update, storing current position")
+            self._height_during_lock_state = self._previous_shutter_height
+            self._angle_during_lock_state = self._previous_shutter_angle
+
+            self._locked_by_auto_lock = False
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
+    async def _async_handle_lock_with_position_trigger(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Handle a change of the lock with position entities."""
+        if new_state.state == "off" and not self._dynamic_config.lock_integration:
+            # Lock with position DISABLED
+            self.logger.info("Lock with position was disabled and simple lock already disabled")
+            self._cover_output.async_reset_in_flight()
+
+            # Check if lock position differs from computed position by temporary caluculation
+            # without real positioning of shutters
+            temp_calculated_height = (
+                self._calculate_shutter_height() if await self._check_if_facade_is_in_sun() else self._facade_config.neutral_pos_height
+            )
+            temp_calculated_angle = (
+                self._calculate_shutter_angle() if await self._check_if_facade_is_in_sun() else self._facade_config.neutral_pos_angle
+            )
+
+            forced_height = self._dynamic_config.lock_height
+            forced_angle = self._dynamic_config.lock_angle
+
+            # Check if positions differ (with small tolerance)
+            height_differs = abs(temp_calculated_height - forced_height) > 0.5
+            angle_differs = abs(temp_calculated_angle - forced_angle) > 0.5
+
+            if height_differs or angle_differs:
+                self.logger.info(
+                    "Calculated position (%.1f%%, %.1f%%) differs from forced position (%.1f%%, %.1f%%) -> enforcing position update",
+                    temp_calculated_height,
+                    temp_calculated_angle,
+                    forced_height,
+                    forced_angle,
+                )
+                self._enforce_position_update = True
+                self._previous_shutter_height = forced_height
+                self._previous_shutter_angle = forced_angle
+            else:
+                self.logger.info(
+                    "Calculated position (%.1f%%, %.1f%%) equals forced position (%.1f%%, %.1f%%) -> no position update needed",
+                    temp_calculated_height,
+                    temp_calculated_angle,
+                    forced_height,
+                    forced_angle,
+                )
+                # Setze die previous-Werte trotzdem, damit bei der nächsten Änderung die Differenz korrekt berechnet wird
+                self._previous_shutter_height = forced_height
+                self._previous_shutter_angle = forced_angle
+
+            # Reset auto-lock flag if both locks are disabled — skip during startup state restore
+            if self._startup_restore_complete:
+                self._locked_by_auto_lock = False
+
+        elif new_state.state == "off" and self._dynamic_config.lock_integration:
+            self.logger.info("Lock with position was disabled but simple lock already enabled -> no position update")
+        else:
+            # Lock with position ENABLED
+            self.logger.info("Lock with position enabled -> storing current position and enforcing position update")
+            self._enforce_position_update = True
+            self._height_during_lock_state = self._dynamic_config.lock_height
+            self._angle_during_lock_state = self._dynamic_config.lock_angle
+
+            # This overwrites auto-lock
+            # If lock-with-position, it's no longer auto-lock
+            self._locked_by_auto_lock = False
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
+    async def _async_handle_enforce_positioning_trigger(self, entity: str, old_state: State | None, new_state: State | None) -> SCTriggerAction:
+        """Handle a change of the external enforce positioning entity."""
+        # External enforce entity changed
+        if new_state.state == "on":
+            self.logger.debug("External enforce positioning entity triggered")
+            # Async handling by separate method
+            # This method calls async_trigger_enforce_positioning,
+            # which reset the flag automatically at the end
+            await self._handle_external_enforce_trigger()
+        return SCTriggerAction.PROCESS_SHUTTER_STATE
+
     async def _check_if_facade_is_in_sun(self) -> bool:
-        """Calculate if the sun illuminates the given facade."""
-        self.logger.debug("Checking if facade is in sun")
+        """
+        Calculate if the sun illuminates the given facade.
 
+        The result only depends on the sun position and the static facade configuration, so it
+        is calculated once per sun position and reused until the sun moves.
+        """
         sun_current_azimuth = self._dynamic_config.sun_azimuth
         sun_current_elevation = self._dynamic_config.sun_elevation
+
+        sun_facade_state = self._sun_facade_state
+        if sun_facade_state is not None and sun_facade_state.sun_position == (sun_current_azimuth, sun_current_elevation):
+            self._effective_elevation = sun_facade_state.effective_elevation
+            self.is_in_sun = sun_facade_state.is_in_sun
+            return self.is_in_sun
+
+        self.logger.debug("Checking if facade is in sun")
         facade_azimuth = self._facade_config.azimuth
         facade_offset_start = self._facade_config.offset_sun_in
         facade_offset_end = self._facade_config.offset_sun_out
@@ -2276,56 +2932,42 @@ class ShadowControlManager:
         ):
             self.logger.debug("Not all required values available to compute sun state of facade")
             self._effective_elevation = None
+            # Only results calculated from complete values are reused
+            self._sun_facade_state = None
             return False
 
-        sun_entry_angle = facade_azimuth - abs(facade_offset_start)
-        sun_exit_angle = facade_azimuth + abs(facade_offset_end)
-        if sun_entry_angle < 0:
-            sun_entry_angle = 360 - abs(sun_entry_angle)
-        if sun_exit_angle >= 360:
-            sun_exit_angle %= 360
-
-        sun_exit_angle_calc = sun_exit_angle - sun_entry_angle
-        if sun_exit_angle_calc < 0:
-            sun_exit_angle_calc += 360
-        azimuth_calc = sun_current_azimuth - sun_entry_angle
-        if azimuth_calc < 0:
-            azimuth_calc += 360
-        self.logger.debug(
-            "sun_entry_angle: %s, sun_exit_angle: %s, sun_exit_angle_calc: %s, azimuth_calc: %s",
-            sun_entry_angle,
-            sun_exit_angle,
-            sun_exit_angle_calc,
-            azimuth_calc,
-        )
+        sun_entry_angle, sun_exit_angle = calculate_sun_entry_exit_angles(facade_azimuth, facade_offset_start, facade_offset_end)
 
-        message = f"Finished facade check:\n -> Real azimuth {sun_current_azimuth}° and facade at {facade_azimuth}° -> "
-        _sun_between_offsets = False
-        if 0 <= azimuth_calc <= sun_exit_angle_calc:
-            message += f"IN sun (from {sun_entry_angle}° to {sun_exit_angle}°)"
-            _sun_between_offsets = True
+        _sun_between_offsets = is_sun_between_offsets(sun_current_azimuth, sun_entry_angle, sun_exit_angle)
+        if _sun_between_offsets:
             self._effective_elevation = await self._calculate_effective_elevation()
         else:
-            message += f"NOT IN sun (shadow side, at sun from {sun_entry_angle}° to {sun_exit_angle}°)"
             self._effective_elevation = None
 
-        effective_elevation_shortened = f"{self._effective_elevation:.1f}" if self._effective_elevation else "---"
-        message += f"\n -> Effective elevation {effective_elevation_shortened}° for given elevation of {sun_current_elevation:.1f}°"
         _is_elevation_in_range = False
+        if self._effective_elevation is not None:
+            _is_elevation_in_range = is_elevation_in_range(self._effective_elevation, min_elevation, max_elevation)
+            self._sun_between_min_max = _is_elevation_in_range
 
-        if self._effective_elevation is None:
-            _is_elevation_in_range = False
-            message += f" -> NOT IN min-max-range ({min_elevation}°-{max_elevation}°)"
-        elif min_elevation < self._effective_elevation < max_elevation:
-            message += f" -> IN min-max-range ({min_elevation}°-{max_elevation}°)"
-            self._sun_between_min_max = True
-            _is_elevation_in_range = True
-        else:
-            message += f" -> NOT IN min-max-range ({min_elevation}°-{max_elevation}°)"
-            self._sun_between_min_max = False
-        self.logger.debug("%s", message)
+        if self._debug_enabled:
+            self.logger.debug(
+                "Finished facade check:\n -> Real azimuth %s° and facade at %s° -> %s (%sfrom %s° to %s°)"
+                "\n -> Effective elevation %s° for given elevation of %.1f° -> %s min-max-range (%s°-%s°)",
+                sun_current_azimuth,
+                facade_azimuth,
+                "IN sun" if _sun_between_offsets else "NOT IN sun",
+                "" if _sun_between_offsets else "shadow side, at sun ",
+                sun_entry_angle,
+                sun_exit_angle,
+                f"{self._effective_elevation:.1f}" if self._effective_elevation else "---",
+                sun_current_elevation,
+                "IN" if _is_elevation_in_range else "NOT IN",
+                min_elevation,
+                max_elevation,
+            )
 
         self.is_in_sun = _sun_between_offsets and _is_elevation_in_range
+        self._sun_facade_state = SCSunFacadeState((sun_current_azimuth, sun_current_elevation), self.is_in_sun, self._effective_elevation)
         return self.is_in_sun
 
     def _get_current_brightness(self) -> float:
@@ -2349,15 +2991,7 @@ class ShadowControlManager:
         self.logger.debug("Current sun position (a:e): %s°:%s°, facade: %s°", sun_current_azimuth, sun_current_elevation, facade_azimuth)
 
         try:
-            virtual_depth = math.cos(math.radians(abs(sun_current_azimuth - facade_azimuth)))
-            virtual_height = math.tan(math.radians(sun_current_elevation))
-
-            # Prevent division by zero if virtual_depth if very small
-            if abs(virtual_depth) < 1e-9:
-                effective_elevation = 90.0 if virtual_height > 0 else -90.0
-            else:
-                effective_elevation = math.degrees(math.atan(virtual_height / virtual_depth))
-
+            effective_elevation = self._geometry_cache.effective_elevation(sun_current_azimuth, sun_current_elevation, facade_azimuth)
         except ValueError:
             self.logger.debug("Unable to compute effective elevation: Invalid input values")
             return None
@@ -2365,12 +2999,7 @@ class ShadowControlManager:
             self.logger.debug("Unable to compute effective elevation: Division by zero")
             return None
         else:
-            self.logger.debug(
-                "Virtual deep and height of the sun against the facade: %s, %s, effektive Elevation: %s",
-                virtual_depth,
-                virtual_height,
-                effective_elevation,
-            )
+            self.logger.debug("Effektive Elevation: %s", effective_elevation)
             return effective_elevation
 
     def _update_extra_state_attributes(self) -> None:
@@ -2400,6 +3029,7 @@ class ShadowControlManager:
                 self.logger.debug("Shadow handling was disabled, position shutter at neutral height")
                 self._cancel_timer()
                 self.current_shutter_state = ShutterState.NEUTRAL
+                self.performance_stats.record_state_transition()
                 self._update_extra_state_attributes()
             case ShutterState.NEUTRAL:
                 self.logger.debug("Shadow handling was disabled, but shutter already at neutral height. Nothing to do")
@@ -2420,6 +3050,7 @@ class ShadowControlManager:
                 self.logger.debug("Dawn handling was disabled, position shutter at neutral height")
                 self._cancel_timer()
                 self.current_shutter_state = ShutterState.NEUTRAL
+                self.performance_stats.record_state_transition()
                 self._update_extra_state_attributes()
             case ShutterState.NEUTRAL:
                 self.logger.debug("Dawn handling was disabled, but shutter already at neutral height. Nothing to do")
@@ -2505,49 +3136,39 @@ class ShadowControlManager:
             self.logger.warning("Cannot force immediate positioning - height or angle is None (state: %s)", self.current_shutter_state.name)
 
     async def _process_shutter_state(self) -> None:
-        """Process current shutter state and call corresponding handler functions."""
+        """
+        Process current shutter state by the transitions of the state machine.
+
+        Transitions are run iteratively until the state doesn't change anymore. Their guards are
+        evaluated against the snapshot of this cycle.
+        """
         self.logger.debug("Current shutter state (before processing): %s (%s)", self.current_shutter_state.name, self.current_shutter_state.value)
 
-        # If close_not_later_than is configured and reached, force any non-dawn state into
-        # DAWN_FULL_CLOSED so the dawn state machine takes over and keeps the cover closed
-        # until the normal dawn cycle (brightness-based) handles the morning opening.
-        # When the option is not configured, _check_dawn_close_time_constraint() returns False
-        # and existing behaviour is fully preserved.
-        _dawn_states = {
-            ShutterState.DAWN_NEUTRAL,
-            ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-            ShutterState.DAWN_FULL_CLOSED,
-            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-        }
-        if self._dawn_config.enabled and self._check_dawn_close_time_constraint() and self.current_shutter_state not in _dawn_states:
-            self.logger.info(
-                "Dawn close_not_later_than reached: overriding state %s → %s",
-                self.current_shutter_state.name,
-                ShutterState.DAWN_FULL_CLOSED.name,
-            )
-            self.current_shutter_state = ShutterState.DAWN_FULL_CLOSED
-            self._update_extra_state_attributes()
-            await self._process_shutter_state()
-            return
+        snapshot = await self._async_take_cycle_snapshot()
+        trace: list[tuple[ShutterState, ShutterState]] = []
 
-        handler_func = self._state_handlers.get(self.current_shutter_state)
-        new_shutter_state: ShutterState
+        for _ in range(STATE_MACHINE_MAX_HOPS):
+            current_state = self.current_shutter_state
+            new_shutter_state, snapshot = await self._async_run_state_transition(snapshot)
+            if new_shutter_state == current_state:
+                break
+            self.logger.info("State change from %s to %s", current_state.name, new_shutter_state.name)
 
-        if handler_func:
-            new_shutter_state = await handler_func()
-            if new_shutter_state is not None and new_shutter_state != self.current_shutter_state:
-                self.logger.info("State change from %s to %s", self.current_shutter_state.name, new_shutter_state.name)
-                self.current_shutter_state = new_shutter_state
-                self._update_extra_state_attributes()
-                self.logger.debug("Checking if there might be another change required")
-                await self._process_shutter_state()
-        else:
-            self.logger.debug("No specific handler for current state or locked. Current lock state: %s", self.current_lock_state.name)
-            self._cancel_timer()
+            self.current_shutter_state = new_shutter_state
+            trace.append((current_state, new_shutter_state))
+            self.performance_stats.record_state_transition()
             self._update_extra_state_attributes()
+            self.logger.debug("Checking if there might be another change required")
+        else:
+            self.logger.warning(
+                "State machine stopped after %d transitions without reaching a stable state: %s",
+                STATE_MACHINE_MAX_HOPS,
+                format_transition_trace(tuple(trace)),
+            )
 
+        if trace:
+            self.performance_stats.record_transition_trace(tuple(trace))
+            self.logger.debug("State transitions of this cycle: %s", format_transition_trace(tuple(trace)))
         self.logger.debug("New shutter state after processing: %s (%s)", self.current_shutter_state.name, self.current_shutter_state.value)
 
     async def _position_shutter(self, shutter_height_percent: float, shutter_angle_percent: float, stop_timer: bool) -> None:
@@ -2635,13 +3256,15 @@ class ShadowControlManager:
             self.logger.debug("Integration is locked (%s). Calculations are running, but physical outputs are skipped.", self.current_lock_state.name)
 
             if self.current_lock_state == LockState.LOCKED_MANUALLY_WITH_FORCED_POSITION:
-                for entity in self._target_cover_entity_id:
-                    current_cover_state: State | None = self.hass.states.get(entity)
-
-                    if not current_cover_state:
-                        self.logger.warning("Target cover entity '%s' not found. Cannot send commands.", entity)
-                        continue
+                # Update positioning reference before sending, so that cover movement toward forced position
+                # is correctly recognised as integration-triggered and not as manual movement.
+                self._last_calculated_height = self._dynamic_config.lock_height
+                self._last_calculated_angle = self._dynamic_config.lock_angle
+                if self._last_positioning_time is None or not self._is_positioning_in_progress():
+                    self._last_positioning_time = dt_util.utcnow()
 
+                cover_states = self._get_target_cover_states()
+                if cover_states:
                     shutter_height_percent = self._dynamic_config.lock_height
                     shutter_angle_percent = self._dynamic_config.lock_angle
                     self.used_shutter_height = shutter_height_percent
@@ -2652,25 +3275,14 @@ class ShadowControlManager:
                         shutter_height_percent,
                         shutter_angle_percent,
                     )
-                    try:
-                        await self.hass.services.async_call(
-                            "cover", "set_cover_position", {"entity_id": entity, "position": 100 - shutter_height_percent}, blocking=False
-                        )
-                    except Exception:
-                        self.logger.exception("Failed to set position:")
-                    try:
-                        await self.hass.services.async_call(
-                            "cover", "set_cover_tilt_position", {"entity_id": entity, "tilt_position": 100 - shutter_angle_percent}, blocking=False
-                        )
-                    except Exception:
-                        self.logger.exception("Failed to set tilt position:")
-
-                # Update positioning reference so that cover movement toward forced position
-                # is correctly recognised as integration-triggered and not as manual movement.
-                self._last_calculated_height = self._dynamic_config.lock_height
-                self._last_calculated_angle = self._dynamic_config.lock_angle
-                if self._last_positioning_time is None or not self._is_positioning_in_progress():
-                    self._last_positioning_time = dt_util.utcnow()
+                    # All covers get the forced position, independent of their features
+                    entity_ids = tuple(cover_states)
+                    self._cover_output.async_submit(
+                        [
+                            SCCoverCommand(SERVICE_SET_COVER_POSITION, entity_ids, 100 - shutter_height_percent, SCCommandPriority.FORCED),
+                            SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, entity_ids, 100 - shutter_angle_percent, SCCommandPriority.FORCED),
+                        ]
+                    )
 
             self._update_extra_state_attributes()
             async_dispatcher_send(self.hass, f"{DOMAIN}_update_{self.name.lower().replace(' ', '_')}")
@@ -2679,16 +3291,13 @@ class ShadowControlManager:
         # --- Phase 4: Apply stepping and output restriction logic (only if not initial run AND not locked) ---
         # Computation is done with the first configured shutter
         entity = self._target_cover_entity_id[0]
-        current_cover_state: State | None = self.hass.states.get(entity)
+        cover_states = self._get_target_cover_states()
 
-        if not current_cover_state:
-            self.logger.warning("Target cover entity '%s' not found. Cannot send commands.", entity)
+        if entity not in cover_states:
             return
 
-        supported_features = current_cover_state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
-
-        has_pos_service = self.hass.services.has_service("cover", "set_cover_position")
-        has_tilt_service = self.hass.services.has_service("cover", "set_cover_tilt_position")
+        has_pos_service = self.hass.services.has_service("cover", SERVICE_SET_COVER_POSITION)
+        has_tilt_service = self.hass.services.has_service("cover", SERVICE_SET_COVER_TILT_POSITION)
 
         self.logger.debug("Services availability (%s): set_cover_position=%s, set_cover_tilt_position=%s", entity, has_pos_service, has_tilt_service)
 
@@ -2723,76 +3332,67 @@ class ShadowControlManager:
             abs(self.used_shutter_angle - self._previous_shutter_angle) > 0.001 if self._previous_shutter_angle is not None else True
         ) or height_calculated_different_from_previous
 
-        if self._enforce_position_update:
+        enforce_position_update = self._enforce_position_update
+        if enforce_position_update:
             self.logger.debug("Enforcing position update")
             send_height_command = True
             send_angle_command = True
             self._enforce_position_update = False  # Reset enforce positioning flag
 
-        # Position all configured shutters
-        for entity in self._target_cover_entity_id:
-            current_cover_state: State | None = self.hass.states.get(entity)
+        # Position all configured shutters, covers with the same features are moved with one service call
+        commands: list[SCCoverCommand] = []
+        priority = SCCommandPriority.FORCED if enforce_position_update else SCCommandPriority.REGULAR
 
-            if not current_cover_state:
-                self.logger.warning("Target cover entity '%s' not found. Cannot send commands.", entity)
-                continue
+        # Height positioning
+        if send_height_command:
+            position_entities, other_entities = split_covers_by_feature(cover_states, CoverEntityFeature.SET_POSITION)
+            if not has_pos_service:
+                position_entities, other_entities = (), tuple(cover_states)
+            if position_entities:
+                self.logger.debug(
+                    "Setting position to %.1f%% (current: %s) for entity_id(s) %s.",
+                    self.used_shutter_height,
+                    self._previous_shutter_height,
+                    ", ".join(position_entities),
+                )
+                commands.append(SCCoverCommand(SERVICE_SET_COVER_POSITION, position_entities, 100 - self.used_shutter_height, priority))
+            if other_entities:
+                self.logger.debug(
+                    "Skipping position set for entity_id(s) %s. Position not supported or service not found (Service Found: %s).",
+                    ", ".join(other_entities),
+                    has_pos_service,
+                )
+        else:
+            self.logger.debug(
+                "Height '%.2f%%' for entity_id(s) %s not sent, value was the same or restricted.", self.used_shutter_height, ", ".join(cover_states)
+            )
 
-            # Height positioning
-            if send_height_command:
-                if (supported_features & CoverEntityFeature.SET_POSITION) and has_pos_service:
+        # Angle positioning
+        if self._facade_config.shutter_type is not ShutterType.MODE3:
+            if send_angle_command:
+                tilt_entities, other_entities = split_covers_by_feature(cover_states, CoverEntityFeature.SET_TILT_POSITION)
+                if not has_tilt_service:
+                    tilt_entities, other_entities = (), tuple(cover_states)
+                if tilt_entities:
                     self.logger.debug(
-                        "Setting position to %.1f%% (current: %s) for entity_id %s.", self.used_shutter_height, self._previous_shutter_height, entity
+                        "Setting tilt position to %.1f%% (current: %s) for entity_id(s) %s.",
+                        self.used_shutter_angle,
+                        self._previous_shutter_angle,
+                        ", ".join(tilt_entities),
                     )
-                    try:
-                        await self.hass.services.async_call(
-                            "cover", "set_cover_position", {"entity_id": entity, "position": 100 - self.used_shutter_height}, blocking=False
-                        )
-                    except Exception:
-                        self.logger.exception("Failed to set position:")
-                else:
+                    commands.append(SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, tilt_entities, 100 - self.used_shutter_angle, priority))
+                if other_entities:
                     self.logger.debug(
-                        "Skipping position set. Supported: %s, Service Found: %s.",
-                        supported_features & CoverEntityFeature.SET_POSITION,
-                        has_pos_service,
+                        "Skipping tilt set for entity_id(s) %s. Tilt position not supported or service not found (Service Found: %s).",
+                        ", ".join(other_entities),
+                        has_tilt_service,
                     )
             else:
-                self.logger.debug("Height '%.2f%%' for entity_id %s not sent, value was the same or restricted.", self.used_shutter_height, entity)
-
-            # Angle positioning
-            if self._facade_config.shutter_type is not ShutterType.MODE3:
-                if send_angle_command:
-                    if (supported_features & CoverEntityFeature.SET_TILT_POSITION) and has_tilt_service:
-                        self.logger.debug(
-                            "Setting tilt position to %.1f%% (current: %s) for entity_id %s.",
-                            self.used_shutter_angle,
-                            self._previous_shutter_angle,
-                            entity,
-                        )
-                        try:
-                            await self.hass.services.async_call(
-                                "cover",
-                                "set_cover_tilt_position",
-                                {"entity_id": entity, "tilt_position": 100 - self.used_shutter_angle},
-                                blocking=False,
-                            )
-                        except Exception:
-                            self.logger.exception("Failed to set tilt position:")
-                    else:
-                        self.logger.debug(
-                            "Skipping tilt set. Supported: %s, Service Found: %s.",
-                            supported_features & CoverEntityFeature.SET_TILT_POSITION,
-                            has_tilt_service,
-                        )
-                else:
-                    self.logger.debug("Angle '%.2f%%' for entity_id %s not sent, value was the same or restricted.", self.used_shutter_angle, entity)
-
-        self._previous_shutter_height = self.used_shutter_height
-        self._previous_shutter_angle = self.used_shutter_angle
-        self.used_shutter_angle_degrees = self._convert_shutter_angle_percent_to_degrees(self.used_shutter_angle)
-
-        # Always update HA state at the end to reflect the latest internal calculated values and attributes
-        self._update_extra_state_attributes()
+                self.logger.debug(
+                    "Angle '%.2f%%' for entity_id(s) %s not sent, value was the same or restricted.", self.used_shutter_angle, ", ".join(cover_states)
+                )
 
+        # Updated before sending, as the state changes of the moving covers may arrive before the service calls returned
         if send_height_command or send_angle_command:
             self._last_positioning_time = dt_util.utcnow()
             self._last_calculated_height = self.used_shutter_height
@@ -2805,8 +3405,55 @@ class ShadowControlManager:
                 self._last_positioning_time,
             )
 
+        # The commands are sent in the background, the calculation doesn't wait for the cover services
+        self._cover_output.async_submit(commands, force=enforce_position_update)
+
+        self._previous_shutter_height = self.used_shutter_height
+        self._previous_shutter_angle = self.used_shutter_angle
+        self.used_shutter_angle_degrees = self._convert_shutter_angle_percent_to_degrees(self.used_shutter_angle)
+
+        # Always update HA state at the end to reflect the latest internal calculated values and attributes
+        self._update_extra_state_attributes()
+
         self.logger.debug("_position_shutter finished.")
 
+    def _get_target_cover_states(self) -> dict[str, State]:
+        """Return the states of the configured covers, covers without state are logged and skipped."""
+        cover_states: dict[str, State] = {}
+        for entity in self._target_cover_entity_id:
+            current_cover_state: State | None = self.hass.states.get(entity)
+            if not current_cover_state:
+                self.logger.warning("Target cover entity '%s' not found. Cannot send commands.", entity)
+                continue
+            cover_states[entity] = current_cover_state
+        return cover_states
+
+    async def _async_send_cover_command(self, command: SCCoverCommand) -> None:
+        """Queue the command at the command scheduler and wait, until it was sent to all its covers."""
+        await self._command_scheduler.async_submit(command.priority, len(command.entity_ids), partial(self._async_call_cover_service, command))
+
+    async def _async_call_cover_service(self, command: SCCoverCommand) -> None:
+        """Send the command released by the command scheduler to all its covers with a single service call."""
+        self.performance_stats.record_cover_service_call()
+        # Delayed by the min interval or the command scheduler, the covers start moving only now, so the
+        # manual movement detection measures the max movement duration from here
+        self._last_positioning_time = dt_util.utcnow()
+        # Blocking, so failing covers are detected and the tilt follows the completed position call
+        await self.hass.services.async_call("cover", command.service, command.service_data, blocking=True)
+
+    async def _async_dispatch_cover_commands(self, commands: list[SCCoverCommand]) -> SCCoverDispatchResult | None:
+        """Send the commands of a positioning run concurrently, report failing covers and return the result."""
+        if not commands:
+            return None
+        result = await async_dispatch_cover_commands(self._async_send_cover_command, commands)
+        self.performance_stats.record_cover_dispatch(result.duration, len(result.failures))
+        for failure in result.failures:
+            self.logger.error("Failed to call %s for %s: %s", failure.service, failure.entity_id, failure.error, exc_info=failure.error)
+        self.logger.debug(
+            "Dispatched %d service call(s) in %.1f ms, %d cover command(s) failed", result.service_calls, result.duration * 1000, len(result.failures)
+        )
+        return result
+
     def _calculate_shutter_height(self) -> float:
         """Calculate shutter height based on sun position and shadow area configuration."""
         # Returns height in percent (0-100).
@@ -2837,39 +3484,17 @@ class ShadowControlManager:
             return shutter_height_to_set_percent
 
         if width_of_light_strip != 0:
-            # PHP's deg2rad equates to math.radians
-            # PHP's tan equates math.tan
-            shutter_height_from_bottom_raw = width_of_light_strip * math.tan(math.radians(elevation))
-
-            # PHP's round is usually 'trading round' (round up 0.5).
-            # Python's round() rounds to next even number at 0.5 ('bankers rounding').
-            # For traders round one would need to use math.floor(x + 0.5) or decimal.
-            # For the shutter position, the difference would be minimal, so we're using round().
-            shutter_height_from_bottom = round(shutter_height_from_bottom_raw)
-
-            # PHP: 100 - round($shutterHeightToSet * 100 / $shutterOverallHeight);
-            new_shutter_height = 100 - round((shutter_height_from_bottom * 100) / shutter_overall_height)
-
-            if new_shutter_height < shadow_max_height_percent:
-                shutter_height_to_set_percent = new_shutter_height
-                self.logger.debug(
-                    "Elevation: %s°, Height: %s, Light strip width: %s, Resulting shutter height: %s (%s%%). Is smaller than max height",
-                    elevation,
-                    shutter_overall_height,
-                    width_of_light_strip,
-                    shutter_height_from_bottom,
-                    shutter_height_to_set_percent,
-                )
-            else:
-                self.logger.debug(
-                    "Elevation: %s°, Height: %s, Light strip width: %s, Resulting shutter height (%s%%) is bigger or equal than given max "
-                    "height (%s%%). Using max height",
-                    elevation,
-                    shutter_overall_height,
-                    width_of_light_strip,
-                    new_shutter_height,
-                    shadow_max_height_percent,
-                )
+            shutter_height_to_set_percent = self._geometry_cache.shutter_height(
+                elevation, width_of_light_strip, shutter_overall_height, shadow_max_height_percent
+            )
+            self.logger.debug(
+                "Elevation: %s°, Height: %s, Light strip width: %s, Resulting shutter height: %s%% (max height: %s%%)",
+                elevation,
+                shutter_overall_height,
+                width_of_light_strip,
+                shutter_height_to_set_percent,
+                shadow_max_height_percent,
+            )
         else:
             self.logger.debug("width_of_light_strip is 0. No height calculation required. Using default height %s%%.", shutter_height_to_set_percent)
 
@@ -2886,19 +3511,15 @@ class ShadowControlManager:
             return calculated_height_percent
 
         # Only apply stepping if the stepping value is not zero and height is not yet a multiple of the stepping
-        if shutter_stepping_percent != 0:
-            remainder = calculated_height_percent % shutter_stepping_percent
-            if remainder != 0:
-                # Example: 10% stepping, current height 23%. remainder = 3.
-                # 23 + 10 - 3 = 30. (Rounds up to the next full step).
-                adjusted_height = calculated_height_percent + shutter_stepping_percent - remainder
-                self.logger.debug(
-                    "Adjusting shutter height from %.2f%% to %.2f%% (stepping: %.2f%%).",
-                    calculated_height_percent,
-                    adjusted_height,
-                    shutter_stepping_percent,
-                )
-                return adjusted_height
+        adjusted_height = apply_stepping(calculated_height_percent, shutter_stepping_percent)
+        if adjusted_height != calculated_height_percent:
+            self.logger.debug(
+                "Adjusting shutter height from %.2f%% to %.2f%% (stepping: %.2f%%).",
+                calculated_height_percent,
+                adjusted_height,
+                shutter_stepping_percent,
+            )
+            return adjusted_height
 
         self.logger.debug("Shutter height %.2f%% fits stepping or stepping is 0. No adjustment.", calculated_height_percent)
         return calculated_height_percent
@@ -2949,117 +3570,38 @@ class ShadowControlManager:
             )
             return 0.0  # Default if values missing
 
-        # ==============================
-        # Math based on oblique triangle
-
-        # The sun hits the facade at a relative azimuth angle. This reduces the
-        # effective slat width as seen from the sun's perspective, requiring a
-        # steeper slat angle to block direct sunlight.
-        # effective_slat_width = slat_width * cos(relative_azimuth)
-        relative_azimuth_deg = abs(azimuth - facade_azimuth)
-        # Normalize to 0-90° range (facade is in sun, so max offset is 90°)
-        if relative_azimuth_deg > 90:
-            relative_azimuth_deg = 90.0
-        effective_slat_width = given_shutter_slat_width * math.cos(math.radians(relative_azimuth_deg))
+        if shutter_type not in (ShutterType.MODE1, ShutterType.MODE2):
+            self.logger.warning("Unknown shutter type '%s'. Using default (mode1, 90°)", shutter_type)
 
-        self.logger.debug(
-            "Relative azimuth: %s°, effective slat width: %s mm (given: %s mm)",
-            relative_azimuth_deg,
-            round(effective_slat_width, 1),
-            given_shutter_slat_width,
+        # Math based on oblique triangle, see geometry.calculate_shutter_angle()
+        shutter_angle_percent = self._geometry_cache.shutter_angle(
+            azimuth, effective_elevation, facade_azimuth, given_shutter_slat_width, shutter_slat_distance, shutter_type
         )
-
-        # Fallback: if effective_slat_width is near zero (sun nearly parallel to facade),
-        # use given_shutter_slat_width to avoid division by zero / extreme values
-        if effective_slat_width < 1e-6:
+        if shutter_angle_percent is None:
             self.logger.warning(
-                "Effective slat width near zero (%s mm), falling back to given slat width (%s mm)",
-                effective_slat_width,
+                "Slat geometry can't block the sun (slat_width=%smm, slat_distance=%smm, effective_elevation=%s°). Unable to compute angle, "
+                "returning 0.0",
                 given_shutter_slat_width,
-            )
-            effective_slat_width = given_shutter_slat_width
-
-        # $alpha is the opposite angle of shutter slat width, so this is the difference
-        # between effectiveElevation and vertical
-        alpha_deg = 90 - effective_elevation
-        alpha_rad = math.radians(alpha_deg)
-
-        # $beta is the opposite angle of shutter slat distance
-        # First try with azimuth-corrected effective_slat_width
-        asin_arg = (math.sin(alpha_rad) * shutter_slat_distance) / effective_slat_width
-
-        # Check if azimuth correction leads to impossible geometry (asin_arg > 1.0)
-        # This happens when effective_slat_width < slat_distance due to oblique sun angle
-        if asin_arg > 1.0:
-            self.logger.warning(
-                "Azimuth correction leads to impossible geometry (asin_arg=%.3f, "
-                "effective_slat_width=%smm < slat_distance=%smm). "
-                "Falling back to original slat width without azimuth correction.",
-                asin_arg,
-                round(effective_slat_width, 1),
                 shutter_slat_distance,
-            )
-            # Retry with original slat width (no azimuth correction)
-            asin_arg = (math.sin(alpha_rad) * shutter_slat_distance) / given_shutter_slat_width
-
-        if not (-1 <= asin_arg <= 1):
-            self.logger.warning(
-                "Argument for asin() out of valid range (-1 <= arg <= 1). Current value: %s. Unable to compute angle, returning 0.0", asin_arg
+                effective_elevation,
             )
             return 0.0
 
-        beta_rad = math.asin(asin_arg)
-        beta_deg = math.degrees(beta_rad)
-
-        # $gamma is the angle between vertical and shutter slat
-        gamma_deg = 180 - alpha_deg - beta_deg
-
-        # $shutterAnglePercent is the difference between horizontal and shutter slat,
-        # so this is the result of the calculation
-        shutter_angle_degrees = round(90 - gamma_deg)
-
         self.logger.debug(
-            "Elevation/azimuth: %s°/%s°, resulting effective elevation and shutter angle: %s°/%s° (without stepping and offset)",
+            "Elevation/azimuth: %s°/%s°, resulting effective elevation and shutter angle: %s°/%s%% (without stepping and offset)",
             elevation,
             azimuth,
-            effective_elevation,
-            shutter_angle_degrees,
-        )
-
-        shutter_angle_percent: float
-        if shutter_type == ShutterType.MODE1:
-            shutter_angle_percent = shutter_angle_degrees / 0.9
-        elif shutter_type == ShutterType.MODE2:
-            shutter_angle_percent = shutter_angle_degrees / 1.8 + 50
-        else:
-            self.logger.warning("Unknown shutter type '%s'. Using default (mode1, 90°)", shutter_type)
-            shutter_angle_percent = shutter_angle_degrees / 0.9  # Standardverhalten
-
-        # Make sure, the angle will not be lower than 0
-        if shutter_angle_percent < 0:
-            shutter_angle_percent = 0.0
-
-        # Round before stepping
-        shutter_angle_percent_rounded_for_stepping = round(shutter_angle_percent)
-
-        shutter_angle_percent_with_stepping = self._handle_shutter_angle_stepping(shutter_angle_percent_rounded_for_stepping)
-
-        shutter_angle_percent_with_stepping += shutter_angle_offset
-
-        if shutter_angle_percent_with_stepping < min_shutter_angle_percent:
-            final_shutter_angle_percent = min_shutter_angle_percent
-            self.logger.debug("Limiting angle to min: %s%%", min_shutter_angle_percent)
-        elif shutter_angle_percent_with_stepping > max_shutter_angle_percent:
-            final_shutter_angle_percent = max_shutter_angle_percent
-            self.logger.debug("Limiting angle to max: %s%%", max_shutter_angle_percent)
-        else:
-            final_shutter_angle_percent = shutter_angle_percent_with_stepping
+            effective_elevation,
+            shutter_angle_percent,
+        )
 
-        # Round final angle
-        final_shutter_angle_percent = round(final_shutter_angle_percent)
+        shutter_angle_percent_with_stepping = self._handle_shutter_angle_stepping(shutter_angle_percent)
+        final_shutter_angle_percent = limit_shutter_angle(
+            shutter_angle_percent_with_stepping, shutter_angle_offset, min_shutter_angle_percent, max_shutter_angle_percent
+        )
 
         self.logger.debug("Resulting shutter angle with offset and stepping: %s%%", final_shutter_angle_percent)
-        return float(final_shutter_angle_percent)
+        return final_shutter_angle_percent
 
     def _handle_shutter_angle_stepping(self, calculated_angle_percent: float) -> float:
         """Modify shutter angle according to configured minimal stepping."""
@@ -3077,18 +3619,15 @@ class ShadowControlManager:
         # if ($shutterSteppingPercent != 0 && ($shutterAnglePercent % $shutterSteppingPercent) != 0) {
         #    $shutterAnglePercent = $shutterAnglePercent + $shutterSteppingPercent - ($shutterAnglePercent % $shutterSteppingPercent);
         # }
-
-        if shutter_stepping_percent != 0:
-            remainder = calculated_angle_percent % shutter_stepping_percent
-            if remainder != 0:
-                adjusted_angle = calculated_angle_percent + shutter_stepping_percent - remainder
-                self.logger.debug(
-                    "Adjusting shutter height from %.2f%% to %.2f%% (stepping: %.2f%%).",
-                    calculated_angle_percent,
-                    adjusted_angle,
-                    shutter_stepping_percent,
-                )
-                return adjusted_angle
+        adjusted_angle = apply_stepping(calculated_angle_percent, shutter_stepping_percent)
+        if adjusted_angle != calculated_angle_percent:
+            self.logger.debug(
+                "Adjusting shutter height from %.2f%% to %.2f%% (stepping: %.2f%%).",
+                calculated_angle_percent,
+                adjusted_angle,
+                shutter_stepping_percent,
+            )
+            return adjusted_angle
 
         self.logger.debug("Shutter height %.2f%% fits stepping or stepping is 0. No adjustment.", calculated_angle_percent)
         return calculated_angle_percent
@@ -3096,1089 +3635,112 @@ class ShadowControlManager:
     # #######################################################################
     # State handling starts here
     #
-    # =======================================================================
-    # State SHADOW_FULL_CLOSE_TIMER_RUNNING
-    async def _handle_state_shadow_full_close_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_FULL_CLOSE_TIMER_RUNNING")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._dynamic_config.brightness
-            shadow_threshold_close = self.brightness_threshold
-            if current_brightness is not None and shadow_threshold_close is not None and current_brightness > shadow_threshold_close:
-                if self._is_timer_finished():
-                    target_height = self._calculate_shutter_height()
-                    target_angle = self._calculate_shutter_angle()
-                    if target_height is not None and target_angle is not None:
-                        await self._position_shutter(
-                            target_height,
-                            target_angle,
-                            stop_timer=True,
-                        )
-                        self.logger.debug(
-                            "State %s (%s): Timer finished, brightness above threshold, moving to shadow position (%s%%, %s%%). Next state: %s",
-                            ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                            ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-                            target_height,
-                            target_angle,
-                            ShutterState.SHADOW_FULL_CLOSED,
-                        )
-                        return ShutterState.SHADOW_FULL_CLOSED
-                    self.logger.debug(
-                        "State %s (%s): Error within calculation of height a/o angle, staying at %s",
-                        ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                        ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-                        ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                    )
-                    return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
-                self.logger.debug(
-                    "State %s (%s): Waiting for timer (Brightness big enough)",
-                    ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                    ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-                )
-                return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Brightness (%s) not above threshold (%s), transitioning to %s",
-                ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-                current_brightness,
-                shadow_threshold_close,
-                ShutterState.SHADOW_NEUTRAL,
-            )
-            self._cancel_timer()
-            return ShutterState.SHADOW_NEUTRAL
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in the sun or shadow mode disabled, transitioning to (%s%%, %s%%) with state %s",
-                ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-            ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State SHADOW_FULL_CLOSED
-    async def _handle_state_shadow_full_closed(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_FULL_CLOSED")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            shadow_open_slat_delay = self._shadow_config.shutter_look_through_seconds
-            if (
-                current_brightness is not None
-                and shadow_threshold_close is not None
-                and shadow_open_slat_delay is not None
-                and current_brightness < shadow_threshold_close
-            ):
-                self.logger.debug(
-                    "State %s (%s): Brightness (%s) below threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.SHADOW_FULL_CLOSED,
-                    ShutterState.SHADOW_FULL_CLOSED.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    shadow_open_slat_delay,
-                )
-                await self._start_timer(shadow_open_slat_delay)
-                return ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Brightness not below threshold, recalculating shadow position",
-                ShutterState.SHADOW_FULL_CLOSED,
-                ShutterState.SHADOW_FULL_CLOSED.name,
-            )
-            target_height = self._calculate_shutter_height()
-            target_angle = self._calculate_shutter_angle()
-            if target_height is not None and target_angle is not None:
-                await self._position_shutter(
-                    target_height,
-                    target_angle,
-                    stop_timer=False,
-                )
-            return ShutterState.SHADOW_FULL_CLOSED
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in sun or shadow mode deactivated, moving to neutral position (%s%%, %s%%) und state %s",
-                ShutterState.SHADOW_FULL_CLOSED,
-                ShutterState.SHADOW_FULL_CLOSED.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, moving to state %s",
-            ShutterState.SHADOW_FULL_CLOSED,
-            ShutterState.SHADOW_FULL_CLOSED.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-    async def _handle_state_shadow_horizontal_neutral_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            shadow_open_slat_angle = self._shadow_config.shutter_look_through_angle
-            if (
-                current_brightness is not None
-                and shadow_threshold_close is not None
-                and shadow_open_slat_angle is not None
-                and current_brightness > shadow_threshold_close
-            ):
-                self.logger.debug(
-                    "State %s (%s): Brightness (%s) again above threshold (%s), transitioning to %s and stopping timer",
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_FULL_CLOSED,
-                )
-                self._cancel_timer()
-                return ShutterState.SHADOW_FULL_CLOSED
-            if self._is_timer_finished():
-                target_height = self._calculate_shutter_height()
-                if target_height is not None and shadow_open_slat_angle is not None:
-                    await self._position_shutter(
-                        target_height,
-                        float(shadow_open_slat_angle),
-                        stop_timer=True,
-                    )
-                    self.logger.debug(
-                        "State %s (%s): Timer finished, moving to height %s%% with neutral slats (%s°) and state %s",
-                        ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                        ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                        target_height,
-                        shadow_open_slat_angle,
-                        ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                    )
-                    return ShutterState.SHADOW_HORIZONTAL_NEUTRAL
-                self.logger.debug(
-                    "State %s (%s): Error during calculation of height and angle for open slats, staying at %s",
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                )
-                return ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Waiting for timer (brightness not high enough)",
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-            )
-            return ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in the sun or shadow mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State SHADOW_HORIZONTAL_NEUTRAL
-    async def _handle_state_shadow_horizontal_neutral(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_HORIZONTAL_NEUTRAL")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            shadow_open_shutter_delay = self._shadow_config.shutter_open_seconds
-            if (
-                current_brightness is not None
-                and shadow_threshold_close is not None
-                and shadow_open_shutter_delay is not None
-                and current_brightness > shadow_threshold_close
-            ):
-                target_height = self._calculate_shutter_height()
-                target_angle = self._calculate_shutter_angle()
-                if target_height is not None and target_angle is not None:
-                    await self._position_shutter(
-                        target_height,
-                        target_angle,
-                        stop_timer=True,
-                    )
-                    self.logger.debug(
-                        "State %s (%s): Brightness (%s) above threshold (%s), moving to shadow position (%s%%, %s%%) and state %s",
-                        ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                        ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-                        current_brightness,
-                        shadow_threshold_close,
-                        target_height,
-                        target_angle,
-                        ShutterState.SHADOW_FULL_CLOSED,
-                    )
-                    return ShutterState.SHADOW_FULL_CLOSED
-                self.logger.warning(
-                    "State %s (%s): Error at calculating height or angle, staying at %s",
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                )
-                return ShutterState.SHADOW_HORIZONTAL_NEUTRAL
-            if shadow_open_shutter_delay is not None:
-                self.logger.debug(
-                    "State %s (%s): Brightness not above threshold, starting timer for %s (%ss)",
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                    ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                    shadow_open_shutter_delay,
-                )
-                await self._start_timer(shadow_open_shutter_delay)
-                return ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
-            self.logger.warning(
-                "State %s (%s): Brightness not above threshold and 'shadow_open_shutter_delay' not configured, staying at %s",
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-            )
-            return ShutterState.SHADOW_HORIZONTAL_NEUTRAL
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in sun or shadow mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-                ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
-            ShutterState.SHADOW_HORIZONTAL_NEUTRAL.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State SHADOW_NEUTRAL_TIMER_RUNNING
-    async def _handle_state_shadow_neutral_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_NEUTRAL_TIMER_RUNNING")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            height_after_shadow = self._shadow_config.height_after_sun
-            angle_after_shadow = self._shadow_config.angle_after_sun
-            if current_brightness is not None and shadow_threshold_close is not None and current_brightness > shadow_threshold_close:
-                self.logger.debug(
-                    "State %s (%s): Brightness (%s) again above threshold (%s), state %s and stopping timer",
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_FULL_CLOSED,
-                )
-                self._cancel_timer()
-                return ShutterState.SHADOW_FULL_CLOSED
-            if self._is_timer_finished():
-                if height_after_shadow is not None and angle_after_shadow is not None:
-                    await self._position_shutter(
-                        float(height_after_shadow),
-                        float(angle_after_shadow),
-                        stop_timer=True,
-                    )
-                    self.logger.debug(
-                        "State %s (%s): Timer finished, moving to after-shadow position (%s%%, %s°) and state %s",
-                        ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                        ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-                        height_after_shadow,
-                        angle_after_shadow,
-                        ShutterState.SHADOW_NEUTRAL,
-                    )
-                    return ShutterState.SHADOW_NEUTRAL
-                self.logger.warning(
-                    "State %s (%s): Height or angle after shadow not configured, staying at %s",
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-                    ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                )
-                return ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Waiting for timer (brightness not high enough)",
-                ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-            )
-            return ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in sun or shadow mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-                ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
-            ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State SHADOW_NEUTRAL
-    async def _handle_state_shadow_neutral(self) -> ShutterState:
-        self.logger.debug("Handle SHADOW_NEUTRAL")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            dawn_handling_active = self._dawn_config.enabled
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            shadow_close_delay = self._shadow_config.after_seconds
-            dawn_close_delay = self._dawn_config.after_seconds
-            height_after_shadow = self._shadow_config.height_after_sun
-            angle_after_shadow = self._shadow_config.angle_after_sun
-
-            if (
-                current_brightness is not None
-                and shadow_threshold_close is not None
-                and current_brightness > shadow_threshold_close
-                and shadow_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Brightness (%s) above threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.SHADOW_NEUTRAL,
-                    ShutterState.SHADOW_NEUTRAL.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                    shadow_close_delay,
-                )
-                await self._start_timer(shadow_close_delay)
-                return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
-            if (
-                dawn_handling_active
-                and dawn_brightness is not None
-                and dawn_threshold_close is not None
-                and dawn_brightness < dawn_threshold_close
-                and dawn_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Dawn handling active and dawn-brighness (%s) below threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.SHADOW_NEUTRAL,
-                    ShutterState.SHADOW_NEUTRAL.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                    dawn_close_delay,
-                )
-                await self._start_timer(dawn_close_delay)
-                return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-            if height_after_shadow is not None and angle_after_shadow is not None:
-                await self._position_shutter(
-                    float(height_after_shadow),
-                    float(angle_after_shadow),
-                    stop_timer=True,
-                )
-                self.logger.debug(
-                    "State %s (%s): Moving to after-shadow position (%s%%, %s%%)",
-                    ShutterState.SHADOW_NEUTRAL,
-                    ShutterState.SHADOW_NEUTRAL.name,
-                    height_after_shadow,
-                    angle_after_shadow,
-                )
-                return ShutterState.SHADOW_NEUTRAL
-            self.logger.warning(
-                "State %s (%s): Height or angle after shadow not configured, staying at %s",
-                ShutterState.SHADOW_NEUTRAL,
-                ShutterState.SHADOW_NEUTRAL.name,
-                ShutterState.SHADOW_NEUTRAL,
-            )
-            return ShutterState.SHADOW_NEUTRAL
-
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_close_delay = self._dawn_config.after_seconds
-            if (
-                dawn_brightness is not None
-                and dawn_threshold_close is not None
-                and dawn_brightness < dawn_threshold_close
-                and dawn_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Dawn mode active and brightness (%s) below threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.SHADOW_NEUTRAL,
-                    ShutterState.SHADOW_NEUTRAL.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                    dawn_close_delay,
-                )
-                await self._start_timer(dawn_close_delay)
-                return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Not in sun or shadow mode disabled or dawn mode not active, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.SHADOW_NEUTRAL,
-                ShutterState.SHADOW_NEUTRAL.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.SHADOW_NEUTRAL,
-            ShutterState.SHADOW_NEUTRAL.name,
-            ShutterState.NEUTRAL,
+    # The transitions are declared within STATE_TRANSITIONS, the methods below
+    # take the snapshot of the guard inputs and run the transition actions.
+
+    async def _async_take_cycle_snapshot(self) -> SCCycleSnapshot:
+        """Evaluate the inputs of the transition guards once for this cycle."""
+        dawn_enabled = await self._is_dawn_control_enabled()
+        dawn_height = self._dawn_config.shutter_max_height
+        dawn_look_through_angle = self._dawn_config.shutter_look_through_angle
+        return SCCycleSnapshot(
+            in_sun=await self._check_if_facade_is_in_sun(),
+            shadow_enabled=await self._is_shadow_control_enabled(),
+            brightness=self._get_current_brightness(),
+            shadow_threshold=self.brightness_threshold,
+            dawn_enabled=dawn_enabled,
+            dawn_brightness=self._get_current_dawn_brightness(),
+            dawn_threshold=self._dawn_config.brightness_threshold,
+            # When close_not_later_than is not configured, _check_dawn_close_time_constraint() returns False
+            dawn_close_time_reached=dawn_enabled and self._check_dawn_close_time_constraint(),
+            dawn_open_time_reached=dawn_enabled and self._check_dawn_open_time_constraint(),
+            timer_finished=self._is_timer_finished(),
+            shadow_close_delay=self._shadow_config.after_seconds,
+            shadow_look_through_delay=self._shadow_config.shutter_look_through_seconds,
+            shadow_open_delay=self._shadow_config.shutter_open_seconds,
+            dawn_close_delay=self._dawn_config.after_seconds,
+            dawn_look_through_delay=self._dawn_config.shutter_look_through_seconds,
+            shadow_look_through_configured=self._shadow_config.shutter_look_through_angle is not None,
+            dawn_look_through_configured=dawn_height is not None and dawn_look_through_angle is not None,
         )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State NEUTRAL
-    async def _handle_state_neutral(self) -> ShutterState:
-        self.logger.debug("Handle NEUTRAL")
-        if await self._check_if_facade_is_in_sun() and await self._is_shadow_control_enabled():
-            self.logger.debug("self._check_if_facade_is_in_sun and self._is_shadow_handling_activated")
-            current_brightness = self._get_current_brightness()
-            shadow_threshold_close = self.brightness_threshold
-            shadow_close_delay = self._shadow_config.after_seconds
-            if (
-                current_brightness is not None
-                and shadow_threshold_close is not None
-                and current_brightness > shadow_threshold_close
-                and shadow_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Brightness (%s) above dawn threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.NEUTRAL,
-                    ShutterState.NEUTRAL.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                    shadow_close_delay,
-                )
-                await self._start_timer(shadow_close_delay)
-                return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
 
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_close_delay = self._dawn_config.after_seconds
-            if (
-                dawn_brightness is not None
-                and dawn_threshold_close is not None
-                and dawn_brightness < dawn_threshold_close
-                and dawn_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Dawn mode active and brightness (%s) below dawn threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.NEUTRAL,
-                    ShutterState.NEUTRAL.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                    dawn_close_delay,
-                )
-                await self._start_timer(dawn_close_delay)
-                return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Moving shutter to neutral position (%s%%, %s%%).",
-                ShutterState.NEUTRAL,
-                ShutterState.NEUTRAL.name,
-                neutral_height,
-                neutral_angle,
-            )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_NEUTRAL
-    async def _handle_state_dawn_neutral(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_NEUTRAL")
-        current_brightness = self._get_current_brightness()
-
-        shadow_handling_active = await self._is_shadow_control_enabled()
-        shadow_threshold_close = self.brightness_threshold
-        shadow_close_delay = self._shadow_config.after_seconds
-
-        dawn_handling_active = await self._is_dawn_control_enabled()
-        dawn_brightness = self._get_current_dawn_brightness()
-        dawn_threshold_close = self._dawn_config.brightness_threshold
-        dawn_close_delay = self._dawn_config.after_seconds
-        height_after_dawn = self._dawn_config.height_after_dawn
-        angle_after_dawn = self._dawn_config.angle_after_dawn
-
-        is_in_sun = await self._check_if_facade_is_in_sun()
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-
-        if dawn_handling_active:
-            brightness_below_threshold = dawn_brightness is not None and dawn_threshold_close is not None and dawn_brightness < dawn_threshold_close
-            if (brightness_below_threshold or self._check_dawn_close_time_constraint()) and dawn_close_delay is not None:
-                self.logger.debug(
-                    "State %s (%s): Dawn mode active and brightness (%s) below dawn threshold (%s) or close time reached,"
-                    " starting timer for %s (%ss)",
-                    ShutterState.DAWN_NEUTRAL,
-                    ShutterState.DAWN_NEUTRAL.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                    dawn_close_delay,
-                )
-                await self._start_timer(dawn_close_delay)
-                return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-            if (
-                is_in_sun
-                and shadow_handling_active
-                and current_brightness is not None
-                and shadow_threshold_close is not None
-                and current_brightness > shadow_threshold_close
-                and shadow_close_delay is not None
-            ):
-                self.logger.debug(
-                    "State %s (%s): Within sun, shadow mode active and brightness (%s) above shadow threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.DAWN_NEUTRAL,
-                    ShutterState.DAWN_NEUTRAL.name,
-                    current_brightness,
-                    shadow_threshold_close,
-                    ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                    shadow_close_delay,
-                )
-                await self._start_timer(shadow_close_delay)
-                return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
-            if height_after_dawn is not None and angle_after_dawn is not None:
-                await self._position_shutter(
-                    float(height_after_dawn),
-                    float(angle_after_dawn),
-                    stop_timer=True,
-                )
-                self.logger.debug(
-                    "State %s (%s): Moving shutter to after-dawn position (%s%%, %s%%).",
-                    ShutterState.DAWN_NEUTRAL,
-                    ShutterState.DAWN_NEUTRAL.name,
-                    height_after_dawn,
-                    angle_after_dawn,
-                )
-                return ShutterState.DAWN_NEUTRAL
-            self.logger.warning(
-                "State %s (%s): Height or angle after dawn not configured, staying at %s",
-                ShutterState.DAWN_NEUTRAL,
-                ShutterState.DAWN_NEUTRAL.name,
-                ShutterState.DAWN_NEUTRAL,
-            )
-            return ShutterState.DAWN_NEUTRAL
+    async def _async_run_state_transition(self, snapshot: SCCycleSnapshot) -> tuple[ShutterState, SCCycleSnapshot]:
+        """
+        Run the matching transition of the current state.
 
-        if (
-            is_in_sun
-            and shadow_handling_active
-            and current_brightness is not None
-            and shadow_threshold_close is not None
-            and current_brightness > shadow_threshold_close
-            and shadow_close_delay is not None
-        ):
-            self.logger.debug(
-                "State %s (%s): Within sun, shadow mode active and brightness (%s) above shadow threshold (%s), starting timer for %s (%ss)",
-                ShutterState.DAWN_NEUTRAL,
-                ShutterState.DAWN_NEUTRAL.name,
-                current_brightness,
-                shadow_threshold_close,
-                ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
-                shadow_close_delay,
-            )
-            await self._start_timer(shadow_close_delay)
-            return ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
-
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn mode disabled or requirements for shadow not given, moving to neutral position (%s%%, %s%%)",
-                ShutterState.DAWN_NEUTRAL,
-                ShutterState.DAWN_NEUTRAL.name,
-                neutral_height,
-                neutral_angle,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_NEUTRAL,
-            ShutterState.DAWN_NEUTRAL.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_NEUTRAL_TIMER_RUNNING
-    async def _handle_state_dawn_neutral_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_NEUTRAL_TIMER_RUNNING")
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_height = self._dawn_config.shutter_max_height
-            dawn_open_slat_angle = self._dawn_config.shutter_look_through_angle
-
-            if dawn_brightness is not None and dawn_threshold_close is not None and dawn_brightness < dawn_threshold_close:
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness (%s) again below threshold (%s), moving to %s and stopping timer",
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSED,
-                )
-                self._cancel_timer()
-                return ShutterState.DAWN_FULL_CLOSED
-            if self._is_timer_finished():
-                if dawn_height is not None and dawn_open_slat_angle is not None:
-                    await self._position_shutter(
-                        float(dawn_height),
-                        float(dawn_open_slat_angle),
-                        stop_timer=True,
-                    )
-                    self.logger.debug(
-                        "State %s (%s): Timer finished, moving to dawn height (%s%%) with open slats (%s°) and state %s",
-                        ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                        ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-                        dawn_height,
-                        dawn_open_slat_angle,
-                        ShutterState.DAWN_NEUTRAL,
-                    )
-                    return ShutterState.DAWN_NEUTRAL
-                self.logger.warning(
-                    "State %s (%s): Dawn height or angle for open slats not configured, staying at %s",
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                )
-                return ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Waiting for timer (brightness not low enough)",
-                ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-            )
-            return ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-            ShutterState.DAWN_NEUTRAL_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_HORIZONTAL_NEUTRAL
-    async def _handle_state_dawn_horizontal_neutral(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_HORIZONTAL_NEUTRAL")
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_height = self._dawn_config.shutter_max_height
-            dawn_open_slat_angle = self._dawn_config.shutter_look_through_angle
-            dawn_open_shutter_delay = self._dawn_config.shutter_look_through_seconds
-
-            brightness_below_threshold = (
-                dawn_brightness is not None
-                and dawn_threshold_close is not None
-                and dawn_brightness < dawn_threshold_close
-                and dawn_height is not None
-                and dawn_open_slat_angle is not None
-            )
-            if brightness_below_threshold or self._check_dawn_close_time_constraint():
-                if dawn_height is not None and dawn_open_slat_angle is not None:
-                    await self._position_shutter(
-                        float(dawn_height),
-                        float(dawn_open_slat_angle),
-                        stop_timer=False,
-                    )
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness (%s) below threshold (%s) or close time reached,"
-                    " moving to dawn height (%s%%) with open slats (%s°) and state %s",
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    dawn_height,
-                    dawn_open_slat_angle,
-                    ShutterState.DAWN_FULL_CLOSED,
-                )
-                return ShutterState.DAWN_FULL_CLOSED
-            if dawn_open_shutter_delay is not None:
-                if not self._check_dawn_open_time_constraint():
-                    self.logger.debug(
-                        "State %s (%s): Dawn brightness not below threshold but open_not_before not yet reached, staying at %s",
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                    )
-                    return ShutterState.DAWN_HORIZONTAL_NEUTRAL
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness not below threshold, starting timer for %s (%ss)",
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-                    ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
-                    dawn_open_shutter_delay,
-                )
-                await self._start_timer(dawn_open_shutter_delay)
-                return ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
-            self.logger.warning(
-                "State %s (%s): Dawn brightness not below threshold and 'dawn_open_shutter_delay' not configured, staying at %s",
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-            )
-            return ShutterState.DAWN_HORIZONTAL_NEUTRAL
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-    async def _handle_state_dawn_horizontal_neutral_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING")
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_height = self._dawn_config.shutter_max_height
-            dawn_open_slat_angle = self._dawn_config.shutter_look_through_angle
-            if dawn_brightness is not None and dawn_threshold_close is not None and dawn_brightness < dawn_threshold_close:
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness (%s) again below threshold (%s), moving to %s and stopping timer",
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_FULL_CLOSED,
-                )
-                self._cancel_timer()
-                return ShutterState.DAWN_FULL_CLOSED
-            if self._is_timer_finished():
-                if dawn_height is not None and dawn_open_slat_angle is not None:
-                    await self._position_shutter(
-                        float(dawn_height),
-                        float(dawn_open_slat_angle),
-                        stop_timer=False,
-                    )
-                    self.logger.debug(
-                        "State %s (%s): Timer finished, moving to dawn height (%s%%) with open slats (%s°) and state %s",
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                        dawn_height,
-                        dawn_open_slat_angle,
-                        ShutterState.DAWN_HORIZONTAL_NEUTRAL,
-                    )
-                    return ShutterState.DAWN_HORIZONTAL_NEUTRAL
-                self.logger.warning(
-                    "State %s (%s): Dawn height or angle for open slats not configured, staying at %s",
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                )
-                return ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Waiting for timer (brightness not low enough)",
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-            )
-            return ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-            ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_FULL_CLOSED
-    async def _handle_state_dawn_full_closed(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_FULL_CLOSED")
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_height = self._dawn_config.shutter_max_height
-            dawn_open_slat_delay = self._dawn_config.shutter_look_through_seconds
-            dawn_angle = self._dawn_config.shutter_max_angle
-            if (
-                dawn_brightness is not None
-                and dawn_threshold_close is not None
-                and dawn_brightness > dawn_threshold_close
-                and dawn_open_slat_delay is not None
-            ):
-                if not self._check_dawn_open_time_constraint():
-                    self.logger.debug(
-                        "State %s (%s): Dawn brightness (%s) above threshold (%s) but open_not_before not yet reached, staying at %s",
-                        ShutterState.DAWN_FULL_CLOSED,
-                        ShutterState.DAWN_FULL_CLOSED.name,
-                        dawn_brightness,
-                        dawn_threshold_close,
-                        ShutterState.DAWN_FULL_CLOSED,
-                    )
-                    return ShutterState.DAWN_FULL_CLOSED
-                if self._check_dawn_close_time_constraint():
-                    if dawn_height is not None and dawn_angle is not None:
-                        await self._position_shutter(float(dawn_height), float(dawn_angle), stop_timer=True)
-                    self.logger.debug(
-                        "State %s (%s): Dawn brightness (%s) above threshold (%s) but close_not_later_than already reached,"
-                        " moving to dawn position and staying at %s",
-                        ShutterState.DAWN_FULL_CLOSED,
-                        ShutterState.DAWN_FULL_CLOSED.name,
-                        dawn_brightness,
-                        dawn_threshold_close,
-                        ShutterState.DAWN_FULL_CLOSED,
+        Returns the next state and the snapshot, updated by the effect of the action on the timer.
+        The current state is returned, if no transition matches or a required action failed.
+        """
+        current_state = self.current_shutter_state
+        transition = STATE_MACHINE.next_transition(current_state, snapshot)
+        if transition is None:
+            self.logger.debug("State %s: No transition matches, staying", current_state.name)
+            return current_state, snapshot
+
+        if transition.action is not None:
+            if not await self._async_run_transition_action(transition, snapshot):
+                if transition.action_required:
+                    self.logger.warning(
+                        "State %s: %s, but %s could not be run, staying", current_state.name, transition.reason, transition.action.name
                     )
-                    return ShutterState.DAWN_FULL_CLOSED
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness (%s) above threshold (%s), starting timer for %s (%ss)",
-                    ShutterState.DAWN_FULL_CLOSED,
-                    ShutterState.DAWN_FULL_CLOSED.name,
-                    dawn_brightness,
-                    dawn_threshold_close,
-                    ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
-                    dawn_open_slat_delay,
-                )
-                await self._start_timer(dawn_open_slat_delay)
-                return ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
-            if dawn_height is not None and dawn_angle is not None:
-                await self._position_shutter(
-                    float(dawn_height),
-                    float(dawn_angle),
-                    stop_timer=True,
-                )
-                self.logger.debug(
-                    "State %s (%s): Dawn brightness not above threshold, moving to dawn position (%s%%, %s%%)",
-                    ShutterState.DAWN_FULL_CLOSED,
-                    ShutterState.DAWN_FULL_CLOSED.name,
-                    dawn_height,
-                    dawn_angle,
-                )
-                return ShutterState.DAWN_FULL_CLOSED
-            self.logger.warning(
-                "State %s (%s): Dawn height or angle not configured, staying at %s",
-                ShutterState.DAWN_FULL_CLOSED,
-                ShutterState.DAWN_FULL_CLOSED.name,
-                ShutterState.DAWN_FULL_CLOSED,
-            )
-            return ShutterState.DAWN_FULL_CLOSED
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn handling disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.DAWN_FULL_CLOSED,
-                ShutterState.DAWN_FULL_CLOSED.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_FULL_CLOSED,
-            ShutterState.DAWN_FULL_CLOSED.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
-
-    # =======================================================================
-    # State DAWN_FULL_CLOSE_TIMER_RUNNING
-    async def _handle_state_dawn_full_close_timer_running(self) -> ShutterState:
-        self.logger.debug("Handle DAWN_FULL_CLOSE_TIMER_RUNNING")
-        if await self._is_dawn_control_enabled():
-            dawn_brightness = self._get_current_dawn_brightness()
-            dawn_threshold_close = self._dawn_config.brightness_threshold
-            dawn_height = self._dawn_config.shutter_max_height
-            dawn_angle = self._dawn_config.shutter_max_angle
-            brightness_below_threshold = dawn_brightness is not None and dawn_threshold_close is not None and dawn_brightness < dawn_threshold_close
-            if brightness_below_threshold or self._check_dawn_close_time_constraint():
-                if self._is_timer_finished():
-                    if dawn_height is not None and dawn_angle is not None:
-                        await self._position_shutter(
-                            float(dawn_height),
-                            float(dawn_angle),
-                            stop_timer=True,
-                        )
-                        self.logger.debug(
-                            "State %s (%s): Timer finished, moving to dawn position (%s%%, %s%%) and state %s",
-                            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-                            dawn_height,
-                            dawn_angle,
-                            ShutterState.DAWN_FULL_CLOSED,
-                        )
-                        return ShutterState.DAWN_FULL_CLOSED
+                    return current_state, snapshot
+                if transition.next_state != current_state:
                     self.logger.warning(
-                        "State %s (%s): Dawn height or angle not configured, staying at %s",
-                        ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                        ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-                        ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
+                        "State %s: %s, %s could not be run, transitioning to %s anyway",
+                        current_state.name,
+                        transition.reason,
+                        transition.action.name,
+                        transition.next_state.name,
                     )
-                    return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-                self.logger.debug(
-                    "State %s (%s): Waiting for timer (brightness below threshold or close time reached)",
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                    ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-                )
-                return ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
-            self.logger.debug(
-                "State %s (%s): Brightness (%s) not below threshold (%s) and close time not reached, moving to %s and stopping timer",
-                ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-                dawn_brightness,
-                dawn_threshold_close,
-                ShutterState.DAWN_NEUTRAL,
-            )
-            self._cancel_timer()
-            return ShutterState.DAWN_NEUTRAL
-        neutral_height = self._facade_config.neutral_pos_height
-        neutral_angle = self._facade_config.neutral_pos_angle
-        if neutral_height is not None and neutral_angle is not None:
-            await self._position_shutter(
-                float(neutral_height),
-                float(neutral_angle),
-                stop_timer=True,
-            )
-            self.logger.debug(
-                "State %s (%s): Dawn mode disabled, moving to neutral position (%s%%, %s%%) and state %s",
-                ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-                ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-                neutral_height,
-                neutral_angle,
-                ShutterState.NEUTRAL,
-            )
-            return ShutterState.NEUTRAL
-        self.logger.warning(
-            "State %s (%s): Neutral height or angle not configured, transitioning to %s",
-            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
-            ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING.name,
-            ShutterState.NEUTRAL,
-        )
-        return ShutterState.NEUTRAL
+            snapshot = replace(snapshot, timer_finished=self._is_timer_finished())
+
+        self.logger.debug("State %s: %s, next state %s", current_state.name, transition.reason, transition.next_state.name)
+        return transition.next_state, snapshot
+
+    async def _async_run_transition_action(self, transition: SCStateTransition, snapshot: SCCycleSnapshot) -> bool:
+        """Run the action of the transition, return False if the target position is not available."""
+        match transition.action:
+            case SCTransitionAction.CANCEL_TIMER:
+                self._cancel_timer()
+                return True
+            case SCTransitionAction.START_SHADOW_CLOSE_TIMER:
+                delay = snapshot.shadow_close_delay
+            case SCTransitionAction.START_SHADOW_LOOK_THROUGH_TIMER:
+                delay = snapshot.shadow_look_through_delay
+            case SCTransitionAction.START_SHADOW_OPEN_TIMER:
+                delay = snapshot.shadow_open_delay
+            case SCTransitionAction.START_DAWN_CLOSE_TIMER:
+                delay = snapshot.dawn_close_delay
+            case SCTransitionAction.START_DAWN_LOOK_THROUGH_TIMER:
+                delay = snapshot.dawn_look_through_delay
+            case _:
+                height, angle = self._get_transition_target(transition.action)
+                if height is None or angle is None:
+                    return False
+                await self._position_shutter(float(height), float(angle), stop_timer=transition.stop_timer)
+                return True
+
+        # The guards of all timer transitions require the delay to be configured
+        await self._start_timer(delay)
+        return True
+
+    def _get_transition_target(self, action: SCTransitionAction) -> tuple[float | None, float | None]:
+        """Return height and angle of the positioning action, None if not configured or not calculable."""
+        match action:
+            case SCTransitionAction.POSITION_SHADOW:
+                return self._calculate_shutter_height(), self._calculate_shutter_angle()
+            case SCTransitionAction.POSITION_SHADOW_LOOK_THROUGH:
+                return self._calculate_shutter_height(), self._shadow_config.shutter_look_through_angle
+            case SCTransitionAction.POSITION_AFTER_SHADOW:
+                return self._shadow_config.height_after_sun, self._shadow_config.angle_after_sun
+            case SCTransitionAction.POSITION_AFTER_DAWN:
+                return self._dawn_config.height_after_dawn, self._dawn_config.angle_after_dawn
+            case SCTransitionAction.POSITION_DAWN:
+                return self._dawn_config.shutter_max_height, self._dawn_config.shutter_max_angle
+            case SCTransitionAction.POSITION_DAWN_LOOK_THROUGH:
+                return self._dawn_config.shutter_max_height, self._dawn_config.shutter_look_through_angle
+            case _:
+                return self._facade_config.neutral_pos_height, self._facade_config.neutral_pos_angle
 
     # End of state handling
     # #######################################################################
@@ -4356,62 +3918,14 @@ class ShadowControlManager:
             return default
 
         try:
-            # Try to read from attribute if specified and it exists
-            if attribute_name:
-                attr_value = state.attributes.get(attribute_name)
-                if attr_value is not None:
-                    # Attribute exists - use it (e.g., sun.sun has elevation/azimuth)
-                    value = attr_value
-                    self.logger.debug(
-                        "Reading attribute '%s' from entity '%s': %s",
-                        attribute_name,
-                        entity_id,
-                        value,
-                    )
-                else:
-                    # Attribute doesn't exist - fall back to state (e.g., input_number)
-                    if state.state in ["unavailable", "unknown"]:
-                        if log_warning:
-                            self.logger.debug(
-                                "Entity '%s' is unavailable or unknown. Using default: %s",
-                                entity_id,
-                                default,
-                            )
-                        return default
-                    value = state.state
-                    self.logger.debug(
-                        "Attribute '%s' not found in '%s', using state: %s",
-                        attribute_name,
-                        entity_id,
-                        value,
-                    )
-            else:
-                # No attribute requested - read from state
-                if state.state in ["unavailable", "unknown"]:
-                    if log_warning:
-                        self.logger.debug(
-                            "Entity '%s' is unavailable or unknown. Using default: %s",
-                            entity_id,
-                            default,
-                        )
-                    return default
-                value = state.state
-
-            # Type conversion
-            if expected_type is bool:
-                return str(value).lower() in ["on", "true", "1"]
-            if expected_type is int:
-                return int(float(value))
-            if expected_type is float:
-                return float(value)
-            return expected_type(value)
-
+            # Parsed once per state update for all instances
+            return self._state_cache.get(state, attribute_name, expected_type)
         except (ValueError, TypeError) as e:
             if log_warning:
                 self.logger.warning(
                     "Failed to convert %s '%s' of entity '%s' to type %s. Using default: %s. Error: %s",
-                    "attribute" if attribute_name and attr_value is not None else "state",
-                    value,
+                    "attribute" if attribute_name and state.attributes.get(attribute_name) is not None else "state",
+                    get_raw_state_value(state, attribute_name),
                     entity_id,
                     expected_type.__name__,
                     default,
@@ -4473,7 +3987,7 @@ class ShadowControlManager:
 
             async def _time_constraint_callback(_now: datetime.datetime, _label: str = label) -> None:
                 self.logger.debug("Dawn time constraint '%s' reached — triggering recalculation.", _label)
-                await self.async_calculate_and_apply_cover_position(None)
+                await self.async_calculate_and_apply_cover_position(None, SCTriggerSource.TIME_CONSTRAINT)
 
             unsub = async_track_point_in_utc_time(self.hass, _time_constraint_callback, trigger_utc)
             self._unsub_time_constraint_callbacks.append(unsub)
@@ -4727,7 +4241,7 @@ class ShadowControlManager:
 
         if delay_seconds <= 0:
             self.logger.debug("Timer delay is <= 0 (%ss). Scheduling immediate recalculation", delay_seconds)
-            self.hass.async_create_task(self.async_calculate_and_apply_cover_position(None))
+            self.hass.async_create_task(self.async_calculate_and_apply_cover_position(None, SCTriggerSource.TIMER))
             self.next_modification_timestamp = None
             return
 
@@ -4777,7 +4291,7 @@ class ShadowControlManager:
         self._timer = None
         self._timer_start_time = None
         self._timer_duration_seconds = None
-        await self.async_calculate_and_apply_cover_position(None)
+        await self.async_calculate_and_apply_cover_position(None, SCTriggerSource.TIMER)
 
     def get_remaining_timer_seconds(self) -> float | None:
         """Return remaining time of running timer or None if no timer is running."""
@@ -4828,13 +4342,61 @@ class ShadowControlManager:
         """Restore auto-lock state from the persisted switch entity on HA startup."""
         self._locked_by_auto_lock = value
 
-    def get_internal_entity_id(self, internal_enum: SCInternal) -> str:
+    def get_internal_entity_id(self, internal_enum: SCInternal) -> str | None:
         """Get the internal entity_id for this instance."""
+        entity_id = self._internal_entity_ids.get(internal_enum)
+        if entity_id is not None:
+            return entity_id
+
         registry = entity_registry.async_get(self.hass)
-        unique_id = f"{self._entry_id}_{internal_enum.value}"
-        entity_id = registry.async_get_entity_id(internal_enum.domain, "shadow_control", unique_id)
+        unique_id = f"{self._internal_unique_id_prefix}{internal_enum.value}"
+        entity_id = registry.async_get_entity_id(internal_enum.domain, DOMAIN, unique_id)
         # self.logger.debug("Looking up internal entity_id for unique_id: %s -> %s", unique_id, entity_id)
-        return entity_id  # noqa: RET504
+
+        # Entities which are not (yet) registered are not cached, they might be created by the platform setup later
+        if entity_id is not None:
+            self._internal_entity_ids[internal_enum] = entity_id
+        return entity_id
+
+    def build_internal_entity_index(self) -> None:
+        """Resolve the entity_ids of all internal entities of this instance at once."""
+        registry = entity_registry.async_get(self.hass)
+        self._internal_entity_ids.clear()
+        for internal_enum in SCInternal:
+            entity_id = registry.async_get_entity_id(internal_enum.domain, DOMAIN, f"{self._internal_unique_id_prefix}{internal_enum.value}")
+            if entity_id is not None:
+                self._internal_entity_ids[internal_enum] = entity_id
+        self.logger.debug("Internal entity index built with %s entries", len(self._internal_entity_ids))
+
+        # Internal entities might have been created right now, so track them and read all inputs again
+        self._mark_all_input_groups_dirty()
+        self._async_track_input_entities()
+        self._build_trigger_dispatch()
+
+    @callback
+    def _is_internal_entity_registry_event(self, event_data: entity_registry.EventEntityRegistryUpdatedData) -> bool:
+        """Check if an entity registry update affects one of the internal entities of this instance."""
+        known_entity_ids = self._internal_entity_ids.values()
+        if event_data["entity_id"] in known_entity_ids or event_data.get("old_entity_id") in known_entity_ids:
+            return True
+
+        # Newly created or renamed entity, which is not indexed yet
+        registry_entry = entity_registry.async_get(self.hass).async_get(event_data["entity_id"])
+        return (
+            registry_entry is not None
+            and registry_entry.platform == DOMAIN
+            and isinstance(registry_entry.unique_id, str)
+            and registry_entry.unique_id.startswith(self._internal_unique_id_prefix)
+        )
+
+    @callback
+    def _async_entity_registry_updated_listener(self, event: Event[entity_registry.EventEntityRegistryUpdatedData]) -> None:
+        """Drop the internal entity_id index and track the (possibly renamed) internal entities again."""
+        self.logger.debug("Entity registry %s of %s, invalidating internal entity index", event.data["action"], event.data["entity_id"])
+        self._internal_entity_ids.clear()
+        self._mark_all_input_groups_dirty()
+        self._async_track_input_entities()
+        self._build_trigger_dispatch()
 
     async def async_trigger_enforce_positioning(self) -> None:
         """Trigger a forced positioning update (one-time action)."""
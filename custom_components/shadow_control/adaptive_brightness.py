@@ -2,12 +2,28 @@
 
 import logging
 import math
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
 from logging import Logger
+from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class SCAdaptiveBrightnessCurve:
+    """Sine curve parameters of one day: f(x) = amplitude * sin(frequency * (x - phase_shift)) + y_offset."""
+
+    # Threshold outside the sun hours
+    minimal: float
+    # Threshold for the whole day, if the thresholds or sun times don't allow a curve
+    constant: float | None = None
+    amplitude: float = 0.0
+    frequency: float = 0.0
+    phase_shift: float = 0.0
+    y_offset: float = 0.0
+
+
 class AdaptiveBrightnessCalculator:
     """Calculate dynamic brightness thresholds based on seasonal and daily sun position."""
 
@@ -27,6 +43,12 @@ class AdaptiveBrightnessCalculator:
         self._is_southern_hemisphere = latitude < 0
         self._logger = logger if logger is not None else _LOGGER
 
+        # Curve of the current day and the inputs it was calculated from
+        self._curve: SCAdaptiveBrightnessCurve | None = None
+        self._curve_key: tuple[date, datetime, datetime, float, float, float, float | None] | None = None
+        self.curve_hits = 0
+        self.curve_misses = 0
+
     def calculate_threshold(
         self,
         current_time: datetime,
@@ -40,6 +62,9 @@ class AdaptiveBrightnessCalculator:
         """
         Calculate the adaptive brightness threshold for the current time.
 
+        The curve parameters only change once per day or on config change, so they are
+        calculated once and reused, see _get_curve().
+
         Args:
             current_time: Current datetime
             sunrise: Today's sunrise datetime
@@ -54,6 +79,85 @@ class AdaptiveBrightnessCalculator:
             Brightness threshold in lux
 
         """
+        curve = self._get_curve(current_time, sunrise, sunset, winter_lux, summer_lux, minimal, dawn_threshold)
+        if curve.constant is not None:
+            return curve.constant
+
+        # CRITICAL FIX: Handle sun_next_rising/sun_next_setting sensors
+        # These sensors always point to the NEXT occurrence, so:
+        # - After sunset: both sunrise and sunset are tomorrow
+        # - Before sunrise: sunrise is today, sunset is tomorrow
+        if sunrise > current_time and sunset > current_time:
+            # Both times in future = we're in the night (after sunset or before sunrise)
+            self._logger.debug(
+                "Both sunrise (%s) and sunset (%s) are in the future (current time: %s). "
+                "This indicates we are in the night period. Returning minimal: %s",
+                sunrise,
+                sunset,
+                current_time,
+                curve.minimal,
+            )
+            return curve.minimal
+
+        # Check if we're between sunrise and sunset
+        if not (sunrise <= current_time <= sunset):
+            self._logger.debug(
+                "Outside sun hours (%s - %s), returning minimal: %s",
+                sunrise.time(),
+                sunset.time(),
+                curve.minimal,
+            )
+            return curve.minimal
+
+        minutes_since_sunrise = (current_time - sunrise).total_seconds() / 60
+        threshold = curve.amplitude * math.sin(curve.frequency * (minutes_since_sunrise - curve.phase_shift)) + curve.y_offset
+
+        self._logger.debug("Adaptive threshold: %s lux (x=%s min)", round(threshold), round(minutes_since_sunrise))
+
+        return round(threshold)
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of threshold calculations, which reused the curve of the day."""
+        lookups = self.curve_hits + self.curve_misses
+        return round(self.curve_hits / lookups, 3) if lookups else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the curve cache statistics for the diagnostics."""
+        return {"curve_hits": self.curve_hits, "curve_misses": self.curve_misses, "hit_rate": self.hit_rate}
+
+    def _get_curve(
+        self,
+        current_time: datetime,
+        sunrise: datetime,
+        sunset: datetime,
+        winter_lux: float,
+        summer_lux: float,
+        minimal: float,
+        dawn_threshold: float | None,
+    ) -> SCAdaptiveBrightnessCurve:
+        """Return the curve of the day, which is only calculated again if the date, sun times or thresholds change."""
+        key = (current_time.date(), sunrise, sunset, winter_lux, summer_lux, minimal, dawn_threshold)
+        if self._curve is not None and self._curve_key == key:
+            self.curve_hits += 1
+            return self._curve
+
+        self.curve_misses += 1
+        self._curve = self._calculate_curve(current_time, sunrise, sunset, winter_lux, summer_lux, minimal, dawn_threshold)
+        self._curve_key = key
+        return self._curve
+
+    def _calculate_curve(
+        self,
+        current_time: datetime,
+        sunrise: datetime,
+        sunset: datetime,
+        winter_lux: float,
+        summer_lux: float,
+        minimal: float,
+        dawn_threshold: float | None,
+    ) -> SCAdaptiveBrightnessCurve:
+        """Validate the thresholds and calculate the sine curve parameters of the day."""
         # Ensure minimal >= 0
         minimal = max(0, minimal)
 
@@ -84,7 +188,7 @@ class AdaptiveBrightnessCalculator:
         # Validate sun times
         if sunset <= sunrise:
             self._logger.error("Sunset (%s) must be after sunrise (%s). Returning minimal value.", sunset, sunrise)
-            return effective_minimal
+            return SCAdaptiveBrightnessCurve(minimal=effective_minimal, constant=effective_minimal)
 
         # Get daily brightness based on season
         day_brightness = self._get_day_brightness(current_time, winter_lux, summer_lux)
@@ -100,37 +204,10 @@ class AdaptiveBrightnessCalculator:
                 effective_minimal,
                 day_brightness,
             )
-            return effective_minimal
-
-        # CRITICAL FIX: Handle sun_next_rising/sun_next_setting sensors
-        # These sensors always point to the NEXT occurrence, so:
-        # - After sunset: both sunrise and sunset are tomorrow
-        # - Before sunrise: sunrise is today, sunset is tomorrow
-        if sunrise > current_time and sunset > current_time:
-            # Both times in future = we're in the night (after sunset or before sunrise)
-            self._logger.debug(
-                "Both sunrise (%s) and sunset (%s) are in the future (current time: %s). "
-                "This indicates we are in the night period. Returning minimal: %s",
-                sunrise,
-                sunset,
-                current_time,
-                effective_minimal,
-            )
-            return effective_minimal
-
-        # Check if we're between sunrise and sunset
-        if not (sunrise <= current_time <= sunset):
-            self._logger.debug(
-                "Outside sun hours (%s - %s), returning minimal: %s",
-                sunrise.time(),
-                sunset.time(),
-                effective_minimal,
-            )
-            return effective_minimal
+            return SCAdaptiveBrightnessCurve(minimal=effective_minimal, constant=effective_minimal)
 
         # Calculate sine curve parameters
         period_minutes = (sunset - sunrise).total_seconds() / 60
-        minutes_since_sunrise = (current_time - sunrise).total_seconds() / 60
 
         # Sine function: f(x) = a * sin(b * (x - c)) + d
         # Using effective_minimal ensures the curve minimum stays above dawn threshold
@@ -139,12 +216,9 @@ class AdaptiveBrightnessCalculator:
         phase_shift = period_minutes / 4  # Peak at solar noon
         y_offset = amplitude + effective_minimal
 
-        threshold = amplitude * math.sin(frequency * (minutes_since_sunrise - phase_shift)) + y_offset
-
         self._logger.debug(
-            "Adaptive threshold: %s lux (x=%s min, period=%s min, a=%s, b=%s, c=%s, d=%s)",
-            round(threshold),
-            round(minutes_since_sunrise),
+            "Adaptive brightness curve of %s: period=%s min, a=%s, b=%s, c=%s, d=%s",
+            current_time.date(),
             round(period_minutes),
             round(amplitude),
             round(frequency, 6),
@@ -152,7 +226,9 @@ class AdaptiveBrightnessCalculator:
             round(y_offset),
         )
 
-        return round(threshold)
+        return SCAdaptiveBrightnessCurve(
+            minimal=effective_minimal, amplitude=amplitude, frequency=frequency, phase_shift=phase_shift, y_offset=y_offset
+        )
 
     def _get_day_brightness(self, current_time: datetime, winter_lux: float, summer_lux: float) -> float:
         """
@@ -0,0 +1,241 @@
+"""
+Shadow Control cover command scheduler.
+
+At sunrise, sunset or with passing clouds, many instances send their cover commands within
+the same second. This may saturate a bus gateway (e.g. KNX/IP), so telegrams get lost. The
+scheduler is shared by all instances and limits the cover commands with a token bucket.
+Waiting commands are released by priority lane, forced positions before sun tracking, and
+sent by tasks of the scheduler, so no caller waits for the tokens.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, SCCommandPriority
+
+DOMAIN_DATA_COMMAND_SCHEDULER = f"{DOMAIN}_command_scheduler"
+
+# Refilled tokens are compared with this tolerance, as the wakeup is calculated from the rate
+TOKEN_TOLERANCE = 1e-6
+
+SCCommandSender = Callable[[], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class SCWaitingCommand:
+    """Cover command waiting for tokens."""
+
+    send: SCCommandSender
+    # Done, when the command was sent
+    future: asyncio.Future[None]
+    # Number of covers addressed by the service call
+    cost: int
+    # Monotonic time of queueing
+    queued: float
+
+
+class SCCommandScheduler:
+    """
+    Token bucket limiting the cover commands of all instances.
+
+    Each cover addressed by a service call costs one token, as bus based integrations send a
+    telegram per cover. Tokens are refilled with the configured rate up to the burst size. A
+    call is sent as soon as one token is available, tokens missing for further covers of the
+    same call delay the following calls. Each instance configures its limit, the most
+    restrictive limit of all instances applies. Without limit, all commands are sent at once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler without limit."""
+        self._hass = hass
+        self._limits: dict[str, tuple[float, int]] = {}
+        self._rate = 0.0
+        self._burst = 0
+        self._tokens = 0.0
+        self._refilled = time.monotonic()
+        self._lanes: dict[SCCommandPriority, deque[SCWaitingCommand]] = {priority: deque() for priority in SCCommandPriority}
+        self._unsub_wakeup: Callable[[], None] | None = None
+        self._send_tasks: set[asyncio.Task[None]] = set()
+
+        self.commands = 0
+        self.queued_commands = 0
+        self.max_queue_depth = 0
+        self.last_wait: float | None = None
+        self.max_wait: float | None = None
+        self._total_wait = 0.0
+        self._waited_commands = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting for tokens."""
+        return sum(len(lane) for lane in self._lanes.values())
+
+    @callback
+    def async_set_limit(self, key: str, rate: float, burst: int) -> None:
+        """Set the limit of an instance in commands per second and burst size, a rate of 0 means no limit."""
+        if rate > 0:
+            self._limits[key] = (rate, max(burst, 1))
+        else:
+            self._limits.pop(key, None)
+        self._apply_limits()
+
+    @callback
+    def async_remove_limit(self, key: str) -> None:
+        """Remove the limit of an unloaded instance."""
+        if self._limits.pop(key, None) is not None:
+            self._apply_limits()
+
+    def _apply_limits(self) -> None:
+        """Use the most restrictive limit and release the commands, which are allowed now."""
+        self._refill(time.monotonic())
+        unlimited = self._rate <= 0
+        if self._limits:
+            self._rate = min(rate for rate, _ in self._limits.values())
+            self._burst = min(burst for _, burst in self._limits.values())
+            # The bucket starts full
+            self._tokens = self._burst if unlimited else min(self._tokens, self._burst)
+        else:
+            self._rate = 0.0
+            self._burst = 0
+            self._tokens = 0.0
+        if self._unsub_wakeup is not None:
+            self._unsub_wakeup()
+            self._unsub_wakeup = None
+        self._release()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        if self._rate > 0:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+
+    def _has_token(self) -> bool:
+        """Return if a command may be sent."""
+        return self._rate <= 0 or self._tokens >= 1 - TOKEN_TOLERANCE
+
+    @callback
+    def async_submit(self, priority: SCCommandPriority, cost: int, send: SCCommandSender) -> asyncio.Future[None]:
+        """
+        Queue a command for the given number of covers and send it, as soon as tokens are available.
+
+        The command is sent by a task of the scheduler, the returned future is done, when the
+        command was sent, or holds its error. Cancelling the future removes a waiting command.
+        """
+        self.commands += 1
+        now = time.monotonic()
+        self._refill(now)
+        waiting = SCWaitingCommand(send, self._hass.loop.create_future(), cost, now)
+        if not self.queue_depth and self._has_token():
+            self._consume(cost)
+            self._start(waiting)
+            return waiting.future
+
+        lane = self._lanes[priority]
+        lane.append(waiting)
+        self.queued_commands += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+        def _remove_cancelled(future: asyncio.Future[None]) -> None:
+            if future.cancelled():
+                with contextlib.suppress(ValueError):
+                    lane.remove(waiting)
+
+        waiting.future.add_done_callback(_remove_cancelled)
+        self._schedule_wakeup()
+        return waiting.future
+
+    def _start(self, waiting: SCWaitingCommand) -> None:
+        """Send the released command in a task of the scheduler."""
+        task = self._hass.async_create_task(self._async_send(waiting), f"{DOMAIN}_cover_command")
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _async_send(self, waiting: SCWaitingCommand) -> None:
+        """Send the command and pass its outcome to the future."""
+        try:
+            await waiting.send()
+        except Exception as err:  # noqa: BLE001
+            if not waiting.future.done():
+                waiting.future.set_exception(err)
+        else:
+            if not waiting.future.done():
+                waiting.future.set_result(None)
+
+    def _consume(self, cost: int) -> None:
+        """Take the tokens of a command, missing tokens delay the following commands."""
+        if self._rate > 0:
+            self._tokens -= cost
+
+    def _release(self) -> None:
+        """Release the waiting commands in the order of their lanes, as long as tokens are available."""
+        now = time.monotonic()
+        self._refill(now)
+        for lane in self._lanes.values():
+            while lane and self._has_token():
+                waiting = lane.popleft()
+                if waiting.future.done():
+                    continue
+                self._consume(waiting.cost)
+                self._record_wait(now - waiting.queued)
+                self._start(waiting)
+            if lane:
+                # Lower lanes wait until this lane is empty
+                break
+        self._schedule_wakeup()
+
+    @callback
+    def _async_wakeup(self, _now: datetime) -> None:
+        """Release the waiting commands, after tokens were refilled."""
+        self._unsub_wakeup = None
+        self._release()
+
+    def _schedule_wakeup(self) -> None:
+        """Schedule the release of the waiting commands, when the next token is available."""
+        if self._unsub_wakeup is not None or self._rate <= 0 or not self.queue_depth:
+            return
+        self._unsub_wakeup = async_call_later(self._hass, max((1 - self._tokens) / self._rate, 0), self._async_wakeup)
+
+    def _record_wait(self, wait: float) -> None:
+        """Remember the time a command waited for tokens."""
+        self.last_wait = wait
+        self.max_wait = wait if self.max_wait is None else max(self.max_wait, wait)
+        self._total_wait += wait
+        self._waited_commands += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limit, queue and wait time statistics for the diagnostics."""
+
+        def _as_ms(duration: float | None) -> float | None:
+            return round(duration * 1000, 3) if duration is not None else None
+
+        return {
+            "commands_per_second": self._rate or None,
+            "burst": self._burst or None,
+            "commands": self.commands,
+            "queued_commands": self.queued_commands,
+            "queue_depth": {priority.name.lower(): len(lane) for priority, lane in self._lanes.items()},
+            "max_queue_depth": self.max_queue_depth,
+            "wait_ms": {
+                "last": _as_ms(self.last_wait),
+                "mean": _as_ms(self._total_wait / self._waited_commands) if self._waited_commands else None,
+                "max": _as_ms(self.max_wait),
+            },
+        }
+
+
+@callback
+def async_get_command_scheduler(hass: HomeAssistant) -> SCCommandScheduler:
+    """Return the command scheduler shared by all instances."""
+    scheduler: SCCommandScheduler | None = hass.data.get(DOMAIN_DATA_COMMAND_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[DOMAIN_DATA_COMMAND_SCHEDULER] = SCCommandScheduler(hass)
+    return scheduler
@@ -14,11 +14,18 @@ from homeassistant.helpers import selector
 from voluptuous import Any
 
 from .const import (
+    COMMAND_BURST,
+    COMMAND_RATE_LIMIT,
     DEBUG_ENABLED,
     DEPRECATED_CONFIG_KEYS,
     DOMAIN,
+    INPUT_COALESCING_WINDOW,
+    OUTPUT_MIN_INTERVAL,
     OWN_LOGFILE_ENABLED,
+    OWN_LOGFILE_SHARED_WRITER,
+    RECALCULATION_CONCURRENCY,
     SC_CONF_NAME,
+    SUN_POSITION_BUILTIN,
     TARGET_COVER_ENTITY,
     VERSION,
     MovementRestricted,
@@ -118,6 +125,23 @@ def get_cfg_facade_settings_part1() -> vol.Schema:
             ),
             vol.Optional(DEBUG_ENABLED, default=False): selector.BooleanSelector(),
             vol.Optional(OWN_LOGFILE_ENABLED, default=False): selector.BooleanSelector(),
+            vol.Optional(OWN_LOGFILE_SHARED_WRITER, default=False): selector.BooleanSelector(),
+            vol.Optional(INPUT_COALESCING_WINDOW, default=SCDefaults.INPUT_COALESCING_WINDOW_VALUE.value): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=60, step=0.1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(OUTPUT_MIN_INTERVAL, default=SCDefaults.OUTPUT_MIN_INTERVAL_VALUE.value): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=10, step=0.1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(COMMAND_RATE_LIMIT, default=SCDefaults.COMMAND_RATE_LIMIT_VALUE.value): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=50, step=0.1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(COMMAND_BURST, default=SCDefaults.COMMAND_BURST_VALUE.value): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=1, max=100, step=1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(RECALCULATION_CONCURRENCY, default=SCDefaults.RECALCULATION_CONCURRENCY_VALUE.value): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=1, max=32, step=1, mode=selector.NumberSelectorMode.BOX)
+            ),
+            vol.Optional(SUN_POSITION_BUILTIN, default=False): selector.BooleanSelector(),
         }
     )
 
@@ -539,6 +563,17 @@ YAML_CONFIG_SCHEMA = vol.Schema(
         vol.Optional(SCFacadeConfig1.ELEVATION_SUN_MAX_STATIC.value, default=90): vol.Coerce(float),
         vol.Optional(DEBUG_ENABLED, default=False): cv.boolean,
         vol.Optional(OWN_LOGFILE_ENABLED, default=False): cv.boolean,
+        vol.Optional(OWN_LOGFILE_SHARED_WRITER, default=False): cv.boolean,
+        vol.Optional(INPUT_COALESCING_WINDOW, default=SCDefaults.INPUT_COALESCING_WINDOW_VALUE.value): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=60)
+        ),
+        vol.Optional(OUTPUT_MIN_INTERVAL, default=SCDefaults.OUTPUT_MIN_INTERVAL_VALUE.value): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+        vol.Optional(COMMAND_RATE_LIMIT, default=SCDefaults.COMMAND_RATE_LIMIT_VALUE.value): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+        vol.Optional(COMMAND_BURST, default=SCDefaults.COMMAND_BURST_VALUE.value): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(RECALCULATION_CONCURRENCY, default=SCDefaults.RECALCULATION_CONCURRENCY_VALUE.value): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=32)
+        ),
+        vol.Optional(SUN_POSITION_BUILTIN, default=False): cv.boolean,
         vol.Optional(SCInternal.NEUTRAL_POS_HEIGHT_MANUAL.value, default=SCDefaults.NEUTRAL_POS_HEIGHT_VALUE.value): vol.Coerce(float),
         vol.Optional(SCFacadeConfig2.NEUTRAL_POS_HEIGHT_ENTITY.value): cv.entity_id,
         vol.Optional(SCInternal.NEUTRAL_POS_ANGLE_MANUAL.value, default=SCDefaults.NEUTRAL_POS_ANGLE_VALUE.value): vol.Coerce(float),
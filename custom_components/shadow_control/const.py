@@ -15,6 +15,13 @@ VERSION = 5
 SC_CONF_NAME = "name"
 DEBUG_ENABLED = "debug_enabled"
 OWN_LOGFILE_ENABLED = "own_logfile_enabled"
+OWN_LOGFILE_SHARED_WRITER = "own_logfile_shared_writer"
+INPUT_COALESCING_WINDOW = "input_coalescing_window"
+OUTPUT_MIN_INTERVAL = "output_min_interval"
+COMMAND_RATE_LIMIT = "command_rate_limit"
+COMMAND_BURST = "command_burst"
+RECALCULATION_CONCURRENCY = "recalculation_concurrency"
+SUN_POSITION_BUILTIN = "sun_position_builtin"
 TARGET_COVER_ENTITY = "target_cover_entity"
 
 
@@ -206,6 +213,21 @@ class SCDawnInput(Enum):
     CLOSE_NOT_LATER_THAN_ENTITY = "dawn_close_not_later_than_entity"
 
 
+class SCInputGroup(Enum):
+    """Groups of input values, which are read together from the configuration or from entity states."""
+
+    NEUTRAL_POSITION = "neutral_position"
+    BRIGHTNESS = "brightness"
+    SUN_POSITION = "sun_position"
+    SUN_TIMES = "sun_times"
+    SHUTTER_POSITION = "shutter_position"
+    LOCK = "lock"
+    MOVEMENT_RESTRICTION = "movement_restriction"
+    SHADOW = "shadow"
+    DAWN = "dawn"
+    DAWN_TIME_CONSTRAINTS = "dawn_time_constraints"
+
+
 # State constants for shutter control
 class ShutterState(IntEnum):
     """Enum for the possible states of the shutter."""
@@ -239,6 +261,38 @@ class LockState(IntEnum):
     LOCKED_BY_EXTERNAL_MODIFICATION = 3
 
 
+# Follow-up action of a calculation trigger, higher values take precedence
+class SCTriggerAction(IntEnum):
+    """Enum for the possible follow-up actions of a calculation trigger."""
+
+    PROCESS_SHUTTER_STATE = 0
+    FORCE_IMMEDIATE_POSITIONING = 1
+    DAWN_HANDLING_DISABLED = 2
+    SHADOW_HANDLING_DISABLED = 3
+
+
+# Source of a calculation trigger, used for the performance diagnostics
+class SCTriggerSource(Enum):
+    """Enum for the sources triggering a calculation."""
+
+    LISTENER = "listener"
+    TIMER = "timer"
+    TIME_CONSTRAINT = "time_constraint"
+    ENTITY_NOTIFY = "entity_notify"
+    SOLAR_ENGINE = "solar_engine"
+    SUN_CROSSING = "sun_crossing"
+    OTHER = "other"
+
+
+class SCCommandPriority(IntEnum):
+    """Enum for the priority lanes of the cover commands, lower values are sent first."""
+
+    # Lock with forced position and enforce positioning
+    FORCED = 0
+    # Sun tracking and all other positioning
+    REGULAR = 1
+
+
 # Configuration values, how to update lock state output
 class UpdateLockStateOutput(IntEnum):
     """Enum for the possible states of the lock."""
@@ -309,6 +363,11 @@ class SCDefaults(Enum):
     LOCK_HEIGHT_VALUE = 0
     LOCK_ANGLE_VALUE = 0  # noqa: PIE796
     MAX_MOVEMENT_DURATION_VALUE = 30
+    INPUT_COALESCING_WINDOW_VALUE = 0  # noqa: PIE796
+    OUTPUT_MIN_INTERVAL_VALUE = 0  # noqa: PIE796
+    COMMAND_RATE_LIMIT_VALUE = 0  # noqa: PIE796
+    COMMAND_BURST_VALUE = 10
+    RECALCULATION_CONCURRENCY_VALUE = 4
     MODIFICATION_TOLERANCE_HEIGHT_STATIC = 3
     MODIFICATION_TOLERANCE_ANGLE_STATIC = 3  # noqa: PIE796
     NEUTRAL_POS_HEIGHT_VALUE = 0  # noqa: PIE796
@@ -415,6 +474,117 @@ SELECT_INTERNAL_TO_EXTERNAL_MAP = {
     SCInternal.MOVEMENT_RESTRICTION_ANGLE_MANUAL.value: SCDynamicInput.MOVEMENT_RESTRICTION_ANGLE_ENTITY.value,
 }
 
+# Entities feeding the input groups. Internal entities are resolved by their SCInternal member,
+# all other members are configuration keys holding the entity_id of an external entity.
+INPUT_GROUP_SOURCES = {
+    SCInputGroup.NEUTRAL_POSITION: (
+        SCFacadeConfig2.NEUTRAL_POS_HEIGHT_ENTITY,
+        SCFacadeConfig2.NEUTRAL_POS_ANGLE_ENTITY,
+        SCInternal.NEUTRAL_POS_HEIGHT_MANUAL,
+        SCInternal.NEUTRAL_POS_ANGLE_MANUAL,
+    ),
+    SCInputGroup.BRIGHTNESS: (
+        SCDynamicInput.BRIGHTNESS_ENTITY,
+        SCDynamicInput.BRIGHTNESS_DAWN_ENTITY,
+    ),
+    SCInputGroup.SUN_POSITION: (
+        SCDynamicInput.SUN_ELEVATION_ENTITY,
+        SCDynamicInput.SUN_AZIMUTH_ENTITY,
+    ),
+    SCInputGroup.SUN_TIMES: (
+        SCDynamicInput.SUNRISE_ENTITY,
+        SCDynamicInput.SUNSET_ENTITY,
+    ),
+    SCInputGroup.SHUTTER_POSITION: (
+        SCDynamicInput.SHUTTER_CURRENT_HEIGHT_ENTITY,
+        SCDynamicInput.SHUTTER_CURRENT_ANGLE_ENTITY,
+    ),
+    SCInputGroup.LOCK: (
+        SCDynamicInput.LOCK_INTEGRATION_ENTITY,
+        SCDynamicInput.LOCK_INTEGRATION_WITH_POSITION_ENTITY,
+        SCDynamicInput.LOCK_HEIGHT_ENTITY,
+        SCDynamicInput.LOCK_ANGLE_ENTITY,
+        SCInternal.LOCK_INTEGRATION_MANUAL,
+        SCInternal.LOCK_INTEGRATION_WITH_POSITION_MANUAL,
+        SCInternal.LOCK_HEIGHT_MANUAL,
+        SCInternal.LOCK_ANGLE_MANUAL,
+    ),
+    SCInputGroup.MOVEMENT_RESTRICTION: (
+        SCDynamicInput.MOVEMENT_RESTRICTION_HEIGHT_ENTITY,
+        SCDynamicInput.MOVEMENT_RESTRICTION_ANGLE_ENTITY,
+        SCInternal.MOVEMENT_RESTRICTION_HEIGHT_MANUAL,
+        SCInternal.MOVEMENT_RESTRICTION_ANGLE_MANUAL,
+    ),
+    SCInputGroup.SHADOW: (
+        SCShadowInput.CONTROL_ENABLED_ENTITY,
+        SCShadowInput.BRIGHTNESS_THRESHOLD_WINTER_ENTITY,
+        SCShadowInput.BRIGHTNESS_THRESHOLD_SUMMER_ENTITY,
+        SCShadowInput.BRIGHTNESS_THRESHOLD_MINIMAL_ENTITY,
+        SCShadowInput.AFTER_SECONDS_ENTITY,
+        SCShadowInput.SHUTTER_MAX_HEIGHT_ENTITY,
+        SCShadowInput.SHUTTER_MAX_ANGLE_ENTITY,
+        SCShadowInput.SHUTTER_LOOK_THROUGH_SECONDS_ENTITY,
+        SCShadowInput.SHUTTER_OPEN_SECONDS_ENTITY,
+        SCShadowInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY,
+        SCShadowInput.HEIGHT_AFTER_SUN_ENTITY,
+        SCShadowInput.ANGLE_AFTER_SUN_ENTITY,
+        SCInternal.SHADOW_CONTROL_ENABLED_MANUAL,
+        SCInternal.SHADOW_BRIGHTNESS_THRESHOLD_WINTER_MANUAL,
+        SCInternal.SHADOW_BRIGHTNESS_THRESHOLD_SUMMER_MANUAL,
+        SCInternal.SHADOW_BRIGHTNESS_THRESHOLD_MINIMAL_MANUAL,
+        SCInternal.SHADOW_AFTER_SECONDS_MANUAL,
+        SCInternal.SHADOW_SHUTTER_MAX_HEIGHT_MANUAL,
+        SCInternal.SHADOW_SHUTTER_MAX_ANGLE_MANUAL,
+        SCInternal.SHADOW_SHUTTER_LOOK_THROUGH_SECONDS_MANUAL,
+        SCInternal.SHADOW_SHUTTER_OPEN_SECONDS_MANUAL,
+        SCInternal.SHADOW_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL,
+        SCInternal.SHADOW_HEIGHT_AFTER_SUN_MANUAL,
+        SCInternal.SHADOW_ANGLE_AFTER_SUN_MANUAL,
+    ),
+    SCInputGroup.DAWN: (
+        SCDawnInput.CONTROL_ENABLED_ENTITY,
+        SCDawnInput.BRIGHTNESS_THRESHOLD_ENTITY,
+        SCDawnInput.AFTER_SECONDS_ENTITY,
+        SCDawnInput.SHUTTER_MAX_HEIGHT_ENTITY,
+        SCDawnInput.SHUTTER_MAX_ANGLE_ENTITY,
+        SCDawnInput.SHUTTER_LOOK_THROUGH_SECONDS_ENTITY,
+        SCDawnInput.SHUTTER_OPEN_SECONDS_ENTITY,
+        SCDawnInput.SHUTTER_LOOK_THROUGH_ANGLE_ENTITY,
+        SCDawnInput.HEIGHT_AFTER_DAWN_ENTITY,
+        SCDawnInput.ANGLE_AFTER_DAWN_ENTITY,
+        SCInternal.DAWN_CONTROL_ENABLED_MANUAL,
+        SCInternal.DAWN_BRIGHTNESS_THRESHOLD_MANUAL,
+        SCInternal.DAWN_AFTER_SECONDS_MANUAL,
+        SCInternal.DAWN_SHUTTER_MAX_HEIGHT_MANUAL,
+        SCInternal.DAWN_SHUTTER_MAX_ANGLE_MANUAL,
+        SCInternal.DAWN_SHUTTER_LOOK_THROUGH_SECONDS_MANUAL,
+        SCInternal.DAWN_SHUTTER_OPEN_SECONDS_MANUAL,
+        SCInternal.DAWN_SHUTTER_LOOK_THROUGH_ANGLE_MANUAL,
+        SCInternal.DAWN_HEIGHT_AFTER_DAWN_MANUAL,
+        SCInternal.DAWN_ANGLE_AFTER_DAWN_MANUAL,
+    ),
+    SCInputGroup.DAWN_TIME_CONSTRAINTS: (
+        SCDawnInput.OPEN_NOT_BEFORE_ENTITY,
+        SCDawnInput.CLOSE_NOT_LATER_THAN_ENTITY,
+        SCInternal.DAWN_OPEN_NOT_BEFORE_MANUAL,
+        SCInternal.DAWN_CLOSE_NOT_LATER_THAN_MANUAL,
+    ),
+}
+
+# Input groups fed by internal entities, which notify the manager right after a change
+INTERNAL_INPUT_GROUPS = frozenset(
+    input_group for input_group, sources in INPUT_GROUP_SOURCES.items() if any(isinstance(source, SCInternal) for source in sources)
+)
+
+# Inputs usually shared by many instances, tracked once for all instances by the input hub.
+# Value: attribute to read instead of the state, if the entity has it (e.g. sun.sun)
+SHARED_INPUT_ATTRIBUTES = {
+    SCDynamicInput.BRIGHTNESS_ENTITY: None,
+    SCDynamicInput.BRIGHTNESS_DAWN_ENTITY: None,
+    SCDynamicInput.SUN_ELEVATION_ENTITY: "elevation",
+    SCDynamicInput.SUN_AZIMUTH_ENTITY: "azimuth",
+}
+
 # Select entity keys that are angle-related and must NOT be created for mode3 (roller blinds)
 SELECT_KEYS_MODE3_EXCLUDED = {
     SCInternal.MOVEMENT_RESTRICTION_ANGLE_MANUAL,
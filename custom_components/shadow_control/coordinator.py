@@ -0,0 +1,137 @@
+"""
+Shadow Control recalculation coordinator.
+
+A change of the sun position (built-in solar engine or shared sun entity) triggers the
+recalculation of many instances at once. The coordinator collects these recalculations and
+runs them in one pass, instead of letting all instances interleave on the event loop.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN_DATA_COORDINATOR = f"{DOMAIN}_coordinator"
+
+# Max number of instances recalculated at the same time within one pass, if no instance configures it
+RECALCULATION_PASS_CONCURRENCY = 4
+
+SCRecalculationJob = Callable[[], Coroutine[Any, Any, None]]
+
+
+class SCRecalculationCoordinator:
+    """
+    Run the recalculations requested within one event loop iteration in a single pass.
+
+    Instances with identical facade geometry form a group. The first instance of a group is
+    recalculated on its own, so equal geometry is calculated once, the other instances then
+    reuse it from the shared geometry cache and are recalculated concurrently. Instances are
+    recalculated concurrently up to the bound configured by the instances, the most
+    restrictive bound applies. Requests arriving while a pass is running are collected for
+    the next pass.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_concurrency: int = RECALCULATION_PASS_CONCURRENCY) -> None:
+        """Initialize the coordinator with the bound used as long as no instance configures one."""
+        self._hass = hass
+        self._default_max_concurrency = max_concurrency
+        self._max_concurrency_limits: dict[str, int] = {}
+        self._pending: dict[Hashable, list[SCRecalculationJob]] = {}
+        self._pass_task: asyncio.Task | None = None
+
+        self.passes = 0
+        self.last_pass_duration: float | None = None
+        self.max_pass_duration: float | None = None
+        self.last_pass_jobs = 0
+        self.last_pass_groups = 0
+
+    @property
+    def max_concurrency(self) -> int:
+        """Return the max number of instances recalculated at the same time."""
+        return min(self._max_concurrency_limits.values(), default=self._default_max_concurrency)
+
+    @callback
+    def async_set_max_concurrency(self, key: str, max_concurrency: int) -> None:
+        """Set the bound configured by an instance, which applies from the next pass on."""
+        self._max_concurrency_limits[key] = max(max_concurrency, 1)
+
+    @callback
+    def async_remove_max_concurrency(self, key: str) -> None:
+        """Remove the bound of an unloaded instance."""
+        self._max_concurrency_limits.pop(key, None)
+
+    @callback
+    def async_request(self, group_key: Hashable, job: SCRecalculationJob) -> None:
+        """Request a recalculation within the next pass, grouped by the given facade geometry."""
+        self._pending.setdefault(group_key, []).append(job)
+        if self._pass_task is None:
+            # Starts after the current loop iteration, so all requests of one update form one pass
+            self._pass_task = self._hass.async_create_task(self._async_run_passes(), eager_start=False)
+
+    async def _async_run_passes(self) -> None:
+        """Run passes as long as recalculations are requested."""
+        try:
+            while self._pending:
+                groups = self._pending
+                self._pending = {}
+                await self._async_run_pass(groups)
+        finally:
+            self._pass_task = None
+
+    async def _async_run_pass(self, groups: dict[Hashable, list[SCRecalculationJob]]) -> None:
+        """Recalculate all groups with bounded concurrency and record the pass time."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _async_run_job(job: SCRecalculationJob) -> None:
+            async with semaphore:
+                try:
+                    await job()
+                except Exception:
+                    # One failing instance must not stop the others
+                    _LOGGER.exception("Recalculation within coordinated pass failed")
+
+        async def _async_run_group(jobs: list[SCRecalculationJob]) -> None:
+            # The first instance fills the geometry cache, so a slow instance delays only its own positioning
+            first, *others = jobs
+            await _async_run_job(first)
+            await asyncio.gather(*(_async_run_job(job) for job in others))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_async_run_group(jobs) for jobs in groups.values()))
+        duration = time.perf_counter() - start
+
+        self.passes += 1
+        self.last_pass_duration = duration
+        self.max_pass_duration = duration if self.max_pass_duration is None else max(self.max_pass_duration, duration)
+        self.last_pass_jobs = sum(len(jobs) for jobs in groups.values())
+        self.last_pass_groups = len(groups)
+        _LOGGER.debug(
+            "Recalculation pass of %d instance(s) in %d facade group(s) took %.1f ms", self.last_pass_jobs, self.last_pass_groups, duration * 1000
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the pass statistics for the diagnostics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "passes": self.passes,
+            "last_pass_ms": round(self.last_pass_duration * 1000, 3) if self.last_pass_duration is not None else None,
+            "max_pass_ms": round(self.max_pass_duration * 1000, 3) if self.max_pass_duration is not None else None,
+            "last_pass_instances": self.last_pass_jobs,
+            "last_pass_groups": self.last_pass_groups,
+        }
+
+
+@callback
+def async_get_recalculation_coordinator(hass: HomeAssistant) -> SCRecalculationCoordinator:
+    """Return the recalculation coordinator shared by all instances."""
+    coordinator: SCRecalculationCoordinator | None = hass.data.get(DOMAIN_DATA_COORDINATOR)
+    if coordinator is None:
+        coordinator = hass.data[DOMAIN_DATA_COORDINATOR] = SCRecalculationCoordinator(hass)
+    return coordinator
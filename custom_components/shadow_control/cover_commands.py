@@ -0,0 +1,120 @@
+"""
+Shadow Control cover commands.
+
+All covers of an instance are moved to the same target. Instead of one service call per
+cover, covers supporting the required feature are moved with a single service call. The
+commands of a positioning run are dispatched concurrently per service, position before tilt,
+a failing call is repeated per cover, so a single faulty cover doesn't prevent the others
+from being moved.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from homeassistant.components.cover import CoverEntityFeature
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+from homeassistant.core import State
+
+from .const import SCCommandPriority
+
+SERVICE_SET_COVER_POSITION = "set_cover_position"
+SERVICE_SET_COVER_TILT_POSITION = "set_cover_tilt_position"
+
+# Max number of service calls of one positioning run in flight at the same time
+COVER_DISPATCH_CONCURRENCY = 8
+
+# Service data attribute of the target value per service
+COVER_SERVICE_ATTRIBUTES = {
+    SERVICE_SET_COVER_POSITION: "position",
+    SERVICE_SET_COVER_TILT_POSITION: "tilt_position",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SCCoverCommand:
+    """Service call, which moves one or several covers to the same target."""
+
+    service: str
+    entity_ids: tuple[str, ...]
+    # Target in the semantics of Home Assistant (100 = open)
+    value: float
+    # Lane of the command scheduler
+    priority: SCCommandPriority = SCCommandPriority.REGULAR
+
+    @property
+    def service_data(self) -> dict[str, Any]:
+        """Return the data of the service call, a single cover is addressed without list."""
+        entity_id: str | list[str] = self.entity_ids[0] if len(self.entity_ids) == 1 else list(self.entity_ids)
+        return {"entity_id": entity_id, COVER_SERVICE_ATTRIBUTES[self.service]: self.value}
+
+
+def split_covers_by_feature(cover_states: Mapping[str, State], feature: CoverEntityFeature) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return the covers supporting the given feature and the other ones."""
+    supported: list[str] = []
+    unsupported: list[str] = []
+    for entity_id, state in cover_states.items():
+        if state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) & feature:
+            supported.append(entity_id)
+        else:
+            unsupported.append(entity_id)
+    return tuple(supported), tuple(unsupported)
+
+
+@dataclass(frozen=True, slots=True)
+class SCCoverCommandFailure:
+    """Service call, which failed for a single cover."""
+
+    service: str
+    entity_id: str
+    error: Exception
+
+
+@dataclass(frozen=True, slots=True)
+class SCCoverDispatchResult:
+    """Outcome of all commands of a positioning run."""
+
+    # Seconds from the first call until all calls returned
+    duration: float
+    service_calls: int
+    failures: tuple[SCCoverCommandFailure, ...]
+
+
+async def async_dispatch_cover_commands(
+    send: Callable[[SCCoverCommand], Awaitable[None]],
+    commands: Sequence[SCCoverCommand],
+    max_concurrency: int = COVER_DISPATCH_CONCURRENCY,
+) -> SCCoverDispatchResult:
+    """
+    Send all commands with the given function, concurrently per service and bounded by max_concurrency.
+
+    The send function is expected to return, when the service call is completed. All position
+    commands are completed before the tilt commands are sent, as a cover may ignore the tilt
+    while it starts moving to a new position. If a command for several covers fails, it is
+    sent again to each cover on its own, so only the faulty covers are reported as failed.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    failures: list[SCCoverCommandFailure] = []
+    service_calls = 0
+
+    async def _async_send(command: SCCoverCommand) -> None:
+        nonlocal service_calls
+        async with semaphore:
+            service_calls += 1
+            try:
+                await send(command)
+            except Exception as err:  # noqa: BLE001
+                if len(command.entity_ids) == 1:
+                    failures.append(SCCoverCommandFailure(command.service, command.entity_ids[0], err))
+                    return
+            else:
+                return
+        # Repeated per cover after releasing the semaphore, as each single call acquires it itself
+        await asyncio.gather(*(_async_send(replace(command, entity_ids=(entity_id,))) for entity_id in command.entity_ids))
+
+    start = time.perf_counter()
+    for service in COVER_SERVICE_ATTRIBUTES:
+        await asyncio.gather(*(_async_send(command) for command in commands if command.service == service))
+    return SCCoverDispatchResult(time.perf_counter() - start, service_calls, tuple(failures))
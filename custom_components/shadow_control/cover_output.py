@@ -0,0 +1,209 @@
+"""
+Shadow Control cover output stage.
+
+Bus based actuators (e.g. KNX) lose telegrams, if they receive several position or tilt
+commands in quick succession. The output stage is placed between the positioning and the
+cover services: per cover, only the latest pending target is kept, commands are sent at most
+once within the configured minimum interval and commands equal to the target, to which the
+cover is already moving, are dropped. Commands are sent in the background, so the
+positioning doesn't wait for the cover services.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    import asyncio
+
+from .const import DOMAIN, SCCommandPriority
+from .cover_commands import COVER_SERVICE_ATTRIBUTES, SCCoverCommand, SCCoverDispatchResult
+
+_LOGGER = logging.getLogger(__name__)
+
+# Timers may fire slightly before the monotonic clock reaches the due time
+OUTPUT_DUE_TOLERANCE = 0.01
+
+SCCoverCommandSender = Callable[[list[SCCoverCommand]], Awaitable[SCCoverDispatchResult | None]]
+
+
+@dataclass(slots=True)
+class SCCoverOutputState:
+    """Output state of a single cover."""
+
+    # Monotonic time of the last command sent to the cover
+    last_sent: float | None = None
+    # Last sent target and its monotonic send time per service
+    in_flight: dict[str, tuple[float, float]] = field(default_factory=dict)
+    # Latest target and its priority per service, which wasn't sent yet
+    pending: dict[str, tuple[float, SCCommandPriority]] = field(default_factory=dict)
+
+
+class SCCoverOutput:
+    """
+    Output stage of the cover commands of one instance.
+
+    Targets are tracked per cover and service. A target equal to the one sent within the in
+    flight duration (the max movement duration of the cover) is dropped, unless sending it
+    failed for this cover. Targets for a cover,
+    which received a command within the minimum interval, are kept pending and sent together
+    when the interval elapsed, a newer target replaces the pending one. Covers with the same
+    target are still moved with a single service call.
+    """
+
+    def __init__(self, hass: HomeAssistant, send: SCCoverCommandSender, min_interval: float, in_flight_duration: float) -> None:
+        """Initialize the output stage."""
+        self._hass = hass
+        self._send = send
+        self._min_interval = min_interval
+        self._in_flight_duration = in_flight_duration
+        self._covers: dict[str, SCCoverOutputState] = {}
+        self._unsub_flush: Callable[[], None] | None = None
+        self._flush_due: float | None = None
+        # Dispatches waiting for the cover services
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+
+        # Counted per cover and service
+        self.sent_targets = 0
+        self.superseded_targets = 0
+        self.dropped_targets = 0
+
+    @property
+    def pending_targets(self) -> int:
+        """Return the number of targets waiting for the minimum interval."""
+        return sum(len(state.pending) for state in self._covers.values())
+
+    @callback
+    def async_submit(self, commands: Sequence[SCCoverCommand], force: bool = False) -> None:
+        """
+        Send the commands to all covers, which are ready, and keep the others pending.
+
+        Returns without waiting for the service calls. With force (enforce positioning), targets equal to the in flight target are sent anyway.
+        """
+        now = time.monotonic()
+        for command in commands:
+            for entity_id in command.entity_ids:
+                self._add_target(self._covers.setdefault(entity_id, SCCoverOutputState()), command, now, force)
+        self._send_due(now)
+
+    def _add_target(self, state: SCCoverOutputState, command: SCCoverCommand, now: float, force: bool) -> None:
+        """Add the target of the command as pending target of the cover, unless the cover already moves there."""
+        service = command.service
+        in_flight = state.in_flight.get(service)
+        if not force and in_flight is not None and abs(in_flight[0] - command.value) < 0.001 and now - in_flight[1] < self._in_flight_duration:
+            # The cover is already moving to this target, an older pending target is obsolete
+            if state.pending.pop(service, None) is not None:
+                self.superseded_targets += 1
+            self.dropped_targets += 1
+            return
+        if service in state.pending:
+            self.superseded_targets += 1
+        state.pending[service] = (command.value, command.priority)
+
+    def _is_due(self, state: SCCoverOutputState, now: float) -> bool:
+        """Return if the minimum interval since the last command of the cover elapsed."""
+        return state.last_sent is None or now >= state.last_sent + self._min_interval - OUTPUT_DUE_TOLERANCE
+
+    def _send_due(self, now: float) -> None:
+        """Send the pending targets of all due covers and schedule the remaining ones."""
+        targets: dict[tuple[str, float, SCCommandPriority], list[str]] = {}
+        for entity_id, state in self._covers.items():
+            if not state.pending or not self._is_due(state, now):
+                continue
+            for service, (value, priority) in state.pending.items():
+                targets.setdefault((service, value, priority), []).append(entity_id)
+                state.in_flight[service] = (value, now)
+            self.sent_targets += len(state.pending)
+            state.pending.clear()
+            state.last_sent = now
+
+        self._schedule_flush()
+        if not targets:
+            return
+        # Position before tilt, like the positioning itself
+        commands = [
+            SCCoverCommand(service, tuple(entity_ids), value, priority)
+            for ordered_service in COVER_SERVICE_ATTRIBUTES
+            for (service, value, priority), entity_ids in targets.items()
+            if service == ordered_service
+        ]
+        task = self._hass.async_create_task(self._async_dispatch(commands, now), f"{DOMAIN}_cover_dispatch")
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _async_dispatch(self, commands: list[SCCoverCommand], sent: float) -> None:
+        """Send the commands and forget the targets, which failed to be sent."""
+        try:
+            result = await self._send(commands)
+        except Exception:
+            _LOGGER.exception("Dispatch of cover commands failed")
+            return
+        if result is not None:
+            self._clear_failed_in_flight(result, sent)
+
+    def _clear_failed_in_flight(self, result: SCCoverDispatchResult, sent: float) -> None:
+        """Forget the targets, which failed to be sent, so the next positioning sends them again."""
+        for failure in result.failures:
+            state = self._covers[failure.entity_id]
+            in_flight = state.in_flight.get(failure.service)
+            # Keep a newer target, which was sent while waiting for the result
+            if in_flight is not None and in_flight[1] == sent:
+                del state.in_flight[failure.service]
+
+    def _schedule_flush(self) -> None:
+        """Schedule sending the pending targets, when the first cover with pending targets is due."""
+        due = min(
+            (state.last_sent + self._min_interval for state in self._covers.values() if state.pending and state.last_sent is not None),
+            default=None,
+        )
+        if due is None or (self._flush_due is not None and self._flush_due <= due):
+            return
+        self.async_cancel_flush()
+        self._flush_due = due
+        self._unsub_flush = async_call_later(self._hass, max(due - time.monotonic(), 0), self._async_flush)
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Send the pending targets, whose minimum interval elapsed."""
+        self._unsub_flush = None
+        self._flush_due = None
+        self._send_due(time.monotonic())
+
+    @callback
+    def async_cancel_flush(self) -> None:
+        """Cancel the scheduled sending of the pending targets."""
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        self._flush_due = None
+
+    @callback
+    def async_reset_in_flight(self) -> None:
+        """Forget the sent targets, e.g. after the covers were moved manually, so equal targets are sent again."""
+        for state in self._covers.values():
+            state.in_flight.clear()
+
+    @callback
+    def async_cancel(self) -> None:
+        """Discard all pending targets and stop the running dispatches, e.g. on unload."""
+        self.async_cancel_flush()
+        for state in self._covers.values():
+            state.pending.clear()
+        for task in self._dispatch_tasks:
+            task.cancel()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the output statistics for the diagnostics."""
+        return {
+            "min_interval": self._min_interval,
+            "sent_targets": self.sent_targets,
+            "superseded_targets": self.superseded_targets,
+            "dropped_targets": self.dropped_targets,
+            "pending_targets": self.pending_targets,
+        }
@@ -0,0 +1,41 @@
+"""Shadow Control diagnostics."""
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from . import ShadowControlManager
+
+from .command_scheduler import DOMAIN_DATA_COMMAND_SCHEDULER, SCCommandScheduler
+from .const import DOMAIN_DATA_MANAGERS
+from .coordinator import DOMAIN_DATA_COORDINATOR, SCRecalculationCoordinator
+from .geometry_cache import DOMAIN_DATA_GEOMETRY_CACHE, SCGeometryCache
+from .state_cache import DOMAIN_DATA_STATE_CACHE, SCParsedStateCache
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return the performance diagnostics and sun path of a Shadow Control instance and the statistics of the shared helpers."""
+    manager: ShadowControlManager | None = hass.data.get(DOMAIN_DATA_MANAGERS, {}).get(entry.entry_id)
+    if manager is None:
+        return {}
+
+    sun_path_table = await manager.async_get_sun_path_table()
+    adaptive_brightness = manager.adaptive_brightness_calculator
+    # Shared by all instances
+    state_cache: SCParsedStateCache | None = hass.data.get(DOMAIN_DATA_STATE_CACHE)
+    geometry_cache: SCGeometryCache | None = hass.data.get(DOMAIN_DATA_GEOMETRY_CACHE)
+    coordinator: SCRecalculationCoordinator | None = hass.data.get(DOMAIN_DATA_COORDINATOR)
+    command_scheduler: SCCommandScheduler | None = hass.data.get(DOMAIN_DATA_COMMAND_SCHEDULER)
+    return {
+        "name": manager.name,
+        "performance": manager.performance_stats.as_dict(),
+        "cover_output": manager.cover_output.as_dict(),
+        "sun_path": sun_path_table.as_dict(),
+        "adaptive_brightness": adaptive_brightness.as_dict() if adaptive_brightness is not None else None,
+        "state_cache": state_cache.as_dict() if state_cache is not None else None,
+        "geometry_cache": geometry_cache.as_dict() if geometry_cache is not None else None,
+        "recalculation_passes": coordinator.as_dict() if coordinator is not None else None,
+        "command_scheduler": command_scheduler.as_dict() if command_scheduler is not None else None,
+    }
@@ -0,0 +1,163 @@
+"""
+Shadow Control facade and shutter geometry.
+
+Pure functions without any manager state or logging, so they can be used for a single
+sun position within a calculation run as well as for schedules and simulations. See
+geometry_batch.py for the vectorized variant working on whole arrays of sun positions.
+"""
+
+import math
+
+from .const import ShutterType
+
+# Sun nearly parallel to the facade
+MIN_VIRTUAL_DEPTH = 1e-9
+MIN_EFFECTIVE_SLAT_WIDTH = 1e-6
+
+
+def calculate_effective_elevation(sun_azimuth: float, sun_elevation: float, facade_azimuth: float) -> float:
+    """
+    Calculate the elevation of the sun in the right angle to the facade.
+
+    Raises ValueError for sun positions without a tangent (e.g. infinite values).
+    """
+    virtual_depth = math.cos(math.radians(abs(sun_azimuth - facade_azimuth)))
+    virtual_height = math.tan(math.radians(sun_elevation))
+
+    # Prevent division by zero if virtual_depth if very small
+    if abs(virtual_depth) < MIN_VIRTUAL_DEPTH:
+        return 90.0 if virtual_height > 0 else -90.0
+    return math.degrees(math.atan(virtual_height / virtual_depth))
+
+
+def calculate_sun_entry_exit_angles(facade_azimuth: float, offset_sun_in: float, offset_sun_out: float) -> tuple[float, float]:
+    """Return the azimuth angles (0-360°), at which the sun enters and leaves the facade."""
+    sun_entry_angle = facade_azimuth - abs(offset_sun_in)
+    sun_exit_angle = facade_azimuth + abs(offset_sun_out)
+    if sun_entry_angle < 0:
+        sun_entry_angle = 360 - abs(sun_entry_angle)
+    if sun_exit_angle >= 360:
+        sun_exit_angle %= 360
+    return sun_entry_angle, sun_exit_angle
+
+
+def is_sun_between_offsets(sun_azimuth: float, sun_entry_angle: float, sun_exit_angle: float) -> bool:
+    """Check if the sun azimuth is between the entry and exit angle, also across north (0°)."""
+    sun_exit_angle_calc = sun_exit_angle - sun_entry_angle
+    if sun_exit_angle_calc < 0:
+        sun_exit_angle_calc += 360
+    azimuth_calc = sun_azimuth - sun_entry_angle
+    if azimuth_calc < 0:
+        azimuth_calc += 360
+    return 0 <= azimuth_calc <= sun_exit_angle_calc
+
+
+def is_elevation_in_range(effective_elevation: float, elevation_sun_min: float, elevation_sun_max: float) -> bool:
+    """Check if the effective elevation is between the configured min and max elevation."""
+    return elevation_sun_min < effective_elevation < elevation_sun_max
+
+
+def calculate_shutter_height(sun_elevation: float, light_strip_width: float, shutter_height: float, shutter_max_height: float) -> float:
+    """
+    Calculate the shutter height in percent, so the light strip on the floor keeps the given width.
+
+    Stepping is not applied, see apply_stepping().
+    """
+    if light_strip_width == 0:
+        return shutter_max_height
+
+    # PHP's round is usually 'trading round' (round up 0.5).
+    # Python's round() rounds to next even number at 0.5 ('bankers rounding').
+    # For the shutter position, the difference would be minimal, so we're using round().
+    shutter_height_from_bottom = round(light_strip_width * math.tan(math.radians(sun_elevation)))
+
+    # PHP: 100 - round($shutterHeightToSet * 100 / $shutterOverallHeight);
+    new_shutter_height = 100 - round((shutter_height_from_bottom * 100) / shutter_height)
+    if new_shutter_height < shutter_max_height:
+        return new_shutter_height
+    return shutter_max_height
+
+
+def calculate_shutter_angle(
+    sun_azimuth: float,
+    effective_elevation: float,
+    facade_azimuth: float,
+    slat_width: float,
+    slat_distance: float,
+    shutter_type: ShutterType,
+) -> float | None:
+    """
+    Calculate the slat angle in percent, which prevents direct sunlight within the room.
+
+    The result is rounded to full percent, stepping, offset and limits are not applied, see
+    apply_stepping() and limit_shutter_angle(). Returns None if the slat geometry doesn't
+    allow to block the sun at all. Shutters of type MODE3 have no angle and must not be
+    passed to this function.
+    """
+    # The sun hits the facade at a relative azimuth angle. This reduces the
+    # effective slat width as seen from the sun's perspective, requiring a
+    # steeper slat angle to block direct sunlight.
+    relative_azimuth_deg = abs(sun_azimuth - facade_azimuth)
+    # Normalize to 0-90° range (facade is in sun, so max offset is 90°)
+    if relative_azimuth_deg > 90:
+        relative_azimuth_deg = 90.0
+    effective_slat_width = slat_width * math.cos(math.radians(relative_azimuth_deg))
+
+    # Sun nearly parallel to facade, avoid division by zero / extreme values
+    if effective_slat_width < MIN_EFFECTIVE_SLAT_WIDTH:
+        effective_slat_width = slat_width
+
+    # $alpha is the opposite angle of shutter slat width, so this is the difference
+    # between effectiveElevation and vertical
+    alpha_deg = 90 - effective_elevation
+    alpha_rad = math.radians(alpha_deg)
+
+    # $beta is the opposite angle of shutter slat distance
+    asin_arg = (math.sin(alpha_rad) * slat_distance) / effective_slat_width
+
+    # Azimuth correction leads to impossible geometry if the effective slat width is smaller
+    # than the slat distance, fall back to the original slat width in this case
+    if asin_arg > 1.0:
+        asin_arg = (math.sin(alpha_rad) * slat_distance) / slat_width
+
+    if not (-1 <= asin_arg <= 1):
+        return None
+
+    beta_deg = math.degrees(math.asin(asin_arg))
+
+    # $gamma is the angle between vertical and shutter slat
+    gamma_deg = 180 - alpha_deg - beta_deg
+
+    # $shutterAnglePercent is the difference between horizontal and shutter slat
+    shutter_angle_degrees = round(90 - gamma_deg)
+
+    # MODE1 and fallback for unknown types
+    shutter_angle_percent: float = shutter_angle_degrees / 1.8 + 50 if shutter_type == ShutterType.MODE2 else shutter_angle_degrees / 0.9
+
+    # Make sure, the angle will not be lower than 0
+    if shutter_angle_percent < 0:
+        shutter_angle_percent = 0.0
+
+    # Round before stepping
+    return round(shutter_angle_percent)
+
+
+def apply_stepping(value_percent: float, stepping_percent: float) -> float:
+    """Round the given value up to the next multiple of the stepping, a stepping of 0 disables it."""
+    # Example: 10% stepping, current height 23%. remainder = 3.
+    # 23 + 10 - 3 = 30. (Rounds up to the next full step).
+    if stepping_percent != 0:
+        remainder = value_percent % stepping_percent
+        if remainder != 0:
+            return value_percent + stepping_percent - remainder
+    return value_percent
+
+
+def limit_shutter_angle(angle_percent: float, slat_angle_offset: float, slat_min_angle: float, shutter_max_angle: float) -> float:
+    """Add the slat angle offset to the (stepped) angle and limit the result to the configured min and max angle."""
+    angle_percent += slat_angle_offset
+    if angle_percent < slat_min_angle:
+        angle_percent = slat_min_angle
+    elif angle_percent > shutter_max_angle:
+        angle_percent = shutter_max_angle
+    return float(round(angle_percent))
@@ -0,0 +1,161 @@
+"""
+Vectorized Shadow Control facade and shutter geometry.
+
+Same calculations as geometry.py, but for whole arrays of sun positions at once. Used for
+what-if analysis, schedules and simulations. Up to the last bit of the trigonometric
+functions, the results are the same as the ones of the scalar functions.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .const import ShutterType
+from .geometry import MIN_EFFECTIVE_SLAT_WIDTH, MIN_VIRTUAL_DEPTH, calculate_sun_entry_exit_angles
+
+if TYPE_CHECKING:
+    from . import SCStaticFacadeConfiguration
+
+
+@dataclass(frozen=True, slots=True)
+class SCGeometryBatch:
+    """Geometry results for an array of sun positions."""
+
+    # Sun between the facade offsets and effective elevation within min-max-range
+    is_in_sun: NDArray[np.bool_]
+    # NaN, where the sun is not between the facade offsets
+    effective_elevation: NDArray[np.float64]
+    # Shutter height in percent for shadow handling, stepping applied
+    height: NDArray[np.float64]
+    # Slat angle in percent for shadow handling, stepping, offset and limits applied. 0.0 if not in sun.
+    angle: NDArray[np.float64]
+
+
+def calculate_effective_elevation(sun_azimuth: ArrayLike, sun_elevation: ArrayLike, facade_azimuth: float) -> NDArray[np.float64]:
+    """Calculate the elevation of the sun in the right angle to the facade, see geometry.calculate_effective_elevation()."""
+    virtual_depth = np.cos(np.radians(np.abs(np.asarray(sun_azimuth, dtype=float) - facade_azimuth)))
+    virtual_height = np.tan(np.radians(np.asarray(sun_elevation, dtype=float)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        effective_elevation = np.degrees(np.arctan(virtual_height / virtual_depth))
+    return np.where(np.abs(virtual_depth) < MIN_VIRTUAL_DEPTH, np.where(virtual_height > 0, 90.0, -90.0), effective_elevation)
+
+
+def is_sun_between_offsets(sun_azimuth: ArrayLike, sun_entry_angle: float, sun_exit_angle: float) -> NDArray[np.bool_]:
+    """Check if the sun azimuth is between the entry and exit angle, see geometry.is_sun_between_offsets()."""
+    sun_exit_angle_calc = sun_exit_angle - sun_entry_angle
+    if sun_exit_angle_calc < 0:
+        sun_exit_angle_calc += 360
+    azimuth_calc = np.asarray(sun_azimuth, dtype=float) - sun_entry_angle
+    azimuth_calc = np.where(azimuth_calc < 0, azimuth_calc + 360, azimuth_calc)
+    return (azimuth_calc >= 0) & (azimuth_calc <= sun_exit_angle_calc)
+
+
+def calculate_shutter_height(
+    sun_elevation: ArrayLike, light_strip_width: float, shutter_height: float, shutter_max_height: float
+) -> NDArray[np.float64]:
+    """Calculate the shutter height in percent without stepping, see geometry.calculate_shutter_height()."""
+    sun_elevation = np.asarray(sun_elevation, dtype=float)
+    if light_strip_width == 0:
+        return np.full(sun_elevation.shape, float(shutter_max_height))
+
+    # np.round() rounds half to even, same as Python's round()
+    shutter_height_from_bottom = np.round(light_strip_width * np.tan(np.radians(sun_elevation)))
+    new_shutter_height = 100 - np.round((shutter_height_from_bottom * 100) / shutter_height)
+    return np.where(new_shutter_height < shutter_max_height, new_shutter_height, float(shutter_max_height))
+
+
+def calculate_shutter_angle(
+    sun_azimuth: ArrayLike,
+    effective_elevation: ArrayLike,
+    facade_azimuth: float,
+    slat_width: float,
+    slat_distance: float,
+    shutter_type: ShutterType,
+) -> NDArray[np.float64]:
+    """
+    Calculate the rounded slat angle in percent without stepping, see geometry.calculate_shutter_angle().
+
+    NaN, where the slat geometry doesn't allow to block the sun or the effective elevation is NaN.
+    """
+    relative_azimuth_deg = np.minimum(np.abs(np.asarray(sun_azimuth, dtype=float) - facade_azimuth), 90.0)
+    effective_slat_width = slat_width * np.cos(np.radians(relative_azimuth_deg))
+    effective_slat_width = np.where(effective_slat_width < MIN_EFFECTIVE_SLAT_WIDTH, slat_width, effective_slat_width)
+
+    alpha_deg = 90 - np.asarray(effective_elevation, dtype=float)
+    alpha_rad = np.radians(alpha_deg)
+
+    asin_arg = (np.sin(alpha_rad) * slat_distance) / effective_slat_width
+    asin_arg = np.where(asin_arg > 1.0, (np.sin(alpha_rad) * slat_distance) / slat_width, asin_arg)
+    valid = (asin_arg >= -1) & (asin_arg <= 1)
+
+    with np.errstate(invalid="ignore"):
+        beta_deg = np.degrees(np.arcsin(asin_arg))
+    gamma_deg = 180 - alpha_deg - beta_deg
+    shutter_angle_degrees = np.round(90 - gamma_deg)
+
+    shutter_angle_percent = shutter_angle_degrees / 1.8 + 50 if shutter_type == ShutterType.MODE2 else shutter_angle_degrees / 0.9
+    shutter_angle_percent = np.where(shutter_angle_percent < 0, 0.0, shutter_angle_percent)
+
+    return np.where(valid, np.round(shutter_angle_percent), np.nan)
+
+
+def apply_stepping(value_percent: ArrayLike, stepping_percent: float) -> NDArray[np.float64]:
+    """Round the given values up to the next multiple of the stepping, see geometry.apply_stepping()."""
+    value_percent = np.asarray(value_percent, dtype=float)
+    if stepping_percent == 0:
+        return value_percent
+    # np.mod() has the same sign semantics as Python's %
+    remainder = np.mod(value_percent, stepping_percent)
+    return np.where(remainder != 0, value_percent + stepping_percent - remainder, value_percent)
+
+
+def limit_shutter_angle(angle_percent: ArrayLike, slat_angle_offset: float, slat_min_angle: float, shutter_max_angle: float) -> NDArray[np.float64]:
+    """Add the slat angle offset and limit the result to min and max angle, see geometry.limit_shutter_angle()."""
+    angle_percent = np.asarray(angle_percent, dtype=float) + slat_angle_offset
+    angle_percent = np.where(
+        angle_percent < slat_min_angle, slat_min_angle, np.where(angle_percent > shutter_max_angle, shutter_max_angle, angle_percent)
+    )
+    return np.round(angle_percent)
+
+
+def calculate_geometry_batch(
+    sun_azimuth: ArrayLike,
+    sun_elevation: ArrayLike,
+    facade: "SCStaticFacadeConfiguration",
+    shutter_max_height: float,
+    shutter_max_angle: float,
+) -> SCGeometryBatch:
+    """
+    Calculate the facade relation and the shadow position of the shutter for all given sun positions.
+
+    Azimuth and elevation must have the same shape. Corresponds to the values a manager would
+    calculate for each sun position within a shadow state.
+    """
+    sun_azimuth = np.asarray(sun_azimuth, dtype=float)
+    sun_elevation = np.asarray(sun_elevation, dtype=float)
+
+    sun_entry_angle, sun_exit_angle = calculate_sun_entry_exit_angles(facade.azimuth, facade.offset_sun_in, facade.offset_sun_out)
+    sun_between_offsets = is_sun_between_offsets(sun_azimuth, sun_entry_angle, sun_exit_angle)
+    effective_elevation = np.where(sun_between_offsets, calculate_effective_elevation(sun_azimuth, sun_elevation, facade.azimuth), np.nan)
+    is_in_sun = sun_between_offsets & (effective_elevation > facade.elevation_sun_min) & (effective_elevation < facade.elevation_sun_max)
+
+    height = apply_stepping(
+        calculate_shutter_height(sun_elevation, facade.light_strip_width, facade.shutter_height, shutter_max_height),
+        facade.shutter_stepping_height,
+    )
+
+    if facade.shutter_type == ShutterType.MODE3:
+        angle = np.zeros(sun_azimuth.shape)
+    else:
+        raw_angle = calculate_shutter_angle(
+            sun_azimuth, effective_elevation, facade.azimuth, facade.slat_width, facade.slat_distance, facade.shutter_type
+        )
+        angle = limit_shutter_angle(
+            apply_stepping(raw_angle, facade.shutter_stepping_angle), facade.slat_angle_offset, facade.slat_min_angle, shutter_max_angle
+        )
+        angle = np.where(np.isnan(raw_angle), 0.0, angle)
+
+    return SCGeometryBatch(is_in_sun=is_in_sun, effective_elevation=effective_elevation, height=height, angle=angle)
@@ -0,0 +1,80 @@
+"""
+Shadow Control cache of geometry results.
+
+Instances with identical facades (e.g. all south-facing windows of a building) calculate
+identical angles and heights for the same sun position. The cache stores the results of
+the geometry functions keyed by their inputs, so these instances share them.
+"""
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, ShutterType
+from .geometry import calculate_effective_elevation, calculate_shutter_angle, calculate_shutter_height
+from .lru_cache import SCLruCache
+
+DOMAIN_DATA_GEOMETRY_CACHE = f"{DOMAIN}_geometry_cache"
+
+# Max number of results, enough for some hundred facades at the current sun position
+GEOMETRY_CACHE_SIZE = 1024
+
+# Decimal places of the sun position (0.01°), within which the geometry results are shared
+SUN_POSITION_DIGITS = 2
+
+
+def quantize_sun_position(value: float) -> float:
+    """Round an azimuth or elevation to the resolution of the cache."""
+    return round(value, SUN_POSITION_DIGITS)
+
+
+class SCGeometryCache(SCLruCache):
+    """
+    Results of the geometry functions, keyed by the facade geometry and the quantized sun position.
+
+    The results are calculated with the exact sun position of the instance, which misses the
+    cache first. Other lookups within the same quantization step get this result, i.e. one for
+    a sun position deviating by at most 0.005°, which is far below the resolution of the height
+    and angle stepping. The cache is shared by all instances and bounded, the least recently
+    used results are removed if it is full.
+    """
+
+    def __init__(self, max_size: int = GEOMETRY_CACHE_SIZE) -> None:
+        """Initialize the empty cache."""
+        super().__init__(max_size)
+
+    def effective_elevation(self, sun_azimuth: float, sun_elevation: float, facade_azimuth: float) -> float:
+        """Return the effective elevation, see geometry.calculate_effective_elevation()."""
+        return self._get(
+            ("effective_elevation", quantize_sun_position(sun_azimuth), quantize_sun_position(sun_elevation), facade_azimuth),
+            lambda: calculate_effective_elevation(sun_azimuth, sun_elevation, facade_azimuth),
+        )
+
+    def shutter_height(self, sun_elevation: float, light_strip_width: float, shutter_height: float, shutter_max_height: float) -> float:
+        """Return the shutter height without stepping, see geometry.calculate_shutter_height()."""
+        return self._get(
+            ("shutter_height", quantize_sun_position(sun_elevation), light_strip_width, shutter_height, shutter_max_height),
+            lambda: calculate_shutter_height(sun_elevation, light_strip_width, shutter_height, shutter_max_height),
+        )
+
+    def shutter_angle(
+        self,
+        sun_azimuth: float,
+        effective_elevation: float,
+        facade_azimuth: float,
+        slat_width: float,
+        slat_distance: float,
+        shutter_type: ShutterType,
+    ) -> float | None:
+        """Return the slat angle without stepping, offset and limits, see geometry.calculate_shutter_angle()."""
+        return self._get(
+            ("shutter_angle", quantize_sun_position(sun_azimuth), effective_elevation, facade_azimuth, slat_width, slat_distance, shutter_type),
+            lambda: calculate_shutter_angle(sun_azimuth, effective_elevation, facade_azimuth, slat_width, slat_distance, shutter_type),
+        )
+
+
+@callback
+def async_get_geometry_cache(hass: HomeAssistant) -> SCGeometryCache:
+    """Return the geometry cache shared by all instances."""
+    cache: SCGeometryCache | None = hass.data.get(DOMAIN_DATA_GEOMETRY_CACHE)
+    if cache is None:
+        cache = hass.data[DOMAIN_DATA_GEOMETRY_CACHE] = SCGeometryCache()
+    return cache
@@ -0,0 +1,93 @@
+"""
+Shadow Control input hub.
+
+Sun and brightness entities are usually used by many instances. The hub subscribes once to
+each of these entities and hands the change over to all instances using the entity. The values
+are parsed once per state update by the state cache shared by all instances.
+"""
+
+from collections.abc import Callable
+
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+from .state_cache import SCParsedStateCache, async_get_state_cache, get_raw_state_value
+
+DOMAIN_DATA_INPUT_HUB = f"{DOMAIN}_input_hub"
+
+SCInputListener = Callable[[Event[EventStateChangedData]], None]
+
+
+def parse_float_state(state: State | None, attribute_name: str | None = None, state_cache: SCParsedStateCache | None = None) -> float | None:
+    """
+    Return the value of the given state as float or None if the entity has no valid value.
+
+    If the attribute exists (e.g. elevation of sun.sun), its value is used, otherwise the state.
+    With a state cache, the value is parsed once per state update.
+    """
+    if state is None or state.state in ["unavailable", "unknown"]:
+        return None
+
+    try:
+        if state_cache is not None:
+            return state_cache.get_float(state, attribute_name)
+        return float(get_raw_state_value(state, attribute_name))
+    except (ValueError, TypeError):
+        return None
+
+
+class SCInputHub:
+    """Track input entities shared by several instances with a single subscription per entity."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self._hass = hass
+        self._listeners: dict[str, list[SCInputListener]] = {}
+        self._unsub_entities: dict[str, Callable[[], None]] = {}
+        self._state_cache: SCParsedStateCache = async_get_state_cache(hass)
+
+    @property
+    def tracked_entities(self) -> int:
+        """Return the number of entities with a subscription."""
+        return len(self._unsub_entities)
+
+    def value(self, entity_id: str, attribute_name: str | None = None) -> float | None:
+        """Return the parsed value of the given entity (attribute) or None if the entity has no valid value."""
+        return parse_float_state(self._hass.states.get(entity_id), attribute_name, self._state_cache)
+
+    @callback
+    def async_subscribe(self, entity_id: str, listener: SCInputListener) -> Callable[[], None]:
+        """Call the listener on each state change of the entity, returns the function to unsubscribe."""
+        listeners = self._listeners.setdefault(entity_id, [])
+        listeners.append(listener)
+        if entity_id not in self._unsub_entities:
+            self._unsub_entities[entity_id] = async_track_state_change_event(self._hass, entity_id, self._async_state_changed)
+
+        @callback
+        def _async_unsubscribe() -> None:
+            if listener not in listeners:
+                return
+            listeners.remove(listener)
+            if not listeners:
+                del self._listeners[entity_id]
+                self._unsub_entities.pop(entity_id)()
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Inform all instances using the changed entity."""
+        entity_id = event.data["entity_id"]
+        # Copy, as listeners might unsubscribe meanwhile
+        for listener in list(self._listeners.get(entity_id, ())):
+            listener(event)
+
+
+@callback
+def async_get_input_hub(hass: HomeAssistant) -> SCInputHub:
+    """Return the input hub shared by all instances."""
+    hub: SCInputHub | None = hass.data.get(DOMAIN_DATA_INPUT_HUB)
+    if hub is None:
+        hub = hass.data[DOMAIN_DATA_INPUT_HUB] = SCInputHub(hass)
+    return hub
@@ -0,0 +1,221 @@
+"""Shadow Control own logfile handling."""
+
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+DOMAIN_DATA_LOGFILE_WRITERS = f"{DOMAIN}_logfile_writers"
+_SHARED_WRITER = "shared"
+
+LOGFILE_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+LOGFILE_BACKUP_COUNT = 3
+LOGFILE_FORMAT = "%(asctime)s  %(levelname)-8s  %(name)s — %(message)s"
+
+# Can't collide with an instance logger, as the sanitized instance names contain no colon
+_FLUSH_MARKER_LOGGER_NAME = f"{DOMAIN}:flush"
+
+
+class _BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler, which leaves flushing after each record to the queue listener."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the handler."""
+        self._in_emit = False
+        super().__init__(*args, **kwargs)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the record without flushing the stream."""
+        self._in_emit = True
+        try:
+            super().emit(record)
+        finally:
+            self._in_emit = False
+
+    def flush(self) -> None:
+        """Flush the stream, unless called while writing a single record."""
+        if not self._in_emit:
+            super().flush()
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener, which flushes its handlers once the queue is drained."""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Flush all handlers before waiting for the next record."""
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+class _FlushMarkerHandler(logging.Handler):
+    """Signal when a given marker record was handled by the queue listener."""
+
+    def __init__(self, marker: logging.LogRecord) -> None:
+        """Initialize the handler for the given marker."""
+        super().__init__(logging.NOTSET)
+        self._marker = marker
+        self.handled = threading.Event()
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Set the event if the marker was handled."""
+        if record is self._marker:
+            self.handled.set()
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Nothing to emit."""
+
+
+class SCLogfileWriter:
+    """
+    Write the own logfiles of Shadow Control instances from a background thread.
+
+    The instance loggers only get a QueueHandler attached, so writing and rotating the
+    files never blocks the event loop. One writer can serve several instances, each
+    file handler only gets the records of its own instance logger.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the writer and start its thread."""
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener = _BatchingQueueListener(self._queue, respect_handler_level=True)
+        self._queue_handlers: dict[str, logging.handlers.QueueHandler] = {}
+        self._file_handlers: dict[str, logging.handlers.RotatingFileHandler] = {}
+        self._handlers_lock = threading.Lock()
+        self._running = True
+        self._listener.start()
+
+    @property
+    def instance_count(self) -> int:
+        """Return the number of instance loggers served by this writer."""
+        return len(self._queue_handlers)
+
+    def add_logger(self, logger: logging.Logger, log_file_path: str) -> None:
+        """
+        Route the records of the given instance logger to its own logfile.
+
+        Opens the logfile, so it must not be called from within the event loop.
+        """
+        file_handler = _BatchedRotatingFileHandler(
+            log_file_path,
+            maxBytes=LOGFILE_MAX_BYTES,
+            backupCount=LOGFILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setFormatter(logging.Formatter(LOGFILE_FORMAT))
+        file_handler.setLevel(logger.level)
+        file_handler.addFilter(logging.Filter(logger.name))
+        self._file_handlers[logger.name] = file_handler
+        self._add_listener_handler(file_handler)
+
+        queue_handler = logging.handlers.QueueHandler(self._queue)
+        queue_handler.setLevel(logger.level)
+        queue_handler.listener = self._listener
+        self._queue_handlers[logger.name] = queue_handler
+        logger.addHandler(queue_handler)
+
+    def remove_logger(self, logger: logging.Logger) -> None:
+        """
+        Stop routing the records of the given instance logger and close its logfile.
+
+        Pending records are written before the logfile is closed. Blocks until then,
+        so it must not be called from within the event loop.
+        """
+        queue_handler = self._queue_handlers.pop(logger.name, None)
+        if queue_handler is not None:
+            logger.removeHandler(queue_handler)
+        self.flush()
+
+        file_handler = self._file_handlers.pop(logger.name, None)
+        if file_handler is not None:
+            self._remove_listener_handler(file_handler)
+            file_handler.close()
+
+    def file_handler(self, logger: logging.Logger) -> logging.handlers.RotatingFileHandler | None:
+        """Return the file handler writing the records of the given instance logger."""
+        return self._file_handlers.get(logger.name)
+
+    def flush(self) -> None:
+        """Block until all records queued so far are written to the logfiles."""
+        if not self._running:
+            return
+        # Records are handled in order, so once the marker was handled, all records before it were too
+        marker = logging.makeLogRecord({"name": _FLUSH_MARKER_LOGGER_NAME, "levelno": logging.NOTSET})
+        marker_handler = _FlushMarkerHandler(marker)
+        self._add_listener_handler(marker_handler)
+        try:
+            self._queue.put_nowait(marker)
+            marker_handler.handled.wait()
+        finally:
+            self._remove_listener_handler(marker_handler)
+        for handler in self._file_handlers.values():
+            handler.flush()
+
+    def stop(self) -> None:
+        """Write all pending records, stop the thread and close all logfiles. Blocks until done."""
+        if not self._running:
+            return
+        self._running = False
+        self._listener.stop()
+        for handler in self._file_handlers.values():
+            handler.close()
+        self._listener.handlers = ()
+        self._file_handlers.clear()
+        self._queue_handlers.clear()
+
+    def _add_listener_handler(self, handler: logging.Handler) -> None:
+        # Handlers are replaced as a whole, so the writer thread always sees a consistent tuple
+        with self._handlers_lock:
+            self._listener.handlers = (*self._listener.handlers, handler)
+
+    def _remove_listener_handler(self, handler: logging.Handler) -> None:
+        with self._handlers_lock:
+            self._listener.handlers = tuple(listener_handler for listener_handler in self._listener.handlers if listener_handler is not handler)
+
+
+async def async_attach_logfile(hass: HomeAssistant, logger: logging.Logger, log_file_path: str, shared_writer: bool = False) -> None:
+    """
+    Write all records of the given instance logger to its own logfile.
+
+    With shared_writer, all instances requesting it use a single writer thread.
+    Otherwise, the instance gets a writer thread of its own.
+    """
+    writers: dict[str, SCLogfileWriter] = hass.data.setdefault(DOMAIN_DATA_LOGFILE_WRITERS, {})
+
+    # Leftover of a failed setup or unload
+    await async_detach_logfile(hass, logger)
+
+    writer = writers.get(_SHARED_WRITER) if shared_writer else None
+    if writer is None:
+        writer = SCLogfileWriter()
+        if shared_writer:
+            writers[_SHARED_WRITER] = writer
+
+    writers[logger.name] = writer
+    await hass.async_add_executor_job(writer.add_logger, logger, log_file_path)
+
+
+async def async_detach_logfile(hass: HomeAssistant, logger: logging.Logger) -> None:
+    """Write the pending records of the given instance logger, close its logfile and stop the writer if unused."""
+    writers: dict[str, SCLogfileWriter] = hass.data.get(DOMAIN_DATA_LOGFILE_WRITERS, {})
+    writer = writers.pop(logger.name, None)
+    if writer is None:
+        return
+
+    await hass.async_add_executor_job(writer.remove_logger, logger)
+    if writer.instance_count == 0:
+        if writers.get(_SHARED_WRITER) is writer:
+            writers.pop(_SHARED_WRITER)
+        await hass.async_add_executor_job(writer.stop)
+
+
+def get_logfile_writer(hass: HomeAssistant, logger: logging.Logger) -> SCLogfileWriter | None:
+    """Return the writer of the own logfile of the given instance logger."""
+    return hass.data.get(DOMAIN_DATA_LOGFILE_WRITERS, {}).get(logger.name)
@@ -0,0 +1,54 @@
+"""Shadow Control bounded cache with least recently used eviction."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class SCLruCache:
+    """
+    Bounded cache of calculated values with hit and miss counters.
+
+    The least recently used value is removed if the cache is full. Errors raised by the
+    calculation are not cached, so the caller can handle them on each lookup.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the empty cache."""
+        self._max_size = max_size
+        self._values: OrderedDict[Hashable, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._values)
+
+    def _get(self, key: Hashable, calculate: Callable[[], Any]) -> Any:
+        """Return the cached value for the key or calculate and store it."""
+        try:
+            value = self._values[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = calculate()
+        self._values[key] = value
+        if len(self._values) > self._max_size:
+            self._values.popitem(last=False)
+        return value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the cache statistics for the diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._values),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
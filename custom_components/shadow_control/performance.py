@@ -0,0 +1,107 @@
+"""Shadow Control performance diagnostics."""
+
+import math
+from collections import deque
+from typing import Any
+
+from .const import SCTriggerSource
+from .state_machine import SCStateTransitionTrace, format_transition_trace
+
+# Number of calculation durations kept for the percentiles
+PERFORMANCE_SAMPLE_SIZE = 256
+
+
+class SCPerformanceStats:
+    """
+    Performance counters of one Shadow Control instance.
+
+    The durations of the latest calculations are kept within a ring buffer of
+    fixed size, so the memory usage stays constant during the whole uptime.
+    """
+
+    def __init__(self, sample_size: int = PERFORMANCE_SAMPLE_SIZE) -> None:
+        """Initialize all counters with zero."""
+        self.recalculations = 0
+        self.triggers: dict[SCTriggerSource, int] = dict.fromkeys(SCTriggerSource, 0)
+        self.calculation_triggers = 0
+        self.collapsed_triggers = 0
+        self.cover_service_calls = 0
+        self.cover_command_failures = 0
+        self.last_dispatch_duration: float | None = None
+        self.max_dispatch_duration: float | None = None
+        self.state_transitions = 0
+        self.suppressed_recalculations = 0
+        self.max_transitions_per_cycle = 0
+        self.last_transition_trace: SCStateTransitionTrace = ()
+        self._durations: deque[float] = deque(maxlen=sample_size)
+
+    def record_trigger(self, source: SCTriggerSource) -> None:
+        """Count a calculation trigger of the given source."""
+        self.triggers[source] += 1
+        self.calculation_triggers += 1
+
+    def record_collapsed_trigger(self) -> None:
+        """Count a trigger, which was collapsed into the follow-up of a running calculation."""
+        self.collapsed_triggers += 1
+
+    def record_calculation(self, duration: float) -> None:
+        """Count a calculation and remember its duration in seconds."""
+        self.recalculations += 1
+        self._durations.append(duration)
+
+    def record_cover_service_call(self) -> None:
+        """Count a cover.* service call."""
+        self.cover_service_calls += 1
+
+    def record_cover_dispatch(self, duration: float, failures: int) -> None:
+        """Remember the duration in seconds of dispatching the commands of a positioning run and count the failed cover commands."""
+        self.last_dispatch_duration = duration
+        self.max_dispatch_duration = duration if self.max_dispatch_duration is None else max(self.max_dispatch_duration, duration)
+        self.cover_command_failures += failures
+
+    def record_state_transition(self) -> None:
+        """Count a transition of the shutter state."""
+        self.state_transitions += 1
+
+    def record_transition_trace(self, trace: SCStateTransitionTrace) -> None:
+        """Remember the transitions of the latest cycle, which changed the state."""
+        self.last_transition_trace = trace
+        self.max_transitions_per_cycle = max(self.max_transitions_per_cycle, len(trace))
+
+    def record_suppressed_recalculation(self) -> None:
+        """Count a sun driven recalculation, which was skipped as it couldn't change the shutter position."""
+        self.suppressed_recalculations += 1
+
+    def duration_percentile(self, percentile: float) -> float | None:
+        """Return the given percentile (nearest rank) of the latest calculation durations in seconds."""
+        if not self._durations:
+            return None
+        durations = sorted(self._durations)
+        rank = max(math.ceil(percentile / 100 * len(durations)), 1)
+        return durations[rank - 1]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all counters, durations in milliseconds."""
+
+        def _as_ms(duration: float | None) -> float | None:
+            return round(duration * 1000, 3) if duration is not None else None
+
+        return {
+            "recalculations": self.recalculations,
+            "triggers": {source.value: count for source, count in self.triggers.items()},
+            "calculation_triggers": self.calculation_triggers,
+            "collapsed_triggers": self.collapsed_triggers,
+            "calculation_duration_ms": {
+                "samples": len(self._durations),
+                "p50": _as_ms(self.duration_percentile(50)),
+                "p95": _as_ms(self.duration_percentile(95)),
+                "max": _as_ms(max(self._durations, default=None)),
+            },
+            "cover_service_calls": self.cover_service_calls,
+            "cover_dispatch_ms": {"last": _as_ms(self.last_dispatch_duration), "max": _as_ms(self.max_dispatch_duration)},
+            "cover_command_failures": self.cover_command_failures,
+            "state_transitions": self.state_transitions,
+            "max_transitions_per_cycle": self.max_transitions_per_cycle,
+            "last_transition_trace": format_transition_trace(self.last_transition_trace),
+            "suppressed_recalculations": self.suppressed_recalculations,
+        }
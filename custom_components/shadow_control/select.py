@@ -21,6 +21,7 @@ from .const import (
     SELECT_KEYS_MODE3_EXCLUDED,
     MovementRestricted,
     SCInternal,
+    SCTriggerSource,
     ShutterType,
 )
 
@@ -218,4 +219,5 @@ class ShadowControlSelect(SelectEntity, RestoreEntity):
             self.async_write_ha_state()
 
     async def _notify_integration(self) -> None:
-        await self.hass.data[DOMAIN_DATA_MANAGERS][self._config_entry.entry_id].async_calculate_and_apply_cover_position(None)
+        manager = self.hass.data[DOMAIN_DATA_MANAGERS][self._config_entry.entry_id]
+        await manager.async_calculate_and_apply_cover_position(None, SCTriggerSource.ENTITY_NOTIFY)
@@ -0,0 +1,164 @@
+"""
+Shadow Control built-in solar position.
+
+Sun position based on the equations of the NOAA solar calculator, which are accurate to
+about 0.01° for the years 1800 to 2100. One engine is shared by all instances, it
+calculates the position once per minute for the location configured in Home Assistant.
+"""
+
+import datetime
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+DOMAIN_DATA_SOLAR_ENGINE = f"{DOMAIN}_solar_engine"
+SIGNAL_SOLAR_POSITION_UPDATED = f"{DOMAIN}_solar_position_updated"
+
+
+@dataclass(frozen=True, slots=True)
+class SCSolarPosition:
+    """Position of the sun at a given minute."""
+
+    time: datetime.datetime
+    azimuth: float
+    elevation: float
+
+
+def _atmospheric_refraction(elevation: float) -> float:
+    """Return the approximated atmospheric refraction in degrees for the given geometric elevation."""
+    if elevation > 85:
+        return 0.0
+    tan_elevation = math.tan(math.radians(elevation))
+    if elevation > 5:
+        refraction = 58.1 / tan_elevation - 0.07 / tan_elevation**3 + 0.000086 / tan_elevation**5
+    elif elevation > -0.575:
+        refraction = 1735 + elevation * (-518.2 + elevation * (103.4 + elevation * (-12.79 + elevation * 0.711)))
+    else:
+        refraction = -20.772 / tan_elevation
+    return refraction / 3600
+
+
+def calculate_solar_position(latitude: float, longitude: float, when: datetime.datetime) -> tuple[float, float]:
+    """Return azimuth (clockwise from north) and elevation (including refraction) of the sun in degrees."""
+    when_utc = dt_util.as_utc(when)
+    julian_century = (when_utc.timestamp() / 86400 + 2440587.5 - 2451545) / 36525
+
+    mean_longitude = (280.46646 + julian_century * (36000.76983 + julian_century * 0.0003032)) % 360
+    mean_anomaly = math.radians(357.52911 + julian_century * (35999.05029 - 0.0001537 * julian_century))
+    eccentricity = 0.016708634 - julian_century * (0.000042037 + 0.0000001267 * julian_century)
+    equation_of_center = (
+        math.sin(mean_anomaly) * (1.914602 - julian_century * (0.004817 + 0.000014 * julian_century))
+        + math.sin(2 * mean_anomaly) * (0.019993 - 0.000101 * julian_century)
+        + math.sin(3 * mean_anomaly) * 0.000289
+    )
+    omega = math.radians(125.04 - 1934.136 * julian_century)
+    apparent_longitude = math.radians(mean_longitude + equation_of_center - 0.00569 - 0.00478 * math.sin(omega))
+
+    mean_obliquity = 23 + (26 + (21.448 - julian_century * (46.815 + julian_century * (0.00059 - julian_century * 0.001813))) / 60) / 60
+    obliquity = math.radians(mean_obliquity + 0.00256 * math.cos(omega))
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_longitude))
+
+    # Equation of time in minutes
+    y = math.tan(obliquity / 2) ** 2
+    mean_longitude_rad = math.radians(mean_longitude)
+    equation_of_time = 4 * math.degrees(
+        y * math.sin(2 * mean_longitude_rad)
+        - 2 * eccentricity * math.sin(mean_anomaly)
+        + 4 * eccentricity * y * math.sin(mean_anomaly) * math.cos(2 * mean_longitude_rad)
+        - 0.5 * y * y * math.sin(4 * mean_longitude_rad)
+        - 1.25 * eccentricity * eccentricity * math.sin(2 * mean_anomaly)
+    )
+
+    minutes_of_day = when_utc.hour * 60 + when_utc.minute + when_utc.second / 60 + when_utc.microsecond / 60e6
+    true_solar_time = (minutes_of_day + equation_of_time + 4 * longitude) % 1440
+    hour_angle = math.radians(true_solar_time / 4 - 180)
+
+    latitude_rad = math.radians(latitude)
+    cos_zenith = math.sin(latitude_rad) * math.sin(declination) + math.cos(latitude_rad) * math.cos(declination) * math.cos(hour_angle)
+    zenith = math.acos(max(-1.0, min(1.0, cos_zenith)))
+
+    sin_zenith = math.sin(zenith)
+    if abs(math.cos(latitude_rad) * sin_zenith) < 1e-12:
+        # Sun in zenith or observer at a pole, azimuth is undefined
+        azimuth = 180.0
+    else:
+        cos_azimuth = (math.sin(latitude_rad) * math.cos(zenith) - math.sin(declination)) / (math.cos(latitude_rad) * sin_zenith)
+        azimuth_from_south = math.degrees(math.acos(max(-1.0, min(1.0, cos_azimuth))))
+        azimuth = (azimuth_from_south + 180) % 360 if hour_angle > 0 else (540 - azimuth_from_south) % 360
+
+    elevation = 90 - math.degrees(zenith)
+    return azimuth, elevation + _atmospheric_refraction(elevation)
+
+
+class SCSolarEngine:
+    """
+    Calculate the sun position for all Shadow Control instances.
+
+    The position is calculated for the start of each minute and cached, so all instances
+    get the same values within a minute. While at least one instance is subscribed, the
+    new position is sent to all instances at the start of each minute.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the engine."""
+        self._hass = hass
+        self._cached_position: SCSolarPosition | None = None
+        self._subscribers = 0
+        self._unsub_tick: Callable[[], None] | None = None
+
+    def position(self, when: datetime.datetime | None = None) -> SCSolarPosition:
+        """Return the sun position of the minute containing the given point in time (default: now)."""
+        minute = dt_util.as_utc(when or dt_util.utcnow()).replace(second=0, microsecond=0)
+        cached_position = self._cached_position
+        if cached_position is not None and cached_position.time == minute:
+            return cached_position
+
+        azimuth, elevation = calculate_solar_position(self._hass.config.latitude, self._hass.config.longitude, minute)
+        position = SCSolarPosition(minute, azimuth, elevation)
+        # Only cache the current minute, lookups of other points in time must not evict it
+        if when is None or self._cached_position is None or minute > self._cached_position.time:
+            self._cached_position = position
+        return position
+
+    @callback
+    def async_subscribe(self) -> Callable[[], None]:
+        """Start sending the sun position each minute, returns the function to unsubscribe."""
+        self._subscribers += 1
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_change(self._hass, self._async_tick, second=0)
+
+        unsubscribed = False
+
+        @callback
+        def _async_unsubscribe() -> None:
+            nonlocal unsubscribed
+            if unsubscribed:
+                return
+            unsubscribed = True
+            self._subscribers -= 1
+            if self._subscribers == 0 and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_tick(self, now: datetime.datetime) -> None:
+        """Send the sun position of the new minute to all instances."""
+        async_dispatcher_send(self._hass, SIGNAL_SOLAR_POSITION_UPDATED, self.position(now))
+
+
+@callback
+def async_get_solar_engine(hass: HomeAssistant) -> SCSolarEngine:
+    """Return the solar engine shared by all instances."""
+    engine: SCSolarEngine | None = hass.data.get(DOMAIN_DATA_SOLAR_ENGINE)
+    if engine is None:
+        engine = hass.data[DOMAIN_DATA_SOLAR_ENGINE] = SCSolarEngine(hass)
+    return engine
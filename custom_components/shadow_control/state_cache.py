@@ -0,0 +1,82 @@
+"""Shadow Control cache of parsed entity states."""
+
+from collections.abc import Hashable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, State, callback
+
+from .const import DOMAIN
+from .lru_cache import SCLruCache
+
+DOMAIN_DATA_STATE_CACHE = f"{DOMAIN}_state_cache"
+
+# Max number of parsed values, enough for the inputs of some hundred instances
+STATE_CACHE_SIZE = 2048
+
+
+def get_raw_state_value(state: State, attribute_name: str | None = None) -> Any:
+    """Return the attribute value if the attribute exists (e.g. elevation of sun.sun), otherwise the state."""
+    if attribute_name:
+        attr_value = state.attributes.get(attribute_name)
+        if attr_value is not None:
+            return attr_value
+    return state.state
+
+
+def convert_state_value(value: Any, expected_type: type) -> Any:
+    """Convert a state or attribute value to the expected type, raises ValueError or TypeError if not possible."""
+    if expected_type is bool:
+        return str(value).lower() in ["on", "true", "1"]
+    if expected_type is int:
+        return int(float(value))
+    if expected_type is float:
+        return float(value)
+    return expected_type(value)
+
+
+class SCParsedStateCache(SCLruCache):
+    """
+    Entity states and attributes converted to the requested type.
+
+    The values are keyed by entity, attribute and the point in time of the last update of
+    the state, so they are parsed again after each change. The raw value is part of the key
+    as well, as two updates may share the same point in time (e.g. with a coarse or frozen
+    clock). The cache is shared by all instances and bounded, the least recently used values
+    are removed if it is full.
+    """
+
+    def __init__(self, max_size: int = STATE_CACHE_SIZE) -> None:
+        """Initialize the empty cache."""
+        super().__init__(max_size)
+
+    def get(self, state: State, attribute_name: str | None, expected_type: type) -> Any:
+        """Return the converted value of the state, raises ValueError or TypeError if it can't be converted."""
+        value = get_raw_state_value(state, attribute_name)
+        if not isinstance(value, Hashable):
+            # E.g. list attributes, which can't be part of the key
+            return convert_state_value(value, expected_type)
+        return self._get(
+            (state.entity_id, attribute_name, state.last_updated, value, expected_type),
+            lambda: convert_state_value(value, expected_type),
+        )
+
+    def get_float(self, state: State, attribute_name: str | None = None) -> float:
+        """Return the state or attribute as float."""
+        return self.get(state, attribute_name, float)
+
+    def get_int(self, state: State, attribute_name: str | None = None) -> int:
+        """Return the state or attribute as int."""
+        return self.get(state, attribute_name, int)
+
+    def get_bool(self, state: State, attribute_name: str | None = None) -> bool:
+        """Return the state or attribute as bool."""
+        return self.get(state, attribute_name, bool)
+
+
+@callback
+def async_get_state_cache(hass: HomeAssistant) -> SCParsedStateCache:
+    """Return the state cache shared by all instances."""
+    cache: SCParsedStateCache | None = hass.data.get(DOMAIN_DATA_STATE_CACHE)
+    if cache is None:
+        cache = hass.data[DOMAIN_DATA_STATE_CACHE] = SCParsedStateCache()
+    return cache
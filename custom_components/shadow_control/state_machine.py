@@ -0,0 +1,413 @@
+"""
+Shadow Control state machine.
+
+All transitions are declared within one table as rows of states, guard, action and next
+state. The guards are evaluated against a snapshot of the inputs, which is taken once per
+calculation cycle, so the sun, brightness and enable flags are not queried again for
+each hop. The actions are run by the manager, before the next state is entered.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum, auto
+
+from .const import ShutterState
+
+# Upper bound of transitions within one cycle, far above the longest regular path
+STATE_MACHINE_MAX_HOPS = 16
+
+SHADOW_STATES = frozenset(
+    {
+        ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
+        ShutterState.SHADOW_FULL_CLOSED,
+        ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
+        ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
+        ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
+        ShutterState.SHADOW_NEUTRAL,
+    }
+)
+
+DAWN_STATES = frozenset(
+    {
+        ShutterState.DAWN_NEUTRAL,
+        ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
+        ShutterState.DAWN_HORIZONTAL_NEUTRAL,
+        ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
+        ShutterState.DAWN_FULL_CLOSED,
+        ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
+    }
+)
+
+# Transitions of one cycle as (from, to) pairs
+SCStateTransitionTrace = tuple[tuple[ShutterState, ShutterState], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SCCycleSnapshot:
+    """Inputs of the transition guards, evaluated once at the start of a cycle."""
+
+    in_sun: bool
+    shadow_enabled: bool
+    brightness: float | None
+    shadow_threshold: float | None
+    dawn_enabled: bool
+    dawn_brightness: float | None
+    dawn_threshold: float | None
+    # close_not_later_than is configured and reached
+    dawn_close_time_reached: bool
+    # open_not_before is not configured or reached
+    dawn_open_time_reached: bool
+    # The only input changed by the transitions themselves, so it is updated after each action
+    timer_finished: bool
+    # Delays in seconds, None if not configured
+    shadow_close_delay: float | None
+    shadow_look_through_delay: float | None
+    shadow_open_delay: float | None
+    dawn_close_delay: float | None
+    dawn_look_through_delay: float | None
+    # Look through angle of the shadow position is configured
+    shadow_look_through_configured: bool
+    # Height and look through angle of the dawn position are configured
+    dawn_look_through_configured: bool
+
+    @property
+    def shadow_active(self) -> bool:
+        """Return if the facade is in the sun and the shadow handling is enabled."""
+        return self.in_sun and self.shadow_enabled
+
+    @property
+    def above_shadow_threshold(self) -> bool:
+        """Return if the brightness is above the shadow threshold."""
+        return self.brightness is not None and self.shadow_threshold is not None and self.brightness > self.shadow_threshold
+
+    @property
+    def below_shadow_threshold(self) -> bool:
+        """Return if the brightness is below the shadow threshold."""
+        return self.brightness is not None and self.shadow_threshold is not None and self.brightness < self.shadow_threshold
+
+    @property
+    def above_dawn_threshold(self) -> bool:
+        """Return if the dawn brightness is above the dawn threshold."""
+        return self.dawn_brightness is not None and self.dawn_threshold is not None and self.dawn_brightness > self.dawn_threshold
+
+    @property
+    def below_dawn_threshold(self) -> bool:
+        """Return if the dawn brightness is below the dawn threshold."""
+        return self.dawn_brightness is not None and self.dawn_threshold is not None and self.dawn_brightness < self.dawn_threshold
+
+
+class SCTransitionAction(Enum):
+    """Action of a transition, run before the next state is entered."""
+
+    CANCEL_TIMER = auto()
+    START_SHADOW_CLOSE_TIMER = auto()
+    START_SHADOW_LOOK_THROUGH_TIMER = auto()
+    START_SHADOW_OPEN_TIMER = auto()
+    START_DAWN_CLOSE_TIMER = auto()
+    START_DAWN_LOOK_THROUGH_TIMER = auto()
+    POSITION_NEUTRAL = auto()
+    POSITION_SHADOW = auto()
+    POSITION_SHADOW_LOOK_THROUGH = auto()
+    POSITION_AFTER_SHADOW = auto()
+    POSITION_AFTER_DAWN = auto()
+    POSITION_DAWN = auto()
+    POSITION_DAWN_LOOK_THROUGH = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class SCStateTransition:
+    """Transition from any of the given states to the next state, if the guard matches."""
+
+    states: frozenset[ShutterState]
+    guard: Callable[[SCCycleSnapshot], bool]
+    next_state: ShutterState
+    reason: str
+    action: SCTransitionAction | None = None
+    # Positioning actions only: cancel a running timer
+    stop_timer: bool = True
+    # Keep the current state, if the action could not be run (e.g. the position is not configured)
+    action_required: bool = True
+
+
+def _always(_snapshot: SCCycleSnapshot) -> bool:
+    """Guard of the fallback transitions, reached if no other transition of the state matches."""
+    return True
+
+
+STATE_TRANSITIONS: tuple[SCStateTransition, ...] = (
+    # Force any non-dawn state into DAWN_FULL_CLOSED, so the dawn handling keeps the cover
+    # closed until the brightness based dawn cycle handles the morning opening
+    SCStateTransition(
+        states=frozenset(ShutterState) - DAWN_STATES,
+        guard=lambda snapshot: snapshot.dawn_enabled and snapshot.dawn_close_time_reached,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn close_not_later_than reached",
+    ),
+    # Leave the shadow and dawn states, if their handling doesn't apply anymore. SHADOW_NEUTRAL
+    # and DAWN_NEUTRAL check the closing of the other mode first, see below.
+    SCStateTransition(
+        states=SHADOW_STATES - {ShutterState.SHADOW_NEUTRAL},
+        guard=lambda snapshot: not snapshot.shadow_active,
+        next_state=ShutterState.NEUTRAL,
+        reason="Not in the sun or shadow handling disabled",
+        action=SCTransitionAction.POSITION_NEUTRAL,
+        action_required=False,
+    ),
+    SCStateTransition(
+        states=DAWN_STATES - {ShutterState.DAWN_NEUTRAL},
+        guard=lambda snapshot: not snapshot.dawn_enabled,
+        next_state=ShutterState.NEUTRAL,
+        reason="Dawn handling disabled",
+        action=SCTransitionAction.POSITION_NEUTRAL,
+        action_required=False,
+    ),
+    # SHADOW_FULL_CLOSE_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.above_shadow_threshold and snapshot.timer_finished,
+        next_state=ShutterState.SHADOW_FULL_CLOSED,
+        reason="Timer finished, brightness above threshold",
+        action=SCTransitionAction.POSITION_SHADOW,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.above_shadow_threshold,
+        next_state=ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
+        reason="Waiting for timer, brightness above threshold",
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING}),
+        guard=_always,
+        next_state=ShutterState.SHADOW_NEUTRAL,
+        reason="Brightness not above threshold",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+    # SHADOW_FULL_CLOSED
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_FULL_CLOSED}),
+        guard=lambda snapshot: snapshot.below_shadow_threshold and snapshot.shadow_look_through_delay is not None,
+        next_state=ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
+        reason="Brightness below threshold",
+        action=SCTransitionAction.START_SHADOW_LOOK_THROUGH_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_FULL_CLOSED}),
+        guard=_always,
+        next_state=ShutterState.SHADOW_FULL_CLOSED,
+        reason="Brightness not below threshold, following the sun",
+        action=SCTransitionAction.POSITION_SHADOW,
+        stop_timer=False,
+    ),
+    # SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.above_shadow_threshold and snapshot.shadow_look_through_configured,
+        next_state=ShutterState.SHADOW_FULL_CLOSED,
+        reason="Brightness again above threshold",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.timer_finished,
+        next_state=ShutterState.SHADOW_HORIZONTAL_NEUTRAL,
+        reason="Timer finished",
+        action=SCTransitionAction.POSITION_SHADOW_LOOK_THROUGH,
+    ),
+    # SHADOW_HORIZONTAL_NEUTRAL
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_HORIZONTAL_NEUTRAL}),
+        guard=lambda snapshot: snapshot.above_shadow_threshold and snapshot.shadow_open_delay is not None,
+        next_state=ShutterState.SHADOW_FULL_CLOSED,
+        reason="Brightness above threshold",
+        action=SCTransitionAction.POSITION_SHADOW,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_HORIZONTAL_NEUTRAL}),
+        guard=lambda snapshot: snapshot.shadow_open_delay is not None,
+        next_state=ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING,
+        reason="Brightness not above threshold",
+        action=SCTransitionAction.START_SHADOW_OPEN_TIMER,
+    ),
+    # SHADOW_NEUTRAL_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.above_shadow_threshold,
+        next_state=ShutterState.SHADOW_FULL_CLOSED,
+        reason="Brightness again above threshold",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.timer_finished,
+        next_state=ShutterState.SHADOW_NEUTRAL,
+        reason="Timer finished",
+        action=SCTransitionAction.POSITION_AFTER_SHADOW,
+    ),
+    # NEUTRAL, SHADOW_NEUTRAL and DAWN_NEUTRAL: DAWN_NEUTRAL checks the dawn closing first,
+    # the others the shadow closing
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_NEUTRAL}),
+        guard=lambda snapshot: (
+            snapshot.dawn_enabled and (snapshot.below_dawn_threshold or snapshot.dawn_close_time_reached) and snapshot.dawn_close_delay is not None
+        ),
+        next_state=ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
+        reason="Dawn brightness below threshold or close time reached",
+        action=SCTransitionAction.START_DAWN_CLOSE_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.NEUTRAL, ShutterState.SHADOW_NEUTRAL, ShutterState.DAWN_NEUTRAL}),
+        guard=lambda snapshot: snapshot.shadow_active and snapshot.above_shadow_threshold and snapshot.shadow_close_delay is not None,
+        next_state=ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING,
+        reason="In the sun and brightness above threshold",
+        action=SCTransitionAction.START_SHADOW_CLOSE_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.NEUTRAL, ShutterState.SHADOW_NEUTRAL}),
+        guard=lambda snapshot: snapshot.dawn_enabled and snapshot.below_dawn_threshold and snapshot.dawn_close_delay is not None,
+        next_state=ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
+        reason="Dawn brightness below threshold",
+        action=SCTransitionAction.START_DAWN_CLOSE_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.SHADOW_NEUTRAL}),
+        guard=lambda snapshot: snapshot.shadow_active,
+        next_state=ShutterState.SHADOW_NEUTRAL,
+        reason="In the sun, brightness not above threshold",
+        action=SCTransitionAction.POSITION_AFTER_SHADOW,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_NEUTRAL}),
+        guard=lambda snapshot: snapshot.dawn_enabled,
+        next_state=ShutterState.DAWN_NEUTRAL,
+        reason="Dawn brightness not below threshold",
+        action=SCTransitionAction.POSITION_AFTER_DAWN,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.NEUTRAL, ShutterState.SHADOW_NEUTRAL, ShutterState.DAWN_NEUTRAL}),
+        guard=_always,
+        next_state=ShutterState.NEUTRAL,
+        reason="Neither shadow nor dawn conditions given",
+        action=SCTransitionAction.POSITION_NEUTRAL,
+        action_required=False,
+    ),
+    # DAWN_NEUTRAL_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.below_dawn_threshold,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn brightness again below threshold",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.timer_finished,
+        next_state=ShutterState.DAWN_NEUTRAL,
+        reason="Timer finished",
+        action=SCTransitionAction.POSITION_DAWN_LOOK_THROUGH,
+    ),
+    # DAWN_HORIZONTAL_NEUTRAL: closed even without a configured dawn position, if the close time is reached
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_HORIZONTAL_NEUTRAL}),
+        guard=lambda snapshot: (snapshot.below_dawn_threshold and snapshot.dawn_look_through_configured) or snapshot.dawn_close_time_reached,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn brightness below threshold or close time reached",
+        action=SCTransitionAction.POSITION_DAWN_LOOK_THROUGH,
+        stop_timer=False,
+        action_required=False,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_HORIZONTAL_NEUTRAL}),
+        guard=lambda snapshot: snapshot.dawn_look_through_delay is not None and snapshot.dawn_open_time_reached,
+        next_state=ShutterState.DAWN_NEUTRAL_TIMER_RUNNING,
+        reason="Dawn brightness not below threshold",
+        action=SCTransitionAction.START_DAWN_LOOK_THROUGH_TIMER,
+    ),
+    # DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.below_dawn_threshold,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn brightness again below threshold",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.timer_finished,
+        next_state=ShutterState.DAWN_HORIZONTAL_NEUTRAL,
+        reason="Timer finished",
+        action=SCTransitionAction.POSITION_DAWN_LOOK_THROUGH,
+        stop_timer=False,
+    ),
+    # DAWN_FULL_CLOSED
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSED}),
+        guard=lambda snapshot: snapshot.above_dawn_threshold and snapshot.dawn_look_through_delay is not None and not snapshot.dawn_open_time_reached,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn brightness above threshold, but open_not_before not reached",
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSED}),
+        guard=lambda snapshot: (
+            snapshot.above_dawn_threshold and snapshot.dawn_look_through_delay is not None and not snapshot.dawn_close_time_reached
+        ),
+        next_state=ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING,
+        reason="Dawn brightness above threshold",
+        action=SCTransitionAction.START_DAWN_LOOK_THROUGH_TIMER,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSED}),
+        guard=_always,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Dawn brightness not above threshold or close time reached",
+        action=SCTransitionAction.POSITION_DAWN,
+    ),
+    # DAWN_FULL_CLOSE_TIMER_RUNNING
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING}),
+        guard=lambda snapshot: (snapshot.below_dawn_threshold or snapshot.dawn_close_time_reached) and snapshot.timer_finished,
+        next_state=ShutterState.DAWN_FULL_CLOSED,
+        reason="Timer finished, dawn brightness below threshold or close time reached",
+        action=SCTransitionAction.POSITION_DAWN,
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING}),
+        guard=lambda snapshot: snapshot.below_dawn_threshold or snapshot.dawn_close_time_reached,
+        next_state=ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING,
+        reason="Waiting for timer, dawn brightness below threshold or close time reached",
+    ),
+    SCStateTransition(
+        states=frozenset({ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING}),
+        guard=_always,
+        next_state=ShutterState.DAWN_NEUTRAL,
+        reason="Dawn brightness not below threshold and close time not reached",
+        action=SCTransitionAction.CANCEL_TIMER,
+    ),
+)
+
+
+class SCStateMachine:
+    """Transition table compiled to the transitions per state, evaluated in the order of declaration."""
+
+    def __init__(self, transitions: tuple[SCStateTransition, ...] = STATE_TRANSITIONS) -> None:
+        """Compile the table."""
+        self._transitions: dict[ShutterState, tuple[SCStateTransition, ...]] = {
+            state: tuple(transition for transition in transitions if state in transition.states) for state in ShutterState
+        }
+
+    def next_transition(self, state: ShutterState, snapshot: SCCycleSnapshot) -> SCStateTransition | None:
+        """Return the first transition of the state, whose guard matches the snapshot."""
+        for transition in self._transitions[state]:
+            if transition.guard(snapshot):
+                return transition
+        return None
+
+
+# Compiled once, the table is the same for all instances
+STATE_MACHINE = SCStateMachine()
+
+
+def format_transition_trace(trace: SCStateTransitionTrace) -> str:
+    """Return the trace as compact path of state names, e.g. NEUTRAL > SHADOW_NEUTRAL."""
+    if not trace:
+        return ""
+    return " > ".join([trace[0][0].name, *(to_state.name for _, to_state in trace)])
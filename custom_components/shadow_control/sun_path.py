@@ -0,0 +1,193 @@
+"""Shadow Control daily sun path of a facade."""
+
+import datetime
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from astral.location import Location
+from homeassistant.util import dt as dt_util
+from numpy.typing import NDArray
+
+from .geometry_batch import SCGeometryBatch, calculate_geometry_batch
+
+if TYPE_CHECKING:
+    from . import SCStaticFacadeConfiguration
+
+SUN_PATH_RESOLUTION = datetime.timedelta(minutes=1)
+# Max deviation in degrees between the sun position of the table and the one of the sun entities,
+# up to which the table is used to skip sun driven recalculations
+SUN_HORIZON_TOLERANCE = 1.0
+# Upper limit for skipping sun driven recalculations, as other time dependent values (e.g. the
+# adaptive brightness threshold) are evaluated with each recalculation
+SUN_HORIZON_MAX_DURATION = datetime.timedelta(minutes=15)
+
+
+@dataclass(frozen=True, slots=True)
+class SCSunPathEntry:
+    """Sun position and shadow position of the shutter at a given point in time."""
+
+    sun_azimuth: float
+    sun_elevation: float
+    is_in_sun: bool
+    effective_elevation: float | None
+    height: float
+    angle: float
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SCSunPathTable:
+    """
+    Sun path of one day in fixed steps and the resulting facade relation and shadow position.
+
+    Continuous values are interpolated between two steps, in-sun, height and angle are taken
+    from the step before the requested point in time.
+    """
+
+    day: datetime.date
+    # Local midnight in UTC
+    start: datetime.datetime
+    resolution: datetime.timedelta
+    facade: "SCStaticFacadeConfiguration"
+    shutter_max_height: float
+    shutter_max_angle: float
+    sun_azimuth: NDArray[np.float64]
+    sun_elevation: NDArray[np.float64]
+    geometry: SCGeometryBatch
+
+    def is_valid_for(self, day: datetime.date, facade: "SCStaticFacadeConfiguration", shutter_max_height: float, shutter_max_angle: float) -> bool:
+        """Check if the table was built for the given day and configuration."""
+        return (
+            self.day == day
+            and self.facade == facade
+            and self.shutter_max_height == shutter_max_height
+            and self.shutter_max_angle == shutter_max_angle
+        )
+
+    def lookup(self, when: datetime.datetime) -> SCSunPathEntry | None:
+        """Return the entry for the given point in time or None if it is not within the day of the table."""
+        offset = (dt_util.as_utc(when) - self.start) / self.resolution
+        last_index = len(self.sun_azimuth) - 1
+        if offset < 0 or offset > last_index:
+            return None
+
+        index = int(offset)
+        next_index = min(index + 1, last_index)
+        fraction = offset - index
+
+        # Shortest way around north
+        azimuth_delta = (self.sun_azimuth[next_index] - self.sun_azimuth[index] + 180) % 360 - 180
+        elevation_delta = self.sun_elevation[next_index] - self.sun_elevation[index]
+
+        effective_elevation: float | None = float(self.geometry.effective_elevation[index])
+        if np.isnan(effective_elevation):
+            effective_elevation = None
+        elif not np.isnan(self.geometry.effective_elevation[next_index]):
+            effective_elevation += float(self.geometry.effective_elevation[next_index] - effective_elevation) * fraction
+
+        return SCSunPathEntry(
+            sun_azimuth=float((self.sun_azimuth[index] + azimuth_delta * fraction) % 360),
+            sun_elevation=float(self.sun_elevation[index] + elevation_delta * fraction),
+            is_in_sun=bool(self.geometry.is_in_sun[index]),
+            effective_elevation=effective_elevation,
+            height=float(self.geometry.height[index]),
+            angle=float(self.geometry.angle[index]),
+        )
+
+    def next_in_sun_change(self, after: datetime.datetime) -> datetime.datetime | None:
+        """
+        Return the first step after the given point in time, at which the facade enters or leaves the sun.
+
+        This covers crossing the sun entry and exit angles as well as the min and max elevation.
+        None, if there is no further change within the day of the table.
+        """
+        offset = (dt_util.as_utc(after) - self.start) / self.resolution
+        if offset < 0 or offset >= len(self.sun_azimuth):
+            return None
+
+        index = int(offset)
+        changes = np.flatnonzero(self.geometry.is_in_sun[index + 1 :] != self.geometry.is_in_sun[index])
+        if not changes.size:
+            return None
+        return self.start + (index + 1 + int(changes[0])) * self.resolution
+
+    def stable_until(self, after: datetime.datetime) -> datetime.datetime | None:
+        """
+        Return the first step after the given point in time, at which in-sun, the stepped height or angle change.
+
+        Height and angle only count while the facade is in the sun. The end of the day of the table, if nothing
+        changes anymore. None, if the point in time is not within the day.
+        """
+        offset = (dt_util.as_utc(after) - self.start) / self.resolution
+        if offset < 0 or offset >= len(self.sun_azimuth):
+            return None
+
+        index = int(offset)
+        geometry = self.geometry
+        changed = geometry.is_in_sun[index + 1 :] != geometry.is_in_sun[index]
+        if geometry.is_in_sun[index]:
+            changed |= (geometry.height[index + 1 :] != geometry.height[index]) | (geometry.angle[index + 1 :] != geometry.angle[index])
+        changes = np.flatnonzero(changed)
+        steps = index + 1 + int(changes[0]) if changes.size else len(self.sun_azimuth)
+        return self.start + steps * self.resolution
+
+    def in_sun_periods(self) -> list[tuple[datetime.datetime, datetime.datetime]]:
+        """Return start and end (UTC) of all periods, within which the facade is in the sun."""
+        # Indexes, where in-sun changes: rising edges are starts, falling edges are ends
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], self.geometry.is_in_sun, [False])).astype(np.int8)))
+        return [(self.start + int(start) * self.resolution, self.start + int(end) * self.resolution) for start, end in edges.reshape(-1, 2)]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the table for the diagnostics."""
+        arrays = (self.sun_azimuth, self.sun_elevation, *(getattr(self.geometry, field.name) for field in fields(self.geometry)))
+        return {
+            "day": self.day.isoformat(),
+            "resolution_seconds": self.resolution.total_seconds(),
+            "samples": len(self.sun_azimuth),
+            "size_bytes": sum(array.nbytes for array in arrays),
+            "shutter_max_height": self.shutter_max_height,
+            "shutter_max_angle": self.shutter_max_angle,
+            "in_sun_periods": [
+                {"start": dt_util.as_local(start).isoformat(), "end": dt_util.as_local(end).isoformat()} for start, end in self.in_sun_periods()
+            ],
+        }
+
+
+def build_sun_path_table(
+    location: Location,
+    observer_elevation: float,
+    day: datetime.date,
+    time_zone: datetime.tzinfo,
+    facade: "SCStaticFacadeConfiguration",
+    shutter_max_height: float,
+    shutter_max_angle: float,
+    resolution: datetime.timedelta = SUN_PATH_RESOLUTION,
+) -> SCSunPathTable:
+    """
+    Calculate the sun path of the given (local) day at the given location.
+
+    Takes some milliseconds, so it must not be called from within the event loop.
+    """
+    # Days with a DST change have 23 or 25 hours
+    start = dt_util.as_utc(datetime.datetime.combine(day, datetime.time(), tzinfo=time_zone))
+    end = dt_util.as_utc(datetime.datetime.combine(day + datetime.timedelta(days=1), datetime.time(), tzinfo=time_zone))
+    points_in_time = [start + step * resolution for step in range(int((end - start) / resolution))]
+
+    sun_azimuth = np.fromiter(
+        (location.solar_azimuth(point_in_time, observer_elevation) for point_in_time in points_in_time), dtype=float, count=len(points_in_time)
+    )
+    sun_elevation = np.fromiter(
+        (location.solar_elevation(point_in_time, observer_elevation) for point_in_time in points_in_time), dtype=float, count=len(points_in_time)
+    )
+
+    return SCSunPathTable(
+        day=day,
+        start=start,
+        resolution=resolution,
+        facade=facade,
+        shutter_max_height=shutter_max_height,
+        shutter_max_angle=shutter_max_angle,
+        sun_azimuth=sun_azimuth,
+        sun_elevation=sun_elevation,
+        geometry=calculate_geometry_batch(sun_azimuth, sun_elevation, facade, shutter_max_height, shutter_max_angle),
+    )
@@ -23,6 +23,7 @@ from .const import (
     OWN_LOGFILE_ENABLED,
     SWITCH_INTERNAL_TO_EXTERNAL_MAP,
     SCInternal,
+    SCTriggerSource,
 )
 
 
@@ -343,4 +344,5 @@ class ShadowControlSwitch(SwitchEntity, RestoreEntity):
         self.async_write_ha_state()
 
     async def _notify_integration(self) -> None:
-        await self.hass.data[DOMAIN_DATA_MANAGERS][self._config_entry.entry_id].async_calculate_and_apply_cover_position(None)
+        manager = self.hass.data[DOMAIN_DATA_MANAGERS][self._config_entry.entry_id]
+        await manager.async_calculate_and_apply_cover_position(None, SCTriggerSource.ENTITY_NOTIFY)
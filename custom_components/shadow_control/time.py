@@ -15,7 +15,7 @@ from homeassistant.helpers.restore_state import RestoreEntity
 if TYPE_CHECKING:
     from . import ShadowControlManager
 
-from .const import DOMAIN, DOMAIN_DATA_MANAGERS, INTERNAL_TO_DEFAULTS_MAP, TIME_INTERNAL_TO_EXTERNAL_MAP, SCInternal
+from .const import DOMAIN, DOMAIN_DATA_MANAGERS, INTERNAL_TO_DEFAULTS_MAP, TIME_INTERNAL_TO_EXTERNAL_MAP, SCInternal, SCTriggerSource
 
 
 async def async_setup_entry(
@@ -212,4 +212,4 @@ class ShadowControlTimeEntity(TimeEntity, RestoreEntity):
         """Notify the integration that the value changed."""
         manager = self.hass.data[DOMAIN_DATA_MANAGERS].get(self._config_entry.entry_id)
         if manager:
-            await manager.async_calculate_and_apply_cover_position(None)
+            await manager.async_calculate_and_apply_cover_position(None, SCTriggerSource.ENTITY_NOTIFY)
@@ -0,0 +1,95 @@
+"""
+Benchmark the per-cycle cost of the debug output within the calculation hot path.
+
+Creates a real ShadowControlManager on a bare Home Assistant core and runs the
+input value logging and the facade check of one calculation cycle with debug
+logging disabled and enabled. Log records are dropped by a NullHandler, so only
+the assembly of the messages is measured.
+
+Results with 10000 cycles on the dev container: debug off 109 µs per cycle before
+the debug output was guarded, 47 µs after, debug on about 250 µs in both cases.
+
+Usage (from the repository root, within the dev environment):
+    python scripts/benchmark_debug_logging.py [cycles]
+"""
+
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import MappingProxyType
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.shadow_control import SCInputGroup, ShadowControlManager
+from custom_components.shadow_control.const import DOMAIN
+
+CONFIG = {
+    "name": "Benchmark",
+    "target_cover_entity": ["cover.benchmark"],
+    "facade_shutter_type_static": "mode1",
+    "brightness_entity": "sensor.brightness",
+    "sun_elevation_entity": "sensor.sun_elevation",
+    "sun_azimuth_entity": "sensor.sun_azimuth",
+}
+
+
+def _create_manager(hass: HomeAssistant, logger: logging.Logger) -> ShadowControlManager:
+    entry = ConfigEntry(
+        data=CONFIG,
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source="user",
+        subentries_data=None,
+        title=CONFIG["name"],
+        unique_id=None,
+        version=1,
+    )
+    manager = ShadowControlManager(hass, entry, logger)
+    manager._dynamic_config.sun_azimuth = 170.0
+    manager._dynamic_config.sun_elevation = 35.0
+    return manager
+
+
+async def _run_cycles(manager: ShadowControlManager, cycles: int) -> float:
+    start = time.perf_counter()
+    for _ in range(cycles):
+        # Same as at the start of each calculation cycle
+        manager._debug_enabled = manager.logger.isEnabledFor(logging.DEBUG)
+        manager._dirty_input_groups = {SCInputGroup.BRIGHTNESS}
+        manager._sun_facade_state = None
+        await manager._update_input_values()
+        await manager._check_if_facade_is_in_sun()
+    return (time.perf_counter() - start) / cycles
+
+
+async def main(cycles: int) -> None:
+    """Run the benchmark with debug logging disabled and enabled."""
+    logger = logging.getLogger("shadow_control.benchmark")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        await entity_registry.async_load(hass)
+        hass.states.async_set("sensor.brightness", "30000")
+        manager = _create_manager(hass, logger)
+
+        for level in (logging.INFO, logging.DEBUG):
+            logger.setLevel(level)
+            per_cycle = await _run_cycles(manager, cycles)
+            print(f"debug {'on ' if level == logging.DEBUG else 'off'}: {per_cycle * 1e6:8.2f} µs per cycle ({cycles} cycles)")
+
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
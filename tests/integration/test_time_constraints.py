@@ -578,7 +578,7 @@ async def test_close_constraint_keeps_timer_running_despite_brightness_recovery(
 
     Without the constraint, high brightness in DAWN_FULL_CLOSED triggers re-opening.
     With past close_not_later_than, the shutter stays at DAWN_FULL_CLOSED regardless
-    of brightness (fixed in _handle_state_dawn_full_closed).
+    of brightness (fixed in the DAWN_FULL_CLOSED transitions).
     """
     config = {DOMAIN: [BASE_CONFIG[DOMAIN][0].copy()]}
     pos_calls, tilt_calls = await setup_instance(
@@ -27,6 +27,7 @@ from custom_components.shadow_control.const import (
     TARGET_COVER_ENTITY,
     ShutterState,
 )
+from custom_components.shadow_control.geometry_cache import SCGeometryCache
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -180,27 +181,47 @@ def mock_async_call_later() -> Generator[MagicMock]:
 
 @pytest.fixture(name="mock_manager")
 def mock_manager_fixture(hass: HomeAssistant) -> MagicMock:
-    """Fixture to mock ShadowControlManager and its state handlers."""
+    """Fixture to mock ShadowControlManager with the real state machine."""
     manager = MagicMock()
     manager.hass = hass
     manager.logger = MagicMock()
     manager.current_shutter_state = ShutterState.NEUTRAL
 
-    # Mock internal methods used by the orchestrator
+    # Mock internal methods used by the orchestrator and the transition actions
     manager._update_extra_state_attributes = MagicMock()
     manager._cancel_timer = MagicMock()
-
-    # Create the state handlers dictionary with AsyncMocks for every state
-    # We populate it with mocks that by default return the current state (no change)
-    manager._state_handlers = {state: AsyncMock(return_value=state) for state in ShutterState}
-
-    # Default dawn config — disabled so the pre-dispatch time-constraint override does not fire
-    # unless a test explicitly enables it.
-    manager._dawn_config = MagicMock()
-    manager._dawn_config.enabled = False
+    manager._start_timer = AsyncMock()
+    manager._position_shutter = AsyncMock()
+
+    # Real geometry calculations, shared by all instances
+    manager._geometry_cache = SCGeometryCache()
+
+    # Inputs of the cycle snapshot: not in the sun, shadow and dawn handling disabled,
+    # no brightness and no timer running, unless a test sets them explicitly
+    manager._check_if_facade_is_in_sun = AsyncMock(return_value=False)
+    manager._is_shadow_control_enabled = AsyncMock(return_value=False)
+    manager._is_dawn_control_enabled = AsyncMock(return_value=False)
+    manager._get_current_brightness = MagicMock(return_value=None)
+    manager._get_current_dawn_brightness = MagicMock(return_value=None)
+    manager.brightness_threshold = None
+    manager._is_timer_finished = MagicMock(return_value=True)
     manager._check_dawn_close_time_constraint = MagicMock(return_value=False)
+    manager._check_dawn_open_time_constraint = MagicMock(return_value=True)
+    manager._shadow_config = MagicMock()
+    manager._dawn_config = MagicMock()
+    manager._facade_config = MagicMock()
 
-    # Bind the real orchestrator logic to the mock instance
+    # Bind the real orchestrator and state machine logic to the mock instance
     manager._process_shutter_state = ShadowControlManager._process_shutter_state.__get__(manager)
+    manager._async_take_cycle_snapshot = ShadowControlManager._async_take_cycle_snapshot.__get__(manager)
+    manager._async_run_state_transition = ShadowControlManager._async_run_state_transition.__get__(manager)
+    manager._async_run_transition_action = ShadowControlManager._async_run_transition_action.__get__(manager)
+    manager._get_transition_target = ShadowControlManager._get_transition_target.__get__(manager)
 
     return manager
+
+
+async def run_state_transition(manager: MagicMock) -> ShutterState:
+    """Run the transition of the current state against a fresh snapshot and return the next state."""
+    next_state, _ = await manager._async_run_state_transition(await manager._async_take_cycle_snapshot())
+    return next_state
@@ -684,7 +684,7 @@ class TestDawnThresholdProtection:
             assert threshold >= expected_min, f"Threshold {threshold} below minimum at {time.hour}:00"
 
     def test_adjustment_only_logged_once(self, caplog):
-        """Test that adjustment is only logged once per calculation."""
+        """Test that adjustment is only logged once per day, as the curve is reused."""
         calc = AdaptiveBrightnessCalculator(latitude=47.0)
 
         sunrise = datetime(2024, 1, 15, 8, 0, 0, tzinfo=UTC)
@@ -705,7 +705,7 @@ class TestDawnThresholdProtection:
         log_count_1 = caplog.text.count("Adjusting adaptive brightness curve minimum")
         assert log_count_1 == 1
 
-        # Second call - should log again (not cached)
+        # Second call on the same day - curve is reused, no log
         caplog.clear()
         calc.calculate_threshold(
             sunrise.replace(hour=12),
@@ -718,7 +718,7 @@ class TestDawnThresholdProtection:
         )
 
         log_count_2 = caplog.text.count("Adjusting adaptive brightness curve minimum")
-        assert log_count_2 == 1
+        assert log_count_2 == 0
 
     def test_real_world_scenario_winter_with_dawn(self):
         """Test realistic winter scenario with dawn protection."""
@@ -821,5 +821,50 @@ class TestDawnThresholdProtection:
         assert threshold == 5001
 
 
+class TestCurveCache:
+    """Test that the curve parameters are calculated once per day."""
+
+    SUNRISE = datetime(2024, 5, 10, 6, 0, 0, tzinfo=UTC)
+    SUNSET = datetime(2024, 5, 10, 20, 0, 0, tzinfo=UTC)
+
+    def _threshold(self, calc, current, sunrise=SUNRISE, sunset=SUNSET, summer_lux=70000):
+        return calc.calculate_threshold(current, sunrise, sunset, winter_lux=50000, summer_lux=summer_lux, minimal=10000, dawn_threshold=5000)
+
+    def test_same_thresholds_as_new_calculator(self):
+        """Reusing the curve doesn't change the thresholds throughout the day."""
+        calc = AdaptiveBrightnessCalculator(latitude=50.0)
+
+        for hour in range(24):
+            current = self.SUNRISE.replace(hour=hour, minute=17)
+            assert self._threshold(calc, current) == self._threshold(AdaptiveBrightnessCalculator(latitude=50.0), current)
+
+        assert calc.curve_misses == 1
+        assert calc.curve_hits == 23
+
+    def test_new_curve_on_change(self):
+        """A new date, new sun times or changed thresholds lead to a new curve."""
+        calc = AdaptiveBrightnessCalculator(latitude=50.0)
+        noon = self.SUNRISE.replace(hour=13)
+
+        self._threshold(calc, noon)
+        self._threshold(calc, noon + timedelta(days=1), self.SUNRISE + timedelta(days=1), self.SUNSET + timedelta(days=1))
+        self._threshold(calc, noon + timedelta(days=1), self.SUNRISE + timedelta(days=1), self.SUNSET + timedelta(days=1, minutes=1))
+        threshold = self._threshold(calc, noon, summer_lux=60000)
+
+        assert threshold == self._threshold(AdaptiveBrightnessCalculator(latitude=50.0), noon, summer_lux=60000)
+        assert calc.curve_misses == 4
+        assert calc.curve_hits == 0
+
+    def test_statistics(self):
+        """The hit rate is part of the statistics."""
+        calc = AdaptiveBrightnessCalculator(latitude=50.0)
+        assert calc.as_dict() == {"curve_hits": 0, "curve_misses": 0, "hit_rate": None}
+
+        for minute in range(4):
+            self._threshold(calc, self.SUNRISE.replace(hour=12, minute=minute))
+
+        assert calc.as_dict() == {"curve_hits": 3, "curve_misses": 1, "hit_rate": 0.75}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
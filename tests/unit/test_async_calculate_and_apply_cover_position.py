@@ -1,5 +1,6 @@
 """Tests for async_calculate_and_apply_cover_position method."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,11 +9,15 @@ from homeassistant.const import STATE_OFF, STATE_ON
 from homeassistant.core import Event
 
 from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.command_scheduler import SCCommandScheduler
 from custom_components.shadow_control.const import (
+    SCCommandPriority,
     SCDawnInput,
     SCDynamicInput,
     SCShadowInput,
 )
+from custom_components.shadow_control.cover_commands import SERVICE_SET_COVER_POSITION, SCCoverCommand
+from custom_components.shadow_control.cover_output import SCCoverOutput
 
 
 class TestAsyncCalculateAndApplyCoverPosition:
@@ -53,14 +58,38 @@ class TestAsyncCalculateAndApplyCoverPosition:
         instance._calculate_shutter_angle = MagicMock(return_value=45.0)
 
         instance._last_unlock_time = None
+        instance._cover_output = MagicMock()
 
         # Grace period attributes
         instance._ha_start_time = datetime.now(tz=UTC) - timedelta(seconds=35)  # Beyond grace period by default
         instance._ha_restart_grace_period_seconds = 30
         instance._startup_restore_complete = True
 
-        # Bind the actual method to the mock instance
+        # Single-flight state
+        instance._calculation_task = None
+        instance._calculation_follow_up = None
+        instance._pending_calculation_triggers = {}
+
+        # Bind the actual methods to the mock instance
         instance.async_calculate_and_apply_cover_position = ShadowControlManager.async_calculate_and_apply_cover_position.__get__(instance)
+        instance.async_calculate_for_events = ShadowControlManager.async_calculate_for_events.__get__(instance)
+        instance._async_timed_calculation_cycle = ShadowControlManager._async_timed_calculation_cycle.__get__(instance)
+        instance._async_calculation_cycle = ShadowControlManager._async_calculation_cycle.__get__(instance)
+        instance._async_handle_calculation_trigger = ShadowControlManager._async_handle_calculation_trigger.__get__(instance)
+
+        # Trigger dispatch is built from the config of the test at the first trigger
+        instance._trigger_handlers = None
+        instance._immediate_positioning_entities = frozenset()
+        for method_name in (
+            "_build_trigger_dispatch",
+            "_get_immediate_positioning_action",
+            "_async_handle_shadow_control_enabled_trigger",
+            "_async_handle_dawn_control_enabled_trigger",
+            "_async_handle_lock_trigger",
+            "_async_handle_lock_with_position_trigger",
+            "_async_handle_enforce_positioning_trigger",
+        ):
+            setattr(instance, method_name, getattr(ShadowControlManager, method_name).__get__(instance))
 
         # Bind grace period check method
         instance._is_in_ha_restart_grace_period = ShadowControlManager._is_in_ha_restart_grace_period.__get__(instance)
@@ -330,3 +359,46 @@ class TestAsyncCalculateAndApplyCoverPosition:
         manager._dawn_handling_was_disabled.assert_called_once()
         manager._force_immediate_positioning.assert_not_called()
         manager._process_shutter_state.assert_not_called()
+
+    # ========================================================================
+    # PHASE 5: COVER OUTPUT
+    # ========================================================================
+
+    async def test_queued_command_does_not_block_calculation(self, manager, hass):
+        """Test that the calculation returns, while its command waits for the command scheduler."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("other_entry", 1.0, 1)
+        # The only token is used by another instance
+        await scheduler.async_submit(SCCommandPriority.REGULAR, 1, AsyncMock())
+
+        queued = asyncio.Event()
+        submit = scheduler.async_submit
+
+        def submit_and_notify(*args):
+            future = submit(*args)
+            queued.set()
+            return future
+
+        scheduler.async_submit = submit_and_notify
+        manager.hass.services.async_call = AsyncMock()
+        manager._command_scheduler = scheduler
+        for method_name in ("_async_dispatch_cover_commands", "_async_send_cover_command", "_async_call_cover_service"):
+            setattr(manager, method_name, getattr(ShadowControlManager, method_name).__get__(manager))
+        manager._cover_output = SCCoverOutput(hass, manager._async_dispatch_cover_commands, 0, 30.0)
+        manager._process_shutter_state.side_effect = lambda *_: manager._cover_output.async_submit(
+            [SCCoverCommand(SERVICE_SET_COVER_POSITION, ("cover.test",), 70.0)]
+        )
+
+        await asyncio.wait_for(manager.async_calculate_and_apply_cover_position(event=None), timeout=1)
+
+        # The dispatch reaches the scheduler in the background
+        await asyncio.wait_for(queued.wait(), timeout=1)
+        assert scheduler.queue_depth == 1
+        manager.hass.services.async_call.assert_not_called()
+
+        scheduler.async_remove_limit("other_entry")
+        await hass.async_block_till_done()
+
+        manager.hass.services.async_call.assert_awaited_once_with(
+            "cover", SERVICE_SET_COVER_POSITION, {"entity_id": "cover.test", "position": 70.0}, blocking=True
+        )
@@ -15,6 +15,7 @@ def manager(mock_manager):
 
     # Mock the helper for effective elevation
     manager._calculate_effective_elevation = AsyncMock(return_value=25.0)
+    manager._sun_facade_state = None
 
     # Default Config: South-facing (180°) facade with 90° spread
     manager._facade_config.azimuth = 180
@@ -92,3 +93,30 @@ class TestCheckIfFacadeIsInSun:
         assert result is True
         # If the modulo works, internal sun_exit_angle became 10.0
         # We can verify the logic correctly identified 5 is within [340, 10]
+
+    async def test_result_is_reused_for_same_sun_position(self, manager):
+        """Repeated checks within a calculation run don't recalculate anything."""
+        assert await manager._check_if_facade_is_in_sun() is True
+        assert await manager._check_if_facade_is_in_sun() is True
+
+        manager._calculate_effective_elevation.assert_awaited_once()
+        assert manager._sun_facade_state.sun_position == (180, 30)
+        assert manager._effective_elevation == 25.0
+
+    async def test_changed_sun_position_is_recalculated(self, manager):
+        """A new sun position invalidates the cached result."""
+        assert await manager._check_if_facade_is_in_sun() is True
+
+        manager._dynamic_config.sun_azimuth = 90
+        assert await manager._check_if_facade_is_in_sun() is False
+        assert manager._effective_elevation is None
+
+    async def test_missing_values_are_not_reused(self, manager):
+        """A result from missing values isn't reused for the same sun position."""
+        manager._facade_config.elevation_sun_max = None
+        assert await manager._check_if_facade_is_in_sun() is False
+        assert manager._sun_facade_state is None
+
+        manager._facade_config.elevation_sun_max = 50
+        assert await manager._check_if_facade_is_in_sun() is True
+        manager._calculate_effective_elevation.assert_awaited_once()
@@ -0,0 +1,157 @@
+"""Tests for the cover command scheduler shared by all instances."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.shadow_control.command_scheduler import DOMAIN_DATA_COMMAND_SCHEDULER, SCCommandScheduler, async_get_command_scheduler
+from custom_components.shadow_control.const import SCCommandPriority
+
+
+@pytest.fixture
+def clock():
+    """Monotonic clock of the scheduler, set by the tests."""
+    clock = MagicMock()
+    clock.monotonic.return_value = 100.0
+    with patch("custom_components.shadow_control.command_scheduler.time", clock):
+        yield clock
+
+
+@pytest.fixture
+def call_later():
+    """Capture the scheduled wakeups instead of running them after the delay."""
+    with patch("custom_components.shadow_control.command_scheduler.async_call_later") as call_later:
+        yield call_later
+
+
+def _submit(scheduler: SCCommandScheduler, priority: SCCommandPriority, cost: int = 1) -> asyncio.Future[None]:
+    """Submit a command, which returns at once."""
+    return scheduler.async_submit(priority, cost, AsyncMock())
+
+
+async def _wake_up(call_later, clock, seconds: float) -> None:
+    """Advance the clock, run the scheduled wakeup and let the released tasks finish."""
+    clock.monotonic.return_value += seconds
+    call_later.call_args.args[2](None)
+    await asyncio.sleep(0)
+
+
+class TestCommandScheduler:
+    """Test the token bucket and the priority lanes."""
+
+    async def test_unlimited(self, clock, call_later, hass):
+        """Without limit, all commands are sent at once."""
+        scheduler = SCCommandScheduler(hass)
+
+        for _ in range(20):
+            assert _submit(scheduler, SCCommandPriority.REGULAR, 3).done()
+
+        call_later.assert_not_called()
+        result = scheduler.as_dict()
+        assert result["commands_per_second"] is None
+        assert result["commands"] == 20
+        assert result["queued_commands"] == 0
+
+    async def test_burst_then_rate(self, clock, call_later, hass):
+        """After the burst, commands wait for the refill of the bucket."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 2.0, 3)
+
+        for _ in range(3):
+            await _submit(scheduler, SCCommandPriority.REGULAR)
+        task = _submit(scheduler, SCCommandPriority.REGULAR)
+
+        assert not task.done()
+        assert scheduler.queue_depth == 1
+        assert call_later.call_args.args[1] == pytest.approx(0.5)
+
+        await _wake_up(call_later, clock, 0.5)
+
+        assert task.done()
+        result = scheduler.as_dict()
+        assert result["queue_depth"] == {"forced": 0, "regular": 0}
+        assert result["max_queue_depth"] == 1
+        assert result["wait_ms"] == {"last": 500.0, "mean": 500.0, "max": 500.0}
+
+    async def test_each_cover_costs_a_token(self, clock, call_later, hass):
+        """A call for several covers is sent at once, the missing tokens delay the next call."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 1.0, 2)
+
+        await _submit(scheduler, SCCommandPriority.REGULAR, 3)
+        task = _submit(scheduler, SCCommandPriority.REGULAR)
+
+        assert call_later.call_args.args[1] == pytest.approx(2.0)
+        await _wake_up(call_later, clock, 2.0)
+        assert task.done()
+
+    async def test_forced_lane_first(self, clock, call_later, hass):
+        """Forced positions are sent before waiting sun tracking commands."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 1.0, 1)
+        await _submit(scheduler, SCCommandPriority.REGULAR)
+
+        regular = _submit(scheduler, SCCommandPriority.REGULAR)
+        forced = _submit(scheduler, SCCommandPriority.FORCED)
+        assert scheduler.as_dict()["queue_depth"] == {"forced": 1, "regular": 1}
+
+        await _wake_up(call_later, clock, 1.0)
+        assert forced.done()
+        assert not regular.done()
+
+        await _wake_up(call_later, clock, 1.0)
+        assert regular.done()
+
+    async def test_most_restrictive_limit(self, clock, call_later, hass):
+        """The lowest limit of all instances applies, without limits the waiting commands are released."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 5.0, 10)
+        scheduler.async_set_limit("entry_2", 2.0, 1)
+        assert (scheduler.as_dict()["commands_per_second"], scheduler.as_dict()["burst"]) == (2.0, 1)
+
+        await _submit(scheduler, SCCommandPriority.REGULAR)
+        task = _submit(scheduler, SCCommandPriority.REGULAR)
+
+        scheduler.async_remove_limit("entry_2")
+        assert (scheduler.as_dict()["commands_per_second"], scheduler.as_dict()["burst"]) == (5.0, 10)
+        scheduler.async_set_limit("entry_1", 0, 10)
+        await asyncio.sleep(0)
+
+        assert task.done()
+        assert scheduler.as_dict()["commands_per_second"] is None
+
+    async def test_cancelled_command_leaves_queue(self, clock, call_later, hass):
+        """A cancelled command doesn't block the queue."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 1.0, 1)
+        await _submit(scheduler, SCCommandPriority.REGULAR)
+        task = _submit(scheduler, SCCommandPriority.REGULAR)
+
+        task.cancel()
+        await asyncio.sleep(0)
+
+        assert scheduler.queue_depth == 0
+
+    async def test_queued_command_sent_by_scheduler(self, clock, call_later, hass):
+        """A waiting command is sent by the scheduler, its error is passed to the future."""
+        scheduler = SCCommandScheduler(hass)
+        scheduler.async_set_limit("entry_1", 1.0, 1)
+        await _submit(scheduler, SCCommandPriority.REGULAR)
+        send = AsyncMock(side_effect=RuntimeError("unavailable"))
+
+        future = scheduler.async_submit(SCCommandPriority.REGULAR, 1, send)
+        send.assert_not_called()
+
+        await _wake_up(call_later, clock, 1.0)
+
+        send.assert_awaited_once()
+        with pytest.raises(RuntimeError, match="unavailable"):
+            await future
+
+    def test_shared_scheduler(self, hass):
+        """All instances get the same scheduler."""
+        scheduler = async_get_command_scheduler(hass)
+
+        assert async_get_command_scheduler(hass) is scheduler
+        assert hass.data[DOMAIN_DATA_COMMAND_SCHEDULER] is scheduler
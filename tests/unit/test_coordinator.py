@@ -0,0 +1,167 @@
+"""Tests for the recalculation coordinator."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.shadow_control.coordinator import (
+    DOMAIN_DATA_COORDINATOR,
+    RECALCULATION_PASS_CONCURRENCY,
+    SCRecalculationCoordinator,
+    async_get_recalculation_coordinator,
+)
+
+
+@pytest.fixture
+def hass(hass):
+    """Home Assistant counting the created tasks."""
+    with patch.object(hass, "async_create_task", wraps=hass.async_create_task):
+        yield hass
+
+
+async def _wait_for_passes(coordinator: SCRecalculationCoordinator) -> None:
+    """Wait until all requested recalculations are done."""
+    while coordinator._pass_task is not None:
+        await coordinator._pass_task
+
+
+class TestRecalculationCoordinator:
+    """Test running the recalculations of all instances in one pass."""
+
+    async def test_requests_of_one_update_form_one_pass(self, hass):
+        """All requests within one loop iteration are recalculated in a single pass."""
+        coordinator = SCRecalculationCoordinator(hass)
+        calls = []
+
+        async def _recalculate(name):
+            calls.append(name)
+
+        for name, group in (("south_1", "south"), ("south_2", "south"), ("west", "west")):
+            coordinator.async_request(group, lambda name=name: _recalculate(name))
+        await _wait_for_passes(coordinator)
+
+        assert sorted(calls) == ["south_1", "south_2", "west"]
+        hass.async_create_task.assert_called_once()
+        result = coordinator.as_dict()
+        assert result["passes"] == 1
+        assert result["last_pass_instances"] == 3
+        assert result["last_pass_groups"] == 2
+        assert result["last_pass_ms"] is not None
+
+    async def test_first_instance_of_group_runs_alone(self, hass):
+        """The first instance of a facade group is recalculated alone, the others concurrently."""
+        coordinator = SCRecalculationCoordinator(hass)
+        running = []
+        concurrent = []
+
+        async def _recalculate(name):
+            running.append(name)
+            concurrent.append(set(running))
+            await asyncio.sleep(0)
+            running.remove(name)
+
+        for name in ("south_1", "south_2", "south_3"):
+            coordinator.async_request("south", lambda name=name: _recalculate(name))
+        await _wait_for_passes(coordinator)
+
+        assert concurrent == [{"south_1"}, {"south_2"}, {"south_2", "south_3"}]
+
+    async def test_slow_instance_does_not_delay_group(self, hass):
+        """A slow instance delays neither the other instances of its group nor their positioning."""
+        coordinator = SCRecalculationCoordinator(hass)
+        release = asyncio.Event()
+        calls = []
+
+        async def _recalculate(name):
+            calls.append(name)
+
+        async def _recalculate_slowly():
+            await release.wait()
+            calls.append("south_slow")
+
+        coordinator.async_request("south", lambda: _recalculate("south_1"))
+        coordinator.async_request("south", _recalculate_slowly)
+        coordinator.async_request("south", lambda: _recalculate("south_3"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert calls == ["south_1", "south_3"]
+
+        release.set()
+        await _wait_for_passes(coordinator)
+        assert calls == ["south_1", "south_3", "south_slow"]
+
+    async def test_concurrency_bound(self, hass):
+        """Not more instances than the configured bound are recalculated at the same time."""
+        coordinator = SCRecalculationCoordinator(hass, max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def _recalculate():
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        for group in range(5):
+            coordinator.async_request(group, _recalculate)
+        await _wait_for_passes(coordinator)
+
+        assert max_running == 2
+
+    async def test_most_restrictive_concurrency(self, hass):
+        """The lowest bound of all instances applies, without bounds the default is used."""
+        coordinator = SCRecalculationCoordinator(hass)
+        coordinator.async_set_max_concurrency("entry_1", 8)
+        coordinator.async_set_max_concurrency("entry_2", 2)
+        assert coordinator.max_concurrency == 2
+
+        coordinator.async_remove_max_concurrency("entry_2")
+        assert coordinator.as_dict()["max_concurrency"] == 8
+
+        coordinator.async_remove_max_concurrency("entry_1")
+        assert coordinator.max_concurrency == RECALCULATION_PASS_CONCURRENCY
+
+    async def test_requests_during_pass(self, hass):
+        """Requests arriving during a pass are recalculated in the next pass."""
+        coordinator = SCRecalculationCoordinator(hass)
+        calls = []
+
+        async def _recalculate_and_request():
+            calls.append("first")
+            coordinator.async_request("south", _recalculate_later)
+
+        async def _recalculate_later():
+            calls.append("second")
+
+        coordinator.async_request("south", _recalculate_and_request)
+        await _wait_for_passes(coordinator)
+
+        assert calls == ["first", "second"]
+        assert coordinator.passes == 2
+
+    async def test_failing_instance(self, hass):
+        """A failing recalculation doesn't stop the others."""
+        coordinator = SCRecalculationCoordinator(hass)
+        calls = []
+
+        async def _fail():
+            raise RuntimeError
+
+        async def _recalculate():
+            calls.append("ok")
+
+        coordinator.async_request("south", _fail)
+        coordinator.async_request("south", _recalculate)
+        await _wait_for_passes(coordinator)
+
+        assert calls == ["ok"]
+
+    def test_shared_coordinator(self, hass):
+        """All instances get the same coordinator."""
+        coordinator = async_get_recalculation_coordinator(hass)
+
+        assert async_get_recalculation_coordinator(hass) is coordinator
+        assert hass.data[DOMAIN_DATA_COORDINATOR] is coordinator
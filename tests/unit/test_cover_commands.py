@@ -0,0 +1,120 @@
+"""Tests for the batched cover commands."""
+
+import asyncio
+
+from homeassistant.components.cover import CoverEntityFeature
+from homeassistant.core import State
+
+from custom_components.shadow_control.cover_commands import (
+    SERVICE_SET_COVER_POSITION,
+    SERVICE_SET_COVER_TILT_POSITION,
+    SCCoverCommand,
+    async_dispatch_cover_commands,
+    split_covers_by_feature,
+)
+
+
+def _cover(entity_id: str, features: int) -> State:
+    return State(entity_id, "open", {"supported_features": features})
+
+
+class TestCoverCommands:
+    """Test the grouping of covers into service calls."""
+
+    def test_service_data(self):
+        """A single cover is addressed directly, several covers as list."""
+        assert SCCoverCommand(SERVICE_SET_COVER_POSITION, ("cover.one",), 30.0).service_data == {"entity_id": "cover.one", "position": 30.0}
+        assert SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, ("cover.one", "cover.two"), 60.0).service_data == {
+            "entity_id": ["cover.one", "cover.two"],
+            "tilt_position": 60.0,
+        }
+
+    def test_split_covers_by_feature(self):
+        """Covers are split by the supported feature, keeping the configured order."""
+        covers = {
+            "cover.venetian": _cover("cover.venetian", CoverEntityFeature.SET_POSITION | CoverEntityFeature.SET_TILT_POSITION),
+            "cover.roller": _cover("cover.roller", CoverEntityFeature.SET_POSITION),
+            "cover.simple": _cover("cover.simple", CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE),
+        }
+
+        assert split_covers_by_feature(covers, CoverEntityFeature.SET_POSITION) == (("cover.venetian", "cover.roller"), ("cover.simple",))
+        assert split_covers_by_feature(covers, CoverEntityFeature.SET_TILT_POSITION) == (("cover.venetian",), ("cover.roller", "cover.simple"))
+
+
+class TestDispatchCoverCommands:
+    """Test the concurrent dispatch of the commands of a positioning run."""
+
+    async def test_commands_run_concurrently(self):
+        """Position and tilt calls are in flight at the same time, bounded by max_concurrency."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def _send(command):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        commands = [SCCoverCommand(SERVICE_SET_COVER_POSITION, (f"cover.{index}",), 30.0) for index in range(5)]
+
+        result = await async_dispatch_cover_commands(_send, commands, max_concurrency=2)
+
+        assert max_in_flight == 2
+        assert result.service_calls == 5
+        assert result.failures == ()
+        assert result.duration >= 0
+
+    async def test_position_before_tilt(self):
+        """Tilt calls are sent after all position calls are completed."""
+        events = []
+
+        async def _send(command):
+            events.append(("start", command.service, command.entity_ids))
+            await asyncio.sleep(0)
+            events.append(("done", command.service, command.entity_ids))
+
+        commands = [
+            SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, ("cover.one",), 60.0),
+            SCCoverCommand(SERVICE_SET_COVER_POSITION, ("cover.one",), 30.0),
+            SCCoverCommand(SERVICE_SET_COVER_POSITION, ("cover.two",), 30.0),
+        ]
+
+        await async_dispatch_cover_commands(_send, commands)
+
+        assert events == [
+            ("start", SERVICE_SET_COVER_POSITION, ("cover.one",)),
+            ("start", SERVICE_SET_COVER_POSITION, ("cover.two",)),
+            ("done", SERVICE_SET_COVER_POSITION, ("cover.one",)),
+            ("done", SERVICE_SET_COVER_POSITION, ("cover.two",)),
+            ("start", SERVICE_SET_COVER_TILT_POSITION, ("cover.one",)),
+            ("done", SERVICE_SET_COVER_TILT_POSITION, ("cover.one",)),
+        ]
+
+    async def test_failing_cover_is_isolated(self):
+        """A failing call for several covers is repeated per cover, only the faulty cover is reported."""
+        sent = []
+
+        async def _send(command):
+            sent.append((command.service, command.entity_ids))
+            if "cover.broken" in command.entity_ids:
+                msg = "unavailable"
+                raise RuntimeError(msg)
+
+        commands = [
+            SCCoverCommand(SERVICE_SET_COVER_POSITION, ("cover.one", "cover.broken", "cover.two"), 30.0),
+            SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, ("cover.one", "cover.two"), 60.0),
+        ]
+
+        result = await async_dispatch_cover_commands(_send, commands)
+
+        assert sent[0] == (SERVICE_SET_COVER_POSITION, ("cover.one", "cover.broken", "cover.two"))
+        assert sorted(sent[1:4]) == [
+            (SERVICE_SET_COVER_POSITION, ("cover.broken",)),
+            (SERVICE_SET_COVER_POSITION, ("cover.one",)),
+            (SERVICE_SET_COVER_POSITION, ("cover.two",)),
+        ]
+        assert sent[4:] == [(SERVICE_SET_COVER_TILT_POSITION, ("cover.one", "cover.two"))]
+        assert result.service_calls == 5
+        assert [(failure.service, failure.entity_id) for failure in result.failures] == [(SERVICE_SET_COVER_POSITION, "cover.broken")]
+        assert isinstance(result.failures[0].error, RuntimeError)
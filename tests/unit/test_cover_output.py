@@ -0,0 +1,172 @@
+"""Tests for the output stage of the cover commands."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from custom_components.shadow_control.cover_commands import (
+    SERVICE_SET_COVER_POSITION,
+    SERVICE_SET_COVER_TILT_POSITION,
+    SCCoverCommand,
+    SCCoverCommandFailure,
+    SCCoverDispatchResult,
+)
+from custom_components.shadow_control.cover_output import SCCoverOutput
+
+
+def _position(value: float, *entity_ids: str) -> SCCoverCommand:
+    return SCCoverCommand(SERVICE_SET_COVER_POSITION, entity_ids or ("cover.one",), value)
+
+
+def _tilt(value: float, *entity_ids: str) -> SCCoverCommand:
+    return SCCoverCommand(SERVICE_SET_COVER_TILT_POSITION, entity_ids or ("cover.one",), value)
+
+
+@pytest.fixture
+def clock():
+    """Monotonic clock of the output stage, set by the tests."""
+    clock = MagicMock()
+    clock.monotonic.return_value = 100.0
+    with patch("custom_components.shadow_control.cover_output.time", clock):
+        yield clock
+
+
+@pytest.fixture
+def call_later():
+    """Capture the scheduled flushes instead of running them after the delay."""
+    with patch("custom_components.shadow_control.cover_output.async_call_later") as call_later:
+        yield call_later
+
+
+class TestCoverOutput:
+    """Test coalescing and deduplication of the cover commands."""
+
+    async def test_latest_pending_target_sent_after_min_interval(self, hass, clock, call_later):
+        """Within the min interval, only the latest target is kept and sent when the interval elapsed."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=2.0, in_flight_duration=30.0)
+
+        output.async_submit([_position(30.0)])
+        clock.monotonic.return_value = 100.5
+        output.async_submit([_position(40.0)])
+        clock.monotonic.return_value = 101.0
+        output.async_submit([_position(50.0)])
+        await hass.async_block_till_done()
+
+        send.assert_awaited_once_with([_position(30.0)])
+        assert output.pending_targets == 1
+        # Scheduled once, when the first target became pending
+        call_later.assert_called_once()
+        assert call_later.call_args.args[1] == pytest.approx(1.5)
+
+        clock.monotonic.return_value = 102.0
+        call_later.call_args.args[2](None)
+        await hass.async_block_till_done()
+
+        assert send.await_args_list == [call([_position(30.0)]), call([_position(50.0)])]
+        assert output.as_dict() == {"min_interval": 2.0, "sent_targets": 2, "superseded_targets": 1, "dropped_targets": 0, "pending_targets": 0}
+
+    async def test_in_flight_target_dropped(self, hass, clock, call_later):
+        """A target equal to the one in flight is dropped, unless forced or the movement duration elapsed."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=0, in_flight_duration=30.0)
+
+        output.async_submit([_position(30.0), _tilt(60.0)])
+        clock.monotonic.return_value = 105.0
+        output.async_submit([_position(30.0), _tilt(60.0)])
+        output.async_submit([_position(30.0)], force=True)
+        clock.monotonic.return_value = 131.0
+        output.async_submit([_tilt(60.0)])
+        await hass.async_block_till_done()
+
+        assert send.await_args_list == [call([_position(30.0), _tilt(60.0)]), call([_position(30.0)]), call([_tilt(60.0)])]
+        assert output.dropped_targets == 2
+        call_later.assert_not_called()
+
+    async def test_in_flight_target_replaces_pending(self, hass, clock, call_later):
+        """Returning to the target in flight discards the pending target."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=2.0, in_flight_duration=30.0)
+
+        output.async_submit([_position(30.0)])
+        clock.monotonic.return_value = 100.5
+        output.async_submit([_position(40.0)])
+        output.async_submit([_position(30.0)])
+        clock.monotonic.return_value = 102.0
+        call_later.call_args.args[2](None)
+        await hass.async_block_till_done()
+
+        send.assert_awaited_once_with([_position(30.0)])
+        assert output.superseded_targets == 1
+        assert output.dropped_targets == 1
+
+    async def test_covers_with_same_target_share_service_call(self, hass, clock, call_later):
+        """Covers with the same target are moved with one call, position before tilt."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=0, in_flight_duration=30.0)
+
+        output.async_submit([_tilt(60.0, "cover.one", "cover.two"), _position(30.0, "cover.one", "cover.two")])
+        await hass.async_block_till_done()
+
+        send.assert_awaited_once_with([_position(30.0, "cover.one", "cover.two"), _tilt(60.0, "cover.one", "cover.two")])
+
+    async def test_reset_in_flight(self, hass, clock, call_later):
+        """After a manual movement, the same target is sent again."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=0, in_flight_duration=30.0)
+        output.async_submit([_position(30.0)])
+
+        output.async_reset_in_flight()
+        output.async_submit([_position(30.0)])
+        await hass.async_block_till_done()
+
+        assert send.await_count == 2
+
+    async def test_failed_target_sent_again(self, hass, clock, call_later):
+        """A target, which failed for a cover, is not in flight, the other covers keep it."""
+        failure = SCCoverCommandFailure(SERVICE_SET_COVER_POSITION, "cover.broken", RuntimeError("unavailable"))
+        send = AsyncMock(return_value=SCCoverDispatchResult(0.1, 2, (failure,)))
+        output = SCCoverOutput(hass, send, min_interval=0, in_flight_duration=30.0)
+        output.async_submit([_position(30.0, "cover.one", "cover.broken")])
+        await hass.async_block_till_done()
+
+        send.return_value = None
+        output.async_submit([_position(30.0, "cover.one", "cover.broken")])
+        await hass.async_block_till_done()
+
+        assert send.await_args_list == [call([_position(30.0, "cover.one", "cover.broken")]), call([_position(30.0, "cover.broken")])]
+        assert output.dropped_targets == 1
+
+    async def test_cancel_discards_pending_targets(self, hass, clock, call_later):
+        """On unload, the scheduled flush is cancelled and pending targets are discarded."""
+        send = AsyncMock()
+        output = SCCoverOutput(hass, send, min_interval=2.0, in_flight_duration=30.0)
+        output.async_submit([_position(30.0)])
+        output.async_submit([_position(40.0)])
+
+        output.async_cancel()
+
+        call_later.return_value.assert_called_once()
+        assert output.pending_targets == 0
+
+    async def test_submit_does_not_wait_for_services(self, hass, clock, call_later):
+        """The commands are sent in the background, a pending service call is stopped on unload."""
+        service_called = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _send(commands):
+            service_called.set()
+            await release.wait()
+
+        output = SCCoverOutput(hass, _send, min_interval=0, in_flight_duration=30.0)
+        output.async_submit([_position(30.0)])
+        await service_called.wait()
+
+        assert output.as_dict()["sent_targets"] == 1
+        (task,) = output._dispatch_tasks
+
+        output.async_cancel()
+        await hass.async_block_till_done()
+
+        assert task.cancelled()
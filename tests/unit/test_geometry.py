@@ -0,0 +1,146 @@
+"""Tests for the facade and shutter geometry."""
+
+import math
+
+import pytest
+
+from custom_components.shadow_control import SCStaticFacadeConfiguration
+from custom_components.shadow_control.const import ShutterType
+from custom_components.shadow_control.geometry import (
+    apply_stepping,
+    calculate_effective_elevation,
+    calculate_shutter_angle,
+    calculate_shutter_height,
+    calculate_sun_entry_exit_angles,
+    is_elevation_in_range,
+    is_sun_between_offsets,
+    limit_shutter_angle,
+)
+
+
+class TestScalarGeometry:
+    """Test the scalar geometry functions."""
+
+    def test_effective_elevation(self):
+        """Sun in front of the facade keeps its elevation, sun parallel to the facade is limited to 90°."""
+        assert calculate_effective_elevation(180.0, 30.0, 180.0) == pytest.approx(30.0)
+        assert calculate_effective_elevation(210.0, 45.0, 180.0) == pytest.approx(49.1, abs=0.1)
+        assert calculate_effective_elevation(270.0, 10.0, 180.0) == 90.0
+
+    def test_effective_elevation_invalid_input(self):
+        """Sun positions without a tangent raise a ValueError."""
+        with pytest.raises(ValueError, match="math domain error"):
+            calculate_effective_elevation(180.0, math.inf, 180.0)
+
+    @pytest.mark.parametrize(
+        ("facade_azimuth", "sun_azimuth", "expected"),
+        [
+            (180.0, 180.0, True),
+            (180.0, 90.0, False),
+            # Window across north
+            (10.0, 340.0, True),
+            (10.0, 90.0, False),
+        ],
+    )
+    def test_sun_between_offsets(self, facade_azimuth, sun_azimuth, expected):
+        """The azimuth window also works across north."""
+        sun_entry_angle, sun_exit_angle = calculate_sun_entry_exit_angles(facade_azimuth, -45.0, 45.0)
+
+        assert is_sun_between_offsets(sun_azimuth, sun_entry_angle, sun_exit_angle) is expected
+
+    def test_elevation_in_range(self):
+        """Limits are exclusive."""
+        assert is_elevation_in_range(30.0, 10.0, 50.0)
+        assert not is_elevation_in_range(10.0, 10.0, 50.0)
+        assert not is_elevation_in_range(50.0, 10.0, 50.0)
+
+    def test_shutter_height(self):
+        """The light strip defines the height, which is limited to the max height."""
+        # 1000 * tan(30°) = 577 -> 100 - round(57.7) = 42
+        assert calculate_shutter_height(30.0, 1000.0, 1000.0, 100.0) == 42
+        assert calculate_shutter_height(30.0, 1000.0, 1000.0, 40.0) == 40.0
+        assert calculate_shutter_height(30.0, 0.0, 1000.0, 80.0) == 80.0
+
+    def test_stepping(self):
+        """Values are rounded up to the next step, stepping 0 disables it."""
+        assert apply_stepping(23, 10.0) == 30.0
+        assert apply_stepping(30, 10.0) == 30
+        assert apply_stepping(23, 0) == 23
+
+    def test_shutter_angle(self):
+        """Sun directly in front of the facade leads to the reference angle."""
+        assert calculate_shutter_angle(180.0, 30.0, 180.0, 80.0, 70.0, ShutterType.MODE1) == 21
+        assert calculate_shutter_angle(180.0, 30.0, 180.0, 80.0, 70.0, ShutterType.MODE2) == 61
+
+    def test_shutter_angle_impossible_geometry(self):
+        """Slats which can't block the sun lead to None."""
+        assert calculate_shutter_angle(180.0, 5.0, 180.0, 80.0, 200.0, ShutterType.MODE1) is None
+
+    def test_limit_shutter_angle(self):
+        """Offset is added before limiting, the result is a rounded float."""
+        assert limit_shutter_angle(30, 5.0, 0.0, 100.0) == 35.0
+        assert limit_shutter_angle(10, -20.0, 5.0, 100.0) == 5.0
+        assert limit_shutter_angle(90, 20.0, 0.0, 80.0) == 80.0
+        assert isinstance(limit_shutter_angle(30, 0.0, 0.0, 100.0), float)
+
+
+class TestBatchGeometry:
+    """Test the vectorized geometry against the scalar functions."""
+
+    @pytest.mark.parametrize("shutter_type", [ShutterType.MODE1, ShutterType.MODE2, ShutterType.MODE3])
+    def test_batch_matches_scalar(self, shutter_type):
+        """Each element of the batch equals the result of the scalar functions."""
+        np = pytest.importorskip("numpy")
+        from custom_components.shadow_control.geometry_batch import calculate_geometry_batch  # noqa: PLC0415
+
+        facade = SCStaticFacadeConfiguration(
+            azimuth=200.0,
+            offset_sun_in=-80.0,
+            offset_sun_out=70.0,
+            elevation_sun_min=5.0,
+            elevation_sun_max=80.0,
+            slat_width=95.0,
+            slat_distance=67.0,
+            slat_angle_offset=3.0,
+            slat_min_angle=5.0,
+            shutter_stepping_height=5.0,
+            shutter_stepping_angle=10.0,
+            shutter_type=shutter_type,
+            light_strip_width=500.0,
+            shutter_height=2000.0,
+        )
+        azimuths, elevations = np.meshgrid(np.arange(0.0, 360.0, 7.5), np.arange(-5.0, 90.0, 2.5))
+
+        batch = calculate_geometry_batch(azimuths, elevations, facade, 90.0, 95.0)
+
+        assert batch.is_in_sun.shape == azimuths.shape
+        sun_entry_angle, sun_exit_angle = calculate_sun_entry_exit_angles(facade.azimuth, facade.offset_sun_in, facade.offset_sun_out)
+        for azimuth, elevation, is_in_sun, effective_elevation, height, angle in zip(
+            azimuths.flat, elevations.flat, batch.is_in_sun.flat, batch.effective_elevation.flat, batch.height.flat, batch.angle.flat, strict=True
+        ):
+            expected_effective_elevation = None
+            if is_sun_between_offsets(azimuth, sun_entry_angle, sun_exit_angle):
+                expected_effective_elevation = calculate_effective_elevation(azimuth, elevation, facade.azimuth)
+                assert effective_elevation == pytest.approx(expected_effective_elevation)
+            else:
+                assert np.isnan(effective_elevation)
+            assert is_in_sun == (
+                expected_effective_elevation is not None
+                and is_elevation_in_range(expected_effective_elevation, facade.elevation_sun_min, facade.elevation_sun_max)
+            )
+
+            expected_height = apply_stepping(
+                calculate_shutter_height(elevation, facade.light_strip_width, facade.shutter_height, 90.0), facade.shutter_stepping_height
+            )
+            assert height == expected_height
+
+            expected_angle = 0.0
+            if shutter_type != ShutterType.MODE3 and expected_effective_elevation is not None:
+                raw_angle = calculate_shutter_angle(
+                    azimuth, expected_effective_elevation, facade.azimuth, facade.slat_width, facade.slat_distance, shutter_type
+                )
+                if raw_angle is not None:
+                    expected_angle = limit_shutter_angle(
+                        apply_stepping(raw_angle, facade.shutter_stepping_angle), facade.slat_angle_offset, facade.slat_min_angle, 95.0
+                    )
+            assert angle == expected_angle
@@ -0,0 +1,87 @@
+"""Tests for the geometry cache shared by instances with identical facades."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.shadow_control.const import ShutterType
+from custom_components.shadow_control.geometry import calculate_effective_elevation, calculate_shutter_angle, calculate_shutter_height
+from custom_components.shadow_control.geometry_cache import DOMAIN_DATA_GEOMETRY_CACHE, SCGeometryCache, async_get_geometry_cache
+
+
+class TestGeometryCache:
+    """Test the caching of geometry results."""
+
+    def test_same_results_as_geometry(self):
+        """Results for quantized sun positions are the ones of the geometry functions."""
+        cache = SCGeometryCache()
+
+        assert cache.effective_elevation(210.0, 45.0, 180.0) == calculate_effective_elevation(210.0, 45.0, 180.0)
+        assert cache.shutter_height(30.0, 100.0, 200.0, 80.0) == calculate_shutter_height(30.0, 100.0, 200.0, 80.0)
+        assert cache.shutter_angle(180.0, 30.0, 180.0, 95.0, 67.0, ShutterType.MODE1) == calculate_shutter_angle(
+            180.0, 30.0, 180.0, 95.0, 67.0, ShutterType.MODE1
+        )
+
+    def test_identical_facades_share_results(self):
+        """A second facade with identical geometry and sun position within 0.01° gets the result of the first one."""
+        cache = SCGeometryCache()
+
+        first = cache.shutter_height(30.001, 100.0, 200.0, 80.0)
+        second = cache.shutter_height(29.999, 100.0, 200.0, 80.0)
+
+        assert first == second == calculate_shutter_height(30.001, 100.0, 200.0, 80.0)
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_different_geometry_not_shared(self):
+        """Each geometry input is part of the key."""
+        cache = SCGeometryCache()
+
+        cache.shutter_angle(180.0, 30.0, 180.0, 95.0, 67.0, ShutterType.MODE1)
+        cache.shutter_angle(180.0, 30.0, 180.0, 95.0, 67.0, ShutterType.MODE2)
+        cache.shutter_angle(180.0, 30.0, 170.0, 95.0, 67.0, ShutterType.MODE1)
+        cache.effective_elevation(180.0, 30.0, 180.0)
+
+        assert cache.hits == 0
+        assert len(cache) == 4
+
+    def test_impossible_geometry_cached(self):
+        """None for a slat geometry which can't block the sun is a valid result."""
+        cache = SCGeometryCache()
+
+        with patch("custom_components.shadow_control.geometry_cache.calculate_shutter_angle", return_value=None) as mock_angle:
+            assert cache.shutter_angle(180.0, 5.0, 180.0, 10.0, 67.0, ShutterType.MODE1) is None
+            assert cache.shutter_angle(180.0, 5.0, 180.0, 10.0, 67.0, ShutterType.MODE1) is None
+
+        mock_angle.assert_called_once()
+
+    def test_errors_not_cached(self):
+        """Invalid sun positions raise on each call, so the caller can handle them."""
+        cache = SCGeometryCache()
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="math domain error"):
+                cache.effective_elevation(180.0, float("inf"), 180.0)
+        assert len(cache) == 0
+
+    def test_bounded(self):
+        """The least recently used results are removed if the cache is full."""
+        cache = SCGeometryCache(max_size=2)
+        cache.shutter_height(10.0, 100.0, 200.0, 80.0)
+        cache.shutter_height(20.0, 100.0, 200.0, 80.0)
+        cache.shutter_height(10.0, 100.0, 200.0, 80.0)
+
+        cache.shutter_height(30.0, 100.0, 200.0, 80.0)
+
+        assert len(cache) == 2
+        cache.shutter_height(10.0, 100.0, 200.0, 80.0)
+        assert cache.as_dict() == {"size": 2, "max_size": 2, "hits": 2, "misses": 3, "hit_rate": 0.4}
+
+    def test_shared_cache(self):
+        """All instances get the same cache."""
+        hass = MagicMock(data={})
+
+        cache = async_get_geometry_cache(hass)
+
+        assert async_get_geometry_cache(hass) is cache
+        assert hass.data[DOMAIN_DATA_GEOMETRY_CACHE] is cache
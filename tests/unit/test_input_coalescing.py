@@ -0,0 +1,90 @@
+"""Tests for coalescing bursts of input events into a single recalculation."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.const import SCTriggerSource
+
+
+def _event(entity_id: str, old: str, new: str) -> MagicMock:
+    return MagicMock(data={"entity_id": entity_id, "old_state": MagicMock(state=old), "new_state": MagicMock(state=new)})
+
+
+@pytest.fixture
+def manager():
+    """Bind the input event handling to a mock manager with a coalescing window of 2s."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.logger = MagicMock()
+    instance.hass = MagicMock()
+    instance._input_coalescing_window = 2.0
+    instance._coalescing_bypass_entities = frozenset({"switch.sc_lock"})
+    instance._coalesced_events = {}
+    instance._unsub_coalescing_timer = None
+    instance.async_calculate_for_events = AsyncMock()
+
+    instance._async_state_change_listener = ShadowControlManager._async_state_change_listener.__get__(instance)
+    instance._coalesce_input_event = ShadowControlManager._coalesce_input_event.__get__(instance)
+    instance._async_coalescing_window_elapsed = ShadowControlManager._async_coalescing_window_elapsed.__get__(instance)
+    instance._cancel_coalescing_timer = ShadowControlManager._cancel_coalescing_timer.__get__(instance)
+    return instance
+
+
+class TestInputCoalescing:
+    """Test the coalescing window for input events."""
+
+    async def test_burst_leads_to_single_recalculation(self, manager):
+        """Several brightness changes within the window are merged, using the latest event."""
+        with patch("custom_components.shadow_control.async_call_later") as mock_call_later:
+            await manager._async_state_change_listener(_event("sensor.brightness", "1000", "1100"))
+            await manager._async_state_change_listener(_event("sensor.brightness", "1100", "1200"))
+            last_event = _event("sensor.brightness", "1200", "1300")
+            await manager._async_state_change_listener(last_event)
+
+        mock_call_later.assert_called_once()
+        assert mock_call_later.call_args.args[1] == 2.0
+        manager.async_calculate_for_events.assert_not_awaited()
+
+        await manager._async_coalescing_window_elapsed(None)
+
+        manager.async_calculate_for_events.assert_awaited_once_with([last_event], SCTriggerSource.LISTENER)
+        assert manager._unsub_coalescing_timer is None
+        assert manager._coalesced_events == {}
+
+    async def test_latest_event_per_entity_kept(self, manager):
+        """A control enabled change followed by a brightness change within the window is handled as well."""
+        enabled_event = _event("input_boolean.shadow_control", "on", "off")
+        brightness_event = _event("sensor.brightness", "1000", "1100")
+        with patch("custom_components.shadow_control.async_call_later"):
+            await manager._async_state_change_listener(enabled_event)
+            await manager._async_state_change_listener(brightness_event)
+
+        await manager._async_coalescing_window_elapsed(None)
+
+        manager.async_calculate_for_events.assert_awaited_once_with([enabled_event, brightness_event], SCTriggerSource.LISTENER)
+
+    async def test_lock_bypasses_window(self, manager):
+        """A lock change is handled immediately, together with the pending coalesced events."""
+        unsub = MagicMock()
+        brightness_event = _event("sensor.brightness", "1000", "1100")
+        with patch("custom_components.shadow_control.async_call_later", return_value=unsub):
+            await manager._async_state_change_listener(brightness_event)
+        lock_event = _event("switch.sc_lock", "off", "on")
+
+        await manager._async_state_change_listener(lock_event)
+
+        manager.async_calculate_for_events.assert_awaited_once_with([brightness_event, lock_event], SCTriggerSource.LISTENER)
+        unsub.assert_called_once()
+        assert manager._unsub_coalescing_timer is None
+
+    async def test_disabled_window(self, manager):
+        """Without a window every change is handled immediately."""
+        manager._input_coalescing_window = 0
+        event = _event("sensor.brightness", "1000", "1100")
+
+        with patch("custom_components.shadow_control.async_call_later") as mock_call_later:
+            await manager._async_state_change_listener(event)
+
+        mock_call_later.assert_not_called()
+        manager.async_calculate_for_events.assert_awaited_once_with([event], SCTriggerSource.LISTENER)
@@ -0,0 +1,136 @@
+"""Tests for the incremental reading of input values."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.const import INTERNAL_INPUT_GROUPS, SCDynamicInput, SCInputGroup, SCInternal, SCTriggerSource
+
+
+@pytest.fixture
+def manager():
+    """Bind the input group handling to a mock manager."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.logger = MagicMock()
+    instance.hass = MagicMock()
+    instance._config = {
+        SCDynamicInput.BRIGHTNESS_ENTITY.value: "sensor.brightness",
+        SCDynamicInput.SUN_ELEVATION_ENTITY.value: "sun.sun",
+        SCDynamicInput.SUN_AZIMUTH_ENTITY.value: "sun.sun",
+        SCDynamicInput.LOCK_INTEGRATION_ENTITY.value: "none",
+    }
+    instance._dirty_input_groups = set(SCInputGroup)
+    instance._input_groups_by_entity = {}
+    instance._unsub_input_entities = None
+    instance._solar_engine = None
+    instance._shared_input_entities = frozenset()
+    instance._input_group_readers = {group: MagicMock() for group in SCInputGroup}
+    instance._facade_config = instance._dynamic_config = instance._shadow_config = instance._dawn_config = MagicMock()
+    instance._debug_enabled = False
+    instance.get_internal_entity_id = MagicMock(
+        side_effect=lambda internal_enum: "switch.sc_lock" if internal_enum is SCInternal.LOCK_INTEGRATION_MANUAL else None
+    )
+
+    instance._update_input_values = ShadowControlManager._update_input_values.__get__(instance)
+    instance._mark_all_input_groups_dirty = ShadowControlManager._mark_all_input_groups_dirty.__get__(instance)
+    instance._async_track_input_entities = ShadowControlManager._async_track_input_entities.__get__(instance)
+    instance._async_input_entity_state_listener = ShadowControlManager._async_input_entity_state_listener.__get__(instance)
+    instance._mark_trigger_input_groups_dirty = ShadowControlManager._mark_trigger_input_groups_dirty.__get__(instance)
+    return instance
+
+
+class TestInputGroups:
+    """Test that only changed input groups are read."""
+
+    async def test_first_run_reads_all_groups(self, manager):
+        """All groups are read at the first run, none at the next one without changes."""
+        await manager._update_input_values()
+
+        for reader in manager._input_group_readers.values():
+            reader.assert_called_once()
+        assert manager._dirty_input_groups == set()
+
+        await manager._update_input_values()
+
+        for reader in manager._input_group_readers.values():
+            reader.assert_called_once()
+        # Time and auto-lock dependent values are evaluated on every run
+        assert manager._calculate_lock_state.call_count == 2
+        assert manager._update_brightness_threshold.call_count == 2
+
+    async def test_track_input_entities(self, manager):
+        """Entities are mapped to the groups they feed, unset entities are ignored."""
+        with patch("custom_components.shadow_control.async_track_state_change_event") as mock_track:
+            manager._async_track_input_entities()
+
+        assert manager._input_groups_by_entity == {
+            "sensor.brightness": {SCInputGroup.BRIGHTNESS},
+            "sun.sun": {SCInputGroup.SUN_POSITION},
+            "switch.sc_lock": {SCInputGroup.LOCK},
+        }
+        mock_track.assert_called_once()
+        assert set(mock_track.call_args.args[1]) == {"sensor.brightness", "sun.sun", "switch.sc_lock"}
+
+    async def test_shared_input_entities_not_tracked(self, manager):
+        """Shared entities are mapped to their groups, but their changes are received from the input hub."""
+        manager._shared_input_entities = frozenset({"sensor.brightness", "sun.sun"})
+
+        with patch("custom_components.shadow_control.async_track_state_change_event") as mock_track:
+            manager._async_track_input_entities()
+
+        assert set(manager._input_groups_by_entity) == {"sensor.brightness", "sun.sun", "switch.sc_lock"}
+        assert mock_track.call_args.args[1] == ["switch.sc_lock"]
+
+    async def test_state_change_marks_only_fed_groups(self, manager):
+        """A brightness change leads to re-reading only the brightness group."""
+        with patch("custom_components.shadow_control.async_track_state_change_event"):
+            manager._async_track_input_entities()
+        await manager._update_input_values()
+        for reader in manager._input_group_readers.values():
+            reader.reset_mock()
+
+        manager._async_input_entity_state_listener(MagicMock(data={"entity_id": "sensor.brightness"}))
+        await manager._update_input_values()
+
+        manager._input_group_readers[SCInputGroup.BRIGHTNESS].assert_called_once()
+        for group, reader in manager._input_group_readers.items():
+            if group is not SCInputGroup.BRIGHTNESS:
+                reader.assert_not_called()
+
+    async def test_trigger_marks_fed_groups(self, manager):
+        """The trigger marks its groups itself, as the state change listener is called later."""
+        with patch("custom_components.shadow_control.async_track_state_change_event"):
+            manager._async_track_input_entities()
+        manager._dirty_input_groups = set()
+
+        manager._mark_trigger_input_groups_dirty(MagicMock(data={"entity_id": "switch.sc_lock"}), SCTriggerSource.LISTENER)
+        assert manager._dirty_input_groups == {SCInputGroup.LOCK}
+
+        manager._dirty_input_groups = set()
+        manager._mark_trigger_input_groups_dirty(None, SCTriggerSource.ENTITY_NOTIFY)
+        assert manager._dirty_input_groups == INTERNAL_INPUT_GROUPS
+        assert SCInputGroup.BRIGHTNESS not in manager._dirty_input_groups
+
+        manager._dirty_input_groups = set()
+        manager._mark_trigger_input_groups_dirty(None, SCTriggerSource.TIMER)
+        assert manager._dirty_input_groups == set()
+
+    async def test_mark_all_dirty(self, manager):
+        """After re-indexing all groups are read again."""
+        manager._dirty_input_groups = set()
+
+        manager._mark_all_input_groups_dirty()
+
+        assert manager._dirty_input_groups == set(SCInputGroup)
+
+    async def test_config_dump_only_with_debug_enabled(self, manager):
+        """The config objects are only formatted for logging if debug logging is enabled."""
+        with patch("custom_components.shadow_control._format_config_object_for_logging") as mock_format:
+            await manager._update_input_values()
+        mock_format.assert_not_called()
+
+        manager._debug_enabled = True
+        with patch("custom_components.shadow_control._format_config_object_for_logging") as mock_format:
+            await manager._update_input_values()
+        assert mock_format.call_count == 4
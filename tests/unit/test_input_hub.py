@@ -0,0 +1,110 @@
+"""Tests for the input hub shared by all instances."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.shadow_control.input_hub import DOMAIN_DATA_INPUT_HUB, SCInputHub, async_get_input_hub, parse_float_state
+from custom_components.shadow_control.state_cache import async_get_state_cache
+
+
+@pytest.fixture
+async def hass(hass):
+    """Home Assistant with a sun and a brightness entity."""
+    hass.states.async_set("sun.sun", "above_horizon", {"elevation": 35.5, "azimuth": 180.25})
+    hass.states.async_set("sensor.brightness", "42000")
+    return hass
+
+
+class TestParseFloatState:
+    """Test the parsing of input values."""
+
+    def test_attribute_or_state(self):
+        """The attribute is used if it exists, otherwise the state."""
+        state = State("sun.sun", "above_horizon", {"elevation": 35.5})
+
+        assert parse_float_state(state, "elevation") == 35.5
+        assert parse_float_state(State("input_number.elevation", "12.5"), "elevation") == 12.5
+
+    @pytest.mark.parametrize("value", ["unavailable", "unknown", "above_horizon"])
+    def test_invalid_state(self, value):
+        """Entities without a numeric value lead to None."""
+        assert parse_float_state(State("sensor.brightness", value)) is None
+
+    def test_missing_entity(self):
+        """Missing entities lead to None."""
+        assert parse_float_state(None) is None
+
+
+class TestInputHub:
+    """Test tracking the shared input entities."""
+
+    def test_single_subscription_per_entity(self, hass):
+        """All instances share one subscription per entity, which is removed with the last instance."""
+        hub = SCInputHub(hass)
+        unsub_entity = MagicMock()
+
+        with patch("custom_components.shadow_control.input_hub.async_track_state_change_event", return_value=unsub_entity) as track:
+            unsubscribe_first = hub.async_subscribe("sun.sun", MagicMock())
+            unsubscribe_second = hub.async_subscribe("sun.sun", MagicMock())
+            hub.async_subscribe("sensor.brightness", MagicMock())
+
+            assert track.call_count == 2
+            assert hub.tracked_entities == 2
+
+            unsubscribe_first()
+            unsubscribe_first()
+            unsub_entity.assert_not_called()
+
+            unsubscribe_second()
+
+        unsub_entity.assert_called_once()
+        assert hub.tracked_entities == 1
+
+    def test_fan_out(self, hass):
+        """A state change is handed over to all instances using the entity."""
+        hub = SCInputHub(hass)
+        listeners = [MagicMock(), MagicMock()]
+        other_listener = MagicMock()
+        event = MagicMock(data={"entity_id": "sun.sun"})
+
+        with patch("custom_components.shadow_control.input_hub.async_track_state_change_event"):
+            for listener in listeners:
+                hub.async_subscribe("sun.sun", listener)
+            hub.async_subscribe("sensor.brightness", other_listener)
+        hub._async_state_changed(event)
+
+        for listener in listeners:
+            listener.assert_called_once_with(event)
+        other_listener.assert_not_called()
+
+    async def test_values_parsed_once_per_state_update(self, hass):
+        """Values are parsed once per state update by the shared state cache."""
+        hub = SCInputHub(hass)
+        state_cache = async_get_state_cache(hass)
+
+        assert hub.value("sun.sun", "elevation") == 35.5
+        assert hub.value("sun.sun", "azimuth") == 180.25
+        assert hub.value("sun.sun", "elevation") == 35.5
+        assert (state_cache.hits, state_cache.misses) == (1, 2)
+
+        hass.states.async_set("sun.sun", "above_horizon", {"elevation": 36.0, "azimuth": 181.0})
+
+        assert hub.value("sun.sun", "elevation") == 36.0
+        assert state_cache.misses == 3
+
+    def test_invalid_values(self, hass):
+        """Entities without a numeric value lead to None."""
+        hass.states.async_set("sensor.dark", "dark")
+        hub = SCInputHub(hass)
+
+        assert hub.value("sensor.dark") is None
+        assert hub.value("sensor.missing") is None
+
+    def test_shared_hub(self, hass):
+        """All instances get the same hub."""
+        hub = async_get_input_hub(hass)
+
+        assert async_get_input_hub(hass) is hub
+        assert hass.data[DOMAIN_DATA_INPUT_HUB] is hub
@@ -0,0 +1,85 @@
+"""Tests for the cached internal entity_id index of the manager."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.const import DOMAIN, SCInternal
+
+
+@pytest.fixture
+def manager(hass: HomeAssistant):
+    """Bind the index handling to a mock manager using the real entity registry."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.hass = hass
+    instance.logger = MagicMock()
+    instance._entry_id = "test_entry_id"
+    instance._internal_unique_id_prefix = "test_entry_id_"
+    instance._internal_entity_ids = {}
+
+    instance.get_internal_entity_id = ShadowControlManager.get_internal_entity_id.__get__(instance)
+    instance.build_internal_entity_index = ShadowControlManager.build_internal_entity_index.__get__(instance)
+    instance._is_internal_entity_registry_event = ShadowControlManager._is_internal_entity_registry_event.__get__(instance)
+    instance._async_entity_registry_updated_listener = ShadowControlManager._async_entity_registry_updated_listener.__get__(instance)
+    return instance
+
+
+def _register(hass: HomeAssistant, internal_enum: SCInternal, entry_id: str = "test_entry_id") -> str:
+    registry = er.async_get(hass)
+    return registry.async_get_or_create(internal_enum.domain, DOMAIN, f"{entry_id}_{internal_enum.value}").entity_id
+
+
+class TestInternalEntityIndex:
+    """Test the SCInternal -> entity_id index."""
+
+    async def test_build_index_resolves_registered_entities(self, hass, manager):
+        """All registered internal entities are indexed, missing ones are not."""
+        lock_entity_id = _register(hass, SCInternal.LOCK_INTEGRATION_MANUAL)
+        height_entity_id = _register(hass, SCInternal.LOCK_HEIGHT_MANUAL)
+
+        manager.build_internal_entity_index()
+
+        assert manager._internal_entity_ids == {
+            SCInternal.LOCK_INTEGRATION_MANUAL: lock_entity_id,
+            SCInternal.LOCK_HEIGHT_MANUAL: height_entity_id,
+        }
+
+    async def test_lookup_uses_index(self, hass, manager):
+        """A cached entry is returned without asking the registry."""
+        manager._internal_entity_ids[SCInternal.LOCK_INTEGRATION_MANUAL] = "switch.cached"
+
+        assert manager.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL) == "switch.cached"
+
+    async def test_missing_entity_is_not_cached(self, hass, manager):
+        """Entities created after the first lookup are found later on."""
+        assert manager.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL) is None
+        assert SCInternal.LOCK_INTEGRATION_MANUAL not in manager._internal_entity_ids
+
+        entity_id = _register(hass, SCInternal.LOCK_INTEGRATION_MANUAL)
+
+        assert manager.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL) == entity_id
+        assert manager._internal_entity_ids[SCInternal.LOCK_INTEGRATION_MANUAL] == entity_id
+
+    async def test_registry_event_filter(self, hass, manager):
+        """Only updates of own internal entities pass the filter."""
+        own_entity_id = _register(hass, SCInternal.LOCK_INTEGRATION_MANUAL)
+        foreign_entity_id = _register(hass, SCInternal.LOCK_INTEGRATION_MANUAL, entry_id="other_entry")
+        manager.build_internal_entity_index()
+
+        assert manager._is_internal_entity_registry_event({"action": "update", "entity_id": own_entity_id, "changes": {}})
+        assert not manager._is_internal_entity_registry_event({"action": "update", "entity_id": foreign_entity_id, "changes": {}})
+        assert manager._is_internal_entity_registry_event({"action": "remove", "entity_id": own_entity_id})
+
+    async def test_rename_invalidates_index(self, hass, manager):
+        """Renaming an internal entity is picked up on the next lookup."""
+        entity_id = _register(hass, SCInternal.LOCK_INTEGRATION_MANUAL)
+        manager.build_internal_entity_index()
+
+        er.async_get(hass).async_update_entity(entity_id, new_entity_id="switch.renamed_lock")
+        manager._async_entity_registry_updated_listener(MagicMock(data={"action": "update", "entity_id": "switch.renamed_lock"}))
+
+        assert manager._internal_entity_ids == {}
+        assert manager.get_internal_entity_id(SCInternal.LOCK_INTEGRATION_MANUAL) == "switch.renamed_lock"
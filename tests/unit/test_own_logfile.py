@@ -6,6 +6,7 @@ import re
 from pathlib import Path
 
 import pytest
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -14,9 +15,11 @@ from custom_components.shadow_control.const import (
     DEBUG_ENABLED,
     DOMAIN,
     OWN_LOGFILE_ENABLED,
+    OWN_LOGFILE_SHARED_WRITER,
     SC_CONF_NAME,
     TARGET_COVER_ENTITY,
 )
+from custom_components.shadow_control.logfile import DOMAIN_DATA_LOGFILE_WRITERS, get_logfile_writer
 
 _INSTANCE_NAME = "Test Shadow Control"
 _SANITIZED_NAME = "test_shadow_control"
@@ -40,8 +43,14 @@ def entry_with_logfile() -> MockConfigEntry:
 
 
 def _file_handlers(logger_name: str) -> list[logging.handlers.RotatingFileHandler]:
-    """Return all RotatingFileHandlers attached to the named logger."""
-    return [h for h in logging.getLogger(logger_name).handlers if isinstance(h, logging.handlers.RotatingFileHandler)]
+    """Return all RotatingFileHandlers fed by the QueueHandlers attached to the named logger."""
+    return [
+        h
+        for queue_handler in logging.getLogger(logger_name).handlers
+        if isinstance(queue_handler, logging.handlers.QueueHandler)
+        for h in queue_handler.listener.handlers
+        if isinstance(h, logging.handlers.RotatingFileHandler) and any(f.name == logger_name for f in h.filters)
+    ]
 
 
 async def test_handler_added_when_enabled(
@@ -50,7 +59,7 @@ async def test_handler_added_when_enabled(
     mock_sun,
     entry_with_logfile: MockConfigEntry,
 ) -> None:
-    """A RotatingFileHandler is attached to the instance logger when the option is enabled."""
+    """A QueueHandler feeding a RotatingFileHandler is attached to the instance logger when the option is enabled."""
     entry_with_logfile.add_to_hass(hass)
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
     await hass.async_block_till_done()
@@ -59,6 +68,8 @@ async def test_handler_added_when_enabled(
     await hass.async_block_till_done()
 
     assert len(_file_handlers(_LOGGER_NAME)) == 1
+    # Nothing is written from within the event loop
+    assert not any(isinstance(h, logging.handlers.RotatingFileHandler) for h in logging.getLogger(_LOGGER_NAME).handlers)
 
     await hass.config_entries.async_unload(entry_with_logfile.entry_id)
     await hass.async_block_till_done()
@@ -114,7 +125,7 @@ async def test_handler_closed_on_unload(
     mock_sun,
     entry_with_logfile: MockConfigEntry,
 ) -> None:
-    """The RotatingFileHandler is closed and removed from the logger on unload."""
+    """The RotatingFileHandler is closed, the QueueHandler removed and the writer stopped on unload."""
     entry_with_logfile.add_to_hass(hass)
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
     await hass.async_block_till_done()
@@ -124,10 +135,14 @@ async def test_handler_closed_on_unload(
 
     assert len(_file_handlers(_LOGGER_NAME)) == 1
 
+    file_handler = _file_handlers(_LOGGER_NAME)[0]
+
     assert await hass.config_entries.async_unload(entry_with_logfile.entry_id)
     await hass.async_block_till_done()
 
     assert len(_file_handlers(_LOGGER_NAME)) == 0
+    assert file_handler.stream is None
+    assert hass.data[DOMAIN_DATA_LOGFILE_WRITERS] == {}
 
 
 async def test_no_duplicate_handlers_on_reload(
@@ -153,9 +168,9 @@ async def test_no_duplicate_handlers_on_reload(
     await hass.async_block_till_done()
 
 
-def _read_logfile(handler: logging.handlers.RotatingFileHandler) -> str:
-    """Flush and read the full content of the handler's log file."""
-    handler.flush()
+def _read_logfile(hass: HomeAssistant, handler: logging.handlers.RotatingFileHandler, logger_name: str = _LOGGER_NAME) -> str:
+    """Wait until the writer wrote all queued records and read the full content of the handler's log file."""
+    get_logfile_writer(hass, logging.getLogger(logger_name)).flush()
     return Path(handler.baseFilename).read_text(encoding="utf-8")
 
 
@@ -176,7 +191,7 @@ async def test_message_written_to_file(
     sentinel = "logfile-content-test-sentinel-42"
     logging.getLogger(_LOGGER_NAME).info(sentinel)
 
-    content = _read_logfile(_file_handlers(_LOGGER_NAME)[0])
+    content = _read_logfile(hass, _file_handlers(_LOGGER_NAME)[0])
 
     assert sentinel in content
 
@@ -201,7 +216,7 @@ async def test_logfile_format(
     sentinel = "format-check-sentinel"
     logging.getLogger(_LOGGER_NAME).info(sentinel)
 
-    content = _read_logfile(_file_handlers(_LOGGER_NAME)[0])
+    content = _read_logfile(hass, _file_handlers(_LOGGER_NAME)[0])
 
     # Find the sentinel line and validate every field.
     sentinel_line = next(line for line in content.splitlines() if sentinel in line)
@@ -241,7 +256,7 @@ async def test_debug_messages_excluded_at_info_level(
     logger.debug(debug_sentinel)
     logger.info(info_sentinel)
 
-    content = _read_logfile(_file_handlers(_LOGGER_NAME)[0])
+    content = _read_logfile(hass, _file_handlers(_LOGGER_NAME)[0])
 
     assert info_sentinel in content
     assert debug_sentinel not in content
@@ -278,7 +293,7 @@ async def test_debug_messages_appear_when_debug_enabled(
     debug_sentinel = "debug-should-appear-in-file"
     logging.getLogger(_LOGGER_NAME).debug(debug_sentinel)
 
-    content = _read_logfile(_file_handlers(_LOGGER_NAME)[0])
+    content = _read_logfile(hass, _file_handlers(_LOGGER_NAME)[0])
 
     assert debug_sentinel in content
     assert "DEBUG   " in content
@@ -308,3 +323,57 @@ async def test_rotation_config(
 
     await hass.config_entries.async_unload(entry_with_logfile.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_shared_writer(
+    hass: HomeAssistant,
+    mock_cover,
+    mock_sun,
+) -> None:
+    """Instances with the shared writer option use one writer, each one writing its own logfile."""
+    entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            data={SC_CONF_NAME: name},
+            options={
+                TARGET_COVER_ENTITY: ["cover.test_cover"],
+                OWN_LOGFILE_ENABLED: True,
+                OWN_LOGFILE_SHARED_WRITER: True,
+            },
+            entry_id=f"logfile_shared_{index}",
+            title=name,
+            version=5,
+        )
+        for index, name in enumerate(("Shared One", "Shared Two"))
+    ]
+    for entry in entries:
+        entry.add_to_hass(hass)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    # Sets up all entries of the domain
+    assert await hass.config_entries.async_setup(entries[0].entry_id)
+    await hass.async_block_till_done()
+    assert all(entry.state is ConfigEntryState.LOADED for entry in entries)
+
+    logger_one = logging.getLogger(f"{DOMAIN}.shared_one")
+    logger_two = logging.getLogger(f"{DOMAIN}.shared_two")
+    writer = get_logfile_writer(hass, logger_one)
+    assert writer is get_logfile_writer(hass, logger_two)
+    assert writer.instance_count == 2
+
+    logger_one.info("sentinel-one")
+    logger_two.info("sentinel-two")
+    content_one = _read_logfile(hass, writer.file_handler(logger_one), logger_one.name)
+    content_two = _read_logfile(hass, writer.file_handler(logger_two), logger_two.name)
+    assert "sentinel-one" in content_one
+    assert "sentinel-two" not in content_one
+    assert "sentinel-two" in content_two
+
+    await hass.config_entries.async_unload(entries[0].entry_id)
+    await hass.async_block_till_done()
+    assert writer.instance_count == 1
+
+    await hass.config_entries.async_unload(entries[1].entry_id)
+    await hass.async_block_till_done()
+    assert hass.data[DOMAIN_DATA_LOGFILE_WRITERS] == {}
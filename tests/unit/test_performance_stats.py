@@ -0,0 +1,110 @@
+"""Tests for the performance diagnostics."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from custom_components.shadow_control.const import DOMAIN_DATA_MANAGERS, SCTriggerSource, ShutterState
+from custom_components.shadow_control.diagnostics import async_get_config_entry_diagnostics
+from custom_components.shadow_control.performance import SCPerformanceStats
+
+
+class TestPerformanceStats:
+    """Test the performance counters of an instance."""
+
+    def test_empty(self):
+        """Without any calculation there are no durations."""
+        stats = SCPerformanceStats()
+
+        result = stats.as_dict()
+
+        assert result["recalculations"] == 0
+        assert result["triggers"] == dict.fromkeys((source.value for source in SCTriggerSource), 0)
+        assert result["calculation_duration_ms"] == {"samples": 0, "p50": None, "p95": None, "max": None}
+        assert result["calculation_triggers"] == 0
+        assert result["collapsed_triggers"] == 0
+        assert result["suppressed_recalculations"] == 0
+
+    def test_percentiles(self):
+        """Percentiles use the nearest rank of the recorded durations."""
+        stats = SCPerformanceStats()
+        for duration_ms in range(1, 101):
+            stats.record_calculation(duration_ms / 1000)
+
+        result = stats.as_dict()["calculation_duration_ms"]
+
+        assert result == {"samples": 100, "p50": 50.0, "p95": 95.0, "max": 100.0}
+
+    def test_ring_buffer_is_bounded(self):
+        """Only the latest durations are kept, the counter covers all calculations."""
+        stats = SCPerformanceStats(sample_size=10)
+        for duration_ms in range(1, 101):
+            stats.record_calculation(duration_ms / 1000)
+
+        assert stats.recalculations == 100
+        assert stats.as_dict()["calculation_duration_ms"] == {"samples": 10, "p50": 95.0, "p95": 100.0, "max": 100.0}
+
+    def test_counters(self):
+        """Triggers are counted per source, service calls and transitions in total."""
+        stats = SCPerformanceStats()
+        stats.record_trigger(SCTriggerSource.LISTENER)
+        stats.record_trigger(SCTriggerSource.LISTENER)
+        stats.record_trigger(SCTriggerSource.TIMER)
+        stats.record_cover_service_call()
+        stats.record_state_transition()
+
+        result = stats.as_dict()
+
+        assert result["triggers"]["listener"] == 2
+        assert result["triggers"]["timer"] == 1
+        assert result["calculation_triggers"] == 3
+        assert result["cover_service_calls"] == 1
+        assert result["state_transitions"] == 1
+
+    def test_cover_dispatch(self):
+        """The latest and the max dispatch duration are kept, failed cover commands are counted."""
+        stats = SCPerformanceStats()
+        assert stats.as_dict()["cover_dispatch_ms"] == {"last": None, "max": None}
+
+        stats.record_cover_dispatch(0.004, 0)
+        stats.record_cover_dispatch(0.002, 1)
+
+        result = stats.as_dict()
+        assert result["cover_dispatch_ms"] == {"last": 2.0, "max": 4.0}
+        assert result["cover_command_failures"] == 1
+
+    def test_transition_trace(self):
+        """The latest trace and the max number of transitions per cycle are kept."""
+        stats = SCPerformanceStats()
+        stats.record_transition_trace(
+            ((ShutterState.NEUTRAL, ShutterState.SHADOW_NEUTRAL), (ShutterState.SHADOW_NEUTRAL, ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING))
+        )
+        stats.record_transition_trace(((ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING, ShutterState.SHADOW_FULL_CLOSED),))
+
+        result = stats.as_dict()
+
+        assert result["max_transitions_per_cycle"] == 2
+        assert result["last_transition_trace"] == "SHADOW_NEUTRAL_TIMER_RUNNING > SHADOW_FULL_CLOSED"
+
+
+async def test_config_entry_diagnostics():
+    """The diagnostics contain the performance counters of the instance."""
+    stats = SCPerformanceStats()
+    stats.record_trigger(SCTriggerSource.ENTITY_NOTIFY)
+    manager = MagicMock(performance_stats=stats)
+    manager.name = "Test"
+    manager.adaptive_brightness_calculator = None
+    manager.cover_output.as_dict.return_value = {"min_interval": 0.0}
+    manager.async_get_sun_path_table = AsyncMock(return_value=MagicMock(as_dict=MagicMock(return_value={"samples": 1440})))
+    hass = MagicMock(data={DOMAIN_DATA_MANAGERS: {"entry_1": manager}})
+
+    result = await async_get_config_entry_diagnostics(hass, MagicMock(entry_id="entry_1"))
+
+    assert result["name"] == "Test"
+    assert result["performance"]["triggers"]["entity_notify"] == 1
+    assert result["sun_path"] == {"samples": 1440}
+    assert result["cover_output"] == {"min_interval": 0.0}
+    assert result["adaptive_brightness"] is None
+    assert result["state_cache"] is None
+    assert result["geometry_cache"] is None
+    assert result["recalculation_passes"] is None
+    assert result["command_scheduler"] is None
+    assert await async_get_config_entry_diagnostics(hass, MagicMock(entry_id="unknown")) == {}
@@ -1,28 +1,33 @@
 """Tests for _position_shutter method."""
 
+import asyncio
 from datetime import timedelta
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.cover import CoverEntityFeature
 from homeassistant.util import dt as dt_util
 
 from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.command_scheduler import SCCommandScheduler
 from custom_components.shadow_control.const import (
     LockState,
+    SCCommandPriority,
     ShutterType,
 )
+from custom_components.shadow_control.cover_output import SCCoverOutput
 
 
 class TestPositionShutter:
     """Test _position_shutter method."""
 
     @pytest.fixture
-    def manager(self):
+    async def manager(self):
         """Create a mock ShadowControlManager instance."""
         instance = MagicMock(spec=ShadowControlManager)
         instance.logger = MagicMock()
         instance.hass = MagicMock()
+        instance.hass.loop = asyncio.get_running_loop()
         instance.name = "Test Manager"
         instance._config = MagicMock()
         instance._dynamic_config = MagicMock()
@@ -86,8 +91,36 @@ class TestPositionShutter:
 
         instance.hass.services.async_call = AsyncMock(side_effect=mock_async_call)
 
+        # The output stage and the command scheduler send in the background, the tasks are awaited like by the real hass
+        dispatch_tasks: list[asyncio.Task] = []
+
+        def create_task(target, name=None, eager_start=True):
+            task = asyncio.get_running_loop().create_task(target, name=name)
+            dispatch_tasks.append(task)
+            return task
+
+        instance.hass.async_create_task = MagicMock(side_effect=create_task)
+
+        async def block_till_done():
+            while dispatch_tasks:
+                await dispatch_tasks.pop(0)
+
+        instance.hass.async_block_till_done = block_till_done
+        position_shutter = ShadowControlManager._position_shutter.__get__(instance)
+
+        async def position_shutter_and_send(*args, **kwargs):
+            await position_shutter(*args, **kwargs)
+            await block_till_done()
+
         # Bind real method
-        instance._position_shutter = ShadowControlManager._position_shutter.__get__(instance)
+        instance._position_shutter = position_shutter_and_send
+        instance._get_target_cover_states = ShadowControlManager._get_target_cover_states.__get__(instance)
+        instance._async_send_cover_command = ShadowControlManager._async_send_cover_command.__get__(instance)
+        instance._async_call_cover_service = ShadowControlManager._async_call_cover_service.__get__(instance)
+        instance._async_dispatch_cover_commands = ShadowControlManager._async_dispatch_cover_commands.__get__(instance)
+        # Without limit, min interval and in flight duration, each command is sent at once
+        instance._command_scheduler = SCCommandScheduler(instance.hass)
+        instance._cover_output = SCCoverOutput(instance.hass, instance._async_dispatch_cover_commands, 0, 0)
 
         return instance
 
@@ -637,3 +670,164 @@ class TestPositionShutter:
 
         # Verify flag was reset
         assert manager._enforce_position_update is False
+
+    # ========================================================================
+    # TEST 18: Mehrere Behänge - ein Service-Aufruf je Ziel
+    # ========================================================================
+
+    async def test_multiple_covers_single_call_per_target(self, manager):
+        """Test that all covers are moved with one service call per target."""
+        manager._target_cover_entity_id = ["cover.one", "cover.two", "cover.three"]
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        calls = manager.hass.services.async_call.call_args_list
+        assert [c.args[1] for c in calls] == ["set_cover_position", "set_cover_tilt_position"]
+        assert calls[0].args[2] == {"entity_id": ["cover.one", "cover.two", "cover.three"], "position": 20.0}
+        assert calls[1].args[2] == {"entity_id": ["cover.one", "cover.two", "cover.three"], "tilt_position": 55.0}
+        # One state lookup per cover
+        assert manager.hass.states.get.call_count == 3
+
+    async def test_multiple_covers_grouped_by_features(self, manager):
+        """Test that covers without tilt support only get the position command."""
+        manager._target_cover_entity_id = ["cover.venetian", "cover.roller", "cover.missing"]
+        features = {
+            "cover.venetian": CoverEntityFeature.SET_POSITION | CoverEntityFeature.SET_TILT_POSITION,
+            "cover.roller": CoverEntityFeature.SET_POSITION,
+        }
+        manager.hass.states.get = MagicMock(
+            side_effect=lambda entity_id: MagicMock(attributes={"supported_features": features[entity_id]}) if entity_id in features else None
+        )
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        calls = manager.hass.services.async_call.call_args_list
+        assert calls[0].args[2] == {"entity_id": ["cover.venetian", "cover.roller"], "position": 20.0}
+        assert calls[1].args[2] == {"entity_id": "cover.venetian", "tilt_position": 55.0}
+        manager.logger.warning.assert_called_once()
+
+    async def test_locked_with_forced_position_multiple_covers(self, manager):
+        """Test that the forced position is sent to all covers with one call per target."""
+        manager.current_lock_state = LockState.LOCKED_MANUALLY_WITH_FORCED_POSITION
+        manager._target_cover_entity_id = ["cover.one", "cover.two"]
+        manager._dynamic_config.lock_height = 30.0
+        manager._dynamic_config.lock_angle = 20.0
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        calls = manager.hass.services.async_call.call_args_list
+        assert len(calls) == 2
+        assert calls[0].args[2] == {"entity_id": ["cover.one", "cover.two"], "position": 70.0}
+        assert calls[1].args[2] == {"entity_id": ["cover.one", "cover.two"], "tilt_position": 80.0}
+
+    # ========================================================================
+    # TEST 19: Ausgangsstufe - keine doppelten Befehle
+    # ========================================================================
+
+    async def test_repeated_forced_position_sent_once(self, manager):
+        """Test that the forced position isn't sent again while the covers move there, unless enforced."""
+        manager._cover_output = SCCoverOutput(manager.hass, manager._async_dispatch_cover_commands, 0, 30.0)
+        manager.current_lock_state = LockState.LOCKED_MANUALLY_WITH_FORCED_POSITION
+        manager._dynamic_config.lock_height = 30.0
+        manager._dynamic_config.lock_angle = 20.0
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        assert manager.hass.services.async_call.call_count == 2
+        assert manager._cover_output.dropped_targets == 2
+
+    async def test_enforce_sends_target_in_flight(self, manager):
+        """Test that enforce positioning sends the target, even if the covers already move there."""
+        manager._cover_output = SCCoverOutput(manager.hass, manager._async_dispatch_cover_commands, 0, 30.0)
+        manager._previous_shutter_height = None
+        manager._previous_shutter_angle = None
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        manager._enforce_position_update = True
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        assert manager.hass.services.async_call.call_count == 4
+
+    # ========================================================================
+    # TEST 20: Befehlsplaner - Zwangsposition zuerst
+    # ========================================================================
+
+    async def test_forced_position_uses_forced_lane(self, manager):
+        """Test that the forced position is scheduled ahead of sun tracking, one token per cover."""
+        manager._command_scheduler.async_submit = MagicMock(wraps=manager._command_scheduler.async_submit)
+        manager.current_lock_state = LockState.LOCKED_MANUALLY_WITH_FORCED_POSITION
+        manager._target_cover_entity_id = ["cover.one", "cover.two"]
+        manager._dynamic_config.lock_height = 30.0
+        manager._dynamic_config.lock_angle = 20.0
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        assert [submit.args[:2] for submit in manager._command_scheduler.async_submit.call_args_list] == [
+            (SCCommandPriority.FORCED, 2),
+            (SCCommandPriority.FORCED, 2),
+        ]
+
+    async def test_sun_tracking_uses_regular_lane(self, manager):
+        """Test that regular positioning is scheduled in the regular lane."""
+        manager._command_scheduler.async_submit = MagicMock(wraps=manager._command_scheduler.async_submit)
+
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+
+        assert [submit.args[:2] for submit in manager._command_scheduler.async_submit.call_args_list] == [
+            (SCCommandPriority.REGULAR, 1),
+            (SCCommandPriority.REGULAR, 1),
+        ]
+
+    # ========================================================================
+    # TEST 21: Senden im Hintergrund
+    # ========================================================================
+
+    async def test_positioning_reference_set_before_sending(self, manager):
+        """Test that the positioning doesn't wait for the cover services and the reference is set before the covers move."""
+        references = []
+        service_called = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_async_call(domain, service, service_data, blocking=False):
+            references.append((manager._last_positioning_time, manager._last_calculated_height))
+            service_called.set()
+            await release.wait()
+
+        manager.hass.services.async_call = AsyncMock(side_effect=slow_async_call)
+
+        await ShadowControlManager._position_shutter(manager, 80.0, 45.0, stop_timer=False)
+        await service_called.wait()
+
+        assert manager._last_positioning_time is not None
+        assert references == [(manager._last_positioning_time, 80.0)]
+
+        # Unchanged target, only the pending commands of the first positioning are sent
+        release.set()
+        await manager._position_shutter(80.0, 45.0, stop_timer=False)
+        assert manager.hass.services.async_call.call_count == 2
+
+    async def test_positioning_reference_stamped_when_sent(self, manager):
+        """Test that a target delayed by the min interval restarts the movement window, when it is sent."""
+        submitted = dt_util.utcnow()
+        sent = submitted + timedelta(seconds=2)
+        clock = MagicMock()
+        clock.monotonic.return_value = 100.0
+        with (
+            patch("custom_components.shadow_control.cover_output.time", clock),
+            patch("custom_components.shadow_control.cover_output.async_call_later") as call_later,
+            patch("custom_components.shadow_control.dt_util.utcnow", return_value=submitted),
+        ):
+            manager._cover_output = SCCoverOutput(manager.hass, manager._async_dispatch_cover_commands, 2.0, 30.0)
+            await manager._position_shutter(80.0, 45.0, stop_timer=False)
+            await manager._position_shutter(60.0, 45.0, stop_timer=False)
+            assert manager.hass.services.async_call.call_count == 2
+
+            clock.monotonic.return_value = 102.0
+            dt_util.utcnow.return_value = sent
+            call_later.call_args.args[2](None)
+            await manager.hass.async_block_till_done()
+
+        # The unchanged tilt is still in flight, only the new position is sent
+        assert manager.hass.services.async_call.call_count == 3
+        assert manager._last_positioning_time == sent
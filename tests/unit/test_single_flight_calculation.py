@@ -0,0 +1,88 @@
+"""Tests for the single-flight execution of the position calculation."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import Event
+
+from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.const import SCTriggerSource
+from custom_components.shadow_control.performance import SCPerformanceStats
+
+
+def _event(entity_id: str, new: str) -> Event:
+    return Event("state_changed", {"entity_id": entity_id, "old_state": MagicMock(state="old"), "new_state": MagicMock(state=new)})
+
+
+@pytest.fixture
+def manager():
+    """Bind the single-flight wrapper to a mock manager with a blockable calculation cycle."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.logger = MagicMock()
+    instance._calculation_task = None
+    instance._calculation_follow_up = None
+    instance._pending_calculation_triggers = {}
+    instance.performance_stats = SCPerformanceStats()
+
+    instance.cycles = []
+    instance.release = asyncio.Event()
+
+    async def cycle(triggers):
+        instance.cycles.append(triggers)
+        if len(instance.cycles) == 1:
+            await instance.release.wait()
+
+    instance._async_calculation_cycle = cycle
+    instance._async_timed_calculation_cycle = ShadowControlManager._async_timed_calculation_cycle.__get__(instance)
+    instance.async_calculate_and_apply_cover_position = ShadowControlManager.async_calculate_and_apply_cover_position.__get__(instance)
+    instance.async_calculate_for_events = ShadowControlManager.async_calculate_for_events.__get__(instance)
+    return instance
+
+
+class TestSingleFlightCalculation:
+    """Test collapsing of triggers during a running calculation."""
+
+    async def test_triggers_are_collapsed_into_one_follow_up(self, manager):
+        """All triggers arriving during a calculation lead to exactly one follow-up calculation."""
+        first = asyncio.create_task(manager.async_calculate_and_apply_cover_position(None))
+        await asyncio.sleep(0)
+
+        brightness_1 = _event("sensor.brightness", "1000")
+        brightness_2 = _event("sensor.brightness", "2000")
+        lock = _event("switch.lock", "on")
+        waiters = [
+            asyncio.create_task(manager.async_calculate_and_apply_cover_position(trigger)) for trigger in (brightness_1, lock, None, brightness_2)
+        ]
+        await asyncio.sleep(0)
+        assert not any(waiter.done() for waiter in waiters)
+
+        manager.release.set()
+        await asyncio.gather(first, *waiters)
+
+        assert len(manager.cycles) == 2
+        # Latest trigger per entity, the lock change is kept
+        assert manager.cycles[1] == [lock, None, brightness_2]
+        assert manager.performance_stats.collapsed_triggers == 4
+        assert manager.performance_stats.calculation_triggers == 5
+        assert manager._calculation_task is None
+        assert manager._calculation_follow_up is None
+        assert manager.performance_stats.recalculations == 2
+        assert manager.performance_stats.triggers[SCTriggerSource.OTHER] == 5
+
+    async def test_nested_trigger_runs_inline(self, manager):
+        """A trigger from within the running calculation (e.g. enforce positioning) is not collapsed."""
+        manager.release.set()
+        nested_event = _event("input_boolean.enforce", "on")
+
+        async def cycle(triggers):
+            manager.cycles.append(triggers)
+            if len(manager.cycles) == 1:
+                await manager.async_calculate_and_apply_cover_position(nested_event)
+
+        manager._async_calculation_cycle = cycle
+
+        await manager.async_calculate_and_apply_cover_position(None)
+
+        assert manager.cycles == [[None], [nested_event]]
+        assert manager.performance_stats.collapsed_triggers == 0
@@ -0,0 +1,107 @@
+"""Tests for the built-in solar position."""
+
+import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from astral import LocationInfo
+from astral.location import Location
+
+from custom_components.shadow_control.solar import (
+    DOMAIN_DATA_SOLAR_ENGINE,
+    SIGNAL_SOLAR_POSITION_UPDATED,
+    SCSolarEngine,
+    async_get_solar_engine,
+    calculate_solar_position,
+)
+
+
+@pytest.fixture
+def hass(hass):
+    """Home Assistant with a location in Germany."""
+    hass.config.latitude = 50.0
+    hass.config.longitude = 8.0
+    return hass
+
+
+class TestCalculateSolarPosition:
+    """Test the NOAA sun position."""
+
+    @pytest.mark.parametrize(
+        ("latitude", "longitude", "when"),
+        [
+            (50.0, 8.0, datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)),
+            (50.0, 8.0, datetime.datetime(2025, 12, 21, 7, 45, tzinfo=datetime.UTC)),
+            (-33.9, 151.2, datetime.datetime(2025, 3, 20, 23, 10, tzinfo=datetime.UTC)),
+            (64.1, -21.9, datetime.datetime(2025, 9, 1, 18, 0, tzinfo=datetime.UTC)),
+        ],
+    )
+    def test_matches_astral(self, latitude, longitude, when):
+        """Azimuth and elevation equal the values of astral, which is used by Home Assistant."""
+        location = Location(LocationInfo("Test", "Test", "UTC", latitude, longitude))
+
+        azimuth, elevation = calculate_solar_position(latitude, longitude, when)
+
+        assert azimuth == pytest.approx(location.solar_azimuth(when), abs=0.01)
+        assert elevation == pytest.approx(location.solar_elevation(when), abs=0.01)
+
+    def test_local_time(self):
+        """Points in time with another time zone lead to the same position."""
+        when = datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+
+        assert calculate_solar_position(50.0, 8.0, when) == calculate_solar_position(
+            50.0, 8.0, when.astimezone(datetime.timezone(datetime.timedelta(hours=2)))
+        )
+
+
+class TestSolarEngine:
+    """Test the solar engine shared by all instances."""
+
+    def test_position_is_cached_per_minute(self, hass):
+        """All points in time within a minute get the position of the start of the minute."""
+        engine = SCSolarEngine(hass)
+
+        with patch("custom_components.shadow_control.solar.calculate_solar_position", wraps=calculate_solar_position) as calculate:
+            first = engine.position(datetime.datetime(2025, 6, 21, 11, 30, 5, tzinfo=datetime.UTC))
+            second = engine.position(datetime.datetime(2025, 6, 21, 11, 30, 55, tzinfo=datetime.UTC))
+            third = engine.position(datetime.datetime(2025, 6, 21, 11, 31, 0, tzinfo=datetime.UTC))
+
+        assert first is second
+        assert first.time == datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+        assert third.time == datetime.datetime(2025, 6, 21, 11, 31, tzinfo=datetime.UTC)
+        assert calculate.call_count == 2
+
+    def test_single_tick_for_all_subscribers(self, hass):
+        """The minute tick is started with the first and stopped with the last subscriber."""
+        engine = SCSolarEngine(hass)
+        unsub_tick = MagicMock()
+
+        with patch("custom_components.shadow_control.solar.async_track_time_change", return_value=unsub_tick) as track:
+            unsubscribe_first = engine.async_subscribe()
+            unsubscribe_second = engine.async_subscribe()
+            unsubscribe_first()
+            unsubscribe_first()
+
+            assert track.call_count == 1
+            unsub_tick.assert_not_called()
+
+            unsubscribe_second()
+
+        unsub_tick.assert_called_once()
+
+    def test_tick_sends_position(self, hass):
+        """Each tick sends the position of the new minute to the instances."""
+        engine = SCSolarEngine(hass)
+        now = datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+
+        with patch("custom_components.shadow_control.solar.async_dispatcher_send") as send:
+            engine._async_tick(now)
+
+        send.assert_called_once_with(hass, SIGNAL_SOLAR_POSITION_UPDATED, engine.position(now))
+
+    def test_shared_engine(self, hass):
+        """All instances get the same engine."""
+        engine = async_get_solar_engine(hass)
+
+        assert async_get_solar_engine(hass) is engine
+        assert hass.data[DOMAIN_DATA_SOLAR_ENGINE] is engine
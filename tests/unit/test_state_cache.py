@@ -0,0 +1,98 @@
+"""Tests for the cache of parsed entity states."""
+
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.shadow_control.state_cache import DOMAIN_DATA_STATE_CACHE, SCParsedStateCache, async_get_state_cache
+
+UPDATED = datetime.datetime(2025, 6, 21, 12, 0, tzinfo=datetime.UTC)
+
+
+def _state(entity_id: str, value: str, attributes: dict | None = None, last_updated: datetime.datetime = UPDATED) -> State:
+    """Return a state with a fixed point in time of the last update."""
+    return State(entity_id, value, attributes, last_updated=last_updated)
+
+
+class TestParsedStateCache:
+    """Test the conversion and caching of entity states."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected_type", "expected"),
+        [
+            ("12.7", float, 12.7),
+            ("12.7", int, 12),
+            ("on", bool, True),
+            ("off", bool, False),
+            ("mode1", str, "mode1"),
+        ],
+    )
+    def test_conversion(self, value, expected_type, expected):
+        """States are converted like before the cache."""
+        cache = SCParsedStateCache()
+
+        assert cache.get(_state("sensor.test", value), None, expected_type) == expected
+
+    def test_typed_accessors(self):
+        """The typed accessors read the attribute if it exists, otherwise the state."""
+        cache = SCParsedStateCache()
+        state = _state("sun.sun", "above_horizon", {"elevation": 35.5})
+
+        assert cache.get_float(state, "elevation") == 35.5
+        assert cache.get_int(_state("input_number.height", "80.0")) == 80
+        assert cache.get_bool(_state("switch.lock", "on")) is True
+
+    def test_hit_until_state_update(self):
+        """The value is parsed once per state update, also for other types."""
+        cache = SCParsedStateCache()
+
+        cache.get_float(_state("sensor.brightness", "42000"))
+        cache.get_float(_state("sensor.brightness", "42000"))
+        cache.get_int(_state("sensor.brightness", "42000"))
+        assert cache.get_float(_state("sensor.brightness", "43000", last_updated=UPDATED + datetime.timedelta(seconds=1))) == 43000.0
+
+        assert cache.hits == 1
+        assert cache.misses == 3
+
+    def test_update_at_same_point_in_time(self):
+        """An update within the same point in time is parsed again."""
+        cache = SCParsedStateCache()
+
+        assert cache.get_bool(_state("switch.dawn_control", "off")) is False
+        assert cache.get_bool(_state("switch.dawn_control", "on")) is True
+
+        assert cache.hits == 0
+
+    def test_conversion_errors_not_cached(self):
+        """Invalid values raise on each read, so the caller can handle them."""
+        cache = SCParsedStateCache()
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="could not convert string to float"):
+                cache.get_float(_state("sensor.brightness", "dark"))
+        assert len(cache) == 0
+
+    def test_bounded(self):
+        """The least recently used values are removed if the cache is full."""
+        cache = SCParsedStateCache(max_size=2)
+        first = _state("sensor.first", "1")
+        cache.get_float(first)
+        cache.get_float(_state("sensor.second", "2"))
+        cache.get_float(first)
+
+        cache.get_float(_state("sensor.third", "3"))
+
+        assert len(cache) == 2
+        cache.get_float(first)
+        assert cache.as_dict() == {"size": 2, "max_size": 2, "hits": 2, "misses": 3, "hit_rate": 0.4}
+
+    def test_shared_cache(self):
+        """All instances get the same cache."""
+        hass = MagicMock(data={})
+
+        cache = async_get_state_cache(hass)
+
+        assert async_get_state_cache(hass) is cache
+        assert hass.data[DOMAIN_DATA_STATE_CACHE] is cache
@@ -1,18 +1,18 @@
-"""Test the DAWN_FULL_CLOSE_TIMER_RUNNING state handler."""
+"""Test the DAWN_FULL_CLOSE_TIMER_RUNNING state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_full_close_timer_running = ShadowControlManager._handle_state_dawn_full_close_timer_running.__get__(manager)
+    manager.current_shutter_state = ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -36,13 +36,13 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnFullCloseTimerRunning:
-    """Test branches of the DAWN_FULL_CLOSE_TIMER_RUNNING handler."""
+    """Test the transitions of the DAWN_FULL_CLOSE_TIMER_RUNNING state."""
 
     async def test_brightness_recovers_stops_timer(self, manager):
         """Test that if it gets bright again, the timer stops and we go back to DAWN_NEUTRAL."""
         manager._get_current_dawn_brightness.return_value = 50  # Brightness recovered
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL
         manager._cancel_timer.assert_called_once()
@@ -53,7 +53,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         manager._get_current_dawn_brightness.return_value = 5
         manager._is_timer_finished.return_value = True
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -62,7 +62,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         """Test staying in state while brightness is low but timer hasn't finished."""
         manager._is_timer_finished.return_value = False
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._position_shutter.assert_not_called()
@@ -73,7 +73,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         manager._facade_config.neutral_pos_height = 0.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -83,7 +83,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         manager._is_timer_finished.return_value = True
         manager._dawn_config.shutter_max_height = None
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         assert manager.logger.warning.called
@@ -93,7 +93,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness recovered
         manager._check_dawn_close_time_constraint.return_value = True  # But time constraint active
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         # Timer should keep running, NOT cancelled
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
@@ -105,7 +105,7 @@ class TestHandleStateDawnFullCloseTimerRunning:
         manager._check_dawn_close_time_constraint.return_value = True  # But time constraint active
         manager._is_timer_finished.return_value = True
 
-        result = await manager._handle_state_dawn_full_close_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
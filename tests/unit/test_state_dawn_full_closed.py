@@ -1,18 +1,18 @@
-"""Test the DAWN_FULL_CLOSED state handler."""
+"""Test the DAWN_FULL_CLOSED state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_full_closed = ShadowControlManager._handle_state_dawn_full_closed.__get__(manager)
+    manager.current_shutter_state = ShutterState.DAWN_FULL_CLOSED
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -42,7 +42,7 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnFullClosed:
-    """Test branches of the DAWN_FULL_CLOSED handler."""
+    """Test the transitions of the DAWN_FULL_CLOSED state."""
 
     # =========================================================================
     # Dawn handling active
@@ -52,7 +52,7 @@ class TestHandleStateDawnFullClosed:
         """Test that sufficient brightness starts the opening timer."""
         manager._get_current_dawn_brightness.return_value = 50  # Above threshold 10
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(120)
@@ -62,7 +62,7 @@ class TestHandleStateDawnFullClosed:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._check_dawn_open_time_constraint.return_value = False  # Too early to open
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._start_timer.assert_not_called()
@@ -74,7 +74,7 @@ class TestHandleStateDawnFullClosed:
         manager._check_dawn_open_time_constraint.return_value = True  # open_not_before OK
         manager._check_dawn_close_time_constraint.return_value = True  # close time reached → block
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._start_timer.assert_not_called()
@@ -85,7 +85,7 @@ class TestHandleStateDawnFullClosed:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._check_dawn_open_time_constraint.return_value = True  # Time reached
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(120)
@@ -94,7 +94,7 @@ class TestHandleStateDawnFullClosed:
         """Test that low brightness keeps shutter in dawn closed position."""
         manager._get_current_dawn_brightness.return_value = 5  # Below threshold 10
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -105,7 +105,7 @@ class TestHandleStateDawnFullClosed:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._dawn_config.shutter_look_through_seconds = None
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         # Falls through to dawn-position branch
         assert result == ShutterState.DAWN_FULL_CLOSED
@@ -117,7 +117,7 @@ class TestHandleStateDawnFullClosed:
         manager._get_current_dawn_brightness.return_value = 5  # Below threshold
         manager._dawn_config.shutter_max_height = None
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         assert manager.logger.warning.called
@@ -131,7 +131,7 @@ class TestHandleStateDawnFullClosed:
         """Test fallback to neutral position when dawn is disabled."""
         manager._is_dawn_control_enabled.return_value = False
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -141,7 +141,7 @@ class TestHandleStateDawnFullClosed:
         manager._is_dawn_control_enabled.return_value = False
         manager._facade_config.neutral_pos_height = None
 
-        result = await manager._handle_state_dawn_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         assert manager.logger.warning.called
@@ -1,18 +1,18 @@
-"""Test the DAWN_HORIZONTAL_NEUTRAL state handler."""
+"""Test the DAWN_HORIZONTAL_NEUTRAL state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_horizontal_neutral = ShadowControlManager._handle_state_dawn_horizontal_neutral.__get__(manager)
+    manager.current_shutter_state = ShutterState.DAWN_HORIZONTAL_NEUTRAL
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -37,13 +37,13 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnHorizontalNeutral:
-    """Test branches of the DAWN_HORIZONTAL_NEUTRAL handler."""
+    """Test the transitions of the DAWN_HORIZONTAL_NEUTRAL state."""
 
     async def test_darkness_returns_recloses_shutter(self, manager):
         """Test transitioning to FULL_CLOSED if brightness drops below threshold."""
         manager._get_current_dawn_brightness.return_value = 5  # Below 10
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(100.0, 90.0, stop_timer=False)
@@ -52,20 +52,20 @@ class TestHandleStateDawnHorizontalNeutral:
         """Test starting the timer to open further when brightness is stable."""
         manager._get_current_dawn_brightness.return_value = 50  # Above 10
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(600)
 
     async def test_missing_timer_config_stays_in_state(self, manager):
-        """Test warning and staying in state if look_through_seconds is missing."""
+        """Test staying in state without timer if look_through_seconds is missing."""
         manager._get_current_dawn_brightness.return_value = 50
         manager._dawn_config.shutter_look_through_seconds = None
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL
-        assert manager.logger.warning.called
+        manager._start_timer.assert_not_called()
 
     async def test_dawn_disabled_retreats_to_neutral(self, manager):
         """Test falling back to global NEUTRAL if dawn mode is turned off."""
@@ -73,7 +73,7 @@ class TestHandleStateDawnHorizontalNeutral:
         manager._facade_config.neutral_pos_height = 0.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -85,7 +85,7 @@ class TestHandleStateDawnHorizontalNeutral:
 
         # In your code, if height is None, it bypasses the re-close block
         # and falls through to the timer block.
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once()
@@ -95,7 +95,7 @@ class TestHandleStateDawnHorizontalNeutral:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._check_dawn_close_time_constraint.return_value = True  # But time says close
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(100.0, 90.0, stop_timer=False)
@@ -105,7 +105,7 @@ class TestHandleStateDawnHorizontalNeutral:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._check_dawn_open_time_constraint.return_value = False  # Too early to open
 
-        result = await manager._handle_state_dawn_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL
         manager._start_timer.assert_not_called()
@@ -1,20 +1,18 @@
-"""Test the DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING state handler."""
+"""Test the DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_horizontal_neutral_timer_running = ShadowControlManager._handle_state_dawn_horizontal_neutral_timer_running.__get__(
-        manager
-    )
+    manager.current_shutter_state = ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -37,13 +35,13 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnHorizontalNeutralTimerRunning:
-    """Test branches of the DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING handler."""
+    """Test the transitions of the DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING state."""
 
     async def test_brightness_drops_recloses_fully(self, manager):
         """Test returning to DAWN_FULL_CLOSED if it gets dark again."""
         manager._get_current_dawn_brightness.return_value = 5  # Below 10
 
-        result = await manager._handle_state_dawn_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._cancel_timer.assert_called_once()
@@ -54,7 +52,7 @@ class TestHandleStateDawnHorizontalNeutralTimerRunning:
         manager._get_current_dawn_brightness.return_value = 50  # Bright enough
         manager._is_timer_finished.return_value = True
 
-        result = await manager._handle_state_dawn_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 90.0, stop_timer=False)
@@ -63,7 +61,7 @@ class TestHandleStateDawnHorizontalNeutralTimerRunning:
         """Test staying in state while brightness is OK but timer is running."""
         manager._is_timer_finished.return_value = False
 
-        result = await manager._handle_state_dawn_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         manager._position_shutter.assert_not_called()
@@ -74,7 +72,7 @@ class TestHandleStateDawnHorizontalNeutralTimerRunning:
         manager._facade_config.neutral_pos_height = 0.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_dawn_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -84,7 +82,7 @@ class TestHandleStateDawnHorizontalNeutralTimerRunning:
         manager._is_timer_finished.return_value = True
         manager._dawn_config.shutter_max_height = None
 
-        result = await manager._handle_state_dawn_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         assert manager.logger.warning.called
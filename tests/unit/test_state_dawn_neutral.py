@@ -1,18 +1,18 @@
-"""Test the DAWN_NEUTRAL state handler."""
+"""Test the DAWN_NEUTRAL state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_neutral = ShadowControlManager._handle_state_dawn_neutral.__get__(manager)
+    manager.current_shutter_state = ShutterState.DAWN_NEUTRAL
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -48,7 +48,7 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnNeutral:
-    """Test branches of the DAWN_NEUTRAL handler."""
+    """Test the transitions of the DAWN_NEUTRAL state."""
 
     # =========================================================================
     # Dawn handling active
@@ -58,7 +58,7 @@ class TestHandleStateDawnNeutral:
         """Test that darkness triggers the close timer."""
         manager._get_current_dawn_brightness.return_value = 5  # Below threshold 10
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(30)
@@ -68,7 +68,7 @@ class TestHandleStateDawnNeutral:
         manager._get_current_dawn_brightness.return_value = 50  # Brightness OK
         manager._check_dawn_close_time_constraint.return_value = True  # But time says close
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(30)
@@ -77,7 +77,7 @@ class TestHandleStateDawnNeutral:
         """Test positioning to after-dawn position when no close condition is met."""
         manager._get_current_dawn_brightness.return_value = 50  # Above threshold
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL
         manager._position_shutter.assert_called_once_with(50.0, 45.0, stop_timer=True)
@@ -90,7 +90,7 @@ class TestHandleStateDawnNeutral:
         manager._get_current_brightness.return_value = 60000  # Above shadow threshold
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(60)
@@ -100,7 +100,7 @@ class TestHandleStateDawnNeutral:
         manager._get_current_dawn_brightness.return_value = 50  # Above threshold
         manager._dawn_config.height_after_dawn = None
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL
         assert manager.logger.warning.called
@@ -111,7 +111,7 @@ class TestHandleStateDawnNeutral:
         manager._get_current_dawn_brightness.return_value = 5  # Below threshold
         manager._dawn_config.after_seconds = None
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         # No timer started, falls through to after-dawn position
         assert result == ShutterState.DAWN_NEUTRAL
@@ -124,7 +124,7 @@ class TestHandleStateDawnNeutral:
         manager._check_dawn_close_time_constraint.return_value = True  # Time says close
         manager._dawn_config.after_seconds = None  # But no delay configured
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         # No timer, falls through to after-dawn position
         assert result == ShutterState.DAWN_NEUTRAL
@@ -142,7 +142,7 @@ class TestHandleStateDawnNeutral:
         manager._get_current_brightness.return_value = 60000
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(60)
@@ -151,7 +151,7 @@ class TestHandleStateDawnNeutral:
         """Test fallback to neutral position when dawn is disabled."""
         manager._is_dawn_control_enabled.return_value = False
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -161,7 +161,7 @@ class TestHandleStateDawnNeutral:
         manager._is_dawn_control_enabled.return_value = False
         manager._facade_config.neutral_pos_height = None
 
-        result = await manager._handle_state_dawn_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         assert manager.logger.warning.called
@@ -1,18 +1,18 @@
-"""Test the DAWN_NEUTRAL_TIMER_RUNNING state handler."""
+"""Test the DAWN_NEUTRAL_TIMER_RUNNING state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_dawn_neutral_timer_running = ShadowControlManager._handle_state_dawn_neutral_timer_running.__get__(manager)
+    manager.current_shutter_state = ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
 
     # Dependencies
     manager._is_dawn_control_enabled = AsyncMock(return_value=True)
@@ -33,13 +33,13 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateDawnNeutralTimerRunning:
-    """Test branches of the DAWN_NEUTRAL_TIMER_RUNNING handler."""
+    """Test the transitions of the DAWN_NEUTRAL_TIMER_RUNNING state."""
 
     async def test_brightness_drops_returns_to_closed(self, manager):
         """Test that dropping brightness cancels timer and re-closes."""
         manager._get_current_dawn_brightness.return_value = 5  # Below 10
 
-        result = await manager._handle_state_dawn_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSED
         manager._cancel_timer.assert_called_once()
@@ -52,7 +52,7 @@ class TestHandleStateDawnNeutralTimerRunning:
         manager._dawn_config.shutter_max_height = 100.0
         manager._dawn_config.shutter_look_through_angle = 90.0
 
-        result = await manager._handle_state_dawn_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 90.0, stop_timer=True)
@@ -61,7 +61,7 @@ class TestHandleStateDawnNeutralTimerRunning:
         """Test staying in state while timer is still running."""
         manager._is_timer_finished.return_value = False
 
-        result = await manager._handle_state_dawn_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
         manager._position_shutter.assert_not_called()
@@ -72,7 +72,7 @@ class TestHandleStateDawnNeutralTimerRunning:
         manager._facade_config.neutral_pos_height = 0.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_dawn_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(0.0, 0.0, stop_timer=True)
@@ -82,7 +82,7 @@ class TestHandleStateDawnNeutralTimerRunning:
         manager._is_timer_finished.return_value = True
         manager._dawn_config.shutter_max_height = None
 
-        result = await manager._handle_state_dawn_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_NEUTRAL_TIMER_RUNNING
         assert manager.logger.warning.called
@@ -0,0 +1,100 @@
+"""Tests for the transition table of the state machine."""
+
+from dataclasses import replace
+
+from custom_components.shadow_control.const import ShutterState
+from custom_components.shadow_control.state_machine import (
+    DAWN_STATES,
+    SCCycleSnapshot,
+    SCStateMachine,
+    SCStateTransition,
+    SCTransitionAction,
+    format_transition_trace,
+)
+
+# Not in the sun, shadow and dawn handling disabled, nothing configured
+IDLE = SCCycleSnapshot(
+    in_sun=False,
+    shadow_enabled=False,
+    brightness=None,
+    shadow_threshold=None,
+    dawn_enabled=False,
+    dawn_brightness=None,
+    dawn_threshold=None,
+    dawn_close_time_reached=False,
+    dawn_open_time_reached=True,
+    timer_finished=True,
+    shadow_close_delay=None,
+    shadow_look_through_delay=None,
+    shadow_open_delay=None,
+    dawn_close_delay=None,
+    dawn_look_through_delay=None,
+    shadow_look_through_configured=False,
+    dawn_look_through_configured=False,
+)
+
+
+class TestStateMachine:
+    """Test the compiled transition table."""
+
+    def test_dawn_close_time_transition(self):
+        """Only non-dawn states are forced into DAWN_FULL_CLOSED, only with dawn handling enabled."""
+        machine = SCStateMachine()
+        reached = replace(IDLE, dawn_enabled=True, dawn_close_time_reached=True)
+
+        for state in ShutterState:
+            transition = machine.next_transition(state, reached)
+            if state in DAWN_STATES:
+                assert transition.reason != "Dawn close_not_later_than reached"
+            else:
+                assert transition.next_state is ShutterState.DAWN_FULL_CLOSED
+                assert transition.action is None
+
+        assert machine.next_transition(ShutterState.NEUTRAL, replace(IDLE, dawn_close_time_reached=True)).next_state is ShutterState.NEUTRAL
+        assert machine.next_transition(ShutterState.NEUTRAL, replace(IDLE, dawn_enabled=True)).next_state is ShutterState.NEUTRAL
+
+    def test_every_state_has_transitions(self):
+        """Without shadow and dawn handling, every state ends at NEUTRAL by moving to the neutral position."""
+        machine = SCStateMachine()
+
+        for state in ShutterState:
+            transition = machine.next_transition(state, IDLE)
+            assert transition.next_state is ShutterState.NEUTRAL
+            assert transition.action is SCTransitionAction.POSITION_NEUTRAL
+            # A missing neutral position doesn't keep the cover in a shadow or dawn state
+            assert not transition.action_required
+
+    def test_guards_read_snapshot(self):
+        """The guards decide on the snapshot only, e.g. the brightness compared with the threshold."""
+        machine = SCStateMachine()
+        sunny = replace(IDLE, in_sun=True, shadow_enabled=True, brightness=60000, shadow_threshold=50000, shadow_close_delay=30)
+
+        transition = machine.next_transition(ShutterState.NEUTRAL, sunny)
+        assert transition.next_state is ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
+        assert transition.action is SCTransitionAction.START_SHADOW_CLOSE_TIMER
+
+        transition = machine.next_transition(ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING, replace(sunny, timer_finished=False))
+        assert transition.next_state is ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
+        assert transition.action is None
+
+        transition = machine.next_transition(ShutterState.NEUTRAL, replace(sunny, brightness=40000))
+        assert transition.next_state is ShutterState.NEUTRAL
+
+    def test_first_matching_transition(self):
+        """Transitions are evaluated in the order of declaration."""
+        machine = SCStateMachine(
+            (
+                SCStateTransition(frozenset({ShutterState.NEUTRAL}), lambda _: False, ShutterState.SHADOW_NEUTRAL, "never"),
+                SCStateTransition(frozenset({ShutterState.NEUTRAL}), lambda _: True, ShutterState.DAWN_NEUTRAL, "first"),
+                SCStateTransition(frozenset(ShutterState), lambda _: True, ShutterState.SHADOW_FULL_CLOSED, "second"),
+            )
+        )
+        assert machine.next_transition(ShutterState.NEUTRAL, IDLE).reason == "first"
+        assert machine.next_transition(ShutterState.DAWN_NEUTRAL, IDLE).reason == "second"
+
+    def test_format_transition_trace(self):
+        """The trace is formatted as path of state names."""
+        trace = ((ShutterState.NEUTRAL, ShutterState.SHADOW_NEUTRAL), (ShutterState.SHADOW_NEUTRAL, ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING))
+
+        assert format_transition_trace(trace) == "NEUTRAL > SHADOW_NEUTRAL > SHADOW_NEUTRAL_TIMER_RUNNING"
+        assert format_transition_trace(()) == ""
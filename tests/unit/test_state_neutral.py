@@ -1,18 +1,18 @@
-"""Test the NEUTRAL state handler."""
+"""Test the NEUTRAL state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_neutral = ShadowControlManager._handle_state_neutral.__get__(manager)
+    manager.current_shutter_state = ShutterState.NEUTRAL
 
     # Dependencies
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=False)
@@ -33,7 +33,7 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateNeutral:
-    """Test branches of the NEUTRAL handler."""
+    """Test the transitions of the NEUTRAL state."""
 
     async def test_trigger_shadow_flow(self, manager):
         """Test transitioning to shadow timer when sun hits facade and brightness is high."""
@@ -42,7 +42,7 @@ class TestHandleStateNeutral:
         manager.brightness_threshold = 50000
         manager._shadow_config.after_seconds = 60
 
-        result = await manager._handle_state_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(60)
@@ -57,7 +57,7 @@ class TestHandleStateNeutral:
         manager._dawn_config.brightness_threshold = 10
         manager._dawn_config.after_seconds = 300
 
-        result = await manager._handle_state_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(300)
@@ -69,7 +69,7 @@ class TestHandleStateNeutral:
         manager._facade_config.neutral_pos_height = 100.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -80,6 +80,6 @@ class TestHandleStateNeutral:
         manager._get_current_brightness.return_value = 10000
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
@@ -1,48 +1,118 @@
 """Tests for _process_shutter_state()."""
 
+from itertools import cycle
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from custom_components.shadow_control.const import ShutterState
+from custom_components.shadow_control.state_machine import STATE_MACHINE_MAX_HOPS
+
+
+@pytest.fixture
+def manager(mock_manager):
+    """Mock manager in the sun with brightness above the shadow threshold."""
+    mock_manager._check_if_facade_is_in_sun.return_value = True
+    mock_manager._is_shadow_control_enabled.return_value = True
+    mock_manager._get_current_brightness.return_value = 60000
+    mock_manager.brightness_threshold = 50000
+    mock_manager._shadow_config.after_seconds = 0
+    mock_manager._calculate_shutter_height = MagicMock(return_value=80.0)
+    mock_manager._calculate_shutter_angle = MagicMock(return_value=60.0)
+    return mock_manager
 
 
 @pytest.mark.asyncio
-async def test_process_shutter_state_recursion_path(mock_manager):
+async def test_process_shutter_state_recursion_path(manager):
     """Test that the orchestrator follows a multi-step transition path."""
+    # Scenario: Sun shines with a close delay of 0 -> the timer is finished at once,
+    # so NEUTRAL passes SHADOW_FULL_CLOSE_TIMER_RUNNING and ends at SHADOW_FULL_CLOSED
 
-    # Scenario: Sun rises -> Transition from NEUTRAL to SHADOW_NEUTRAL
-    # and then immediately to TIMER_RUNNING.
+    await manager._process_shutter_state()
 
-    # 1. Setup the chain of returns
-    mock_manager._state_handlers[ShutterState.NEUTRAL].return_value = ShutterState.SHADOW_NEUTRAL
-    mock_manager._state_handlers[ShutterState.SHADOW_NEUTRAL].return_value = ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
-    # The last one returns itself to break the recursion
-    mock_manager._state_handlers[ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING].return_value = ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
+    assert manager.current_shutter_state == ShutterState.SHADOW_FULL_CLOSED
+    manager._start_timer.assert_awaited_once_with(0)
+    # Moved to the shadow position, then following the sun without stopping the timer
+    assert [call.kwargs["stop_timer"] for call in manager._position_shutter.await_args_list] == [True, False]
+    assert manager._update_extra_state_attributes.call_count == 2
 
-    # 2. Run the logic
-    await mock_manager._process_shutter_state()
 
-    # 3. Verify the final state
-    assert mock_manager.current_shutter_state == ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
+@pytest.mark.asyncio
+async def test_process_shutter_state_waits_for_started_timer(manager):
+    """The timer state of the snapshot is updated by the action, so a started timer ends the cycle."""
+    manager._shadow_config.after_seconds = 60
+    manager._is_timer_finished.side_effect = [True, False]
 
-    # 4. Verify the "Path" taken
-    mock_manager._state_handlers[ShutterState.NEUTRAL].assert_called_once()
-    mock_manager._state_handlers[ShutterState.SHADOW_NEUTRAL].assert_called_once()
-    mock_manager._state_handlers[ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING].assert_called_once()
+    await manager._process_shutter_state()
 
-    # Verify attributes were updated at each step
-    assert mock_manager._update_extra_state_attributes.call_count == 2
+    assert manager.current_shutter_state == ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
+    manager._start_timer.assert_awaited_once_with(60)
+    manager._position_shutter.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_process_shutter_state_missing_handler(mock_manager):
-    """Test behavior when a state has no assigned handler."""
-    mock_manager.current_shutter_state = ShutterState.DAWN_FULL_CLOSED
+async def test_process_shutter_state_inputs_read_once(manager):
+    """The guard inputs are evaluated once per cycle, regardless of the number of transitions."""
+    await manager._process_shutter_state()
+
+    assert manager.current_shutter_state == ShutterState.SHADOW_FULL_CLOSED
+    manager._check_if_facade_is_in_sun.assert_awaited_once()
+    manager._is_shadow_control_enabled.assert_awaited_once()
+    manager._get_current_brightness.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_shutter_state_stable_state(manager):
+    """A state without matching transition ends the cycle without changes."""
+    manager.current_shutter_state = ShutterState.SHADOW_HORIZONTAL_NEUTRAL
+    manager._shadow_config.shutter_open_seconds = None
+
+    await manager._process_shutter_state()
+
+    assert manager.current_shutter_state == ShutterState.SHADOW_HORIZONTAL_NEUTRAL
+    manager._update_extra_state_attributes.assert_not_called()
+    manager.performance_stats.record_transition_trace.assert_not_called()
+
 
-    # Simulate a missing entry in the dictionary
-    mock_manager._state_handlers = {}
+@pytest.mark.asyncio
+async def test_process_shutter_state_records_trace(manager):
+    """The transitions of the cycle are recorded as one trace."""
+    await manager._process_shutter_state()
+
+    manager.performance_stats.record_transition_trace.assert_called_once_with(
+        (
+            (ShutterState.NEUTRAL, ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING),
+            (ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING, ShutterState.SHADOW_FULL_CLOSED),
+        )
+    )
+    assert manager.performance_stats.record_state_transition.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_process_shutter_state_dawn_close_time_override(manager):
+    """Reaching close_not_later_than forces non-dawn states into DAWN_FULL_CLOSED before their own transitions."""
+    manager._is_dawn_control_enabled.return_value = True
+    manager._check_dawn_close_time_constraint.return_value = True
+    manager._dawn_config.shutter_max_height = 100.0
+    manager._dawn_config.shutter_max_angle = 100.0
+    manager.current_shutter_state = ShutterState.SHADOW_FULL_CLOSED
+
+    await manager._process_shutter_state()
+
+    assert manager.current_shutter_state == ShutterState.DAWN_FULL_CLOSED
+    # Not the shadow position of SHADOW_FULL_CLOSED, but the dawn position of DAWN_FULL_CLOSED
+    manager._position_shutter.assert_awaited_once_with(100.0, 100.0, stop_timer=True)
+    # The constraint is evaluated once per cycle
+    manager._check_dawn_close_time_constraint.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_process_shutter_state_max_hops(manager):
+    """Transitions switching back and forth stop at the hop limit instead of looping forever."""
+    states = cycle((ShutterState.SHADOW_NEUTRAL, ShutterState.NEUTRAL))
+    manager._async_run_state_transition = AsyncMock(side_effect=lambda snapshot: (next(states), snapshot))
 
-    await mock_manager._process_shutter_state()
+    await manager._process_shutter_state()
 
-    # Should log and cleanup
-    mock_manager._cancel_timer.assert_called_once()
-    mock_manager._update_extra_state_attributes.assert_called_once()
+    assert manager._update_extra_state_attributes.call_count == STATE_MACHINE_MAX_HOPS
+    manager.logger.warning.assert_called_once()
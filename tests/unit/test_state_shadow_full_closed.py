@@ -1,20 +1,20 @@
-"""Test the SHADOW_FULL_CLOSED state handler."""
+"""Test the SHADOW_FULL_CLOSED state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_shadow_full_closed = ShadowControlManager._handle_state_shadow_full_closed.__get__(manager)
+    manager.current_shutter_state = ShutterState.SHADOW_FULL_CLOSED
 
-    # Dependencies specific to this handler
+    # Dependencies specific to this state
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=True)
     manager._is_shadow_control_enabled = AsyncMock(return_value=True)
     manager._get_current_brightness = MagicMock(return_value=60000)
@@ -32,7 +32,7 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateShadowFullClosed:
-    """Test branches of the SHADOW_FULL_CLOSED handler."""
+    """Test the transitions of the SHADOW_FULL_CLOSED state."""
 
     async def test_brightness_drops_starts_timer(self, manager):
         """Test starting the timer to open slats when brightness drops."""
@@ -40,7 +40,7 @@ class TestHandleStateShadowFullClosed:
         manager.brightness_threshold = 50000
         manager._shadow_config.shutter_look_through_seconds = 300
 
-        result = await manager._handle_state_shadow_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(300)
@@ -52,7 +52,7 @@ class TestHandleStateShadowFullClosed:
         manager._calculate_shutter_height.return_value = 55.0
         manager._calculate_shutter_angle.return_value = 5.0
 
-        result = await manager._handle_state_shadow_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(55.0, 5.0, stop_timer=False)
@@ -63,18 +63,18 @@ class TestHandleStateShadowFullClosed:
         manager._facade_config.neutral_pos_height = 100
         manager._facade_config.neutral_pos_angle = 0
 
-        result = await manager._handle_state_shadow_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
 
     async def test_recalculate_error_stays_in_state(self, manager):
-        """Test that a calculation error doesn't crash the handler."""
+        """Test that a calculation error doesn't crash the transition."""
         manager._get_current_brightness.return_value = 60000
         manager.brightness_threshold = 50000
         manager._calculate_shutter_height.return_value = None  # Simulating error
 
-        result = await manager._handle_state_shadow_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSED
         manager._position_shutter.assert_not_called()
@@ -84,7 +84,7 @@ class TestHandleStateShadowFullClosed:
         manager._check_if_facade_is_in_sun.return_value = False
         manager._facade_config.neutral_pos_height = None
 
-        result = await manager._handle_state_shadow_full_closed()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         assert manager.logger.warning.called
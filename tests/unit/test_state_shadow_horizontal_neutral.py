@@ -1,20 +1,20 @@
-"""Test the SHADOW_HORIZONTAL_NEUTRAL state handler."""
+"""Test the SHADOW_HORIZONTAL_NEUTRAL state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_shadow_horizontal_neutral = ShadowControlManager._handle_state_shadow_horizontal_neutral.__get__(manager)
+    manager.current_shutter_state = ShutterState.SHADOW_HORIZONTAL_NEUTRAL
 
-    # Dependencies specific to this handler
+    # Dependencies specific to this state
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=True)
     manager._is_shadow_control_enabled = AsyncMock(return_value=True)
     manager._get_current_brightness = MagicMock(return_value=10000)
@@ -32,14 +32,14 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateShadowHorizontalNeutral:
-    """Test branches of the SHADOW_HORIZONTAL_NEUTRAL handler."""
+    """Test the transitions of the SHADOW_HORIZONTAL_NEUTRAL state."""
 
     async def test_brightness_spikes_recloses_shutter(self, manager):
         """Test returning to SHADOW_FULL_CLOSED when brightness increases."""
         manager._get_current_brightness.return_value = 60000
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_shadow_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSED
         manager._position_shutter.assert_called_once_with(50.0, 0.0, stop_timer=True)
@@ -50,7 +50,7 @@ class TestHandleStateShadowHorizontalNeutral:
         manager.brightness_threshold = 50000
         manager._shadow_config.shutter_open_seconds = 600
 
-        result = await manager._handle_state_shadow_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(600)
@@ -61,20 +61,20 @@ class TestHandleStateShadowHorizontalNeutral:
         manager._facade_config.neutral_pos_height = 100.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_shadow_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
 
-    async def test_missing_open_delay_warning(self, manager):
-        """Test behavior when open shutter delay is not configured."""
+    async def test_missing_open_delay_stays_in_state(self, manager):
+        """Test staying in state without timer if the open shutter delay is not configured."""
         manager._get_current_brightness.return_value = 10000
         manager._shadow_config.shutter_open_seconds = None
 
-        result = await manager._handle_state_shadow_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL
-        assert manager.logger.warning.called
+        manager._start_timer.assert_not_called()
 
     async def test_calculation_error_stays_in_state(self, manager):
         """Test handling case where calculation returns None during re-closing."""
@@ -82,7 +82,7 @@ class TestHandleStateShadowHorizontalNeutral:
         manager.brightness_threshold = 50000
         manager._calculate_shutter_height.return_value = None
 
-        result = await manager._handle_state_shadow_horizontal_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL
         manager._position_shutter.assert_not_called()
@@ -1,22 +1,20 @@
-"""Test the SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING state handler."""
+"""Test the SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_shadow_horizontal_neutral_timer_running = (
-        ShadowControlManager._handle_state_shadow_horizontal_neutral_timer_running.__get__(manager)
-    )
+    manager.current_shutter_state = ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
 
-    # Dependencies specific to this handler
+    # Dependencies specific to this state
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=True)
     manager._is_shadow_control_enabled = AsyncMock(return_value=True)
     manager._get_current_brightness = MagicMock(return_value=10000)
@@ -36,14 +34,14 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateShadowHorizontalNeutralTimerRunning:
-    """Test branches of the SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING handler."""
+    """Test the transitions of the SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING state."""
 
     async def test_brightness_spikes_returns_to_closed(self, manager):
         """Test that a brightness spike cancels the timer and goes back to full closed."""
         manager._get_current_brightness.return_value = 60000
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_shadow_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSED
         manager._cancel_timer.assert_called_once()
@@ -56,7 +54,7 @@ class TestHandleStateShadowHorizontalNeutralTimerRunning:
         manager._shadow_config.shutter_look_through_angle = 90.0
         manager._is_timer_finished.return_value = True
 
-        result = await manager._handle_state_shadow_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL
         manager._position_shutter.assert_called_once_with(50.0, 90.0, stop_timer=True)
@@ -66,7 +64,7 @@ class TestHandleStateShadowHorizontalNeutralTimerRunning:
         manager._get_current_brightness.return_value = 10000
         manager._is_timer_finished.return_value = False
 
-        result = await manager._handle_state_shadow_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
         manager._position_shutter.assert_not_called()
@@ -77,7 +75,7 @@ class TestHandleStateShadowHorizontalNeutralTimerRunning:
         manager._facade_config.neutral_pos_height = 100.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_shadow_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -87,6 +85,6 @@ class TestHandleStateShadowHorizontalNeutralTimerRunning:
         manager._is_timer_finished.return_value = True
         manager._calculate_shutter_height.return_value = None
 
-        result = await manager._handle_state_shadow_horizontal_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_HORIZONTAL_NEUTRAL_TIMER_RUNNING
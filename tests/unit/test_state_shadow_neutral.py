@@ -1,18 +1,18 @@
-"""Test the SHADOW_NEUTRAL state handler."""
+"""Test the SHADOW_NEUTRAL state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_shadow_neutral = ShadowControlManager._handle_state_shadow_neutral.__get__(manager)
+    manager.current_shutter_state = ShutterState.SHADOW_NEUTRAL
 
     # Dependencies
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=True)
@@ -31,14 +31,13 @@ def manager(mock_manager):
     # Defaults to prevent NoneType issues in logical checks
     manager.brightness_threshold = 50000
     manager._shadow_config.after_seconds = 60
-    manager._dawn_config.enabled = False
 
     return manager
 
 
 @pytest.mark.asyncio
 class TestHandleStateShadowNeutral:
-    """Test branches of the SHADOW_NEUTRAL handler."""
+    """Test the transitions of the SHADOW_NEUTRAL state."""
 
     async def test_brightness_spike_triggers_shadow_timer(self, manager):
         """Test transitioning back to shadow timer when sun returns."""
@@ -46,19 +45,19 @@ class TestHandleStateShadowNeutral:
         manager.brightness_threshold = 50000
         manager._shadow_config.after_seconds = 120
 
-        result = await manager._handle_state_shadow_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(120)
 
     async def test_brightness_low_triggers_dawn_timer(self, manager):
         """Test transitioning to dawn timer when it gets dark."""
-        manager._dawn_config.enabled = True
+        manager._is_dawn_control_enabled.return_value = True
         manager._get_current_dawn_brightness.return_value = 5
         manager._dawn_config.brightness_threshold = 10
         manager._dawn_config.after_seconds = 300
 
-        result = await manager._handle_state_shadow_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(300)
@@ -69,7 +68,7 @@ class TestHandleStateShadowNeutral:
         manager._shadow_config.height_after_sun = 30.0
         manager._shadow_config.angle_after_sun = 0.0
 
-        result = await manager._handle_state_shadow_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_NEUTRAL
         manager._position_shutter.assert_called_once_with(30.0, 0.0, stop_timer=True)
@@ -80,7 +79,7 @@ class TestHandleStateShadowNeutral:
         manager._facade_config.neutral_pos_height = 100.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_shadow_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -93,7 +92,7 @@ class TestHandleStateShadowNeutral:
         manager._dawn_config.brightness_threshold = 10
         manager._dawn_config.after_seconds = 300
 
-        result = await manager._handle_state_shadow_neutral()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.DAWN_FULL_CLOSE_TIMER_RUNNING
         manager._start_timer.assert_called_once_with(300)
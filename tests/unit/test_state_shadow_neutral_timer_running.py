@@ -1,20 +1,20 @@
-"""Test the SHADOW_NEUTRAL_TIMER_RUNNING state handler."""
+"""Test the SHADOW_NEUTRAL_TIMER_RUNNING state transitions."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from custom_components.shadow_control import ShadowControlManager
 from custom_components.shadow_control.const import ShutterState
+from tests.unit.conftest import run_state_transition
 
 
 @pytest.fixture
 def manager(mock_manager):
-    """Bind the real handler to the mock manager."""
+    """Put the mock manager into the state under test."""
     manager = mock_manager
-    manager._handle_state_shadow_neutral_timer_running = ShadowControlManager._handle_state_shadow_neutral_timer_running.__get__(manager)
+    manager.current_shutter_state = ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
 
-    # Dependencies specific to this handler
+    # Dependencies specific to this state
     manager._check_if_facade_is_in_sun = AsyncMock(return_value=True)
     manager._is_shadow_control_enabled = AsyncMock(return_value=True)
     manager._get_current_brightness = MagicMock(return_value=10000)
@@ -34,14 +34,14 @@ def manager(mock_manager):
 
 @pytest.mark.asyncio
 class TestHandleStateShadowNeutralTimerRunning:
-    """Test branches of the SHADOW_NEUTRAL_TIMER_RUNNING handler."""
+    """Test the transitions of the SHADOW_NEUTRAL_TIMER_RUNNING state."""
 
     async def test_brightness_recovery_cancels_timer(self, manager):
         """Test that brightness spike returns to FULL_CLOSED immediately."""
         manager._get_current_brightness.return_value = 60000
         manager.brightness_threshold = 50000
 
-        result = await manager._handle_state_shadow_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_FULL_CLOSED
         manager._cancel_timer.assert_called_once()
@@ -53,7 +53,7 @@ class TestHandleStateShadowNeutralTimerRunning:
         manager._shadow_config.height_after_sun = 20.0
         manager._shadow_config.angle_after_sun = 10.0
 
-        result = await manager._handle_state_shadow_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_NEUTRAL
         manager._position_shutter.assert_called_once_with(20.0, 10.0, stop_timer=True)
@@ -62,7 +62,7 @@ class TestHandleStateShadowNeutralTimerRunning:
         """Test staying in state while timer is active and brightness is low."""
         manager._is_timer_finished.return_value = False
 
-        result = await manager._handle_state_shadow_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
         manager._position_shutter.assert_not_called()
@@ -72,7 +72,7 @@ class TestHandleStateShadowNeutralTimerRunning:
         manager._is_timer_finished.return_value = True
         manager._shadow_config.height_after_sun = None
 
-        result = await manager._handle_state_shadow_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.SHADOW_NEUTRAL_TIMER_RUNNING
         assert manager.logger.warning.called
@@ -83,7 +83,7 @@ class TestHandleStateShadowNeutralTimerRunning:
         manager._facade_config.neutral_pos_height = 100.0
         manager._facade_config.neutral_pos_angle = 0.0
 
-        result = await manager._handle_state_shadow_neutral_timer_running()
+        result = await run_state_transition(manager)
 
         assert result == ShutterState.NEUTRAL
         manager._position_shutter.assert_called_once_with(100.0, 0.0, stop_timer=True)
@@ -0,0 +1,71 @@
+"""Tests for the static facade configuration, which is parsed once at manager construction."""
+
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.shadow_control import SCFacadeConfiguration, SCStaticFacadeConfiguration, ShadowControlManager
+from custom_components.shadow_control.const import SCFacadeConfig1, SCFacadeConfig2, ShutterType
+
+
+@pytest.fixture
+def manager():
+    """Bind the static config parsing to a mock manager."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.logger = MagicMock()
+    instance._config = {}
+    instance._get_static_value = ShadowControlManager._get_static_value.__get__(instance)
+    instance._build_static_facade_config = ShadowControlManager._build_static_facade_config.__get__(instance)
+    return instance
+
+
+class TestStaticFacadeConfig:
+    """Test parsing and immutability of the static facade configuration."""
+
+    def test_defaults(self, manager):
+        """Missing options lead to the defaults."""
+        static_config = manager._build_static_facade_config()
+
+        assert static_config == SCStaticFacadeConfiguration()
+        assert static_config.shutter_type is ShutterType.MODE1
+        assert static_config.max_movement_duration == 30
+
+    def test_options_are_converted(self, manager):
+        """Options are converted to their types and the shutter type to the enum."""
+        manager._config = {
+            SCFacadeConfig1.AZIMUTH_STATIC.value: "200",
+            SCFacadeConfig2.SLAT_WIDTH_STATIC.value: 80,
+            SCFacadeConfig2.SHUTTER_TYPE_STATIC.value: "mode2",
+            SCFacadeConfig2.MAX_MOVEMENT_DURATION_STATIC.value: 45,
+        }
+
+        static_config = manager._build_static_facade_config()
+
+        assert static_config.azimuth == 200.0
+        assert static_config.slat_width == 80.0
+        assert static_config.shutter_type is ShutterType.MODE2
+        assert static_config.max_movement_duration == 45.0
+
+    def test_invalid_shutter_type(self, manager):
+        """An unknown shutter type falls back to mode1."""
+        manager._config = {SCFacadeConfig2.SHUTTER_TYPE_STATIC.value: "mode42"}
+
+        static_config = manager._build_static_facade_config()
+
+        assert static_config.shutter_type is ShutterType.MODE1
+        manager.logger.warning.assert_called_once()
+
+    def test_static_config_is_immutable(self):
+        """The static configuration can't be modified at runtime."""
+        facade_config = SCFacadeConfiguration(SCStaticFacadeConfiguration(azimuth=90.0))
+
+        assert facade_config.azimuth == 90.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            facade_config.static.azimuth = 180.0
+        with pytest.raises(AttributeError):
+            facade_config.azimuth = 180.0
+
+        # Entity backed values stay writable
+        facade_config.neutral_pos_height = 50.0
+        assert facade_config.neutral_pos_height == 50.0
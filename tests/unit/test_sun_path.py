@@ -0,0 +1,234 @@
+"""Tests for the daily sun path of a facade."""
+
+import dataclasses
+import datetime
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+from astral import LocationInfo
+from astral.location import Location
+
+from custom_components.shadow_control import SCStaticFacadeConfiguration, ShadowControlManager
+from custom_components.shadow_control.const import SCInputGroup, SCTriggerSource
+from custom_components.shadow_control.sun_path import SUN_HORIZON_MAX_DURATION, build_sun_path_table
+
+TIME_ZONE = ZoneInfo("Europe/Berlin")
+LOCATION = Location(LocationInfo("Test", "Germany", "Europe/Berlin", 50.0, 8.0))
+FACADE = SCStaticFacadeConfiguration(azimuth=180.0, offset_sun_in=-80.0, offset_sun_out=80.0, light_strip_width=500.0, shutter_height=2000.0)
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Sun path of a summer day for a south facade."""
+    return build_sun_path_table(LOCATION, 0.0, datetime.date(2025, 6, 21), TIME_ZONE, FACADE, 100.0, 100.0)
+
+
+class TestSunPathTable:
+    """Test building and using the sun path table."""
+
+    def test_one_sample_per_minute(self, table):
+        """A regular day has 1440 samples, starting at local midnight."""
+        assert len(table.sun_azimuth) == 1440
+        assert table.start == datetime.datetime(2025, 6, 20, 22, 0, tzinfo=datetime.UTC)
+
+    def test_dst_change(self):
+        """The day of the change to summer time only has 23 hours."""
+        table = build_sun_path_table(LOCATION, 0.0, datetime.date(2025, 3, 30), TIME_ZONE, FACADE, 100.0, 100.0)
+
+        assert len(table.sun_azimuth) == 23 * 60
+
+    def test_in_sun_around_noon(self, table):
+        """A south facade is in the sun once a day, including solar noon."""
+        periods = table.in_sun_periods()
+
+        assert len(periods) == 1
+        start, end = periods[0]
+        solar_noon = datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+        assert start < solar_noon < end
+
+    def test_next_in_sun_change(self, table):
+        """The next sun entry or exit is found from any point in time of the day."""
+        [(start, end)] = table.in_sun_periods()
+
+        assert table.next_in_sun_change(table.start) == start
+        assert table.next_in_sun_change(start) == end
+        assert table.next_in_sun_change(start + datetime.timedelta(seconds=30)) == end
+        assert table.next_in_sun_change(end) is None
+        assert table.next_in_sun_change(table.start - datetime.timedelta(minutes=1)) is None
+
+    def test_stable_until(self, table):
+        """In-sun, height and angle stay the same up to the returned step, outside the sun only in-sun counts."""
+        [(start, end)] = table.in_sun_periods()
+        noon = datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+
+        stable_until = table.stable_until(noon)
+
+        assert noon < stable_until <= end
+        assert table.lookup(stable_until - table.resolution).height == table.lookup(noon).height
+        assert table.lookup(stable_until).height != table.lookup(noon).height
+        assert table.stable_until(table.start) == start
+        assert table.stable_until(end) == table.start + len(table.sun_azimuth) * table.resolution
+
+    def test_lookup_interpolates(self, table):
+        """Between two samples the sun position is interpolated."""
+        first = table.lookup(datetime.datetime(2025, 6, 21, 12, 0, tzinfo=TIME_ZONE))
+        second = table.lookup(datetime.datetime(2025, 6, 21, 12, 1, tzinfo=TIME_ZONE))
+        between = table.lookup(datetime.datetime(2025, 6, 21, 12, 0, 30, tzinfo=TIME_ZONE))
+
+        assert between.sun_elevation == pytest.approx((first.sun_elevation + second.sun_elevation) / 2)
+        assert between.sun_azimuth == pytest.approx((first.sun_azimuth + second.sun_azimuth) / 2)
+        assert between.is_in_sun is first.is_in_sun
+        assert between.height == first.height
+        assert first.sun_azimuth == pytest.approx(LOCATION.solar_azimuth(datetime.datetime(2025, 6, 21, 12, 0, tzinfo=TIME_ZONE)))
+
+    def test_lookup_outside_day(self, table):
+        """Only points in time of the day of the table can be looked up."""
+        assert table.lookup(datetime.datetime(2025, 6, 22, 0, 1, tzinfo=TIME_ZONE)) is None
+        assert table.lookup(datetime.datetime(2025, 6, 20, 23, 59, tzinfo=TIME_ZONE)) is None
+
+    def test_validity(self, table):
+        """The table is outdated with another day or configuration."""
+        day = datetime.date(2025, 6, 21)
+
+        assert table.is_valid_for(day, dataclasses.replace(FACADE), 100.0, 100.0)
+        assert not table.is_valid_for(day + datetime.timedelta(days=1), FACADE, 100.0, 100.0)
+        assert not table.is_valid_for(day, FACADE, 80.0, 100.0)
+        assert not table.is_valid_for(day, SCStaticFacadeConfiguration(azimuth=90.0), 100.0, 100.0)
+
+    def test_diagnostics(self, table):
+        """The summary contains the in-sun periods as local time."""
+        result = table.as_dict()
+
+        assert result["day"] == "2025-06-21"
+        assert result["samples"] == 1440
+        assert result["resolution_seconds"] == 60.0
+        assert len(result["in_sun_periods"]) == 1
+
+
+class TestSunCrossing:
+    """Test the recalculation at sun entry and exit."""
+
+    @pytest.fixture
+    def manager(self, table):
+        """Bind the scheduling to a mock manager."""
+        instance = MagicMock(spec=ShadowControlManager)
+        instance.logger = MagicMock()
+        instance.hass = MagicMock()
+        instance._sun_path_table = table
+        instance._unsub_sun_crossing = None
+        instance._unsub_callbacks = [MagicMock()]
+        instance._dirty_input_groups = set()
+        instance._schedule_next_sun_crossing = ShadowControlManager._schedule_next_sun_crossing.__get__(instance)
+        instance._cancel_sun_crossing_timer = ShadowControlManager._cancel_sun_crossing_timer.__get__(instance)
+        instance._async_sun_crossing = ShadowControlManager._async_sun_crossing.__get__(instance)
+        return instance
+
+    def test_schedule_next_crossing(self, manager, table):
+        """A single timer is scheduled at the next sun entry, a previous one is cancelled."""
+        previous_timer = MagicMock()
+        manager._unsub_sun_crossing = previous_timer
+        [(start, _end)] = table.in_sun_periods()
+
+        with (
+            patch("custom_components.shadow_control.dt_util.utcnow", return_value=table.start),
+            patch("custom_components.shadow_control.async_track_point_in_utc_time") as mock_track,
+        ):
+            manager._schedule_next_sun_crossing()
+
+        previous_timer.assert_called_once()
+        assert mock_track.call_args.args[2] == start
+        assert manager._unsub_sun_crossing is mock_track.return_value
+
+    def test_no_schedule_after_stop(self, manager):
+        """Without registered listeners no timer is scheduled."""
+        manager._unsub_callbacks = []
+
+        with patch("custom_components.shadow_control.async_track_point_in_utc_time") as mock_track:
+            manager._schedule_next_sun_crossing()
+
+        mock_track.assert_not_called()
+
+    async def test_crossing_recalculates(self, manager, table):
+        """At sun entry or exit the sun position is read again and the next crossing is scheduled."""
+        [(start, end)] = table.in_sun_periods()
+
+        with (
+            patch("custom_components.shadow_control.dt_util.utcnow", return_value=start),
+            patch("custom_components.shadow_control.async_track_point_in_utc_time") as mock_track,
+        ):
+            await manager._async_sun_crossing(start)
+
+        assert mock_track.call_args.args[2] == end
+        assert SCInputGroup.SUN_POSITION in manager._dirty_input_groups
+        manager.async_calculate_and_apply_cover_position.assert_awaited_once_with(None, SCTriggerSource.SUN_CROSSING)
+
+
+class TestSunHorizon:
+    """Test skipping sun driven recalculations, which can't change the shutter position."""
+
+    NOON = datetime.datetime(2025, 6, 21, 11, 30, tzinfo=datetime.UTC)
+
+    @pytest.fixture
+    def manager(self, table):
+        """Bind the sun horizon to a mock manager at noon."""
+        entry = table.lookup(self.NOON)
+        instance = MagicMock(spec=ShadowControlManager)
+        instance.logger = MagicMock()
+        instance.hass = MagicMock()
+        instance._sun_path_table = table
+        instance._sun_path_table_task = None
+        instance._sun_horizon = None
+        instance._is_initial_run = False
+        instance._facade_config = MagicMock(static=FACADE)
+        instance._shadow_config = MagicMock(shutter_max_height=100.0, shutter_max_angle=100.0)
+        instance._dynamic_config = MagicMock(sun_azimuth=entry.sun_azimuth, sun_elevation=entry.sun_elevation)
+        instance._dirty_input_groups = set()
+        instance._update_sun_horizon = ShadowControlManager._update_sun_horizon.__get__(instance)
+        instance._is_within_sun_horizon = ShadowControlManager._is_within_sun_horizon.__get__(instance)
+        return instance
+
+    @pytest.fixture(autouse=True)
+    def now(self):
+        """Fix the current time to noon."""
+        with (
+            patch("custom_components.shadow_control.dt_util.utcnow", return_value=self.NOON),
+            patch("custom_components.shadow_control.dt_util.as_local", side_effect=lambda value: value.astimezone(TIME_ZONE)),
+        ):
+            yield
+
+    def test_horizon_from_sun_path(self, manager, table):
+        """The horizon is the next change of the stepped position, limited to the max duration."""
+        manager._update_sun_horizon()
+
+        assert manager._sun_horizon == min(table.stable_until(self.NOON), self.NOON + SUN_HORIZON_MAX_DURATION)
+
+    def test_skip_within_horizon(self, manager):
+        """Sun position changes are skipped within the horizon, unless another input changed."""
+        manager._update_sun_horizon()
+        manager._dirty_input_groups = {SCInputGroup.SUN_POSITION}
+
+        assert manager._is_within_sun_horizon()
+        manager.performance_stats.record_suppressed_recalculation.assert_called_once()
+
+        manager._dirty_input_groups.add(SCInputGroup.BRIGHTNESS)
+        assert not manager._is_within_sun_horizon()
+
+    def test_no_horizon_with_deviating_sun_entities(self, manager):
+        """Sun entities for another location can't use the sun path of Home Assistant."""
+        manager._dynamic_config.sun_azimuth += 5
+
+        manager._update_sun_horizon()
+
+        assert manager._sun_horizon is None
+        assert not manager._is_within_sun_horizon()
+
+    def test_outdated_sun_path_is_recalculated(self, manager):
+        """With another max height there is no horizon until the sun path is calculated again."""
+        manager._shadow_config.shutter_max_height = 80.0
+
+        manager._update_sun_horizon()
+
+        assert manager._sun_horizon is None
+        manager.hass.async_create_task.assert_called_once()
+        manager.hass.async_create_task.call_args.args[0].close()
@@ -13,6 +13,7 @@ from custom_components.shadow_control.const import (
     DOMAIN,
     SWITCH_INTERNAL_TO_EXTERNAL_MAP,
     SCInternal,
+    SCTriggerSource,
 )
 from custom_components.shadow_control.switch import (
     ShadowControlConfigSwitch,
@@ -108,7 +109,7 @@ class TestSwitchEntities:
 
         # Wait for the async_create_task to finish
         await mock_hass.async_block_till_done()
-        mock_manager.async_calculate_and_apply_cover_position.assert_called_once_with(None)
+        mock_manager.async_calculate_and_apply_cover_position.assert_called_once_with(None, SCTriggerSource.ENTITY_NOTIFY)
 
     async def test_switch_registry_cleanup(self, mock_hass, mock_config_entry, mock_manager):
         """Test that internal switches are removed if an external mapping is present."""
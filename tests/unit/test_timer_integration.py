@@ -78,6 +78,7 @@ class TestTimerIntegration:
 
         # Mock methods
         instance._activate_auto_lock = AsyncMock()
+        instance._cover_output = MagicMock()
 
         # Bind real methods
         instance._is_positioning_in_progress = ShadowControlManager._is_positioning_in_progress.__get__(instance)
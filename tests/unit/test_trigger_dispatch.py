@@ -0,0 +1,83 @@
+"""Tests for the trigger dispatch built at listener registration."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import Event
+
+from custom_components.shadow_control import ShadowControlManager
+from custom_components.shadow_control.const import SCDawnInput, SCDynamicInput, SCInternal, SCShadowInput, SCTriggerAction
+
+
+@pytest.fixture
+def manager():
+    """Bind the trigger dispatch to a mock manager."""
+    instance = MagicMock(spec=ShadowControlManager)
+    instance.logger = MagicMock()
+    instance._config = {
+        SCShadowInput.SHUTTER_MAX_HEIGHT_ENTITY.value: "input_number.max_height",
+        SCShadowInput.CONTROL_ENABLED_ENTITY.value: "input_boolean.shadow_enabled",
+        SCDawnInput.CONTROL_ENABLED_ENTITY.value: "input_boolean.dawn_enabled",
+        SCDynamicInput.LOCK_INTEGRATION_ENTITY.value: "input_boolean.lock",
+    }
+    instance.get_internal_entity_id = MagicMock(
+        side_effect={
+            SCInternal.LOCK_INTEGRATION_MANUAL: "switch.sc_lock",
+            SCInternal.NEUTRAL_POS_HEIGHT_MANUAL: "number.sc_neutral_height",
+        }.get
+    )
+    instance._trigger_handlers = None
+    instance._immediate_positioning_entities = frozenset()
+
+    instance._build_trigger_dispatch = ShadowControlManager._build_trigger_dispatch.__get__(instance)
+    instance._async_handle_calculation_trigger = ShadowControlManager._async_handle_calculation_trigger.__get__(instance)
+    return instance
+
+
+class TestTriggerDispatch:
+    """Test building and using the trigger dispatch."""
+
+    async def test_build_dispatch(self, manager):
+        """Unset entities are skipped, each configured entity gets its handler."""
+        manager._build_trigger_dispatch()
+
+        assert manager._immediate_positioning_entities == frozenset({"input_number.max_height", "number.sc_neutral_height"})
+        assert manager._trigger_handlers == {
+            "input_boolean.shadow_enabled": manager._async_handle_shadow_control_enabled_trigger,
+            "input_boolean.dawn_enabled": manager._async_handle_dawn_control_enabled_trigger,
+            "input_boolean.lock": manager._async_handle_lock_trigger,
+            "switch.sc_lock": manager._async_handle_lock_trigger,
+        }
+        assert manager._coalescing_bypass_entities == frozenset({"switch.sc_lock"})
+
+    async def test_renamed_lock_bypasses_coalescing(self, manager):
+        """After the entity registry update of a renamed lock switch, the new entity_id bypasses the window."""
+        manager._build_trigger_dispatch()
+        manager.get_internal_entity_id.side_effect = {SCInternal.LOCK_INTEGRATION_MANUAL: "switch.renamed_lock"}.get
+        manager._internal_entity_ids = {}
+        manager._mark_all_input_groups_dirty = MagicMock()
+        manager._async_track_input_entities = MagicMock()
+
+        ShadowControlManager._async_entity_registry_updated_listener(
+            manager, MagicMock(data={"action": "update", "entity_id": "switch.renamed_lock"})
+        )
+
+        assert manager._coalescing_bypass_entities == frozenset({"switch.renamed_lock"})
+
+    async def test_events_use_prebuilt_dispatch(self, manager):
+        """Handling events doesn't resolve any entity_id again."""
+        manager._build_trigger_dispatch()
+        manager.get_internal_entity_id.reset_mock()
+        manager._async_handle_shadow_control_enabled_trigger = AsyncMock(return_value=SCTriggerAction.SHADOW_HANDLING_DISABLED)
+        manager._trigger_handlers["input_boolean.shadow_enabled"] = manager._async_handle_shadow_control_enabled_trigger
+        manager._get_immediate_positioning_action = MagicMock(return_value=SCTriggerAction.FORCE_IMMEDIATE_POSITIONING)
+
+        shadow_event = Event("state_changed", {"entity_id": "input_boolean.shadow_enabled", "old_state": None, "new_state": MagicMock(state="off")})
+        brightness_event = Event("state_changed", {"entity_id": "sensor.brightness", "old_state": None, "new_state": MagicMock(state="100")})
+        height_event = Event("state_changed", {"entity_id": "input_number.max_height", "old_state": None, "new_state": MagicMock(state="80")})
+
+        assert await manager._async_handle_calculation_trigger(shadow_event) is SCTriggerAction.SHADOW_HANDLING_DISABLED
+        assert await manager._async_handle_calculation_trigger(brightness_event) is SCTriggerAction.PROCESS_SHUTTER_STATE
+        assert await manager._async_handle_calculation_trigger(height_event) is SCTriggerAction.FORCE_IMMEDIATE_POSITIONING
+        manager.get_internal_entity_id.assert_not_called()
+        manager._get_immediate_positioning_action.assert_called_once()